@@ -0,0 +1,93 @@
+"""
+Deterministic stand-ins for the embedding model and the LLM, so that the benchmarks measure
+mem0's own overhead and give the same memories on every run.
+"""
+
+import ast
+import json
+import re
+import time
+import zlib
+from typing import Dict, List, Literal, Optional
+
+import numpy as np
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.base import LLMBase
+
+# The update prompt shows the existing memories, then the new facts, each in a ``` block
+_PROMPT_BLOCK = re.compile(r"```\s*(\[.*?\])\s*```", re.DOTALL)
+
+
+class HashEmbeddings(MockEmbeddings):
+    """
+    Bag-of-words embeddings: each token maps to a fixed random vector seeded by its hash.
+
+    Texts sharing words get similar vectors, so searches rank memories the way a real model
+    roughly would, at the dimension of a real model and without any network call.
+    """
+
+    def __init__(self, embedding_dims: int = 1536):
+        super().__init__(BaseEmbedderConfig(embedding_dims=embedding_dims))
+        self._token_vectors: Dict[str, np.ndarray] = {}
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            rng = np.random.default_rng(zlib.crc32(token.encode()))
+            vector = rng.standard_normal(self.config.embedding_dims).astype(np.float32)
+            self._token_vectors[token] = vector
+        return vector
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        vector = np.zeros(self.config.embedding_dims, dtype=np.float32)
+        for token in re.findall(r"\w+", text.lower()):
+            vector += self._token_vector(token)
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+
+class FakeLLM(LLMBase):
+    """
+    LLM returning canned fact extraction and memory update JSON derived from the prompt.
+
+    Every sentence of the user messages becomes a fact. A fact is added unless an existing
+    memory has the same text, in which case the memory is left unchanged.
+    """
+
+    def __init__(self, latency: float = 0.0):
+        """
+        Args:
+            latency (float, optional): Seconds each call sleeps, to model the round trip of a real LLM.
+                Defaults to 0.
+        """
+        super().__init__({"model": "fake"})
+        self.latency = latency
+
+    def generate_response(self, messages: List[Dict[str, str]], tools=None, tool_choice="auto", **kwargs):
+        if self.latency:
+            time.sleep(self.latency)
+        if messages[0]["role"] == "system":
+            return json.dumps({"facts": self._facts(messages[-1]["content"])})
+        return json.dumps({"memory": self._memory_actions(messages[-1]["content"])})
+
+    @staticmethod
+    def _facts(user_prompt: str) -> List[str]:
+        facts = []
+        for line in user_prompt.splitlines():
+            if line.startswith("user: "):
+                facts.extend(sentence.strip() for sentence in line[len("user: ") :].split(".") if sentence.strip())
+        return facts
+
+    @staticmethod
+    def _memory_actions(update_prompt: str) -> List[Dict[str, str]]:
+        old_memory, facts = (ast.literal_eval(block) for block in _PROMPT_BLOCK.findall(update_prompt)[-2:])
+        existing = {memory["text"]: memory["id"] for memory in old_memory}
+        actions = []
+        for fact in facts:
+            if fact in existing:
+                actions.append({"id": existing[fact], "text": fact, "event": "NONE"})
+            else:
+                actions.append({"id": str(len(old_memory) + len(actions)), "text": fact, "event": "ADD"})
+        return actions
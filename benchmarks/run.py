@@ -0,0 +1,300 @@
+"""
+Benchmarks of the Memory hot path: add, search, get_all, update and delete_all, sync and async.
+
+The embedding model and the LLM are deterministic stand-ins (see fakes.py), so the numbers
+measure mem0 and the vector store only. Each vector store runs in its own process, which makes
+its peak RSS comparable between runs.
+
+Usage:
+    python benchmarks/run.py                         # run and compare to benchmarks/baseline.json
+    python benchmarks/run.py --stores faiss --ops 50
+    python benchmarks/run.py --update-baseline       # store the results as the new baseline
+    python benchmarks/run.py --fail-on-regression    # exit with 1 when a metric regressed
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+STORES = ("faiss", "chroma", "qdrant")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# Settings that change the numbers, a baseline is only comparable when they match
+WORKLOAD_SETTINGS = ("ops", "users", "dims", "concurrency", "llm_latency_ms")
+
+SUBJECTS = ["I", "My sister", "My manager", "Our team", "My neighbour", "The doctor", "My friend", "The teacher"]
+VERBS = ["likes", "plays", "visits", "avoids", "studies", "cooks", "collects", "recommends", "reads", "watches"]
+OBJECTS = [
+    "chess",
+    "tennis",
+    "sushi",
+    "jazz",
+    "museums",
+    "vintage cameras",
+    "mountain trails",
+    "science fiction",
+    "french cinema",
+    "board games",
+    "spicy food",
+    "open source",
+    "gardening",
+    "astronomy",
+    "pottery",
+    "marathons",
+]
+PLACES = ["in Paris", "on Mondays", "at night", "with friends", "in the summer", "at work", "on weekends", "in Lisbon"]
+
+
+def _sentence(rng: random.Random) -> str:
+    return f"{rng.choice(SUBJECTS)} {rng.choice(VERBS)} {rng.choice(OBJECTS)} {rng.choice(PLACES)}"
+
+
+def _workload(ops: int, users: int, seed: int = 0):
+    """Deterministic (user_id, message, query) triples."""
+    rng = random.Random(seed)
+    return [(f"user-{i % users}", f"{_sentence(rng)}. {_sentence(rng)}.", _sentence(rng)) for i in range(ops)]
+
+
+def _summary(latencies, elapsed):
+    import numpy as np
+
+    latencies_ms = np.array(latencies) * 1000
+    return {
+        "ops": len(latencies),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "throughput": round(len(latencies) / elapsed, 2),
+    }
+
+
+def _measure(fn, calls):
+    latencies = []
+    start = time.perf_counter()
+    for kwargs in calls:
+        call_start = time.perf_counter()
+        fn(**kwargs)
+        latencies.append(time.perf_counter() - call_start)
+    return _summary(latencies, time.perf_counter() - start)
+
+
+async def _ameasure(fn, calls, concurrency):
+    latencies = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def timed(kwargs):
+        async with semaphore:
+            call_start = time.perf_counter()
+            await fn(**kwargs)
+            latencies.append(time.perf_counter() - call_start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(kwargs) for kwargs in calls))
+    return _summary(latencies, time.perf_counter() - start)
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+
+def _memory_config(store: str, collection_name: str, data_dir: str, dims: int):
+    from mem0.configs.base import MemoryConfig
+
+    store_config = {"collection_name": collection_name, "path": os.path.join(data_dir, store)}
+    if store in ("faiss", "qdrant"):
+        store_config["embedding_model_dims"] = dims
+    return MemoryConfig(
+        vector_store={"provider": store, "config": store_config},
+        history_db_path=os.path.join(data_dir, f"history_{collection_name}.db"),
+    )
+
+
+def _create_memory(memory_class, config, args):
+    """Build a Memory or AsyncMemory wired to the deterministic embedding model and LLM."""
+    from unittest.mock import patch
+
+    from fakes import FakeLLM, HashEmbeddings
+
+    from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+    embedder = HashEmbeddings(embedding_dims=args.dims)
+    llm = FakeLLM(latency=args.llm_latency_ms / 1000)
+    with patch.object(EmbedderFactory, "create", return_value=embedder):
+        with patch.object(LlmFactory, "create", return_value=llm):
+            return memory_class(config)
+
+
+def run_store(store: str, args) -> dict:
+    """Run every operation against one vector store and return its metrics."""
+    data_dir = tempfile.mkdtemp(prefix=f"mem0-bench-{store}-")
+    os.environ["MEM0_DIR"] = data_dir
+    os.environ.setdefault("MEM0_TELEMETRY", "False")
+
+    from mem0.memory.main import AsyncMemory, Memory
+
+    workload = _workload(args.ops, args.users)
+    users = sorted({user_id for user_id, _, _ in workload})
+    operations = {}
+
+    memory = _create_memory(Memory, _memory_config(store, "bench", data_dir, args.dims), args)
+    operations["add_raw"] = _measure(
+        memory.add, [{"messages": message, "user_id": user_id, "infer": False} for user_id, message, _ in workload]
+    )
+
+    added = []
+    calls = [{"messages": message, "user_id": user_id} for user_id, message, _ in _workload(args.ops, args.users, 1)]
+    operations["add_infer"] = _measure(lambda **kwargs: added.extend(memory.add(**kwargs)["results"]), calls)
+    operations["search"] = _measure(
+        memory.search, [{"query": query, "user_id": user_id, "limit": 10} for user_id, _, query in workload]
+    )
+    operations["get_all"] = _measure(memory.get_all, [{"user_id": user_id, "limit": 100} for user_id, _, _ in workload])
+    updated = [item for item in added if item["event"] == "ADD"][: args.ops]
+    operations["update"] = _measure(
+        memory.update, [{"memory_id": item["id"], "data": f"{item['memory']} again"} for item in updated]
+    )
+    operations["delete_all"] = _measure(memory.delete_all, [{"user_id": user_id} for user_id in users])
+
+    async_memory = _create_memory(AsyncMemory, _memory_config(store, "bench_async", data_dir, args.dims), args)
+    operations["async_add"] = asyncio.run(
+        _ameasure(
+            async_memory.add,
+            [{"messages": message, "user_id": user_id} for user_id, message, _ in workload],
+            args.concurrency,
+        )
+    )
+    operations["async_search"] = asyncio.run(
+        _ameasure(
+            async_memory.search,
+            [{"query": query, "user_id": user_id, "limit": 10} for user_id, _, query in workload],
+            args.concurrency,
+        )
+    )
+    return {"operations": operations, "peak_rss_mb": _peak_rss_mb()}
+
+
+def _run_worker(store: str, args) -> dict:
+    """Run one store in a fresh interpreter and parse the metrics it prints."""
+    command = [sys.executable, os.path.abspath(__file__), "--worker", store]
+    for setting in WORKLOAD_SETTINGS:
+        command += [f"--{setting.replace('_', '-')}", str(getattr(args, setting))]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark of {store} failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _changes(current: dict, baseline: dict, tolerance: float):
+    """
+    Relative change of every metric present in both runs.
+
+    Returns:
+        list: (store, operation, metric, baseline value, current value, change, regressed) tuples.
+    """
+    changes = []
+    for store, result in current["stores"].items():
+        baseline_result = baseline.get("stores", {}).get(store)
+        if not baseline_result:
+            continue
+        metrics = [
+            (operation, metric, value, baseline_result["operations"].get(operation, {}).get(metric))
+            for operation, values in result["operations"].items()
+            for metric, value in values.items()
+            if metric != "ops"
+        ]
+        metrics.append(("process", "peak_rss_mb", result["peak_rss_mb"], baseline_result.get("peak_rss_mb")))
+        for operation, metric, value, baseline_value in metrics:
+            if not baseline_value:
+                continue
+            change = (value - baseline_value) / baseline_value
+            # Throughput regresses when it drops, latencies and memory when they grow
+            regressed = change < -tolerance if metric == "throughput" else change > tolerance
+            changes.append((store, operation, metric, baseline_value, value, change, regressed))
+    return changes
+
+
+def _print_results(results: dict, changes):
+    by_key = {(store, operation, metric): change for store, operation, metric, _, _, change, _ in changes}
+
+    def cell(store, operation, metric, value):
+        change = by_key.get((store, operation, metric))
+        return f"{value:.2f}" if change is None else f"{value:.2f} ({change:+.0%})"
+
+    header = f"{'store':<8} {'operation':<14} {'p50 ms':>18} {'p99 ms':>18} {'ops/s':>18}"
+    print(header)
+    print("-" * len(header))
+    for store, result in results["stores"].items():
+        for operation, values in result["operations"].items():
+            print(
+                f"{store:<8} {operation:<14} "
+                f"{cell(store, operation, 'p50_ms', values['p50_ms']):>18} "
+                f"{cell(store, operation, 'p99_ms', values['p99_ms']):>18} "
+                f"{cell(store, operation, 'throughput', values['throughput']):>18}"
+            )
+        print(f"{store:<8} {'peak RSS MB':<14} {cell(store, 'process', 'peak_rss_mb', result['peak_rss_mb']):>18}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Memory hot path against local vector stores")
+    parser.add_argument("--stores", nargs="+", choices=STORES, default=list(STORES), help="Vector stores to run")
+    parser.add_argument("--ops", type=int, default=200, help="Calls per operation")
+    parser.add_argument("--users", type=int, default=10, help="Number of users the memories are spread over")
+    parser.add_argument("--dims", type=int, default=1536, help="Embedding dimensions")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent calls in the async operations")
+    parser.add_argument("--llm-latency-ms", type=float, default=0.0, help="Simulated latency of each LLM call")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline to compare to")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the results to the baseline file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Relative change reported as a regression")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit with 1 when a metric regressed")
+    parser.add_argument("--output", help="Also write the results to this JSON file")
+    parser.add_argument("--worker", choices=STORES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_store(args.worker, args)))
+        return
+
+    results = {
+        "settings": {setting: getattr(args, setting) for setting in WORKLOAD_SETTINGS},
+        "stores": {store: _run_worker(store, args) for store in args.stores},
+    }
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline["settings"] != results["settings"]:
+            print(f"Baseline settings {baseline['settings']} differ from this run, the comparison is indicative only")
+
+    changes = _changes(results, baseline, args.tolerance) if baseline else []
+    _print_results(results, changes)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    regressions = [change for change in changes if change[-1]]
+    if regressions:
+        print(f"\n{len(regressions)} metrics regressed by more than {args.tolerance:.0%}:")
+        for store, operation, metric, baseline_value, value, change, _ in regressions:
+            print(f"  {store} {operation} {metric}: {baseline_value} -> {value} ({change:+.0%})")
+        if args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,48 @@ class MemoryItem(BaseModel):
     updated_at: Optional[str] = Field(None, description="The timestamp when the memory was updated")
 
 
+class HistoryStoreConfig(BaseModel):
+    provider: str = Field(
+        description="Provider of the history store (e.g., 'sqlite', 'postgres', 'memory')",
+        default="sqlite",
+    )
+    config: Optional[Dict] = Field(
+        description="Configuration for the specific history store. The sqlite store defaults to history_db_path",
+        default=None,
+    )
+
+
+class RateLimitConfig(BaseModel):
+    requests_per_second: float = Field(description="Sustained request rate allowed for the provider", gt=0)
+    burst: Optional[int] = Field(
+        description="Requests allowed at once after an idle period. Defaults to one second of requests",
+        default=None,
+        ge=1,
+    )
+
+
+class ConcurrencyConfig(BaseModel):
+    max_embedding_calls: Optional[int] = Field(
+        description="Maximum concurrent embedding requests of an AsyncMemory instance. Unbounded if not set",
+        default=None,
+        ge=1,
+    )
+    max_llm_calls: Optional[int] = Field(
+        description="Maximum concurrent LLM requests of an AsyncMemory instance. Unbounded if not set",
+        default=None,
+        ge=1,
+    )
+    max_vector_store_calls: Optional[int] = Field(
+        description="Maximum concurrent vector store calls of an AsyncMemory instance. Unbounded if not set",
+        default=None,
+        ge=1,
+    )
+    rate_limits: Dict[str, RateLimitConfig] = Field(
+        description="Token bucket rate limits by provider name (e.g. 'openai'), shared by the AsyncMemory instances with the same limits",
+        default_factory=dict,
+    )
+
+
 class MemoryConfig(BaseModel):
     vector_store: VectorStoreConfig = Field(
         description="Configuration for the vector store",
@@ -43,6 +85,10 @@ class MemoryConfig(BaseModel):
         description="Path to the history database",
         default=os.path.join(mem0_dir, "history.db"),
     )
+    history_store: HistoryStoreConfig = Field(
+        description="Configuration for the history store",
+        default_factory=HistoryStoreConfig,
+    )
     graph_store: GraphStoreConfig = Field(
         description="Configuration for the graph",
         default_factory=GraphStoreConfig,
@@ -59,6 +105,14 @@ class MemoryConfig(BaseModel):
         description="Custom prompt for the update memory",
         default=None,
     )
+    max_workers: int = Field(
+        description="Maximum number of memory actions (ADD/UPDATE/DELETE) applied concurrently during add",
+        default=8,
+    )
+    concurrency: ConcurrencyConfig = Field(
+        description="Concurrency and rate limits of the provider calls made by AsyncMemory",
+        default_factory=ConcurrencyConfig,
+    )
 
 
 class AzureConfig(BaseModel):
@@ -2,6 +2,8 @@ from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from mem0.vector_stores.configs import QuantizationConfig
+
 
 class FAISSConfig(BaseModel):
     collection_name: str = Field("mem0", description="Default name for the collection")
@@ -13,6 +15,23 @@ class FAISSConfig(BaseModel):
         False, description="Whether to normalize L2 vectors (only applicable for euclidean distance)"
     )
     embedding_model_dims: int = Field(1536, description="Dimension of the embedding vector")
+    index_type: str = Field("flat", description="Index structure to use. Options: 'flat', 'ivf', 'hnsw'")
+    nlist: int = Field(100, description="Number of IVF clusters (only applicable for the ivf index type)")
+    nprobe: int = Field(10, description="Number of IVF clusters searched per query (only applicable for ivf)")
+    hnsw_m: int = Field(32, description="Number of neighbors per HNSW node (only applicable for hnsw)")
+    ef_construction: int = Field(40, description="HNSW candidate list size at build time (only applicable for hnsw)")
+    ef_search: int = Field(16, description="HNSW candidate list size at query time (only applicable for hnsw)")
+    persistence: str = Field(
+        "snapshot",
+        description="Persistence mode. Options: 'snapshot' (rewrite on every change), 'wal' (incremental log + checkpoints)",
+    )
+    checkpoint_interval: float = Field(
+        60.0, description="Seconds after which logged changes are checkpointed into the index (only for wal)"
+    )
+    checkpoint_batch_size: int = Field(
+        1000, description="Number of logged vector changes that triggers a checkpoint (only for wal)"
+    )
+    quantization: Optional[QuantizationConfig] = Field(None, description="Quantized storage of the vectors")
 
     @model_validator(mode="before")
     @classmethod
@@ -22,6 +41,17 @@ class FAISSConfig(BaseModel):
             raise ValueError("Invalid distance_strategy. Must be one of: 'euclidean', 'inner_product', 'cosine'")
         return values
 
+    @model_validator(mode="before")
+    @classmethod
+    def validate_index_options(cls, values: Dict[str, Any]) -> Dict[str, Any]:
+        index_type = values.get("index_type")
+        if index_type and index_type not in ["flat", "ivf", "hnsw"]:
+            raise ValueError("Invalid index_type. Must be one of: 'flat', 'ivf', 'hnsw'")
+        persistence = values.get("persistence")
+        if persistence and persistence not in ["snapshot", "wal"]:
+            raise ValueError("Invalid persistence. Must be one of: 'snapshot', 'wal'")
+        return values
+
     @model_validator(mode="before")
     @classmethod
     def validate_extra_fields(cls, values: Dict[str, Any]) -> Dict[str, Any]:
@@ -1,7 +1,9 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from mem0.vector_stores.configs import QuantizationConfig
+
 
 class PGVectorConfig(BaseModel):
     dbname: str = Field("postgres", description="Default name for the database")
@@ -16,7 +18,16 @@ class PGVectorConfig(BaseModel):
     # New SSL and connection options
     sslmode: Optional[str] = Field(None, description="SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')")
     connection_string: Optional[str] = Field(None, description="PostgreSQL connection string (overrides individual connection parameters)")
-    connection_pool: Optional[Any] = Field(None, description="psycopg2 connection pool object (overrides connection string and individual parameters)")
+    connection_pool: Optional[Any] = Field(None, description="psycopg_pool or psycopg2 connection pool object (overrides connection string and individual parameters)")
+    minconn: int = Field(1, description="Minimum number of connections kept in the pool")
+    maxconn: int = Field(5, description="Maximum number of connections in the pool")
+    hnsw_m: Optional[int] = Field(None, description="Max connections per node of the HNSW index (pgvector default: 16)")
+    hnsw_ef_construction: Optional[int] = Field(None, description="Candidate list size when building the HNSW index (pgvector default: 64)")
+    hnsw_ef_search: Optional[int] = Field(None, description="Candidate list size when searching the HNSW index (pgvector default: 40)")
+    hnsw_iterative_scan: Optional[Literal["strict_order", "relaxed_order"]] = Field(
+        None, description="Keep scanning the HNSW index until enough rows pass the filters (requires pgvector 0.8+)"
+    )
+    quantization: Optional[QuantizationConfig] = Field(None, description="Quantized storage of the vectors")
 
     @model_validator(mode="before")
     def check_auth_and_connection(cls, values):
@@ -2,6 +2,8 @@ from typing import Any, ClassVar, Dict, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
+from mem0.vector_stores.configs import QuantizationConfig
+
 
 class QdrantConfig(BaseModel):
     from qdrant_client import QdrantClient
@@ -17,6 +19,7 @@ class QdrantConfig(BaseModel):
     url: Optional[str] = Field(None, description="Full URL for Qdrant server")
     api_key: Optional[str] = Field(None, description="API key for Qdrant server")
     on_disk: Optional[bool] = Field(False, description="Enables persistent storage")
+    quantization: Optional[QuantizationConfig] = Field(None, description="Quantized storage of the vectors")
 
     @model_validator(mode="before")
     @classmethod
@@ -0,0 +1,228 @@
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Literal, Optional
+
+import numpy as np
+
+from mem0.embeddings.base import EmbeddingBase
+
+logger = logging.getLogger(__name__)
+
+
+class CachedEmbedder(EmbeddingBase):
+    """
+    Embedding cache wrapped around another embedder.
+
+    Vectors are cached under (provider, model, dims, memory_action, text hash) in a
+    bounded in-process LRU, optionally backed by a SQLite file so that the cache
+    survives restarts and is shared by workers on the same host. Persisted vectors
+    are stored as float32, the precision embedding providers produce.
+
+    Args:
+        embedder (EmbeddingBase): The embedder to cache.
+        provider (str, optional): Provider name used in cache keys. Defaults to the embedder class name.
+        max_size (int): Maximum number of vectors kept in memory. Defaults to 10000.
+        path (str, optional): Path of the SQLite file for the persistent tier. Disabled when None.
+    """
+
+    def __init__(
+        self,
+        embedder: EmbeddingBase,
+        provider: Optional[str] = None,
+        max_size: int = 10000,
+        path: Optional[str] = None,
+    ):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.embedder = embedder
+        self.config = embedder.config
+        self.provider = provider or type(embedder).__name__
+        self.max_size = max_size
+        self.path = os.path.expanduser(path) if path else None
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = None
+        if self.path:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB)")
+            self._connection.commit()
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper, e.g. provider clients
+        embedder = self.__dict__.get("embedder")
+        if embedder is None:
+            raise AttributeError(name)
+        return getattr(embedder, name)
+
+    def _cache_key(self, text: str, memory_action: Optional[str]) -> str:
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return "|".join(
+            [
+                self.provider,
+                str(getattr(self.config, "model", None)),
+                str(getattr(self.config, "embedding_dims", None)),
+                str(memory_action),
+                text_hash,
+            ]
+        )
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        """Insert into the LRU, evicting the least recently used entries. Caller holds the lock."""
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._cache.get(key)
+                if vector is not None:
+                    self._cache.move_to_end(key)
+                    found[key] = vector
+            self.hits += len(found)
+
+            disk_keys = [key for key in dict.fromkeys(keys) if key not in found]
+            if self._connection is not None and disk_keys:
+                placeholders = ", ".join("?" for _ in disk_keys)
+                rows = self._connection.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", disk_keys
+                ).fetchall()
+                for key, blob in rows:
+                    vector = np.frombuffer(blob, dtype=np.float32).tolist()
+                    self._remember(key, vector)
+                    found[key] = vector
+                self.disk_hits += len(rows)
+        return found
+
+    def _store(self, entries: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in entries.items():
+                self._remember(key, vector)
+            if self._connection is not None and entries:
+                try:
+                    self._connection.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [(key, np.asarray(vector, dtype=np.float32).tobytes()) for key, vector in entries.items()],
+                    )
+                    self._connection.commit()
+                except sqlite3.Error as e:
+                    # The persistent tier is best effort; the in-memory cache is already populated
+                    logger.warning(f"Failed to persist {len(entries)} embeddings: {e}")
+
+    def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embedding for the given text, from the cache when possible.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        key = self._cache_key(text, memory_action)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+
+        vector = self.embedder.embed(text, memory_action)
+        with self._lock:
+            self.misses += 1
+        self._store({key: vector})
+        return vector
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts, embedding only the ones not in the cache.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        keys = [self._cache_key(text, memory_action) for text in texts]
+        cached = self._lookup(keys)
+        missing = self._missing(keys, texts, cached)
+        if missing:
+            vectors = self.embedder.embed_batch(list(missing.values()), memory_action)
+            self._store_computed(missing, vectors, cached)
+        return [cached[key] for key in keys]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Async version of `embed`, awaiting the wrapped embedder on a miss."""
+        key = self._cache_key(text, memory_action)
+        cached = self._lookup([key])
+        if key in cached:
+            return cached[key]
+
+        vector = await self.embedder.aembed(text, memory_action)
+        with self._lock:
+            self.misses += 1
+        self._store({key: vector})
+        return vector
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """Async version of `embed_batch`, awaiting the wrapped embedder for the texts not in the cache."""
+        keys = [self._cache_key(text, memory_action) for text in texts]
+        cached = self._lookup(keys)
+        missing = self._missing(keys, texts, cached)
+        if missing:
+            vectors = await self.embedder.aembed_batch(list(missing.values()), memory_action)
+            self._store_computed(missing, vectors, cached)
+        return [cached[key] for key in keys]
+
+    @staticmethod
+    def _missing(keys: List[str], texts: List[str], cached: Dict[str, List[float]]) -> Dict[str, str]:
+        """Texts to embed by key, each distinct text once."""
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        return missing
+
+    def _store_computed(
+        self, missing: Dict[str, str], vectors: List[List[float]], cached: Dict[str, List[float]]
+    ) -> None:
+        computed = dict(zip(missing.keys(), vectors))
+        with self._lock:
+            self.misses += len(computed)
+        self._store(computed)
+        cached.update(computed)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache counters: in-memory hits, persistent-tier hits, misses and the current LRU size."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+            }
+
+    def clear(self) -> None:
+        """Drop all cached vectors, including the persistent tier."""
+        with self._lock:
+            self._cache.clear()
+            if self._connection is not None:
+                self._connection.execute("DELETE FROM embeddings")
+                self._connection.commit()
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
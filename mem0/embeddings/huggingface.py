@@ -39,3 +39,21 @@ class HuggingFaceEmbedding(EmbeddingBase):
             return self.client.embeddings.create(input=text, model="tei").data[0].embedding
         else:
             return self.model.encode(text, convert_to_numpy=True).tolist()
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using Hugging Face in a single request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        if self.config.huggingface_base_url:
+            response = self.client.embeddings.create(input=texts, model="tei")
+            return [item.embedding for item in response.data]
+        else:
+            return self.model.encode(texts, convert_to_numpy=True).tolist()
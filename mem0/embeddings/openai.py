@@ -2,10 +2,11 @@ import os
 import warnings
 from typing import Literal, Optional
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.embeddings.base import BaseEmbedderConfig
 from mem0.embeddings.base import EmbeddingBase
+from mem0.utils.loop_local import LoopLocal
 
 
 class OpenAIEmbedding(EmbeddingBase):
@@ -30,6 +31,13 @@ class OpenAIEmbedding(EmbeddingBase):
             )
 
         self.client = OpenAI(api_key=api_key, base_url=base_url)
+        # Created on first async call in each event loop
+        self._async_clients = LoopLocal(lambda: AsyncOpenAI(api_key=api_key, base_url=base_url))
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The async client of the running event loop."""
+        return self._async_clients.get()
 
     def embed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
         """
@@ -47,3 +55,55 @@ class OpenAIEmbedding(EmbeddingBase):
             .data[0]
             .embedding
         )
+
+    def embed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Get the embeddings for a list of texts using OpenAI in a single request.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        response = self.client.embeddings.create(
+            input=texts, model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return [item.embedding for item in response.data]
+
+    async def aembed(self, text, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Async version of `embed`, on the async OpenAI client.
+
+        Args:
+            text (str): The text to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vector.
+        """
+        text = text.replace("\n", " ")
+        response = await self.async_client.embeddings.create(
+            input=[text], model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return response.data[0].embedding
+
+    async def aembed_batch(self, texts, memory_action: Optional[Literal["add", "search", "update"]] = None):
+        """
+        Async version of `embed_batch`, on the async OpenAI client.
+
+        Args:
+            texts (list): The texts to embed.
+            memory_action (optional): The type of embedding to use. Must be one of "add", "search", or "update". Defaults to None.
+        Returns:
+            list: The embedding vectors, in the same order as `texts`.
+        """
+        if not texts:
+            return []
+        texts = [text.replace("\n", " ") for text in texts]
+        response = await self.async_client.embeddings.create(
+            input=texts, model=self.config.model, dimensions=self.config.embedding_dims
+        )
+        return [item.embedding for item in response.data]
@@ -0,0 +1,240 @@
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+_TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+Triple = Tuple[str, str, str]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase `text` and split it into words, treating underscores as separators (e.g. "works_at")."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class _CorpusStats:
+    """Document frequencies and lengths of the relations in one scope."""
+
+    def __init__(self):
+        self.documents: Dict[Triple, Counter] = {}
+        self.document_frequency: Counter = Counter()
+        self.total_length = 0
+        self.loaded_at = time.monotonic()
+        self._average_idf: Optional[float] = None
+
+    def add(self, triple: Triple) -> None:
+        if triple in self.documents:
+            return
+        terms = Counter(tokenize(" ".join(triple)))
+        self.documents[triple] = terms
+        self.document_frequency.update(terms.keys())
+        self.total_length += sum(terms.values())
+        self._average_idf = None
+
+    def remove(self, triple: Triple) -> None:
+        terms = self.documents.pop(triple, None)
+        if terms is None:
+            return
+        self.document_frequency.subtract(terms.keys())
+        for term in terms:
+            if self.document_frequency[term] <= 0:
+                del self.document_frequency[term]
+        self.total_length -= sum(terms.values())
+        self._average_idf = None
+
+    def idf(self, terms: List[str], epsilon: float) -> np.ndarray:
+        """Okapi IDF of `terms`, with negative values floored to `epsilon` times the average IDF."""
+        size = len(self.documents)
+        frequencies = np.array([self.document_frequency.get(term, 0) for term in terms], dtype=np.float64)
+        idf = np.log(size - frequencies + 0.5) - np.log(frequencies + 0.5)
+        if self._average_idf is None:
+            corpus_frequencies = np.fromiter(self.document_frequency.values(), dtype=np.float64)
+            self._average_idf = (
+                float(np.mean(np.log(size - corpus_frequencies + 0.5) - np.log(corpus_frequencies + 0.5)))
+                if corpus_frequencies.size
+                else 0.0
+            )
+        return np.where(idf < 0, epsilon * self._average_idf, idf)
+
+
+class BM25Reranker:
+    """
+    BM25 (Okapi) reranker for graph search results, with corpus statistics cached per scope.
+
+    Document frequencies and lengths are computed over all relations of a scope (user_id, and
+    optionally agent_id and run_id) rather than over the retrieved candidates alone, loaded
+    once and then kept up to date with `add` and `remove` as relations are written. Candidates
+    are scored at once from a term-frequency matrix restricted to the query terms.
+
+    At most `max_scopes` scopes are cached, the least recently searched is dropped first. With
+    `cache_ttl`, a scope is reloaded once its statistics are older than the TTL, so relations
+    written by other processes sharing the graph are eventually counted.
+
+    Args:
+        top_n (int): Number of relations returned by `rerank`. Defaults to 5.
+        k1 (float): Term frequency saturation. Defaults to 1.5.
+        b (float): Document length normalization. Defaults to 0.75.
+        epsilon (float): Floor of negative IDF values, as a fraction of the average IDF. Defaults to 0.25.
+        max_corpus_size (int): Maximum number of relations loaded to seed a scope. Defaults to 10000.
+        max_scopes (int): Maximum number of scopes whose statistics are cached. Defaults to 1000.
+        cache_ttl (float, optional): Seconds after which the statistics of a scope are reloaded.
+            Defaults to None, kept until evicted.
+    """
+
+    def __init__(
+        self,
+        top_n: int = 5,
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        max_corpus_size: int = 10000,
+        max_scopes: int = 1000,
+        cache_ttl: Optional[float] = None,
+    ):
+        if top_n <= 0:
+            raise ValueError(f"top_n must be positive, got {top_n}")
+        if max_scopes <= 0:
+            raise ValueError(f"max_scopes must be positive, got {max_scopes}")
+        self.top_n = top_n
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.max_corpus_size = max_corpus_size
+        self.max_scopes = max_scopes
+        self.cache_ttl = cache_ttl
+        # Least recently searched first
+        self._scopes: "OrderedDict[Tuple[Any, ...], _CorpusStats]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _scope_key(filters: Dict[str, Any]) -> Tuple[Any, ...]:
+        return tuple(filters.get(key) or None for key in SCOPE_KEYS)
+
+    def _matching_scopes(self, filters: Dict[str, Any]) -> List[_CorpusStats]:
+        """Cached scopes that include relations written with `filters`. Caller holds the lock."""
+        written = self._scope_key(filters)
+        return [
+            stats
+            for scope, stats in self._scopes.items()
+            if all(value is None or value == written[index] for index, value in enumerate(scope))
+        ]
+
+    def add(self, filters: Dict[str, Any], triples: Iterable[Triple]) -> None:
+        """Record relations written with `filters` in every cached scope that contains them."""
+        triples = list(triples)
+        with self._lock:
+            for stats in self._matching_scopes(filters):
+                for triple in triples:
+                    stats.add(triple)
+
+    def remove(self, filters: Dict[str, Any], triples: Iterable[Triple]) -> None:
+        """Forget deleted relations in every cached scope of the user of `filters`."""
+        # A relation deleted without agent_id or run_id may also be in narrower scopes of the user
+        triples = list(triples)
+        user_id = filters.get("user_id")
+        with self._lock:
+            for stats in [stats for scope, stats in self._scopes.items() if scope[0] == user_id]:
+                for triple in triples:
+                    stats.remove(triple)
+
+    def invalidate(self, filters: Optional[Dict[str, Any]] = None) -> None:
+        """Drop cached statistics of the scopes sharing the user of `filters`, or of every scope."""
+        with self._lock:
+            if filters is None:
+                self._scopes.clear()
+                return
+            for scope in [scope for scope in self._scopes if scope[0] == filters.get("user_id")]:
+                del self._scopes[scope]
+
+    def _stats(self, filters: Dict[str, Any], load_corpus: Optional[Callable[[], Iterable[Triple]]]) -> _CorpusStats:
+        key = self._scope_key(filters)
+        with self._lock:
+            stats = self._scopes.get(key)
+            if stats is not None and self.cache_ttl is not None and time.monotonic() - stats.loaded_at > self.cache_ttl:
+                del self._scopes[key]
+                stats = None
+            if stats is not None:
+                self._scopes.move_to_end(key)
+        if stats is not None or load_corpus is None:
+            return stats
+
+        # Load outside the lock, it usually queries the graph store
+        loaded = _CorpusStats()
+        for triple in load_corpus():
+            loaded.add(triple)
+        with self._lock:
+            stats = self._scopes.setdefault(key, loaded)
+            self._scopes.move_to_end(key)
+            while len(self._scopes) > self.max_scopes:
+                self._scopes.popitem(last=False)
+            return stats
+
+    def rerank(
+        self,
+        query: str,
+        candidates: List[Triple],
+        filters: Dict[str, Any],
+        load_corpus: Optional[Callable[[], Iterable[Triple]]] = None,
+        top_n: Optional[int] = None,
+    ) -> List[Triple]:
+        """
+        Return the `top_n` candidates with the highest BM25 score for `query`.
+
+        Args:
+            query (str): The search query.
+            candidates (list): (source, relationship, destination) triples to rank.
+            filters (dict): Scope of the search.
+            load_corpus (callable, optional): Returns every relation of the scope, called the first
+                time the scope is seen. The candidates are the corpus when not given or empty.
+            top_n (int, optional): Overrides the configured `top_n`.
+
+        Returns:
+            list: The best candidates, best first.
+        """
+        top_n = top_n or self.top_n
+        if not candidates:
+            return []
+
+        query_terms = Counter(tokenize(query))
+        documents = [Counter(tokenize(" ".join(candidate))) for candidate in candidates]
+
+        stats = self._stats(filters, load_corpus)
+        if stats is None or not stats.documents:
+            stats = _CorpusStats()
+            for candidate in candidates:
+                stats.add(tuple(candidate))
+
+        if not query_terms:
+            return candidates[:top_n]
+
+        terms = list(query_terms)
+        term_index = {term: index for index, term in enumerate(terms)}
+        # Sparse (document, term, count) entries of the query terms, scattered into a dense
+        # documents x query terms matrix; the other terms do not contribute to the score
+        rows, columns, counts = [], [], []
+        for row, document in enumerate(documents):
+            for term, count in document.items():
+                column = term_index.get(term)
+                if column is not None:
+                    rows.append(row)
+                    columns.append(column)
+                    counts.append(count)
+        frequencies = np.zeros((len(documents), len(terms)), dtype=np.float64)
+        frequencies[rows, columns] = counts
+
+        with self._lock:
+            idf = stats.idf(terms, self.epsilon)
+            average_length = stats.total_length / max(len(stats.documents), 1)
+        lengths = np.array([sum(document.values()) for document in documents], dtype=np.float64)
+        normalization = self.k1 * (1 - self.b + self.b * lengths / max(average_length, 1e-9))
+        weights = idf * np.array([query_terms[term] for term in terms], dtype=np.float64)
+        scores = (frequencies * (self.k1 + 1) / (frequencies + normalization[:, None])) @ weights
+
+        order = np.argsort(-scores, kind="stable")[:top_n]
+        return [candidates[index] for index in order]
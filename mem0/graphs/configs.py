@@ -1,6 +1,6 @@
 from typing import Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from mem0.llms.configs import LlmConfig
 
@@ -70,18 +70,39 @@ class NeptuneConfig(BaseModel):
             )
 
 
+class LocalGraphConfig(BaseModel):
+    path: Optional[str] = Field(
+        None, description="Path of the SQLite file storing the graph, ':memory:' for a transient graph"
+    )
+
+    model_config = ConfigDict(extra="forbid")
+
+
 class GraphStoreConfig(BaseModel):
     provider: str = Field(
-        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune')",
+        description="Provider of the data store (e.g., 'neo4j', 'memgraph', 'neptune', 'local')",
         default="neo4j",
     )
-    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig] = Field(
+    config: Union[Neo4jConfig, MemgraphConfig, NeptuneConfig, LocalGraphConfig] = Field(
         description="Configuration for the specific data store", default=None
     )
     llm: Optional[LlmConfig] = Field(description="LLM configuration for querying the graph store", default=None)
     custom_prompt: Optional[str] = Field(
         description="Custom prompt to fetch entities from the given text", default=None
     )
+    rerank_top_n: int = Field(
+        description="Number of relations returned by graph search after BM25 reranking", default=5, gt=0
+    )
+    rerank_cache_max_scopes: int = Field(
+        description="Maximum number of users (or agent and run scopes) whose BM25 statistics are cached",
+        default=1000,
+        gt=0,
+    )
+    rerank_cache_ttl: Optional[float] = Field(
+        description="Seconds after which the cached BM25 statistics of a scope are reloaded from the graph",
+        default=None,
+        gt=0,
+    )
 
     @field_validator("config")
     def validate_config(cls, v, values):
@@ -92,5 +113,7 @@ class GraphStoreConfig(BaseModel):
             return MemgraphConfig(**v.model_dump())
         elif provider == "neptune":
             return NeptuneConfig(**v.model_dump())
+        elif provider == "local":
+            return LocalGraphConfig(**v.model_dump())
         else:
             raise ValueError(f"Unsupported graph store provider: {provider}")
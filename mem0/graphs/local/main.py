@@ -0,0 +1,333 @@
+import asyncio
+import logging
+import os
+
+from mem0.configs.base import mem0_dir
+from mem0.graphs.local.store import LocalGraphStore
+from mem0.memory.utils import format_entities
+
+from mem0.graphs.tools import (
+    DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+    DELETE_MEMORY_TOOL_GRAPH,
+    EXTRACT_ENTITIES_STRUCT_TOOL,
+    EXTRACT_ENTITIES_TOOL,
+    RELATIONS_STRUCT_TOOL,
+    RELATIONS_TOOL,
+)
+from mem0.graphs.bm25 import BM25Reranker
+from mem0.graphs.pipeline import aplan_graph_update, plan_graph_update
+from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
+from mem0.utils.factory import EmbedderFactory, LlmFactory
+
+logger = logging.getLogger(__name__)
+
+
+def _relation_triples(results):
+    """(source, relationship, target) triples of per-item relationship results."""
+    return [(row["source"], row["relationship"], row["target"]) for rows in results for row in rows]
+
+
+class MemoryGraph:
+    """
+    Graph memory stored in-process, in a SQLite file, with no external graph service.
+
+    Follows the same add/search/get_all/delete_all contract as the Neo4j graph memory.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        path = self.config.graph_store.config.path or os.path.join(mem0_dir, "graph.db")
+        self.graph = LocalGraphStore(path)
+        self.embedding_model = EmbedderFactory.create(
+            self.config.embedder.provider, self.config.embedder.config, self.config.vector_store.config
+        )
+
+        self.llm_provider = "openai_structured"
+        if self.config.llm.provider:
+            self.llm_provider = self.config.llm.provider
+        if self.config.graph_store.llm:
+            self.llm_provider = self.config.graph_store.llm.provider
+
+        self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
+        self.user_id = None
+        self.threshold = 0.7
+        self.reranker = BM25Reranker(
+            top_n=self.config.graph_store.rerank_top_n,
+            max_scopes=self.config.graph_store.rerank_cache_max_scopes,
+            cache_ttl=self.config.graph_store.rerank_cache_ttl,
+        )
+
+    def add(self, data, filters):
+        """
+        Adds data to the graph.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = plan_graph_update(self, data, filters)
+
+        deleted_entities = self._delete_entities(to_be_deleted, filters)
+        added_entities = self._add_entities(to_be_added, filters, entity_type_map)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
+    async def aadd(self, data, filters):
+        """
+        Adds data to the graph asynchronously.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = await aplan_graph_update(self, data, filters)
+
+        deleted_entities = await asyncio.to_thread(self._delete_entities, to_be_deleted, filters)
+        added_entities = await asyncio.to_thread(self._add_entities, to_be_added, filters, entity_type_map)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
+    def search(self, query, filters, limit=100):
+        """
+        Search for memories and related graph data.
+
+        Args:
+            query (str): Query to search for.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            limit (int): The maximum number of nodes and relationships to retrieve. Defaults to 100.
+
+        Returns:
+            list: The relationships most relevant to the query, reranked with BM25.
+        """
+        entity_type_map = self._retrieve_nodes_from_data(query, filters)
+        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters, limit=limit)
+
+        if not search_output:
+            return []
+
+        candidates = [(item["source"], item["relationship"], item["destination"]) for item in search_output]
+        reranked_results = self.reranker.rerank(
+            query, candidates, filters, load_corpus=lambda: self._load_rerank_corpus(filters)
+        )
+
+        search_results = []
+        for item in reranked_results:
+            search_results.append({"source": item[0], "relationship": item[1], "destination": item[2]})
+
+        logger.info(f"Returned {len(search_results)} search results")
+
+        return search_results
+
+    def delete_all(self, filters):
+        self.graph.delete_nodes(filters)
+        self.reranker.invalidate(filters)
+
+    def get_all(self, filters, limit=100):
+        """
+        Retrieves all relationships whose nodes match the filters.
+
+        Args:
+            filters (dict): A dictionary containing filters to be applied during the retrieval.
+            limit (int): The maximum number of relationships to retrieve. Defaults to 100.
+
+        Returns:
+            list: Dictionaries with the 'source', 'relationship' and 'target' of each relationship.
+        """
+        final_results = self.graph.get_relations(filters, limit=limit)
+        logger.info(f"Retrieved {len(final_results)} relationships")
+        return final_results
+
+    def _load_rerank_corpus(self, filters):
+        """All relations of the scope, seeding the reranker statistics."""
+        relations = self.get_all(filters, limit=self.reranker.max_corpus_size)
+        return [(relation["source"], relation["relationship"], relation["target"]) for relation in relations]
+
+    def _retrieve_nodes_from_data(self, data, filters):
+        """Extracts all the entities mentioned in the query."""
+        _tools = [EXTRACT_ENTITIES_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [EXTRACT_ENTITIES_STRUCT_TOOL]
+        search_results = self.llm.generate_response(
+            messages=[
+                {
+                    "role": "system",
+                    "content": f"You are a smart assistant who understands entities and their types in a given text. If user message contains self reference such as 'I', 'me', 'my' etc. then use {filters['user_id']} as the source entity. Extract all the entities from the text. ***DO NOT*** answer the question itself if the given text is a question.",
+                },
+                {"role": "user", "content": data},
+            ],
+            tools=_tools,
+        )
+
+        entity_type_map = {}
+
+        try:
+            for tool_call in search_results["tool_calls"]:
+                if tool_call["name"] != "extract_entities":
+                    continue
+                for item in tool_call["arguments"]["entities"]:
+                    entity_type_map[item["entity"]] = item["entity_type"]
+        except Exception as e:
+            logger.exception(
+                f"Error in search tool: {e}, llm_provider={self.llm_provider}, search_results={search_results}"
+            )
+
+        entity_type_map = {k.lower().replace(" ", "_"): v.lower().replace(" ", "_") for k, v in entity_type_map.items()}
+        logger.debug(f"Entity type map: {entity_type_map}\n search_results={search_results}")
+        return entity_type_map
+
+    def _establish_nodes_relations_from_data(self, data, filters, entity_type_map):
+        """Establish relations among the extracted nodes."""
+
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+        if filters.get("run_id"):
+            user_identity += f", run_id: {filters['run_id']}"
+
+        system_content = EXTRACT_RELATIONS_PROMPT.replace("USER_ID", user_identity)
+        if self.config.graph_store.custom_prompt:
+            system_content = system_content.replace("CUSTOM_PROMPT", f"4. {self.config.graph_store.custom_prompt}")
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": data},
+            ]
+        else:
+            messages = [
+                {"role": "system", "content": system_content},
+                {"role": "user", "content": f"List of entities: {list(entity_type_map.keys())}. \n\nText: {data}"},
+            ]
+
+        _tools = [RELATIONS_TOOL]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [RELATIONS_STRUCT_TOOL]
+
+        extracted_entities = self.llm.generate_response(
+            messages=messages,
+            tools=_tools,
+        )
+
+        entities = []
+        if extracted_entities.get("tool_calls"):
+            entities = extracted_entities["tool_calls"][0].get("arguments", {}).get("entities", [])
+
+        entities = self._remove_spaces_from_entities(entities)
+        logger.debug(f"Extracted entities: {entities}")
+        return entities
+
+    def _search_graph_db(self, node_list, filters, limit=100):
+        """
+        Search similar nodes among and their respective incoming and outgoing relations.
+
+        Relations reached from several query nodes are returned once, with their highest similarity.
+        """
+        if not node_list:
+            return []
+
+        node_list = list(dict.fromkeys(node_list))
+        embeddings = self.embedding_model.embed_batch(node_list)
+        matches = self.graph.nearest(embeddings, filters, self.threshold)
+
+        result_relations = {}
+        for query_node, nodes in zip(node_list, matches):
+            relations = []
+            for node_id, similarity in nodes:
+                for relation in self.graph.neighborhood(node_id, filters):
+                    relations.append({"query_node": query_node, **relation, "similarity": similarity})
+            relations.sort(key=lambda relation: relation["similarity"], reverse=True)
+            for relation in relations[:limit]:
+                existing = result_relations.get(relation["relation_id"])
+                if existing is None or relation["similarity"] > existing["similarity"]:
+                    result_relations[relation["relation_id"]] = relation
+        return sorted(result_relations.values(), key=lambda relation: relation["similarity"], reverse=True)
+
+    def _get_delete_entities_from_search_output(self, search_output, data, filters):
+        """Get the entities to be deleted from the search output."""
+        search_output_string = format_entities(search_output)
+
+        # Compose user identification string for prompt
+        user_identity = f"user_id: {filters['user_id']}"
+        if filters.get("agent_id"):
+            user_identity += f", agent_id: {filters['agent_id']}"
+        if filters.get("run_id"):
+            user_identity += f", run_id: {filters['run_id']}"
+
+        system_prompt, user_prompt = get_delete_messages(search_output_string, data, user_identity)
+
+        _tools = [DELETE_MEMORY_TOOL_GRAPH]
+        if self.llm_provider in ["azure_openai_structured", "openai_structured"]:
+            _tools = [
+                DELETE_MEMORY_STRUCT_TOOL_GRAPH,
+            ]
+
+        memory_updates = self.llm.generate_response(
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt},
+            ],
+            tools=_tools,
+        )
+
+        to_be_deleted = []
+        for item in memory_updates.get("tool_calls", []):
+            if item.get("name") == "delete_graph_memory":
+                to_be_deleted.append(item.get("arguments"))
+        # Clean entities formatting
+        to_be_deleted = self._remove_spaces_from_entities(to_be_deleted)
+        logger.debug(f"Deleted relationships: {to_be_deleted}")
+        return to_be_deleted
+
+    def _delete_entities(self, to_be_deleted, filters):
+        """Delete the entities from the graph."""
+        results = [
+            self.graph.delete_relation(item["source"], item["relationship"], item["destination"], filters)
+            for item in to_be_deleted
+        ]
+        self.reranker.remove(filters, _relation_triples(results))
+        return results
+
+    def _add_entities(self, to_be_added, filters, entity_type_map):
+        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        if not to_be_added:
+            return []
+
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+
+        # search for the nodes with the closest embeddings
+        matches = self.graph.nearest([embeddings[name] for name in names], filters, threshold=0.9)
+        resolved = {name: nodes[0][0] for name, nodes in zip(names, matches) if nodes}
+
+        relations = []
+        for item in to_be_added:
+            source = item["source"]
+            destination = item["destination"]
+            relations.append(
+                {
+                    "source": source,
+                    "source_id": resolved.get(source),
+                    "source_type": entity_type_map.get(source, "__User__"),
+                    "source_embedding": embeddings[source],
+                    "relationship": item["relationship"],
+                    "destination": destination,
+                    "destination_id": resolved.get(destination),
+                    "destination_type": entity_type_map.get(destination, "__User__"),
+                    "destination_embedding": embeddings[destination],
+                }
+            )
+        results = [[result] for result in self.graph.add_relations(relations, filters)]
+        self.reranker.add(filters, _relation_triples(results))
+        return results
+
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
+
+    def reset(self):
+        """Reset the graph by clearing all nodes and relationships."""
+        logger.warning("Clearing graph...")
+        self.graph.reset()
+        self.reranker.invalidate()
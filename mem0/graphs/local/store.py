@@ -0,0 +1,398 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SCOPE_KEYS = ("user_id", "agent_id", "run_id")
+
+
+class LocalGraphStore:
+    """
+    Property graph persisted in SQLite and served from memory.
+
+    Nodes and relationships live in SQLite tables indexed on both relationship ends. Reads use
+    an in-memory copy: entity embeddings as one normalized NumPy matrix for vectorized cosine
+    lookups, and relationships as CSR adjacency arrays (outgoing and incoming) so neighborhood
+    queries are array slices. The arrays are rebuilt lazily after writes.
+
+    Nodes are scoped by user_id and optionally agent_id and run_id. As with the Neo4j store, a
+    filter without agent_id or run_id matches nodes regardless of those properties.
+
+    Args:
+        path (str): Path of the SQLite file, or ":memory:" for a transient graph. Defaults to ":memory:".
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path if path == ":memory:" else os.path.expanduser(path)
+        if self.path != ":memory:" and os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        if self.path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute("PRAGMA foreign_keys=ON")
+        self._create_schema()
+
+        self._nodes: Dict[int, Dict[str, Any]] = {}
+        self._relations: Dict[int, Tuple[int, str, int]] = {}
+        self._load()
+
+    def _create_schema(self) -> None:
+        with self._connection:
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS nodes (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    entity_type TEXT,
+                    user_id TEXT NOT NULL,
+                    agent_id TEXT,
+                    run_id TEXT,
+                    embedding BLOB,
+                    mentions INTEGER NOT NULL DEFAULT 1,
+                    created_at REAL
+                )
+                """
+            )
+            self._connection.execute("CREATE INDEX IF NOT EXISTS idx_nodes_user_name ON nodes (user_id, name)")
+            self._connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS relationships (
+                    id INTEGER PRIMARY KEY,
+                    source_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+                    relationship TEXT NOT NULL,
+                    destination_id INTEGER NOT NULL REFERENCES nodes (id) ON DELETE CASCADE,
+                    mentions INTEGER NOT NULL DEFAULT 1,
+                    created_at REAL,
+                    UNIQUE (source_id, relationship, destination_id)
+                )
+                """
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_relationships_destination ON relationships (destination_id)"
+            )
+
+    def _load(self) -> None:
+        """Load nodes and relationships from SQLite into memory."""
+        with self._lock:
+            self._nodes = {}
+            for node_id, name, user_id, agent_id, run_id, blob in self._connection.execute(
+                "SELECT id, name, user_id, agent_id, run_id, embedding FROM nodes"
+            ):
+                embedding = np.frombuffer(blob, dtype=np.float32) if blob is not None else None
+                self._nodes[node_id] = {
+                    "name": name,
+                    "user_id": user_id,
+                    "agent_id": agent_id,
+                    "run_id": run_id,
+                    "embedding": embedding,
+                }
+            self._relations = {
+                relation_id: (source_id, relationship, destination_id)
+                for relation_id, source_id, relationship, destination_id in self._connection.execute(
+                    "SELECT id, source_id, relationship, destination_id FROM relationships"
+                )
+            }
+            self._dirty = True
+
+    def _refresh(self) -> None:
+        """Rebuild the embedding matrix and CSR adjacency arrays if the graph changed. Caller holds the lock."""
+        if not self._dirty:
+            return
+
+        self._node_ids = np.fromiter(self._nodes.keys(), dtype=np.int64, count=len(self._nodes))
+        self._rows = {node_id: row for row, node_id in enumerate(self._node_ids.tolist())}
+        nodes = list(self._nodes.values())
+        self._names = [node["name"] for node in nodes]
+        self._scope = {key: np.array([node[key] for node in nodes], dtype=object) for key in SCOPE_KEYS}
+
+        dims = next((len(node["embedding"]) for node in nodes if node["embedding"] is not None), 0)
+        matrix = np.zeros((len(nodes), dims), dtype=np.float32)
+        for row, node in enumerate(nodes):
+            if node["embedding"] is not None and len(node["embedding"]) == dims:
+                matrix[row] = node["embedding"]
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self._matrix = np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+        self._has_embedding = norms[:, 0] > 0
+
+        self._relation_ids = np.fromiter(self._relations.keys(), dtype=np.int64, count=len(self._relations))
+        relations = list(self._relations.values())
+        self._relation_types = [relationship for _, relationship, _ in relations]
+        self._relation_sources = np.array([self._rows[source] for source, _, _ in relations], dtype=np.int64)
+        self._relation_destinations = np.array(
+            [self._rows[destination] for _, _, destination in relations], dtype=np.int64
+        )
+        self._out_indptr, self._out_relations = self._csr(self._relation_sources)
+        self._in_indptr, self._in_relations = self._csr(self._relation_destinations)
+        self._dirty = False
+
+    def _csr(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Offsets and relationship positions grouping relationships by node row."""
+        counts = np.bincount(rows, minlength=len(self._node_ids))
+        indptr = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        return indptr, np.argsort(rows, kind="stable")
+
+    def _scope_mask(self, filters: Dict[str, Any]) -> np.ndarray:
+        mask = np.ones(len(self._node_ids), dtype=bool)
+        for key in SCOPE_KEYS:
+            if filters.get(key):
+                mask &= self._scope[key] == filters[key]
+        return mask
+
+    @staticmethod
+    def _scope_clause(filters: Dict[str, Any], alias: str) -> Tuple[str, List[Any]]:
+        conditions, params = [], []
+        for key in SCOPE_KEYS:
+            if filters.get(key):
+                conditions.append(f"{alias}.{key} = ?")
+                params.append(filters[key])
+        return " AND ".join(conditions) or "1", params
+
+    def nearest(
+        self, embeddings: List[List[float]], filters: Dict[str, Any], threshold: float
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Find the nodes in scope whose embedding is at least `threshold` cosine-similar to each query.
+
+        Args:
+            embeddings (list): Query embeddings.
+            filters (dict): Scope of the candidate nodes.
+            threshold (float): Minimum cosine similarity, compared after rounding to 4 decimals.
+
+        Returns:
+            list: For each query, (node_id, similarity) pairs sorted by decreasing similarity.
+        """
+        with self._lock:
+            self._refresh()
+            if not len(embeddings) or not self._matrix.size:
+                return [[] for _ in embeddings]
+
+            queries = np.asarray(embeddings, dtype=np.float32)
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = np.divide(queries, norms, out=np.zeros_like(queries), where=norms > 0)
+            similarities = np.round(queries @ self._matrix.T, 4)
+            candidates = self._scope_mask(filters) & self._has_embedding
+            similarities[:, ~candidates] = -np.inf
+
+            results = []
+            for row in similarities:
+                matches = np.flatnonzero(row >= threshold)
+                matches = matches[np.argsort(-row[matches], kind="stable")]
+                results.append([(int(self._node_ids[match]), float(row[match])) for match in matches])
+            return results
+
+    def neighborhood(self, node_id: int, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Outgoing and incoming relationships of a node whose other end is in scope.
+
+        Returns:
+            list: Relationships with source, source_id, relationship, relation_id, destination and destination_id.
+        """
+        with self._lock:
+            self._refresh()
+            row = self._rows.get(node_id)
+            if row is None:
+                return []
+
+            in_scope = self._scope_mask(filters)
+            results = []
+            for indptr, positions, other_ends in (
+                (self._out_indptr, self._out_relations, self._relation_destinations),
+                (self._in_indptr, self._in_relations, self._relation_sources),
+            ):
+                for position in positions[indptr[row] : indptr[row + 1]]:
+                    if not in_scope[other_ends[position]]:
+                        continue
+                    source_row = self._relation_sources[position]
+                    destination_row = self._relation_destinations[position]
+                    results.append(
+                        {
+                            "source": self._names[source_row],
+                            "source_id": int(self._node_ids[source_row]),
+                            "relationship": self._relation_types[position],
+                            "relation_id": int(self._relation_ids[position]),
+                            "destination": self._names[destination_row],
+                            "destination_id": int(self._node_ids[destination_row]),
+                        }
+                    )
+            return results
+
+    def _merge_node(
+        self,
+        node_id: Optional[int],
+        name: str,
+        entity_type: Optional[str],
+        embedding: Optional[List[float]],
+        filters: Dict[str, Any],
+        now: float,
+    ) -> int:
+        """
+        Count a mention of a resolved node, or merge a node by name in scope. Caller holds the lock
+        inside a transaction.
+        """
+        if node_id is None:
+            scope_clause, scope_params = self._scope_clause(filters, "nodes")
+            row = self._connection.execute(
+                f"SELECT id FROM nodes WHERE name = ? AND {scope_clause} ORDER BY id LIMIT 1",
+                [name, *scope_params],
+            ).fetchone()
+            vector = np.asarray(embedding, dtype=np.float32) if embedding is not None else None
+            blob = vector.tobytes() if vector is not None else None
+            if row is None:
+                cursor = self._connection.execute(
+                    "INSERT INTO nodes (name, entity_type, user_id, agent_id, run_id, embedding, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (name, entity_type, filters["user_id"], filters.get("agent_id"), filters.get("run_id"), blob, now),
+                )
+                self._nodes[cursor.lastrowid] = {
+                    "name": name,
+                    "user_id": filters["user_id"],
+                    "agent_id": filters.get("agent_id"),
+                    "run_id": filters.get("run_id"),
+                    "embedding": vector,
+                }
+                return cursor.lastrowid
+
+            node_id = row[0]
+            if vector is not None:
+                self._connection.execute("UPDATE nodes SET embedding = ? WHERE id = ?", (blob, node_id))
+                self._nodes[node_id]["embedding"] = vector
+
+        self._connection.execute("UPDATE nodes SET mentions = mentions + 1 WHERE id = ?", (node_id,))
+        return node_id
+
+    def add_relations(self, relations: List[Dict[str, Any]], filters: Dict[str, Any]) -> List[Dict[str, str]]:
+        """
+        Merge relationships and their end nodes in a single transaction.
+
+        Each relation has "source", "relationship" and "destination" names, optional "source_type" and
+        "destination_type", optional "source_embedding" and "destination_embedding", and optional
+        "source_id" and "destination_id" of nodes it was resolved to.
+
+        Returns:
+            list: One {"source", "relationship", "target"} dict per relation.
+        """
+        results = []
+        with self._lock:
+            now = time.time()
+            try:
+                with self._connection:
+                    for relation in relations:
+                        endpoints = []
+                        for role in ("source", "destination"):
+                            endpoints.append(
+                                self._merge_node(
+                                    relation.get(f"{role}_id"),
+                                    relation[role],
+                                    relation.get(f"{role}_type"),
+                                    relation.get(f"{role}_embedding"),
+                                    filters,
+                                    now,
+                                )
+                            )
+                        source_id, destination_id = endpoints
+                        key = (source_id, relation["relationship"], destination_id)
+                        self._connection.execute(
+                            "INSERT INTO relationships (source_id, relationship, destination_id, created_at) "
+                            "VALUES (?, ?, ?, ?) "
+                            "ON CONFLICT (source_id, relationship, destination_id) "
+                            "DO UPDATE SET mentions = mentions + 1",
+                            (*key, now),
+                        )
+                        relation_id = self._connection.execute(
+                            "SELECT id FROM relationships WHERE source_id = ? AND relationship = ? AND destination_id = ?",
+                            key,
+                        ).fetchone()[0]
+                        self._relations[relation_id] = key
+                        results.append(
+                            {
+                                "source": self._nodes[source_id]["name"],
+                                "relationship": relation["relationship"],
+                                "target": self._nodes[destination_id]["name"],
+                            }
+                        )
+            except sqlite3.Error:
+                # Nodes and relationships recorded before the failure were rolled back with the transaction
+                self._load()
+                raise
+            self._dirty = True
+        return results
+
+    def delete_relation(
+        self, source: str, relationship: str, destination: str, filters: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
+        """
+        Delete the relationships between nodes named `source` and `destination` in scope.
+
+        Returns:
+            list: The deleted relationships as {"source", "target", "relationship"} dicts.
+        """
+        source_clause, source_params = self._scope_clause(filters, "s")
+        destination_clause, destination_params = self._scope_clause(filters, "d")
+        with self._lock:
+            with self._connection:
+                rows = self._connection.execute(
+                    f"""
+                    SELECT r.id, s.name, d.name FROM relationships r
+                    JOIN nodes s ON s.id = r.source_id
+                    JOIN nodes d ON d.id = r.destination_id
+                    WHERE s.name = ? AND r.relationship = ? AND d.name = ?
+                    AND {source_clause} AND {destination_clause}
+                    """,
+                    [source, relationship, destination, *source_params, *destination_params],
+                ).fetchall()
+                self._connection.executemany("DELETE FROM relationships WHERE id = ?", [(row[0],) for row in rows])
+            for row in rows:
+                self._relations.pop(row[0], None)
+            self._dirty = self._dirty or bool(rows)
+        return [{"source": row[1], "target": row[2], "relationship": relationship} for row in rows]
+
+    def get_relations(self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, str]]:
+        """Relationships whose both ends are in scope, as {"source", "relationship", "target"} dicts."""
+        source_clause, source_params = self._scope_clause(filters, "s")
+        destination_clause, destination_params = self._scope_clause(filters, "d")
+        with self._lock:
+            rows = self._connection.execute(
+                f"""
+                SELECT s.name, r.relationship, d.name FROM relationships r
+                JOIN nodes s ON s.id = r.source_id
+                JOIN nodes d ON d.id = r.destination_id
+                WHERE {source_clause} AND {destination_clause}
+                ORDER BY r.id
+                LIMIT ?
+                """,
+                [*source_params, *destination_params, limit],
+            ).fetchall()
+        return [
+            {"source": source, "relationship": relationship, "target": target} for source, relationship, target in rows
+        ]
+
+    def delete_nodes(self, filters: Dict[str, Any]) -> None:
+        """Delete the nodes in scope and their relationships."""
+        scope_clause, scope_params = self._scope_clause(filters, "nodes")
+        with self._lock:
+            with self._connection:
+                self._connection.execute(f"DELETE FROM nodes WHERE {scope_clause}", scope_params)
+            self._load()
+
+    def reset(self) -> None:
+        """Delete every node and relationship."""
+        with self._lock:
+            with self._connection:
+                self._connection.execute("DELETE FROM relationships")
+                self._connection.execute("DELETE FROM nodes")
+            self._load()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from abc import ABC, abstractmethod
 
@@ -16,6 +17,7 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
+from mem0.graphs.pipeline import aplan_graph_update, plan_graph_update
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
@@ -54,16 +56,28 @@ class NeptuneBase(ABC):
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        entity_type_map, to_be_added, to_be_deleted = plan_graph_update(self, data, filters)
 
         deleted_entities = self._delete_entities(to_be_deleted, filters["user_id"])
         added_entities = self._add_entities(to_be_added, filters["user_id"], entity_type_map)
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
+    async def aadd(self, data, filters):
+        """
+        Adds data to the graph asynchronously.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = await aplan_graph_update(self, data, filters)
+
+        deleted_entities = await asyncio.to_thread(self._delete_entities, to_be_deleted, filters["user_id"])
+        added_entities = await asyncio.to_thread(self._add_entities, to_be_added, filters["user_id"], entity_type_map)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
     def _retrieve_nodes_from_data(self, data, filters):
         """
         Extract all entities mentioned in the query.
@@ -0,0 +1,51 @@
+import asyncio
+import concurrent.futures
+
+
+def plan_graph_update(graph, data, filters):
+    """
+    Run the LLM and search stages of a graph add, overlapping the independent ones.
+
+    Once the entities are extracted, relation extraction (one LLM call) does not depend on the
+    neighborhood search and the deletion planning that follows it (a search and an LLM call), so
+    the two branches run concurrently.
+
+    Args:
+        graph: A graph memory implementing `_retrieve_nodes_from_data`, `_establish_nodes_relations_from_data`,
+            `_search_graph_db` and `_get_delete_entities_from_search_output`.
+        data (str): The data to add to the graph.
+        filters (dict): A dictionary containing filters to be applied during the addition.
+
+    Returns:
+        tuple: The entity type map, the relations to add and the relations to delete.
+    """
+    entity_type_map = graph._retrieve_nodes_from_data(data, filters)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        relations_future = executor.submit(graph._establish_nodes_relations_from_data, data, filters, entity_type_map)
+        to_be_deleted = _plan_deletions(graph, data, filters, entity_type_map)
+        to_be_added = relations_future.result()
+
+    return entity_type_map, to_be_added, to_be_deleted
+
+
+async def aplan_graph_update(graph, data, filters):
+    """
+    Async version of `plan_graph_update`, running the two independent branches as concurrent tasks.
+
+    Returns:
+        tuple: The entity type map, the relations to add and the relations to delete.
+    """
+    entity_type_map = await asyncio.to_thread(graph._retrieve_nodes_from_data, data, filters)
+
+    to_be_added, to_be_deleted = await asyncio.gather(
+        asyncio.to_thread(graph._establish_nodes_relations_from_data, data, filters, entity_type_map),
+        asyncio.to_thread(_plan_deletions, graph, data, filters, entity_type_map),
+    )
+
+    return entity_type_map, to_be_added, to_be_deleted
+
+
+def _plan_deletions(graph, data, filters, entity_type_map):
+    search_output = graph._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
+    return graph._get_delete_entities_from_search_output(search_output, data, filters)
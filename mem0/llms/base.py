@@ -1,15 +1,103 @@
+import asyncio
+import contextvars
+import functools
+import inspect
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Union
 
 from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.cache import LLMResponseCache, make_cache_key
+
+# Set while a cached generate_response runs, so that a provider delegating to a parent
+# implementation does not look the same request up twice.
+_in_cached_call = contextvars.ContextVar("mem0_llm_in_cached_call", default=False)
+
+
+def _with_response_cache(generate_response):
+    """
+    Wrap a provider's generate_response (or agenerate_response) so it consults `self.response_cache`
+    when one is set.
+    """
+    signature = inspect.signature(generate_response)
+
+    def cache_key(self, args, kwargs):
+        arguments = signature.bind(self, *args, **kwargs).arguments
+        extra = dict(arguments.get("kwargs") or {})
+        return make_cache_key(
+            model=self.config.model,
+            messages=arguments.get("messages"),
+            response_format=arguments.get("response_format", extra.pop("response_format", None)),
+            temperature=getattr(self.config, "temperature", None),
+            tools=arguments.get("tools", extra.pop("tools", None)),
+            tool_choice=arguments.get("tool_choice", extra.pop("tool_choice", None)),
+            extra=extra,
+        )
+
+    if inspect.iscoroutinefunction(generate_response):
+
+        @functools.wraps(generate_response)
+        async def async_wrapper(self, *args, **kwargs):
+            cache = getattr(self, "response_cache", None)
+            if cache is None or _in_cached_call.get():
+                return await generate_response(self, *args, **kwargs)
+
+            key = cache_key(self, args, kwargs)
+            found, response = cache.get(key)
+            if found:
+                return response
+
+            token = _in_cached_call.set(True)
+            try:
+                response = await generate_response(self, *args, **kwargs)
+            finally:
+                _in_cached_call.reset(token)
+            if response is not None:
+                cache.set(key, response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(generate_response)
+    def wrapper(self, *args, **kwargs):
+        cache = getattr(self, "response_cache", None)
+        if cache is None or _in_cached_call.get():
+            return generate_response(self, *args, **kwargs)
+
+        key = cache_key(self, args, kwargs)
+        found, response = cache.get(key)
+        if found:
+            return response
+
+        token = _in_cached_call.set(True)
+        try:
+            response = generate_response(self, *args, **kwargs)
+        finally:
+            _in_cached_call.reset(token)
+        if response is not None:
+            cache.set(key, response)
+        return response
+
+    return wrapper
 
 
 class LLMBase(ABC):
     """
     Base class for all LLM providers.
     Handles common functionality and delegates provider-specific logic to subclasses.
+
+    Setting `response_cache` to an `LLMResponseCache` (or passing "response_cache" in the
+    LlmFactory config) serves byte-identical requests from the cache instead of the provider.
     """
 
+    response_cache: Optional[LLMResponseCache] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ("generate_response", "agenerate_response"):
+            method = cls.__dict__.get(name)
+            if method is not None and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, name, _with_response_cache(method))
+
     def __init__(self, config: Optional[Union[BaseLlmConfig, Dict]] = None):
         """Initialize a base LLM class
 
@@ -58,6 +146,21 @@ class LLMBase(ABC):
         """
         pass
 
+    async def agenerate_response(self, messages: List[Dict[str, str]], **kwargs):
+        """
+        Async version of `generate_response`.
+
+        Providers with an async client override this. The default runs `generate_response` in a thread.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            **kwargs: The other arguments of the provider's `generate_response`.
+
+        Returns:
+            str or dict: The generated response.
+        """
+        return await asyncio.to_thread(self.generate_response, messages=messages, **kwargs)
+
     def _get_common_params(self, **kwargs) -> Dict:
         """
         Get common parameters that most providers use.
@@ -0,0 +1,259 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Writes between two recounts of the rows of a SQLite cache
+SQLITE_RECOUNT_INTERVAL = 1000
+
+
+def make_cache_key(
+    model: Any,
+    messages: List[Dict[str, Any]],
+    response_format: Any = None,
+    temperature: Optional[float] = None,
+    tools: Optional[List[Dict]] = None,
+    tool_choice: Optional[str] = None,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build a stable cache key for an LLM request.
+
+    Tools are part of the key because the same prompt with different tools can produce
+    a different response shape.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "response_format": response_format,
+        "temperature": temperature,
+    }
+    if tools:
+        payload["tools"] = tools
+        payload["tool_choice"] = tool_choice
+    if extra:
+        payload["extra"] = extra
+    serialized = json.dumps(payload, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(ABC):
+    """
+    Base class for exact-match LLM response caches.
+
+    Args:
+        max_size (int): Maximum number of cached responses. Defaults to 1000.
+        ttl (float, optional): Seconds a response stays valid. Never expires when None.
+    """
+
+    def __init__(self, max_size: int = 1000, ttl: Optional[float] = None):
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self._lock = threading.Lock()
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    @abstractmethod
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Tuple[bool, Any]: Whether the key was found, and the cached response.
+        """
+        pass
+
+    @abstractmethod
+    def set(self, key: str, response: Any) -> None:
+        """Store a response, evicting the oldest entries beyond `max_size`."""
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every cached response."""
+        pass
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Cache counters: hits, misses, size-based evictions and TTL expirations."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class InMemoryResponseCache(LLMResponseCache):
+    """LRU response cache held in process memory."""
+
+    def __init__(self, max_size: int = 1000, ttl: Optional[float] = None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[0]):
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def set(self, key: str, response: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteResponseCache(LLMResponseCache):
+    """
+    Response cache persisted in a SQLite file, shared across restarts and local workers.
+
+    Responses are stored as JSON, so they must be strings or JSON-serializable dicts.
+
+    Args:
+        path (str): Path of the SQLite file.
+        max_size (int): Maximum number of cached responses. Defaults to 1000.
+        ttl (float, optional): Seconds a response stays valid. Never expires when None.
+    """
+
+    def __init__(self, path: str, max_size: int = 1000, ttl: Optional[float] = None):
+        super().__init__(max_size=max_size, ttl=ttl)
+        self.path = os.path.expanduser(path)
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS llm_responses (key TEXT PRIMARY KEY, response TEXT, created_at REAL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_responses_created_at ON llm_responses (created_at)"
+        )
+        self._connection.commit()
+        self._count = self._count_rows()
+        self._writes_since_count = 0
+
+    def _count_rows(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[1]):
+                deleted = self._connection.execute("DELETE FROM llm_responses WHERE key = ?", (key,)).rowcount
+                self._connection.commit()
+                self._count = max(0, self._count - deleted)
+                self.expirations += 1
+                row = None
+            if row is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            return True, json.loads(row[0])
+
+    def set(self, key: str, response: Any) -> None:
+        try:
+            serialized = json.dumps(response)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Skipping LLM response cache write, response is not JSON-serializable: {e}")
+            return
+
+        with self._lock:
+            try:
+                # The row count is kept in memory rather than counted on every write, and recounted
+                # from time to time to pick up rows written by other workers sharing the file
+                self._writes_since_count += 1
+                if self._writes_since_count >= SQLITE_RECOUNT_INTERVAL:
+                    count = self._count_rows()
+                    self._writes_since_count = 0
+                else:
+                    count = self._count
+                exists = self._connection.execute("SELECT 1 FROM llm_responses WHERE key = ?", (key,)).fetchone()
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO llm_responses (key, response, created_at) VALUES (?, ?, ?)",
+                    (key, serialized, time.time()),
+                )
+                if exists is None:
+                    count += 1
+                evicted = 0
+                if count > self.max_size:
+                    evicted = self._connection.execute(
+                        "DELETE FROM llm_responses WHERE key IN "
+                        "(SELECT key FROM llm_responses ORDER BY created_at ASC LIMIT ?)",
+                        (count - self.max_size,),
+                    ).rowcount
+                self._connection.commit()
+                self._count = count - evicted
+                self.evictions += evicted
+            except sqlite3.Error as e:
+                self._connection.rollback()
+                logger.warning(f"Failed to cache LLM response: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM llm_responses")
+            self._connection.commit()
+            self._count = 0
+
+    def close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+def create_response_cache(config: Any) -> Optional[LLMResponseCache]:
+    """
+    Create a response cache from an LLM config's "response_cache" entry.
+
+    Args:
+        config: True for the in-memory defaults, or a dict with "backend" ("memory" or
+            "sqlite"), "max_size", "ttl" and, for sqlite, "path".
+
+    Returns:
+        LLMResponseCache or None when caching is disabled.
+    """
+    if not config:
+        return None
+    if isinstance(config, LLMResponseCache):
+        return config
+
+    options = {} if config is True else dict(config)
+    backend = options.pop("backend", "memory")
+    if backend == "memory":
+        return InMemoryResponseCache(**options)
+    if backend == "sqlite":
+        if "path" not in options:
+            raise ValueError("The sqlite LLM response cache requires a 'path'")
+        return SQLiteResponseCache(**options)
+    raise ValueError(f"Unsupported LLM response cache backend: {backend}")
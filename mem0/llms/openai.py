@@ -2,12 +2,13 @@ import json
 import os
 from typing import Dict, List, Optional, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from mem0.configs.llms.base import BaseLlmConfig
 from mem0.configs.llms.openai import OpenAIConfig
 from mem0.llms.base import LLMBase
 from mem0.memory.utils import extract_json
+from mem0.utils.loop_local import LoopLocal
 
 
 class OpenAILLM(LLMBase):
@@ -37,17 +38,25 @@ class OpenAILLM(LLMBase):
             self.config.model = "gpt-4o-mini"
 
         if os.environ.get("OPENROUTER_API_KEY"):  # Use OpenRouter
-            self.client = OpenAI(
-                api_key=os.environ.get("OPENROUTER_API_KEY"),
-                base_url=self.config.openrouter_base_url
+            client_params = {
+                "api_key": os.environ.get("OPENROUTER_API_KEY"),
+                "base_url": self.config.openrouter_base_url
                 or os.getenv("OPENROUTER_API_BASE")
                 or "https://openrouter.ai/api/v1",
-            )
+            }
         else:
             api_key = self.config.api_key or os.getenv("OPENAI_API_KEY")
             base_url = self.config.openai_base_url or os.getenv("OPENAI_BASE_URL") or "https://api.openai.com/v1"
+            client_params = {"api_key": api_key, "base_url": base_url}
 
-            self.client = OpenAI(api_key=api_key, base_url=base_url)
+        self.client = OpenAI(**client_params)
+        # Created on first async call in each event loop
+        self._async_clients = LoopLocal(lambda: AsyncOpenAI(**client_params))
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """The async client of the running event loop."""
+        return self._async_clients.get()
 
     def _parse_response(self, response, tools):
         """
@@ -100,6 +109,37 @@ class OpenAILLM(LLMBase):
         Returns:
             json: The generated response.
         """
+        params = self._request_params(messages, response_format, tools, tool_choice, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
+
+    async def agenerate_response(
+        self,
+        messages: List[Dict[str, str]],
+        response_format=None,
+        tools: Optional[List[Dict]] = None,
+        tool_choice: str = "auto",
+        **kwargs,
+    ):
+        """
+        Async version of `generate_response`, on the async OpenAI client.
+
+        Args:
+            messages (list): List of message dicts containing 'role' and 'content'.
+            response_format (str or object, optional): Format of the response. Defaults to "text".
+            tools (list, optional): List of tools that the model can call. Defaults to None.
+            tool_choice (str, optional): Tool choice method. Defaults to "auto".
+            **kwargs: Additional OpenAI-specific parameters.
+
+        Returns:
+            json: The generated response.
+        """
+        params = self._request_params(messages, response_format, tools, tool_choice, **kwargs)
+        response = await self.async_client.chat.completions.create(**params)
+        return self._parse_response(response, tools)
+
+    def _request_params(self, messages, response_format, tools, tool_choice, **kwargs) -> Dict:
+        """Parameters of the chat completion request."""
         # Get common parameters
         params = self._get_common_params(**kwargs)
         params.update(
@@ -131,5 +171,4 @@ class OpenAILLM(LLMBase):
             params["tools"] = tools
             params["tool_choice"] = tool_choice
 
-        response = self.client.chat.completions.create(**params)
-        return self._parse_response(response, tools)
+        return params
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import math
+import threading
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from mem0.configs.base import ConcurrencyConfig
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for async callers.
+
+    Callers reserve a token and sleep until it is available, so waiting callers are served
+    in arrival order and the request rate never exceeds `rate` after the initial burst.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self._lock = threading.Lock()
+        self.rate = rate
+        self.capacity = capacity or max(1, math.ceil(rate))
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+
+    def _reserve(self) -> float:
+        """Take a token and return how long to wait for it. Negative tokens are reservations."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+# Buckets are shared by every AsyncMemory of the process, as provider limits apply per API key, not per instance.
+# They are keyed by the limits too, so that an instance configured with other limits never changes those of the
+# existing instances; it gets a bucket of its own instead.
+_rate_limiters: Dict[Tuple[str, float, int], TokenBucket] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, rate: float, capacity: Optional[int] = None) -> TokenBucket:
+    """Return the token bucket shared by the instances limiting `provider` to the same rate and burst."""
+    key = (provider, rate, capacity or max(1, math.ceil(rate)))
+    with _rate_limiters_lock:
+        bucket = _rate_limiters.get(key)
+        if bucket is None:
+            bucket = _rate_limiters[key] = TokenBucket(rate, capacity)
+            if any(other[0] == provider for other in _rate_limiters if other != key):
+                logger.warning(
+                    f"Rate limits of {provider} differ between AsyncMemory instances, "
+                    f"each set of limits is enforced separately"
+                )
+        return bucket
+
+
+class CallLimiter:
+    """
+    Bounds the concurrency and rate of one kind of provider call (embedding, LLM, vector store)
+    and counts the calls waiting for a slot.
+
+    The semaphore is created per event loop, as asyncio primitives cannot be shared between loops.
+    """
+
+    def __init__(self, max_concurrent: Optional[int] = None, rate_limiter: Optional[TokenBucket] = None):
+        self.max_concurrent = max_concurrent
+        self.rate_limiter = rate_limiter
+        self._semaphores = weakref.WeakKeyDictionary()
+        self.waiting = 0
+        self.in_flight = 0
+        self.max_waiting = 0
+        self.calls = 0
+        self.wait_time = 0.0
+
+    def _semaphore(self) -> Optional[asyncio.Semaphore]:
+        if self.max_concurrent is None:
+            return None
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrent)
+        return semaphore
+
+    async def run(self, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await `call()` once a concurrency slot and a rate limit token are available."""
+        semaphore = self._semaphore()
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        started = time.monotonic()
+        try:
+            if semaphore is not None:
+                await semaphore.acquire()
+            try:
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire()
+            except BaseException:
+                if semaphore is not None:
+                    semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+            self.wait_time += time.monotonic() - started
+
+        self.in_flight += 1
+        self.calls += 1
+        try:
+            return await call()
+        finally:
+            self.in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "waiting": self.waiting,
+            "in_flight": self.in_flight,
+            "max_waiting": self.max_waiting,
+            "calls": self.calls,
+            "wait_seconds": round(self.wait_time, 6),
+        }
+
+
+def create_call_limiters(config: ConcurrencyConfig, providers: Dict[str, str]) -> Dict[str, CallLimiter]:
+    """
+    Build the limiters of an AsyncMemory instance.
+
+    Args:
+        config (ConcurrencyConfig): Concurrency and rate limits.
+        providers (dict): Provider name of each kind of call ("embedder", "llm", "vector_store").
+
+    Returns:
+        dict: A CallLimiter for each kind of call.
+    """
+    max_concurrent = {
+        "embedder": config.max_embedding_calls,
+        "llm": config.max_llm_calls,
+        "vector_store": config.max_vector_store_calls,
+    }
+    limiters = {}
+    for kind, provider in providers.items():
+        rate_limit = config.rate_limits.get(provider)
+        rate_limiter = (
+            get_rate_limiter(provider, rate_limit.requests_per_second, rate_limit.burst) if rate_limit else None
+        )
+        limiters[kind] = CallLimiter(max_concurrent[kind], rate_limiter)
+    return limiters
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from mem0.memory.utils import format_entities
@@ -7,11 +8,6 @@ try:
 except ImportError:
     raise ImportError("langchain_neo4j is not installed. Please install it using pip install langchain-neo4j")
 
-try:
-    from rank_bm25 import BM25Okapi
-except ImportError:
-    raise ImportError("rank_bm25 is not installed. Please install it using pip install rank-bm25")
-
 from mem0.graphs.tools import (
     DELETE_MEMORY_STRUCT_TOOL_GRAPH,
     DELETE_MEMORY_TOOL_GRAPH,
@@ -20,11 +16,25 @@ from mem0.graphs.tools import (
     RELATIONS_STRUCT_TOOL,
     RELATIONS_TOOL,
 )
+from mem0.graphs.bm25 import BM25Reranker
+from mem0.graphs.pipeline import aplan_graph_update, plan_graph_update
 from mem0.graphs.utils import EXTRACT_RELATIONS_PROMPT, get_delete_messages
 from mem0.utils.factory import EmbedderFactory, LlmFactory
 
 logger = logging.getLogger(__name__)
 
+VECTOR_INDEX_NAME = "entity_embedding"
+# Nearest nodes fetched from the vector index before filtering by user, agent and run. The index
+# spans every user, so the count grows tenfold, up to the maximum, until the nearest nodes cover
+# all nodes above the threshold; beyond the maximum the query node is resolved with a scan
+VECTOR_INDEX_CANDIDATES = 100
+VECTOR_INDEX_MAX_CANDIDATES = 10000
+
+
+def _relation_triples(results):
+    """(source, relationship, target) triples of per-item relationship query results."""
+    return [(row["source"], row["relationship"], row["target"]) for rows in results for row in rows]
+
 
 class MemoryGraph:
     def __init__(self, config):
@@ -55,6 +65,8 @@ class MemoryGraph:
             except Exception:
                 pass
 
+        self.vector_index_name = self._create_vector_index()
+
         self.llm_provider = "openai_structured"
         if self.config.llm.provider:
             self.llm_provider = self.config.llm.provider
@@ -64,6 +76,33 @@ class MemoryGraph:
         self.llm = LlmFactory.create(self.llm_provider, self.config.llm.config)
         self.user_id = None
         self.threshold = 0.7
+        self.reranker = BM25Reranker(
+            top_n=self.config.graph_store.rerank_top_n,
+            max_scopes=self.config.graph_store.rerank_cache_max_scopes,
+            cache_ttl=self.config.graph_store.rerank_cache_ttl,
+        )
+
+    def _create_vector_index(self):
+        """
+        Create the vector index used to resolve entities, returning its name.
+
+        A vector index covers a single label, so it requires `base_label`. Returns None when the
+        index cannot be created (no base label, unknown dimensions or a Neo4j version without
+        vector indexes), in which case entities are resolved with a similarity scan.
+        """
+        embedding_dims = getattr(self.embedding_model.config, "embedding_dims", None)
+        if not self.node_label or not embedding_dims:
+            return None
+        try:
+            self.graph.query(
+                f"CREATE VECTOR INDEX {VECTOR_INDEX_NAME} IF NOT EXISTS FOR (n {self.node_label}) ON (n.embedding) "
+                f"OPTIONS {{indexConfig: {{`vector.dimensions`: {int(embedding_dims)}, "
+                "`vector.similarity_function`: 'cosine'}}"
+            )
+        except Exception as e:
+            logger.warning(f"Could not create the entity vector index, using similarity scans: {e}")
+            return None
+        return VECTOR_INDEX_NAME
 
     def add(self, data, filters):
         """
@@ -73,10 +112,7 @@ class MemoryGraph:
             data (str): The data to add to the graph.
             filters (dict): A dictionary containing filters to be applied during the addition.
         """
-        entity_type_map = self._retrieve_nodes_from_data(data, filters)
-        to_be_added = self._establish_nodes_relations_from_data(data, filters, entity_type_map)
-        search_output = self._search_graph_db(node_list=list(entity_type_map.keys()), filters=filters)
-        to_be_deleted = self._get_delete_entities_from_search_output(search_output, data, filters)
+        entity_type_map, to_be_added, to_be_deleted = plan_graph_update(self, data, filters)
 
         # TODO: Batch queries with APOC plugin
         # TODO: Add more filter support
@@ -85,6 +121,21 @@ class MemoryGraph:
 
         return {"deleted_entities": deleted_entities, "added_entities": added_entities}
 
+    async def aadd(self, data, filters):
+        """
+        Adds data to the graph asynchronously.
+
+        Args:
+            data (str): The data to add to the graph.
+            filters (dict): A dictionary containing filters to be applied during the addition.
+        """
+        entity_type_map, to_be_added, to_be_deleted = await aplan_graph_update(self, data, filters)
+
+        deleted_entities = await asyncio.to_thread(self._delete_entities, to_be_deleted, filters)
+        added_entities = await asyncio.to_thread(self._add_entities, to_be_added, filters, entity_type_map)
+
+        return {"deleted_entities": deleted_entities, "added_entities": added_entities}
+
     def search(self, query, filters, limit=100):
         """
         Search for memories and related graph data.
@@ -105,13 +156,10 @@ class MemoryGraph:
         if not search_output:
             return []
 
-        search_outputs_sequence = [
-            [item["source"], item["relationship"], item["destination"]] for item in search_output
-        ]
-        bm25 = BM25Okapi(search_outputs_sequence)
-
-        tokenized_query = query.split(" ")
-        reranked_results = bm25.get_top_n(tokenized_query, search_outputs_sequence, n=5)
+        candidates = [(item["source"], item["relationship"], item["destination"]) for item in search_output]
+        reranked_results = self.reranker.rerank(
+            query, candidates, filters, load_corpus=lambda: self._load_rerank_corpus(filters)
+        )
 
         search_results = []
         for item in reranked_results:
@@ -140,6 +188,7 @@ class MemoryGraph:
         if filters.get("run_id"):
             params["run_id"] = filters["run_id"]
         self.graph.query(cypher, params=params)
+        self.reranker.invalidate(filters)
 
     def get_all(self, filters, limit=100):
         """
@@ -185,6 +234,11 @@ class MemoryGraph:
 
         return final_results
 
+    def _load_rerank_corpus(self, filters):
+        """All relations of the scope, seeding the reranker statistics."""
+        relations = self.get_all(filters, limit=self.reranker.max_corpus_size)
+        return [(relation["source"], relation["relationship"], relation["target"]) for relation in relations]
+
     def _retrieve_nodes_from_data(self, data, filters):
         """Extracts all the entities mentioned in the query."""
         _tools = [EXTRACT_ENTITIES_TOOL]
@@ -261,9 +315,16 @@ class MemoryGraph:
         return entities
 
     def _search_graph_db(self, node_list, filters, limit=100):
-        """Search similar nodes among and their respective incoming and outgoing relations."""
-        result_relations = []
-        
+        """
+        Search similar nodes among and their respective incoming and outgoing relations.
+
+        All nodes are embedded in one batch and searched in a single query. Each relation is
+        tagged with the `query_node` that reached it; relations reached from several query
+        nodes are returned once, with their highest similarity.
+        """
+        if not node_list:
+            return []
+
         # Build node properties for filtering
         node_props = ["user_id: $user_id"]
         if filters.get("agent_id"):
@@ -272,44 +333,38 @@ class MemoryGraph:
             node_props.append("run_id: $run_id")
         node_props_str = ", ".join(node_props)
 
-        for node in node_list:
-            n_embedding = self.embedding_model.embed(node)
-
-            cypher_query = f"""
-            MATCH (n {self.node_label} {{{node_props_str}}})
-            WHERE n.embedding IS NOT NULL
-            WITH n, round(2 * vector.similarity.cosine(n.embedding, $n_embedding) - 1, 4) AS similarity // denormalize for backward compatibility
-            WHERE similarity >= $threshold
-            CALL {{
-                WITH n
-                MATCH (n)-[r]->(m {self.node_label} {{{node_props_str}}})
-                RETURN n.name AS source, elementId(n) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
-                UNION
-                WITH n  
-                MATCH (n)<-[r]-(m {self.node_label} {{{node_props_str}}})
-                RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, n.name AS destination, elementId(n) AS destination_id
-            }}
-            WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
-            RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
-            ORDER BY similarity DESC
-            LIMIT $limit
-            """
-
-            params = {
-                "n_embedding": n_embedding,
-                "threshold": self.threshold,
-                "user_id": filters["user_id"],
-                "limit": limit,
-            }
-            if filters.get("agent_id"):
-                params["agent_id"] = filters["agent_id"]
-            if filters.get("run_id"):
-                params["run_id"] = filters["run_id"]
-
-            ans = self.graph.query(cypher_query, params=params)
-            result_relations.extend(ans)
+        node_list = list(dict.fromkeys(node_list))
+        embeddings = dict(zip(node_list, self.embedding_model.embed_batch(node_list)))
+
+        subquery = f"""
+                CALL {{
+                    WITH candidate
+                    MATCH (candidate)-[r]->(m {self.node_label} {{{node_props_str}}})
+                    RETURN candidate.name AS source, elementId(candidate) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, m.name AS destination, elementId(m) AS destination_id
+                    UNION
+                    WITH candidate
+                    MATCH (candidate)<-[r]-(m {self.node_label} {{{node_props_str}}})
+                    RETURN m.name AS source, elementId(m) AS source_id, type(r) AS relationship, elementId(r) AS relation_id, candidate.name AS destination, elementId(candidate) AS destination_id
+                }}
+                WITH distinct source, source_id, relationship, relation_id, destination, destination_id, similarity
+                RETURN source, source_id, relationship, relation_id, destination, destination_id, similarity
+                ORDER BY similarity DESC
+                LIMIT $limit"""
+        rows = self._query_similar_nodes(
+            embeddings,
+            filters,
+            self.threshold,
+            subquery,
+            returns="source, source_id, relationship, relation_id, destination, destination_id, similarity",
+            params={"limit": limit},
+        )
 
-        return result_relations
+        result_relations = {}
+        for row in rows:
+            existing = result_relations.get(row["relation_id"])
+            if existing is None or row["similarity"] > existing["similarity"]:
+                result_relations[row["relation_id"]] = dict(row)
+        return sorted(result_relations.values(), key=lambda relation: relation["similarity"], reverse=True)
 
     def _get_delete_entities_from_search_output(self, search_output, data, filters):
         """Get the entities to be deleted from the search output."""
@@ -400,241 +455,178 @@ class MemoryGraph:
             result = self.graph.query(cypher, params=params)
             results.append(result)
 
+        self.reranker.remove(filters, _relation_triples(results))
         return results
 
     def _add_entities(self, to_be_added, filters, entity_type_map):
-        """Add the new entities to the graph. Merge the nodes if they already exist."""
+        """
+        Add the new entities to the graph. Merge the nodes if they already exist.
+
+        All distinct entity names are embedded in one batch and resolved against the existing
+        nodes in one query, then every triple is written in a single statement (one transaction).
+
+        Returns:
+            list: One list of created or updated relationships per item of `to_be_added`.
+        """
+        if not to_be_added:
+            return []
+
         user_id = filters["user_id"]
         agent_id = filters.get("agent_id", None)
         run_id = filters.get("run_id", None)
-        results = []
-        for item in to_be_added:
-            # entities
-            source = item["source"]
-            destination = item["destination"]
-            relationship = item["relationship"]
 
-            # types
-            source_type = entity_type_map.get(source, "__User__")
-            source_label = self.node_label if self.node_label else f":`{source_type}`"
-            source_extra_set = f", source:`{source_type}`" if self.node_label else ""
-            destination_type = entity_type_map.get(destination, "__User__")
-            destination_label = self.node_label if self.node_label else f":`{destination_type}`"
-            destination_extra_set = f", destination:`{destination_type}`" if self.node_label else ""
-
-            # embeddings
-            source_embedding = self.embedding_model.embed(source)
-            dest_embedding = self.embedding_model.embed(destination)
-
-            # search for the nodes with the closest embeddings
-            source_node_search_result = self._search_source_node(source_embedding, filters, threshold=0.9)
-            destination_node_search_result = self._search_destination_node(dest_embedding, filters, threshold=0.9)
-
-            # TODO: Create a cypher query and common params for all the cases
-            if not destination_node_search_result and source_node_search_result:
-                # Build destination MERGE properties
-                merge_props = ["name: $destination_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MERGE (destination {destination_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    destination.created = timestamp(),
-                    destination.mentions = 1
-                    {destination_extra_set}
-                ON MATCH SET
-                    destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $destination_embedding)
-                WITH source, destination
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET
-                    r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
+        # embeddings
+        names = list(dict.fromkeys(name for item in to_be_added for name in (item["source"], item["destination"])))
+        embeddings = dict(zip(names, self.embedding_model.embed_batch(names)))
+
+        # search for the nodes with the closest embeddings
+        resolved = self._resolve_nodes(embeddings, filters, threshold=0.9)
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
+        # Labels and relationship types cannot be parameterized, so triples sharing them are
+        # written by the same UNWIND branch
+        batches = {}
+        for idx, item in enumerate(to_be_added):
+            source = item["source"]
+            destination = item["destination"]
+            key = (
+                item["relationship"],
+                entity_type_map.get(source, "__User__"),
+                entity_type_map.get(destination, "__User__"),
+            )
+            batches.setdefault(key, []).append(
+                {
+                    "idx": idx,
+                    "source_id": resolved.get(source),
+                    "source_name": source,
+                    "source_embedding": embeddings[source],
+                    "destination_id": resolved.get(destination),
                     "destination_name": destination,
-                    "destination_embedding": dest_embedding,
-                    "user_id": user_id,
+                    "destination_embedding": embeddings[destination],
                 }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif destination_node_search_result and not source_node_search_result:
-                # Build source MERGE properties
-                merge_props = ["name: $source_name", "user_id: $user_id"]
-                if agent_id:
-                    merge_props.append("agent_id: $agent_id")
-                if run_id:
-                    merge_props.append("run_id: $run_id")
-                merge_props_str = ", ".join(merge_props)
-
-                cypher = f"""
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH destination
-                MERGE (source {source_label} {{{merge_props_str}}})
-                ON CREATE SET
-                    source.created = timestamp(),
-                    source.mentions = 1
-                    {source_extra_set}
-                ON MATCH SET
-                    source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source, destination
+            )
+
+        # Build MERGE properties shared by new source and destination nodes
+        merge_props = ["user_id: $user_id"]
+        if agent_id:
+            merge_props.append("agent_id: $agent_id")
+        if run_id:
+            merge_props.append("run_id: $run_id")
+        merge_props_str = ", ".join(merge_props)
+
+        params = {"user_id": user_id}
+        if agent_id:
+            params["agent_id"] = agent_id
+        if run_id:
+            params["run_id"] = run_id
+
+        branches = []
+        for batch_number, ((relationship, source_type, destination_type), rows) in enumerate(batches.items()):
+            batch_param = f"batch_{batch_number}"
+            params[batch_param] = rows
+            branches.append(
+                f"""
+                UNWIND ${batch_param} AS row
+                CALL {{
+                    WITH row
+                    {self._merge_node_cypher("source", source_type, merge_props_str)}
+                }}
+                CALL {{
+                    WITH row
+                    {self._merge_node_cypher("destination", destination_type, merge_props_str)}
+                }}
                 MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
+                ON CREATE SET
                     r.created = timestamp(),
                     r.mentions = 1
                 ON MATCH SET
                     r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
-                """
-
-                params = {
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "source_name": source,
-                    "source_embedding": source_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            elif source_node_search_result and destination_node_search_result:
-                cypher = f"""
-                MATCH (source)
-                WHERE elementId(source) = $source_id
-                SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                MATCH (destination)
-                WHERE elementId(destination) = $destination_id
-                SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                MERGE (source)-[r:{relationship}]->(destination)
-                ON CREATE SET 
-                    r.created_at = timestamp(),
-                    r.updated_at = timestamp(),
-                    r.mentions = 1
-                ON MATCH SET r.mentions = coalesce(r.mentions, 0) + 1
-                RETURN source.name AS source, type(r) AS relationship, destination.name AS target
+                RETURN row.idx AS idx, source.name AS source, type(r) AS relationship, destination.name AS target
                 """
+            )
 
-                params = {
-                    "source_id": source_node_search_result[0]["elementId(source_candidate)"],
-                    "destination_id": destination_node_search_result[0]["elementId(destination_candidate)"],
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-
-            else:
-                # Build dynamic MERGE props for both source and destination
-                source_props = ["name: $source_name", "user_id: $user_id"]
-                dest_props = ["name: $dest_name", "user_id: $user_id"]
-                if agent_id:
-                    source_props.append("agent_id: $agent_id")
-                    dest_props.append("agent_id: $agent_id")
-                if run_id:
-                    source_props.append("run_id: $run_id")
-                    dest_props.append("run_id: $run_id")
-                source_props_str = ", ".join(source_props)
-                dest_props_str = ", ".join(dest_props)
-
-                cypher = f"""
-                MERGE (source {source_label} {{{source_props_str}}})
-                ON CREATE SET source.created = timestamp(),
-                            source.mentions = 1
-                            {source_extra_set}
-                ON MATCH SET source.mentions = coalesce(source.mentions, 0) + 1
-                WITH source
-                CALL db.create.setNodeVectorProperty(source, 'embedding', $source_embedding)
-                WITH source
-                MERGE (destination {destination_label} {{{dest_props_str}}})
-                ON CREATE SET destination.created = timestamp(),
-                            destination.mentions = 1
-                            {destination_extra_set}
-                ON MATCH SET destination.mentions = coalesce(destination.mentions, 0) + 1
-                WITH source, destination
-                CALL db.create.setNodeVectorProperty(destination, 'embedding', $dest_embedding)
-                WITH source, destination
-                MERGE (source)-[rel:{relationship}]->(destination)
-                ON CREATE SET rel.created = timestamp(), rel.mentions = 1
-                ON MATCH SET rel.mentions = coalesce(rel.mentions, 0) + 1
-                RETURN source.name AS source, type(rel) AS relationship, destination.name AS target
-                """
+        cypher = "\nUNION ALL\n".join(branches)
+        rows = self.graph.query(cypher, params=params)
 
-                params = {
-                    "source_name": source,
-                    "dest_name": destination,
-                    "source_embedding": source_embedding,
-                    "dest_embedding": dest_embedding,
-                    "user_id": user_id,
-                }
-                if agent_id:
-                    params["agent_id"] = agent_id
-                if run_id:
-                    params["run_id"] = run_id
-            result = self.graph.query(cypher, params=params)
-            results.append(result)
+        results = [[] for _ in to_be_added]
+        for row in rows:
+            results[row["idx"]].append(
+                {"source": row["source"], "relationship": row["relationship"], "target": row["target"]}
+            )
+        self.reranker.add(filters, _relation_triples(results))
         return results
 
-    def _remove_spaces_from_entities(self, entity_list):
-        for item in entity_list:
-            item["source"] = item["source"].lower().replace(" ", "_")
-            item["relationship"] = item["relationship"].lower().replace(" ", "_")
-            item["destination"] = item["destination"].lower().replace(" ", "_")
-        return entity_list
+    def _merge_node_cypher(self, role, entity_type, merge_props_str):
+        """
+        Cypher subquery binding `role` to the resolved node `row.<role>_id`, or merging a new one by name.
+        """
+        label = self.node_label if self.node_label else f":`{entity_type}`"
+        extra_set = f", {role}:`{entity_type}`" if self.node_label else ""
+        return f"""
+                    WITH row
+                    WHERE row.{role}_id IS NOT NULL
+                    MATCH ({role})
+                    WHERE elementId({role}) = row.{role}_id
+                    SET {role}.mentions = coalesce({role}.mentions, 0) + 1
+                    RETURN {role}
+                    UNION
+                    WITH row
+                    WITH row
+                    WHERE row.{role}_id IS NULL
+                    MERGE ({role} {label} {{name: row.{role}_name, {merge_props_str}}})
+                    ON CREATE SET
+                        {role}.created = timestamp(),
+                        {role}.mentions = 1
+                        {extra_set}
+                    ON MATCH SET
+                        {role}.mentions = coalesce({role}.mentions, 0) + 1
+                    WITH {role}, row
+                    CALL db.create.setNodeVectorProperty({role}, 'embedding', row.{role}_embedding)
+                    RETURN {role}"""
+
+    def _resolve_nodes(self, embeddings, filters, threshold=0.9):
+        """
+        Resolve entity names to the most similar existing nodes in a single query.
 
-    def _search_source_node(self, source_embedding, filters, threshold=0.9):
+        Args:
+            embeddings (dict): Entity name to embedding.
+            filters (dict): A dictionary containing filters to be applied during the search.
+            threshold (float): Minimum cosine similarity for a node to match. Defaults to 0.9.
+
+        Returns:
+            dict: Entity name to the element id of the matching node, for the names that matched.
+        """
+        subquery = """
+                WITH candidate, similarity
+                ORDER BY similarity DESC
+                LIMIT 1
+                RETURN elementId(candidate) AS node_id"""
+        rows = self._query_similar_nodes(embeddings, filters, threshold, subquery, returns="node_id", params={})
+        return {row["query_node"]: row["node_id"] for row in rows}
+
+    def _query_similar_nodes(self, embeddings, filters, threshold, subquery, returns, params):
+        """
+        Run `subquery` once per query node, in a single UNWIND statement, over the user's nodes
+        (bound to `candidate` with their `similarity`) that are at least `threshold` similar to it.
+
+        Candidates come from the entity vector index when there is one. The index spans every user,
+        so query nodes whose nearest nodes may hide matches of this user, as checked by
+        `_index_candidates`, are resolved with a similarity scan, as are all query nodes when the
+        index is missing or the lookup fails.
 
+        Returns:
+            list: Rows with the matching `query_node` name and the `returns` columns of `subquery`.
+        """
         # Build WHERE conditions
-        where_conditions = [
-            "source_candidate.embedding IS NOT NULL",
-            "source_candidate.user_id = $user_id"
-        ]
+        where_conditions = ["candidate.user_id = $user_id"]
         if filters.get("agent_id"):
-            where_conditions.append("source_candidate.agent_id = $agent_id")
+            where_conditions.append("candidate.agent_id = $agent_id")
         if filters.get("run_id"):
-            where_conditions.append("source_candidate.run_id = $run_id")
+            where_conditions.append("candidate.run_id = $run_id")
         where_clause = " AND ".join(where_conditions)
 
-        cypher = f"""
-            MATCH (source_candidate {self.node_label})
-            WHERE {where_clause}
-
-            WITH source_candidate,
-            round(2 * vector.similarity.cosine(source_candidate.embedding, $source_embedding) - 1, 4) AS source_similarity // denormalize for backward compatibility
-            WHERE source_similarity >= $threshold
-
-            WITH source_candidate, source_similarity
-            ORDER BY source_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(source_candidate)
-            """
-
         params = {
-            "source_embedding": source_embedding,
+            **params,
+            "query_nodes": [{"name": name, "embedding": embedding} for name, embedding in embeddings.items()],
             "user_id": filters["user_id"],
             "threshold": threshold,
         }
@@ -643,50 +635,110 @@ class MemoryGraph:
         if filters.get("run_id"):
             params["run_id"] = filters["run_id"]
 
-        result = self.graph.query(cypher, params=params)
-        return result
-
-    def _search_destination_node(self, destination_embedding, filters, threshold=0.9):
+        if self.vector_index_name:
+            try:
+                candidates = self._index_candidates(embeddings, threshold)
+                rows = self._index_similar_nodes(embeddings, candidates, where_clause, subquery, returns, params)
+                uncovered = [name for name in embeddings if name not in candidates]
+                if uncovered:
+                    # Nearest nodes of other users outnumber the candidates, scan the user's nodes instead
+                    logger.debug(f"Vector index does not cover {len(uncovered)} query nodes, using a similarity scan")
+                    uncovered_nodes = [{"name": name, "embedding": embeddings[name]} for name in uncovered]
+                    rows += self._scan_similar_nodes(
+                        where_clause, subquery, returns, {**params, "query_nodes": uncovered_nodes}
+                    )
+                return rows
+            except Exception as e:
+                logger.warning(f"Vector index lookup failed, falling back to a similarity scan: {e}")
+
+        return self._scan_similar_nodes(where_clause, subquery, returns, params)
+
+    def _index_candidates(self, embeddings, threshold):
+        """
+        Number of nearest nodes to fetch from the vector index for each query node.
 
-        # Build WHERE conditions
-        where_conditions = [
-            "destination_candidate.embedding IS NOT NULL",
-            "destination_candidate.user_id = $user_id"
-        ]
-        if filters.get("agent_id"):
-            where_conditions.append("destination_candidate.agent_id = $agent_id")
-        if filters.get("run_id"):
-            where_conditions.append("destination_candidate.run_id = $run_id")
-        where_clause = " AND ".join(where_conditions)
+        The nearest nodes cover every node at least `threshold` similar to the query node once the
+        index runs out of nodes or the farthest of them is below the threshold. Query nodes that are
+        still not covered with VECTOR_INDEX_MAX_CANDIDATES nodes are left out of the result.
 
+        Returns:
+            dict: Query node name to the number of candidates to fetch, for the covered query nodes.
+        """
+        candidates = {}
+        pending = list(embeddings)
+        count = VECTOR_INDEX_CANDIDATES
+        while pending and count <= VECTOR_INDEX_MAX_CANDIDATES:
+            rows = self.graph.query(
+                """
+            UNWIND $query_nodes AS query_node
+            CALL {
+                WITH query_node
+                CALL db.index.vector.queryNodes($index_name, $candidates, query_node.embedding)
+                YIELD score
+                RETURN count(score) AS found, min(score) AS lowest
+            }
+            RETURN query_node.name AS query_node,
+                found < $candidates OR round(2 * lowest - 1, 4) < $threshold AS covered
+            """,
+                params={
+                    "index_name": self.vector_index_name,
+                    "query_nodes": [{"name": name, "embedding": embeddings[name]} for name in pending],
+                    "candidates": count,
+                    "threshold": threshold,
+                },
+            )
+            uncovered = {row["query_node"] for row in rows if not row["covered"]}
+            candidates.update((name, count) for name in pending if name not in uncovered)
+            pending = [name for name in pending if name in uncovered]
+            count *= 10
+        return candidates
+
+    def _index_similar_nodes(self, embeddings, candidates, where_clause, subquery, returns, params):
+        """Run the `_query_similar_nodes` statement over the nearest nodes found in the vector index."""
+        if not candidates:
+            return []
+        # The index returns the nearest nodes of every user, which are filtered afterwards
         cypher = f"""
-            MATCH (destination_candidate {self.node_label})
+        UNWIND $query_nodes AS query_node
+        CALL {{
+            WITH query_node
+            CALL db.index.vector.queryNodes($index_name, query_node.candidates, query_node.embedding)
+            YIELD node AS candidate, score
             WHERE {where_clause}
+            WITH candidate, round(2 * score - 1, 4) AS similarity // denormalize for backward compatibility
+            WHERE similarity >= $threshold{subquery}
+        }}
+        RETURN query_node.name AS query_node, {returns}
+        """
+        query_nodes = [
+            {"name": name, "embedding": embeddings[name], "candidates": count} for name, count in candidates.items()
+        ]
+        return self.graph.query(
+            cypher, params={**params, "index_name": self.vector_index_name, "query_nodes": query_nodes}
+        )
 
-            WITH destination_candidate,
-            round(2 * vector.similarity.cosine(destination_candidate.embedding, $destination_embedding) - 1, 4) AS destination_similarity // denormalize for backward compatibility
-
-            WHERE destination_similarity >= $threshold
-
-            WITH destination_candidate, destination_similarity
-            ORDER BY destination_similarity DESC
-            LIMIT 1
-
-            RETURN elementId(destination_candidate)
-            """
-
-        params = {
-            "destination_embedding": destination_embedding,
-            "user_id": filters["user_id"],
-            "threshold": threshold,
-        }
-        if filters.get("agent_id"):
-            params["agent_id"] = filters["agent_id"]
-        if filters.get("run_id"):
-            params["run_id"] = filters["run_id"]
+    def _scan_similar_nodes(self, where_clause, subquery, returns, params):
+        """Run the `_query_similar_nodes` statement with a similarity scan over the user's nodes."""
+        cypher = f"""
+        UNWIND $query_nodes AS query_node
+        CALL {{
+            WITH query_node
+            MATCH (candidate {self.node_label})
+            WHERE candidate.embedding IS NOT NULL AND {where_clause}
+            WITH candidate,
+            round(2 * vector.similarity.cosine(candidate.embedding, query_node.embedding) - 1, 4) AS similarity // denormalize for backward compatibility
+            WHERE similarity >= $threshold{subquery}
+        }}
+        RETURN query_node.name AS query_node, {returns}
+        """
+        return self.graph.query(cypher, params=params)
 
-        result = self.graph.query(cypher, params=params)
-        return result
+    def _remove_spaces_from_entities(self, entity_list):
+        for item in entity_list:
+            item["source"] = item["source"].lower().replace(" ", "_")
+            item["relationship"] = item["relationship"].lower().replace(" ", "_")
+            item["destination"] = item["destination"].lower().replace(" ", "_")
+        return entity_list
 
     # Reset is not defined in base.py
     def reset(self):
@@ -695,4 +747,5 @@ class MemoryGraph:
         cypher_query = """
         MATCH (n) DETACH DELETE n
         """
+        self.reranker.invalidate()
         return self.graph.query(cypher_query)
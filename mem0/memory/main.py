@@ -2,6 +2,7 @@ import asyncio
 import concurrent
 import gc
 import hashlib
+import inspect
 import json
 import logging
 import os
@@ -9,7 +10,7 @@ import uuid
 import warnings
 from copy import deepcopy
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pytz
 from pydantic import ValidationError
@@ -21,8 +22,8 @@ from mem0.configs.prompts import (
     get_update_memory_messages,
 )
 from mem0.memory.base import MemoryBase
+from mem0.memory.concurrency import create_call_limiters
 from mem0.memory.setup import mem0_dir, setup_config
-from mem0.memory.storage import SQLiteManager
 from mem0.memory.telemetry import capture_event
 from mem0.memory.utils import (
     get_fact_retrieval_messages,
@@ -34,6 +35,7 @@ from mem0.memory.utils import (
 from mem0.utils.factory import (
     EmbedderFactory,
     GraphStoreFactory,
+    HistoryStoreFactory,
     LlmFactory,
     VectorStoreFactory,
 )
@@ -115,6 +117,158 @@ def _build_filters_and_metadata(
     return base_metadata_template, effective_query_filters
 
 
+def _create_history_store(config: MemoryConfig):
+    """Create the configured history store, defaulting the SQLite path to `history_db_path`."""
+    history_config = dict(config.history_store.config or {})
+    if config.history_store.provider == "sqlite":
+        history_config.setdefault("db_path", config.history_db_path)
+    return HistoryStoreFactory.create(config.history_store.provider, history_config)
+
+
+def _plan_memory_actions(actions: List[Dict[str, Any]], temp_uuid_mapping: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Turns the actions returned by the update-decision LLM call into an ordered plan.
+
+    ADD actions get a freshly generated memory id, UPDATE and DELETE actions have their
+    temporary integer ids mapped back to the real memory ids. Empty or malformed actions,
+    NONE events and repeated actions on an already planned memory are dropped, so the
+    remaining actions are independent of each other and can be applied concurrently.
+
+    Args:
+        actions (List[Dict[str, Any]]): The `memory` list from the LLM response.
+        temp_uuid_mapping (Dict[str, str]): Mapping from the integer ids shown to the LLM to memory ids.
+
+    Returns:
+        List[Dict[str, Any]]: One entry per action to apply, with `event`, `id`, `text` and the raw `resp`.
+    """
+    planned_actions = []
+    planned_ids = set()
+    for resp in actions:
+        logger.info(resp)
+        try:
+            action_text = resp.get("text")
+            if not action_text:
+                logger.info("Skipping memory entry because of empty `text` field.")
+                continue
+
+            event_type = resp.get("event")
+            if event_type == "ADD":
+                memory_id = str(uuid.uuid4())
+            elif event_type in ("UPDATE", "DELETE"):
+                memory_id = temp_uuid_mapping[resp.get("id")]
+            else:
+                if event_type == "NONE":
+                    logger.info("NOOP for Memory.")
+                continue
+
+            if memory_id in planned_ids:
+                logger.warning(f"Skipping {event_type} for memory {memory_id}, it is already changed in this batch.")
+                continue
+
+            planned_ids.add(memory_id)
+            planned_actions.append({"event": event_type, "id": memory_id, "text": action_text, "resp": resp})
+        except Exception as e:
+            logger.error(f"Error processing memory action: {resp}, Error: {e}")
+    return planned_actions
+
+
+def _build_updated_metadata(
+    existing_payload: Dict[str, Any], data: str, metadata: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Builds the payload for an updated memory, keeping its creation time and session/actor identifiers.
+    """
+    new_metadata = deepcopy(metadata) if metadata is not None else {}
+
+    new_metadata["data"] = data
+    new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
+    new_metadata["created_at"] = existing_payload.get("created_at")
+    new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+
+    for key in ("user_id", "agent_id", "run_id", "actor_id", "role"):
+        if key in existing_payload:
+            new_metadata[key] = existing_payload[key]
+
+    return new_metadata
+
+
+def _prepare_memory_action(action: Dict[str, Any], metadata: Dict[str, Any]) -> None:
+    """
+    Fills in the vector-store payload and the history record of a planned action.
+
+    UPDATE and DELETE actions must already carry the fetched memory under `existing`.
+    """
+    event_type = action["event"]
+    if event_type == "ADD":
+        payload = deepcopy(metadata)
+        payload["data"] = action["text"]
+        payload["hash"] = hashlib.md5(action["text"].encode()).hexdigest()
+        payload["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
+        action["payload"] = payload
+        action["history"] = {
+            "memory_id": action["id"],
+            "old_memory": None,
+            "new_memory": action["text"],
+            "event": "ADD",
+            "created_at": payload.get("created_at"),
+            "actor_id": payload.get("actor_id"),
+            "role": payload.get("role"),
+        }
+    elif event_type == "UPDATE":
+        existing_payload = action["existing"].payload
+        payload = _build_updated_metadata(existing_payload, action["text"], metadata)
+        action["payload"] = payload
+        action["history"] = {
+            "memory_id": action["id"],
+            "old_memory": existing_payload.get("data"),
+            "new_memory": action["text"],
+            "event": "UPDATE",
+            "created_at": payload["created_at"],
+            "updated_at": payload["updated_at"],
+            "actor_id": payload.get("actor_id"),
+            "role": payload.get("role"),
+        }
+    else:
+        existing_payload = action["existing"].payload
+        action["history"] = {
+            "memory_id": action["id"],
+            "old_memory": existing_payload["data"],
+            "new_memory": None,
+            "event": "DELETE",
+            "actor_id": existing_payload.get("actor_id"),
+            "role": existing_payload.get("role"),
+            "is_deleted": 1,
+        }
+
+
+def _fail_memory_actions(
+    planned_actions: List[Dict[str, Any]], event_type: str, texts: List[str], error: Exception
+) -> set:
+    """Logs the actions of `event_type` whose text could not be embedded and returns their ids."""
+    texts = set(texts)
+    failed_ids = set()
+    for action in planned_actions:
+        if action["event"] == event_type and action["text"] in texts:
+            logger.error(f"Error processing memory action: {action['resp']}, Error: {error}")
+            failed_ids.add(action["id"])
+    return failed_ids
+
+
+def _memory_action_result(action: Dict[str, Any]) -> Dict[str, Any]:
+    """Formats an applied action the way `add` reports it."""
+    result = {"id": action["id"], "memory": action["text"], "event": action["event"]}
+    if action["event"] == "UPDATE":
+        result["previous_memory"] = action["resp"].get("old_memory")
+    return result
+
+
+_MEMORY_ACTION_EVENTS = {
+    "ADD": "mem0._create_memory",
+    "UPDATE": "mem0._update_memory",
+    "DELETE": "mem0._delete_memory",
+}
+
+
 setup_config()
 logger = logging.getLogger(__name__)
 
@@ -134,9 +288,10 @@ class Memory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.db = _create_history_store(self.config)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self.max_workers = self.config.max_workers
 
         self.enable_graph = False
 
@@ -304,7 +459,7 @@ class Memory(MemoryBase):
 
                 msg_content = message_dict["content"]
                 msg_embeddings = self.embedding_model.embed(msg_content, "add")
-                mem_id = self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                mem_id = self._create_memory(msg_content, {msg_content: msg_embeddings}, per_msg_meta)
 
                 returned_memories.append(
                     {
@@ -345,15 +500,20 @@ class Memory(MemoryBase):
 
         retrieved_old_memory = []
         new_message_embeddings = {}
-        for new_mem in new_retrieved_facts:
-            messages_embeddings = self.embedding_model.embed(new_mem, "add")
-            new_message_embeddings[new_mem] = messages_embeddings
-            existing_memories = self.vector_store.search(
-                query=new_mem,
-                vectors=messages_embeddings,
+        if new_retrieved_facts:
+            fact_embeddings = self.embedding_model.embed_batch(new_retrieved_facts, "add")
+            search_results = self.vector_store.search_batch(
+                queries=new_retrieved_facts,
+                vectors_list=fact_embeddings,
                 limit=5,
                 filters=filters,
             )
+        else:
+            fact_embeddings, search_results = [], []
+        for new_mem, messages_embeddings, existing_memories in zip(
+            new_retrieved_facts, fact_embeddings, search_results
+        ):
+            new_message_embeddings[new_mem] = messages_embeddings
             for mem in existing_memories:
                 retrieved_old_memory.append({"id": mem.id, "text": mem.payload["data"]})
 
@@ -394,50 +554,12 @@ class Memory(MemoryBase):
 
         returned_memories = []
         try:
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(resp)
-                try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        logger.info("Skipping memory entry because of empty `text` field.")
-                        continue
-
-                    event_type = resp.get("event")
-                    if event_type == "ADD":
-                        memory_id = self._create_memory(
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append({"id": memory_id, "memory": action_text, "event": event_type})
-                    elif event_type == "UPDATE":
-                        self._update_memory(
-                            memory_id=temp_uuid_mapping[resp.get("id")],
-                            data=action_text,
-                            existing_embeddings=new_message_embeddings,
-                            metadata=deepcopy(metadata),
-                        )
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")])
-                        returned_memories.append(
-                            {
-                                "id": temp_uuid_mapping[resp.get("id")],
-                                "memory": action_text,
-                                "event": event_type,
-                            }
-                        )
-                    elif event_type == "NONE":
-                        logger.info("NOOP for Memory.")
-                except Exception as e:
-                    logger.error(f"Error processing memory action: {resp}, Error: {e}")
+            returned_memories = self._apply_memory_actions(
+                new_memories_with_actions.get("memory", []),
+                temp_uuid_mapping,
+                new_message_embeddings,
+                metadata,
+            )
         except Exception as e:
             logger.error(f"Error iterating new_memories_with_actions: {e}")
 
@@ -449,6 +571,156 @@ class Memory(MemoryBase):
         )
         return returned_memories
 
+    def _apply_memory_actions(self, actions, temp_uuid_mapping, existing_embeddings, metadata):
+        """
+        Apply the ADD/UPDATE/DELETE actions decided by the LLM.
+
+        Independent actions run concurrently on a thread pool bounded by `max_workers`. Existing
+        memories are fetched in parallel, missing embeddings are computed in one batch per memory
+        action, new memories are written with one bulk insert and all history records are written
+        in a single transaction. A failed embedding or write only drops the actions it covers, and
+        a failed history write is logged without dropping the applied actions.
+
+        Args:
+            actions (list): The `memory` list from the update-decision LLM response.
+            temp_uuid_mapping (dict): Mapping from the integer ids shown to the LLM to memory ids.
+            existing_embeddings (dict): Embeddings already computed for the extracted facts.
+            metadata (dict): Metadata template for new and updated memories.
+
+        Returns:
+            list: The applied actions, in the order the LLM returned them.
+        """
+        planned_actions = _plan_memory_actions(actions, temp_uuid_mapping)
+        if not planned_actions:
+            return []
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            changed_actions = [action for action in planned_actions if action["event"] != "ADD"]
+            existing_memories = executor.map(self._get_existing_memory, [action["id"] for action in changed_actions])
+            for action, existing_memory in zip(changed_actions, existing_memories):
+                action["existing"] = existing_memory
+            planned_actions = [
+                action for action in planned_actions if action["event"] == "ADD" or action["existing"] is not None
+            ]
+
+            failed_ids = set()
+            for event_type, memory_action in (("ADD", "add"), ("UPDATE", "update")):
+                missing = list(
+                    dict.fromkeys(
+                        action["text"]
+                        for action in planned_actions
+                        if action["event"] == event_type and action["text"] not in existing_embeddings
+                    )
+                )
+                if missing:
+                    try:
+                        existing_embeddings.update(
+                            zip(missing, self.embedding_model.embed_batch(missing, memory_action))
+                        )
+                    except Exception as e:
+                        failed_ids.update(_fail_memory_actions(planned_actions, event_type, missing, e))
+            planned_actions = [action for action in planned_actions if action["id"] not in failed_ids]
+
+            for action in planned_actions:
+                _prepare_memory_action(action, metadata)
+
+            # New memories go out as one bulk insert, updates and deletes as individual writes.
+            write_futures = [
+                (executor.submit(self._write_memory_action, action, existing_embeddings), action)
+                for action in planned_actions
+                if action["event"] != "ADD"
+            ]
+            add_actions = [action for action in planned_actions if action["event"] == "ADD"]
+            insert_future = (
+                executor.submit(self._insert_memories, add_actions, existing_embeddings) if add_actions else None
+            )
+
+            for future, action in write_futures:
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Error processing memory action: {action['resp']}, Error: {e}")
+                    failed_ids.add(action["id"])
+            if insert_future is not None:
+                failed_ids.update(insert_future.result())
+
+        applied_actions = [action for action in planned_actions if action["id"] not in failed_ids]
+        if applied_actions:
+            try:
+                self.db.add_history_batch([action["history"] for action in applied_actions])
+            except Exception as e:
+                # The memories are stored, only their history is missing
+                logger.error(f"Error writing history for {len(applied_actions)} memory actions: {e}")
+
+        for action in applied_actions:
+            capture_event(
+                _MEMORY_ACTION_EVENTS[action["event"]], self, {"memory_id": action["id"], "sync_type": "sync"}
+            )
+        return [_memory_action_result(action) for action in applied_actions]
+
+    def _get_existing_memory(self, memory_id):
+        try:
+            existing_memory = self.vector_store.get(vector_id=memory_id)
+        except Exception as e:
+            logger.error(f"Error getting memory with ID {memory_id}: {e}")
+            return None
+        if existing_memory is None:
+            logger.error(f"Memory with ID {memory_id} not found.")
+        return existing_memory
+
+    def _insert_memories(self, actions, existing_embeddings):
+        """
+        Insert new memories with one bulk insert. If it fails, insert them one by one so that one
+        bad memory does not fail the others. Memories the bulk insert stored before failing are
+        not inserted again, as not every store rolls back a failed bulk insert.
+
+        Returns:
+            set: IDs of the memories that could not be inserted.
+        """
+        try:
+            self.vector_store.insert(
+                vectors=[existing_embeddings[action["text"]] for action in actions],
+                ids=[action["id"] for action in actions],
+                payloads=[action["payload"] for action in actions],
+            )
+            return set()
+        except Exception as e:
+            if len(actions) == 1:
+                logger.error(f"Error processing memory action: {actions[0]['resp']}, Error: {e}")
+                return {actions[0]["id"]}
+            logger.warning(f"Bulk insert of {len(actions)} memories failed, inserting them one by one: {e}")
+
+        failed_ids = set()
+        for action in actions:
+            if self._is_stored(action["id"]):
+                continue
+            try:
+                self.vector_store.insert(
+                    vectors=[existing_embeddings[action["text"]]], ids=[action["id"]], payloads=[action["payload"]]
+                )
+            except Exception as e:
+                logger.error(f"Error processing memory action: {action['resp']}, Error: {e}")
+                failed_ids.add(action["id"])
+        return failed_ids
+
+    def _is_stored(self, memory_id):
+        try:
+            return self.vector_store.get(vector_id=memory_id) is not None
+        except Exception:
+            return False
+
+    def _write_memory_action(self, action, existing_embeddings):
+        if action["event"] == "UPDATE":
+            logger.info(f"Updating memory with ID {action['id']} with data={action['text']!r}")
+            self.vector_store.update(
+                vector_id=action["id"],
+                vector=existing_embeddings[action["text"]],
+                payload=action["payload"],
+            )
+        else:
+            logger.info(f"Deleting memory with ID {action['id']}")
+            self.vector_store.delete(vector_id=action["id"])
+
     def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -879,23 +1151,7 @@ class Memory(MemoryBase):
 
         prev_value = existing_memory.payload.get("data")
 
-        new_metadata = deepcopy(metadata) if metadata is not None else {}
-
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-        if "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        new_metadata = _build_updated_metadata(existing_memory.payload, data, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
@@ -948,11 +1204,7 @@ class Memory(MemoryBase):
         """
         logger.warning("Resetting all memories")
 
-        if hasattr(self.db, "connection") and self.db.connection:
-            self.db.connection.execute("DROP TABLE IF EXISTS history")
-            self.db.connection.close()
-
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.db.reset()
 
         if hasattr(self.vector_store, "reset"):
             self.vector_store = VectorStoreFactory.reset(self.vector_store)
@@ -981,9 +1233,18 @@ class AsyncMemory(MemoryBase):
             self.config.vector_store.provider, self.config.vector_store.config
         )
         self.llm = LlmFactory.create(self.config.llm.provider, self.config.llm.config)
-        self.db = SQLiteManager(self.config.history_db_path)
+        self.db = _create_history_store(self.config)
         self.collection_name = self.config.vector_store.config.collection_name
         self.api_version = self.config.version
+        self.max_workers = self.config.max_workers
+        self._call_limiters = create_call_limiters(
+            self.config.concurrency,
+            {
+                "embedder": self.config.embedder.provider,
+                "llm": self.config.llm.provider,
+                "vector_store": self.config.vector_store.provider,
+            },
+        )
 
         self.enable_graph = False
 
@@ -1006,6 +1267,44 @@ class AsyncMemory(MemoryBase):
             raise
         return cls(config)
 
+    @staticmethod
+    async def _async_call(target, method, *args, **kwargs):
+        """
+        Call `method` of `target`, awaiting its native async variant (`a<method>`) when it has
+        one and running the sync method in a thread otherwise.
+        """
+        async_method = getattr(target, f"a{method}", None)
+        if inspect.iscoroutinefunction(async_method):
+            return await async_method(*args, **kwargs)
+        return await asyncio.to_thread(getattr(target, method), *args, **kwargs)
+
+    async def _limited_call(self, kind, target, method, *args, **kwargs):
+        """Make a provider call within the concurrency and rate limits configured for its kind."""
+        return await self._call_limiters[kind].run(lambda: self._async_call(target, method, *args, **kwargs))
+
+    async def _embedder_call(self, method, *args, **kwargs):
+        """Call `method` of the embedding model, natively async when the embedder supports it."""
+        return await self._limited_call("embedder", self.embedding_model, method, *args, **kwargs)
+
+    async def _llm_call(self, method, **kwargs):
+        """Call `method` of the LLM, natively async when the LLM supports it."""
+        return await self._limited_call("llm", self.llm, method, **kwargs)
+
+    async def _vector_store_call(self, method, **kwargs):
+        """Call `method` of the vector store, natively async when the store supports it."""
+        return await self._limited_call("vector_store", self.vector_store, method, **kwargs)
+
+    @property
+    def concurrency_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Queue depth and throughput of the provider calls of this instance.
+
+        For each kind of call ("embedder", "llm", "vector_store"): calls waiting for a slot or
+        a rate limit token, calls in flight, the highest number of waiting calls seen, calls made
+        and the total seconds spent waiting.
+        """
+        return {kind: limiter.stats for kind, limiter in self._call_limiters.items()}
+
     @staticmethod
     def _process_config(config_dict: Dict[str, Any]) -> Dict[str, Any]:
         if "graph_store" in config_dict:
@@ -1113,7 +1412,7 @@ class AsyncMemory(MemoryBase):
         infer: bool,
     ):
         if not infer:
-            returned_memories = []
+            raw_messages = []
             for message_dict in messages:
                 if (
                     not isinstance(message_dict, dict)
@@ -1133,20 +1432,28 @@ class AsyncMemory(MemoryBase):
                 if actor_name:
                     per_msg_meta["actor_id"] = actor_name
 
-                msg_content = message_dict["content"]
-                msg_embeddings = await asyncio.to_thread(self.embedding_model.embed, msg_content, "add")
-                mem_id = await self._create_memory(msg_content, msg_embeddings, per_msg_meta)
+                raw_messages.append((message_dict, actor_name, per_msg_meta))
 
-                returned_memories.append(
-                    {
-                        "id": mem_id,
-                        "memory": msg_content,
-                        "event": "ADD",
-                        "actor_id": actor_name if actor_name else None,
-                        "role": message_dict["role"],
-                    }
+            # One embedding request for all messages, then the writes run concurrently
+            contents = [message_dict["content"] for message_dict, _, _ in raw_messages]
+            msg_embeddings = await self._embedder_call("embed_batch", contents, "add") if contents else []
+            mem_ids = await asyncio.gather(
+                *(
+                    self._create_memory(content, {content: embeddings}, per_msg_meta)
+                    for content, embeddings, (_, _, per_msg_meta) in zip(contents, msg_embeddings, raw_messages)
                 )
-            return returned_memories
+            )
+
+            return [
+                {
+                    "id": mem_id,
+                    "memory": message_dict["content"],
+                    "event": "ADD",
+                    "actor_id": actor_name if actor_name else None,
+                    "role": message_dict["role"],
+                }
+                for mem_id, (message_dict, actor_name, _) in zip(mem_ids, raw_messages)
+            ]
 
         parsed_messages = parse_messages(messages)
         if self.config.custom_fact_extraction_prompt:
@@ -1155,8 +1462,8 @@ class AsyncMemory(MemoryBase):
         else:
             system_prompt, user_prompt = get_fact_retrieval_messages(parsed_messages)
 
-        response = await asyncio.to_thread(
-            self.llm.generate_response,
+        response = await self._llm_call(
+            "generate_response",
             messages=[{"role": "system", "content": system_prompt}, {"role": "user", "content": user_prompt}],
             response_format={"type": "json_object"},
         )
@@ -1173,22 +1480,20 @@ class AsyncMemory(MemoryBase):
         retrieved_old_memory = []
         new_message_embeddings = {}
 
-        async def process_fact_for_search(new_mem_content):
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, new_mem_content, "add")
-            new_message_embeddings[new_mem_content] = embeddings
-            existing_mems = await asyncio.to_thread(
-                self.vector_store.search,
-                query=new_mem_content,
-                vectors=embeddings,
+        if new_retrieved_facts:
+            fact_embeddings = await self._embedder_call("embed_batch", new_retrieved_facts, "add")
+            search_results = await self._vector_store_call(
+                "search_batch",
+                queries=new_retrieved_facts,
+                vectors_list=fact_embeddings,
                 limit=5,
                 filters=effective_filters,  # 'filters' is query_filters_for_inference
             )
-            return [{"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems]
-
-        search_tasks = [process_fact_for_search(fact) for fact in new_retrieved_facts]
-        search_results_list = await asyncio.gather(*search_tasks)
-        for result_group in search_results_list:
-            retrieved_old_memory.extend(result_group)
+        else:
+            fact_embeddings, search_results = [], []
+        for new_mem_content, embeddings, existing_mems in zip(new_retrieved_facts, fact_embeddings, search_results):
+            new_message_embeddings[new_mem_content] = embeddings
+            retrieved_old_memory.extend({"id": mem.id, "text": mem.payload["data"]} for mem in existing_mems)
 
         unique_data = {}
         for item in retrieved_old_memory:
@@ -1205,8 +1510,8 @@ class AsyncMemory(MemoryBase):
                 retrieved_old_memory, new_retrieved_facts, self.config.custom_update_memory_prompt
             )
             try:
-                response = await asyncio.to_thread(
-                    self.llm.generate_response,
+                response = await self._llm_call(
+                    "generate_response",
                     messages=[{"role": "user", "content": function_calling_prompt}],
                     response_format={"type": "json_object"},
                 )
@@ -1219,63 +1524,17 @@ class AsyncMemory(MemoryBase):
             except Exception as e:
                 logger.error(f"Invalid JSON response: {e}")
                 new_memories_with_actions = {}
+        else:
+            new_memories_with_actions = {}
 
         returned_memories = []
         try:
-            memory_tasks = []
-            for resp in new_memories_with_actions.get("memory", []):
-                logger.info(resp)
-                try:
-                    action_text = resp.get("text")
-                    if not action_text:
-                        continue
-                    event_type = resp.get("event")
-
-                    if event_type == "ADD":
-                        task = asyncio.create_task(
-                            self._create_memory(
-                                data=action_text,
-                                existing_embeddings=new_message_embeddings,
-                                metadata=deepcopy(metadata),
-                            )
-                        )
-                        memory_tasks.append((task, resp, "ADD", None))
-                    elif event_type == "UPDATE":
-                        task = asyncio.create_task(
-                            self._update_memory(
-                                memory_id=temp_uuid_mapping[resp["id"]],
-                                data=action_text,
-                                existing_embeddings=new_message_embeddings,
-                                metadata=deepcopy(metadata),
-                            )
-                        )
-                        memory_tasks.append((task, resp, "UPDATE", temp_uuid_mapping[resp["id"]]))
-                    elif event_type == "DELETE":
-                        task = asyncio.create_task(self._delete_memory(memory_id=temp_uuid_mapping[resp.get("id")]))
-                        memory_tasks.append((task, resp, "DELETE", temp_uuid_mapping[resp.get("id")]))
-                    elif event_type == "NONE":
-                        logger.info("NOOP for Memory (async).")
-                except Exception as e:
-                    logger.error(f"Error processing memory action (async): {resp}, Error: {e}")
-
-            for task, resp, event_type, mem_id in memory_tasks:
-                try:
-                    result_id = await task
-                    if event_type == "ADD":
-                        returned_memories.append({"id": result_id, "memory": resp.get("text"), "event": event_type})
-                    elif event_type == "UPDATE":
-                        returned_memories.append(
-                            {
-                                "id": mem_id,
-                                "memory": resp.get("text"),
-                                "event": event_type,
-                                "previous_memory": resp.get("old_memory"),
-                            }
-                        )
-                    elif event_type == "DELETE":
-                        returned_memories.append({"id": mem_id, "memory": resp.get("text"), "event": event_type})
-                except Exception as e:
-                    logger.error(f"Error awaiting memory task (async): {e}")
+            returned_memories = await self._apply_memory_actions(
+                new_memories_with_actions.get("memory", []),
+                temp_uuid_mapping,
+                new_message_embeddings,
+                metadata,
+            )
         except Exception as e:
             logger.error(f"Error in memory processing loop (async): {e}")
 
@@ -1287,6 +1546,142 @@ class AsyncMemory(MemoryBase):
         )
         return returned_memories
 
+    async def _apply_memory_actions(self, actions, temp_uuid_mapping, existing_embeddings, metadata):
+        """
+        Apply the ADD/UPDATE/DELETE actions decided by the LLM asynchronously.
+
+        Mirrors `Memory._apply_memory_actions`: at most `max_workers` vector store calls are in
+        flight at once, new memories are written with one bulk insert and all history records
+        are written in a single transaction.
+
+        Args:
+            actions (list): The `memory` list from the update-decision LLM response.
+            temp_uuid_mapping (dict): Mapping from the integer ids shown to the LLM to memory ids.
+            existing_embeddings (dict): Embeddings already computed for the extracted facts.
+            metadata (dict): Metadata template for new and updated memories.
+
+        Returns:
+            list: The applied actions, in the order the LLM returned them.
+        """
+        planned_actions = _plan_memory_actions(actions, temp_uuid_mapping)
+        if not planned_actions:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_bounded(method, **kwargs):
+            async with semaphore:
+                return await self._vector_store_call(method, **kwargs)
+
+        async def get_existing_memory(memory_id):
+            try:
+                existing_memory = await run_bounded("get", vector_id=memory_id)
+            except Exception as e:
+                logger.error(f"Error getting memory with ID {memory_id}: {e}")
+                return None
+            if existing_memory is None:
+                logger.error(f"Memory with ID {memory_id} not found.")
+            return existing_memory
+
+        changed_actions = [action for action in planned_actions if action["event"] != "ADD"]
+        existing_memories = await asyncio.gather(*(get_existing_memory(action["id"]) for action in changed_actions))
+        for action, existing_memory in zip(changed_actions, existing_memories):
+            action["existing"] = existing_memory
+        planned_actions = [
+            action for action in planned_actions if action["event"] == "ADD" or action["existing"] is not None
+        ]
+
+        failed_ids = set()
+        for event_type, memory_action in (("ADD", "add"), ("UPDATE", "update")):
+            missing = list(
+                dict.fromkeys(
+                    action["text"]
+                    for action in planned_actions
+                    if action["event"] == event_type and action["text"] not in existing_embeddings
+                )
+            )
+            if missing:
+                try:
+                    embeddings = await self._embedder_call("embed_batch", missing, memory_action)
+                    existing_embeddings.update(zip(missing, embeddings))
+                except Exception as e:
+                    failed_ids.update(_fail_memory_actions(planned_actions, event_type, missing, e))
+        planned_actions = [action for action in planned_actions if action["id"] not in failed_ids]
+
+        for action in planned_actions:
+            _prepare_memory_action(action, metadata)
+
+        async def write_action(action):
+            if action["event"] == "UPDATE":
+                logger.info(f"Updating memory with ID {action['id']} with data={action['text']!r}")
+                await run_bounded(
+                    "update",
+                    vector_id=action["id"],
+                    vector=existing_embeddings[action["text"]],
+                    payload=action["payload"],
+                )
+            else:
+                logger.info(f"Deleting memory with ID {action['id']}")
+                await run_bounded("delete", vector_id=action["id"])
+
+        async def insert_action(action):
+            # Not every store rolls back a failed bulk insert, skip memories it already stored
+            try:
+                if await run_bounded("get", vector_id=action["id"]) is not None:
+                    return
+            except Exception:
+                pass
+            await run_bounded(
+                "insert",
+                vectors=[existing_embeddings[action["text"]]],
+                ids=[action["id"]],
+                payloads=[action["payload"]],
+            )
+
+        async def insert_actions(add_actions):
+            # One bulk insert, then one insert per memory if it fails so that one bad memory does not fail the others
+            if not add_actions:
+                return []
+            try:
+                await run_bounded(
+                    "insert",
+                    vectors=[existing_embeddings[action["text"]] for action in add_actions],
+                    ids=[action["id"] for action in add_actions],
+                    payloads=[action["payload"] for action in add_actions],
+                )
+                return [None] * len(add_actions)
+            except Exception as e:
+                if len(add_actions) == 1:
+                    return [e]
+                logger.warning(f"Bulk insert of {len(add_actions)} memories failed, inserting them one by one: {e}")
+            return await asyncio.gather(*(insert_action(action) for action in add_actions), return_exceptions=True)
+
+        # New memories go out as one bulk insert, updates and deletes as individual writes.
+        add_actions = [action for action in planned_actions if action["event"] == "ADD"]
+        write_actions = [action for action in planned_actions if action["event"] != "ADD"]
+        *write_results, insert_results = await asyncio.gather(
+            *(write_action(action) for action in write_actions), insert_actions(add_actions), return_exceptions=True
+        )
+
+        for action, write_result in zip(write_actions + add_actions, write_results + insert_results):
+            if isinstance(write_result, Exception):
+                logger.error(f"Error processing memory action (async): {action['resp']}, Error: {write_result}")
+                failed_ids.add(action["id"])
+
+        applied_actions = [action for action in planned_actions if action["id"] not in failed_ids]
+        if applied_actions:
+            try:
+                await self.db.aadd_history_batch([action["history"] for action in applied_actions])
+            except Exception as e:
+                # The memories are stored, only their history is missing
+                logger.error(f"Error writing history for {len(applied_actions)} memory actions: {e}")
+
+        for action in applied_actions:
+            capture_event(
+                _MEMORY_ACTION_EVENTS[action["event"]], self, {"memory_id": action["id"], "sync_type": "async"}
+            )
+        return [_memory_action_result(action) for action in applied_actions]
+
     async def _add_to_graph(self, messages, filters):
         added_entities = []
         if self.enable_graph:
@@ -1294,7 +1689,7 @@ class AsyncMemory(MemoryBase):
                 filters["user_id"] = "user"
 
             data = "\n".join([msg["content"] for msg in messages if "content" in msg and msg["role"] != "system"])
-            added_entities = await asyncio.to_thread(self.graph.add, data, filters)
+            added_entities = await self.graph.aadd(data, filters)
 
         return added_entities
 
@@ -1309,7 +1704,7 @@ class AsyncMemory(MemoryBase):
             dict: Retrieved memory.
         """
         capture_event("mem0.get", self, {"memory_id": memory_id, "sync_type": "async"})
-        memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        memory = await self._vector_store_call("get", vector_id=memory_id)
         if not memory:
             return None
 
@@ -1384,18 +1779,14 @@ class AsyncMemory(MemoryBase):
             "mem0.get_all", self, {"limit": limit, "keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"}
         )
 
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            future_memories = executor.submit(self._get_all_from_vector_store, effective_filters, limit)
-            future_graph_entities = (
-                executor.submit(self.graph.get_all, effective_filters, limit) if self.enable_graph else None
-            )
-
-            concurrent.futures.wait(
-                [future_memories, future_graph_entities] if future_graph_entities else [future_memories]
+        if self.enable_graph:
+            all_memories_result, graph_entities_result = await asyncio.gather(
+                self._get_all_from_vector_store(effective_filters, limit),
+                asyncio.to_thread(self.graph.get_all, effective_filters, limit),
             )
-
-            all_memories_result = future_memories.result()
-            graph_entities_result = future_graph_entities.result() if future_graph_entities else None
+        else:
+            all_memories_result = await self._get_all_from_vector_store(effective_filters, limit)
+            graph_entities_result = None
 
         if self.enable_graph:
             return {"results": all_memories_result, "relations": graph_entities_result}
@@ -1413,7 +1804,7 @@ class AsyncMemory(MemoryBase):
             return {"results": all_memories_result}
 
     async def _get_all_from_vector_store(self, filters, limit):
-        memories_result = await asyncio.to_thread(self.vector_store.list, filters=filters, limit=limit)
+        memories_result = await self._vector_store_call("list", filters=filters, limit=limit)
         actual_memories = (
             memories_result[0]
             if isinstance(memories_result, (tuple, list)) and len(memories_result) > 0
@@ -1531,9 +1922,9 @@ class AsyncMemory(MemoryBase):
             return {"results": original_memories}
 
     async def _search_vector_store(self, query, filters, limit, threshold: Optional[float] = None):
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, query, "search")
-        memories = await asyncio.to_thread(
-            self.vector_store.search, query=query, vectors=embeddings, limit=limit, filters=filters
+        embeddings = await self._embedder_call("embed", query, "search")
+        memories = await self._vector_store_call(
+            "search", query=query, vectors=embeddings, limit=limit, filters=filters
         )
 
         promoted_payload_keys = [
@@ -1583,7 +1974,7 @@ class AsyncMemory(MemoryBase):
         """
         capture_event("mem0.update", self, {"memory_id": memory_id, "sync_type": "async"})
 
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+        embeddings = await self._embedder_call("embed", data, "update")
         existing_embeddings = {data: embeddings}
 
         await self._update_memory(memory_id, data, existing_embeddings)
@@ -1624,7 +2015,7 @@ class AsyncMemory(MemoryBase):
 
         keys, encoded_ids = process_telemetry_filters(filters)
         capture_event("mem0.delete_all", self, {"keys": keys, "encoded_ids": encoded_ids, "sync_type": "async"})
-        memories = await asyncio.to_thread(self.vector_store.list, filters=filters)
+        memories = await self._vector_store_call("list", filters=filters)
 
         delete_tasks = []
         for memory in memories[0]:
@@ -1650,14 +2041,14 @@ class AsyncMemory(MemoryBase):
             list: List of changes for the memory.
         """
         capture_event("mem0.history", self, {"memory_id": memory_id, "sync_type": "async"})
-        return await asyncio.to_thread(self.db.get_history, memory_id)
+        return await self.db.aget_history(memory_id)
 
     async def _create_memory(self, data, existing_embeddings, metadata=None):
         logger.debug(f"Creating memory with {data=}")
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, memory_action="add")
+            embeddings = await self._embedder_call("embed", data, memory_action="add")
 
         memory_id = str(uuid.uuid4())
         metadata = metadata or {}
@@ -1665,15 +2056,14 @@ class AsyncMemory(MemoryBase):
         metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
         metadata["created_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
 
-        await asyncio.to_thread(
-            self.vector_store.insert,
+        await self._vector_store_call(
+            "insert",
             vectors=[embeddings],
             ids=[memory_id],
             payloads=[metadata],
         )
 
-        await asyncio.to_thread(
-            self.db.add_history,
+        await self.db.aadd_history(
             memory_id,
             None,
             data,
@@ -1720,7 +2110,7 @@ class AsyncMemory(MemoryBase):
                 response = await asyncio.to_thread(llm.invoke, input=parsed_messages)
                 procedural_memory = response.content
             else:
-                procedural_memory = await asyncio.to_thread(self.llm.generate_response, messages=parsed_messages)
+                procedural_memory = await self._llm_call("generate_response", messages=parsed_messages)
         except Exception as e:
             logger.error(f"Error generating procedural memory summary: {e}")
             raise
@@ -1729,7 +2119,7 @@ class AsyncMemory(MemoryBase):
             raise ValueError("Metadata cannot be done for procedural memory.")
 
         metadata["memory_type"] = MemoryType.PROCEDURAL.value
-        embeddings = await asyncio.to_thread(self.embedding_model.embed, procedural_memory, memory_action="add")
+        embeddings = await self._embedder_call("embed", procedural_memory, memory_action="add")
         memory_id = await self._create_memory(procedural_memory, {procedural_memory: embeddings}, metadata=metadata)
         capture_event("mem0._create_procedural_memory", self, {"memory_id": memory_id, "sync_type": "async"})
 
@@ -1741,47 +2131,29 @@ class AsyncMemory(MemoryBase):
         logger.info(f"Updating memory with {data=}")
 
         try:
-            existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+            existing_memory = await self._vector_store_call("get", vector_id=memory_id)
         except Exception:
             logger.error(f"Error getting memory with ID {memory_id} during update.")
             raise ValueError(f"Error getting memory with ID {memory_id}. Please provide a valid 'memory_id'")
 
         prev_value = existing_memory.payload.get("data")
 
-        new_metadata = deepcopy(metadata) if metadata is not None else {}
-
-        new_metadata["data"] = data
-        new_metadata["hash"] = hashlib.md5(data.encode()).hexdigest()
-        new_metadata["created_at"] = existing_memory.payload.get("created_at")
-        new_metadata["updated_at"] = datetime.now(pytz.timezone("US/Pacific")).isoformat()
-
-        if "user_id" in existing_memory.payload:
-            new_metadata["user_id"] = existing_memory.payload["user_id"]
-        if "agent_id" in existing_memory.payload:
-            new_metadata["agent_id"] = existing_memory.payload["agent_id"]
-        if "run_id" in existing_memory.payload:
-            new_metadata["run_id"] = existing_memory.payload["run_id"]
-
-        if "actor_id" in existing_memory.payload:
-            new_metadata["actor_id"] = existing_memory.payload["actor_id"]
-        if "role" in existing_memory.payload:
-            new_metadata["role"] = existing_memory.payload["role"]
+        new_metadata = _build_updated_metadata(existing_memory.payload, data, metadata)
 
         if data in existing_embeddings:
             embeddings = existing_embeddings[data]
         else:
-            embeddings = await asyncio.to_thread(self.embedding_model.embed, data, "update")
+            embeddings = await self._embedder_call("embed", data, "update")
 
-        await asyncio.to_thread(
-            self.vector_store.update,
+        await self._vector_store_call(
+            "update",
             vector_id=memory_id,
             vector=embeddings,
             payload=new_metadata,
         )
         logger.info(f"Updating memory with ID {memory_id=} with {data=}")
 
-        await asyncio.to_thread(
-            self.db.add_history,
+        await self.db.aadd_history(
             memory_id,
             prev_value,
             data,
@@ -1796,12 +2168,11 @@ class AsyncMemory(MemoryBase):
 
     async def _delete_memory(self, memory_id):
         logger.info(f"Deleting memory with {memory_id=}")
-        existing_memory = await asyncio.to_thread(self.vector_store.get, vector_id=memory_id)
+        existing_memory = await self._vector_store_call("get", vector_id=memory_id)
         prev_value = existing_memory.payload["data"]
 
-        await asyncio.to_thread(self.vector_store.delete, vector_id=memory_id)
-        await asyncio.to_thread(
-            self.db.add_history,
+        await self._vector_store_call("delete", vector_id=memory_id)
+        await self.db.aadd_history(
             memory_id,
             prev_value,
             None,
@@ -1828,12 +2199,10 @@ class AsyncMemory(MemoryBase):
 
         if hasattr(self.vector_store, "client") and hasattr(self.vector_store.client, "close"):
             await asyncio.to_thread(self.vector_store.client.close)
+        if inspect.iscoroutinefunction(getattr(self.vector_store, "aclose", None)):
+            await self.vector_store.aclose()
 
-        if hasattr(self.db, "connection") and self.db.connection:
-            await asyncio.to_thread(lambda: self.db.connection.execute("DROP TABLE IF EXISTS history"))
-            await asyncio.to_thread(self.db.connection.close)
-
-        self.db = SQLiteManager(self.config.history_db_path)
+        await self.db.areset()
 
         self.vector_store = VectorStoreFactory.create(
             self.config.vector_store.provider, self.config.vector_store.config
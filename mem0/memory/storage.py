@@ -1,17 +1,224 @@
+import asyncio
 import logging
+import queue
 import sqlite3
 import threading
 import uuid
-from typing import Any, Dict, List, Optional
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from mem0.utils.loop_local import LoopLocal
 
 logger = logging.getLogger(__name__)
 
+_HISTORY_COLUMNS = (
+    "id",
+    "memory_id",
+    "old_memory",
+    "new_memory",
+    "event",
+    "created_at",
+    "updated_at",
+    "is_deleted",
+    "actor_id",
+    "role",
+)
+
+
+_HISTORY_TABLE_SQL = """
+    CREATE TABLE {if_not_exists}history (
+        id           TEXT PRIMARY KEY,
+        memory_id    TEXT,
+        old_memory   TEXT,
+        new_memory   TEXT,
+        event        TEXT,
+        created_at   DATETIME,
+        updated_at   DATETIME,
+        is_deleted   INTEGER,
+        actor_id     TEXT,
+        role         TEXT
+    )
+"""
+
+_HISTORY_INDEX_SQL = "CREATE INDEX IF NOT EXISTS idx_history_memory_id ON history (memory_id)"
+
+_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+
+
+def _history_rows(records: List[Dict[str, Any]]) -> List[Tuple]:
+    """Convert history records into rows ordered like `_HISTORY_COLUMNS`, assigning fresh ids."""
+    return [
+        (
+            str(uuid.uuid4()),
+            record["memory_id"],
+            record.get("old_memory"),
+            record.get("new_memory"),
+            record["event"],
+            record.get("created_at"),
+            record.get("updated_at"),
+            record.get("is_deleted", 0),
+            record.get("actor_id"),
+            record.get("role"),
+        )
+        for record in records
+    ]
+
+
+def _history_row_to_dict(row: Tuple) -> Dict[str, Any]:
+    item = dict(zip(_HISTORY_COLUMNS, row))
+    item["is_deleted"] = bool(item["is_deleted"])
+    return item
+
+
+class HistoryStoreBase(ABC):
+    """
+    Base class for memory history stores.
+
+    Subclasses implement the batch write, lookup and reset primitives. The async
+    API defaults to running the sync implementation in a worker thread; stores
+    with a native async driver override it.
+    """
+
+    @abstractmethod
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert several history records at once.
+
+        Args:
+            records (List[Dict[str, Any]]): Records holding the keyword arguments of `add_history`.
+        """
+        pass
+
+    @abstractmethod
+    def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the change history of a memory, oldest first.
+
+        Args:
+            memory_id (str): ID of the memory.
+
+        Returns:
+            List[Dict[str, Any]]: History records.
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Delete all history records."""
+        pass
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        pass
+
+    def add_history(
+        self,
+        memory_id: str,
+        old_memory: Optional[str],
+        new_memory: Optional[str],
+        event: str,
+        *,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        is_deleted: int = 0,
+        actor_id: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> None:
+        self.add_history_batch(
+            [
+                {
+                    "memory_id": memory_id,
+                    "old_memory": old_memory,
+                    "new_memory": new_memory,
+                    "event": event,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "is_deleted": is_deleted,
+                    "actor_id": actor_id,
+                    "role": role,
+                }
+            ]
+        )
+
+    async def aadd_history(
+        self,
+        memory_id: str,
+        old_memory: Optional[str],
+        new_memory: Optional[str],
+        event: str,
+        *,
+        created_at: Optional[str] = None,
+        updated_at: Optional[str] = None,
+        is_deleted: int = 0,
+        actor_id: Optional[str] = None,
+        role: Optional[str] = None,
+    ) -> None:
+        await self.aadd_history_batch(
+            [
+                {
+                    "memory_id": memory_id,
+                    "old_memory": old_memory,
+                    "new_memory": new_memory,
+                    "event": event,
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "is_deleted": is_deleted,
+                    "actor_id": actor_id,
+                    "role": role,
+                }
+            ]
+        )
+
+    async def aadd_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        await asyncio.to_thread(self.add_history_batch, records)
+
+    async def aget_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.get_history, memory_id)
+
+    async def areset(self) -> None:
+        await asyncio.to_thread(self.reset)
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
+
+
+class SQLiteManager(HistoryStoreBase):
+    """
+    SQLite-backed store for memory history.
+
+    File databases run in WAL mode so readers never block the single writer
+    connection: writes are serialized behind a lock while `get_history` draws
+    from a small pool of read-only connections. In-memory databases are private
+    to one connection, so they fall back to reading through the writer.
+
+    Args:
+        db_path (str): Path to the database file, or ":memory:". Defaults to ":memory:".
+        read_pool_size (int): Maximum number of pooled read connections. Defaults to 4.
+        synchronous (str): SQLite `synchronous` pragma for file databases. NORMAL is
+            durable across application crashes in WAL mode and avoids an fsync per
+            commit. Defaults to "NORMAL".
+    """
+
+    def __init__(self, db_path: str = ":memory:", read_pool_size: int = 4, synchronous: str = "NORMAL"):
+        synchronous = synchronous.upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"Invalid synchronous mode: {synchronous}. Expected one of {sorted(_SYNCHRONOUS_MODES)}")
 
-class SQLiteManager:
-    def __init__(self, db_path: str = ":memory:"):
         self.db_path = db_path
+        self.synchronous = synchronous
         self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
         self._lock = threading.Lock()
+        self._in_memory = self.db_path in ("", ":memory:") or "mode=memory" in self.db_path
+        self._read_pool_size = 0 if self._in_memory else max(read_pool_size, 0)
+        self._read_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._read_connections: List[sqlite3.Connection] = []
+        self._read_pool_lock = threading.Lock()
+
+        if not self._in_memory:
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute(f"PRAGMA synchronous={self.synchronous}")
         self._migrate_history_table()
         self._create_history_table()
 
@@ -61,22 +268,7 @@ class SQLiteManager:
                 cur.execute("ALTER TABLE history RENAME TO history_old")
 
                 # Create the new history table with updated schema
-                cur.execute(
-                    """
-                    CREATE TABLE history (
-                        id           TEXT PRIMARY KEY,
-                        memory_id    TEXT,
-                        old_memory   TEXT,
-                        new_memory   TEXT,
-                        event        TEXT,
-                        created_at   DATETIME,
-                        updated_at   DATETIME,
-                        is_deleted   INTEGER,
-                        actor_id     TEXT,
-                        role         TEXT
-                    )
-                """
-                )
+                cur.execute(_HISTORY_TABLE_SQL.format(if_not_exists=""))
 
                 # Copy data from old table to new table
                 intersecting = list(expected_cols & old_cols)
@@ -101,45 +293,66 @@ class SQLiteManager:
         with self._lock:
             try:
                 self.connection.execute("BEGIN")
-                self.connection.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS history (
-                        id           TEXT PRIMARY KEY,
-                        memory_id    TEXT,
-                        old_memory   TEXT,
-                        new_memory   TEXT,
-                        event        TEXT,
-                        created_at   DATETIME,
-                        updated_at   DATETIME,
-                        is_deleted   INTEGER,
-                        actor_id     TEXT,
-                        role         TEXT
-                    )
-                """
-                )
+                self._create_history_schema()
                 self.connection.execute("COMMIT")
             except Exception as e:
                 self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to create history table: {e}")
                 raise
 
-    def add_history(
-        self,
-        memory_id: str,
-        old_memory: Optional[str],
-        new_memory: Optional[str],
-        event: str,
-        *,
-        created_at: Optional[str] = None,
-        updated_at: Optional[str] = None,
-        is_deleted: int = 0,
-        actor_id: Optional[str] = None,
-        role: Optional[str] = None,
-    ) -> None:
+    def _create_history_schema(self) -> None:
+        """Create the history table and its memory_id index. Caller holds the write lock."""
+        self.connection.execute(_HISTORY_TABLE_SQL.format(if_not_exists="IF NOT EXISTS "))
+        self.connection.execute(_HISTORY_INDEX_SQL)
+
+    def _connect_reader(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA query_only=ON")
+        return conn
+
+    @contextmanager
+    def _read_connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Yield a connection for read queries.
+
+        Pooled read connections are created lazily up to `read_pool_size`; once
+        the pool is exhausted callers wait for a connection to be returned.
+        """
+        if not self._read_pool_size:
+            with self._lock:
+                yield self.connection
+            return
+
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._read_pool_lock:
+                if len(self._read_connections) < self._read_pool_size:
+                    conn = self._connect_reader()
+                    self._read_connections.append(conn)
+            if conn is None:
+                conn = self._read_pool.get()
+
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        """
+        Insert several history records in a single transaction.
+
+        Each record holds the keyword arguments of `add_history`.
+        """
+        if not records:
+            return
+
+        rows = _history_rows(records)
         with self._lock:
             try:
                 self.connection.execute("BEGIN")
-                self.connection.execute(
+                self.connection.executemany(
                     """
                     INSERT INTO history (
                         id, memory_id, old_memory, new_memory, event,
@@ -147,28 +360,17 @@ class SQLiteManager:
                     )
                     VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                    (
-                        str(uuid.uuid4()),
-                        memory_id,
-                        old_memory,
-                        new_memory,
-                        event,
-                        created_at,
-                        updated_at,
-                        is_deleted,
-                        actor_id,
-                        role,
-                    ),
+                    rows,
                 )
                 self.connection.execute("COMMIT")
             except Exception as e:
                 self.connection.execute("ROLLBACK")
-                logger.error(f"Failed to add history record: {e}")
+                logger.error(f"Failed to add {len(rows)} history records: {e}")
                 raise
 
     def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
-        with self._lock:
-            cur = self.connection.execute(
+        with self._read_connection() as conn:
+            cur = conn.execute(
                 """
                 SELECT id, memory_id, old_memory, new_memory, event,
                        created_at, updated_at, is_deleted, actor_id, role
@@ -180,21 +382,7 @@ class SQLiteManager:
             )
             rows = cur.fetchall()
 
-        return [
-            {
-                "id": r[0],
-                "memory_id": r[1],
-                "old_memory": r[2],
-                "new_memory": r[3],
-                "event": r[4],
-                "created_at": r[5],
-                "updated_at": r[6],
-                "is_deleted": bool(r[7]),
-                "actor_id": r[8],
-                "role": r[9],
-            }
-            for r in rows
-        ]
+        return [_history_row_to_dict(r) for r in rows]
 
     def reset(self) -> None:
         """Drop and recreate the history table."""
@@ -202,17 +390,258 @@ class SQLiteManager:
             try:
                 self.connection.execute("BEGIN")
                 self.connection.execute("DROP TABLE IF EXISTS history")
+                self._create_history_schema()
                 self.connection.execute("COMMIT")
-                self._create_history_table()
             except Exception as e:
                 self.connection.execute("ROLLBACK")
                 logger.error(f"Failed to reset history table: {e}")
                 raise
 
     def close(self) -> None:
-        if self.connection:
+        for conn in getattr(self, "_read_connections", []):
+            conn.close()
+        self._read_connections = []
+        self._read_pool = queue.LifoQueue()
+        if getattr(self, "connection", None):
             self.connection.close()
             self.connection = None
 
     def __del__(self):
         self.close()
+
+
+class MemoryHistoryManager(HistoryStoreBase):
+    """
+    In-process history store backed by a bounded ring buffer.
+
+    Nothing is persisted and the oldest records are evicted once `max_records`
+    is reached, which keeps memory flat for benchmarks and ephemeral workers.
+
+    Args:
+        max_records (int): Maximum number of records retained. Defaults to 10000.
+    """
+
+    def __init__(self, max_records: int = 10000):
+        if max_records <= 0:
+            raise ValueError(f"max_records must be positive, got {max_records}")
+        self.max_records = max_records
+        self._records: "deque[Tuple]" = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        rows = _history_rows(records)
+        with self._lock:
+            self._records.extend(rows)
+
+    def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = [row for row in self._records if row[1] == memory_id]
+        # Match SQL ordering, where NULL timestamps sort first
+        rows.sort(key=lambda row: (row[5] or "", row[6] or ""))
+        return [_history_row_to_dict(r) for r in rows]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+    # Operations never block, so the async API skips the thread hop.
+    async def aadd_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        self.add_history_batch(records)
+
+    async def aget_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        return self.get_history(memory_id)
+
+    async def areset(self) -> None:
+        self.reset()
+
+    async def aclose(self) -> None:
+        self.close()
+
+
+class PostgresHistoryManager(HistoryStoreBase):
+    """
+    PostgreSQL history store shared by every Memory worker pointing at the same database.
+
+    Connections come from a psycopg connection pool, batches are written with
+    COPY, and the async API uses a separate async pool opened on first use.
+
+    Args:
+        connection_string (str, optional): libpq connection string. Overrides the individual parameters.
+        dbname (str): Database name. Defaults to "postgres".
+        user (str, optional): Database user.
+        password (str, optional): Database password.
+        host (str, optional): Database host.
+        port (int, optional): Database port.
+        sslmode (str, optional): SSL mode, e.g. "require".
+        table_name (str): History table name. Defaults to "mem0_history".
+        minconn (int): Minimum pooled connections. Defaults to 1.
+        maxconn (int): Maximum pooled connections. Defaults to 10.
+    """
+
+    def __init__(
+        self,
+        connection_string: Optional[str] = None,
+        dbname: str = "postgres",
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        sslmode: Optional[str] = None,
+        table_name: str = "mem0_history",
+        minconn: int = 1,
+        maxconn: int = 10,
+    ):
+        try:
+            from psycopg import sql
+            from psycopg.conninfo import make_conninfo
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            raise ImportError(
+                "The 'psycopg' and 'psycopg_pool' libraries are required for the Postgres history store. "
+                "Please install them using 'pip install \"psycopg[pool]\"'."
+            )
+
+        if connection_string:
+            self.conninfo = connection_string
+        else:
+            params = {
+                "dbname": dbname,
+                "user": user,
+                "password": password,
+                "host": host,
+                "port": port,
+                "sslmode": sslmode,
+            }
+            self.conninfo = make_conninfo(**{k: v for k, v in params.items() if v is not None})
+
+        self.table_name = table_name
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self._sql = sql
+        self._table = sql.Identifier(table_name)
+        self._columns = sql.SQL(", ").join(map(sql.Identifier, _HISTORY_COLUMNS))
+        self.pool = ConnectionPool(self.conninfo, min_size=minconn, max_size=maxconn, open=True)
+        self._async_pools = LoopLocal(self._open_async_pool)
+        self._create_history_table()
+
+    def _schema_statements(self) -> List[Any]:
+        sql = self._sql
+        return [
+            sql.SQL(
+                """
+                CREATE TABLE IF NOT EXISTS {table} (
+                    id           TEXT PRIMARY KEY,
+                    memory_id    TEXT,
+                    old_memory   TEXT,
+                    new_memory   TEXT,
+                    event        TEXT,
+                    created_at   TEXT,
+                    updated_at   TEXT,
+                    is_deleted   INTEGER,
+                    actor_id     TEXT,
+                    role         TEXT
+                )
+                """
+            ).format(table=self._table),
+            sql.SQL("CREATE INDEX IF NOT EXISTS {index} ON {table} (memory_id)").format(
+                index=sql.Identifier(f"{self.table_name}_memory_id_idx"), table=self._table
+            ),
+        ]
+
+    def _copy_statement(self):
+        return self._sql.SQL("COPY {table} ({columns}) FROM STDIN").format(table=self._table, columns=self._columns)
+
+    def _select_statement(self):
+        # NULLS FIRST keeps the ordering identical to the SQLite store
+        return self._sql.SQL(
+            "SELECT {columns} FROM {table} WHERE memory_id = %s "
+            "ORDER BY created_at ASC NULLS FIRST, updated_at ASC NULLS FIRST"
+        ).format(columns=self._columns, table=self._table)
+
+    def _create_history_table(self) -> None:
+        with self.pool.connection() as conn:
+            for statement in self._schema_statements():
+                conn.execute(statement)
+
+    def add_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        rows = _history_rows(records)
+        try:
+            with self.pool.connection() as conn:
+                with conn.cursor() as cur:
+                    with cur.copy(self._copy_statement()) as copy:
+                        for row in rows:
+                            copy.write_row(row)
+        except Exception as e:
+            logger.error(f"Failed to add {len(rows)} history records: {e}")
+            raise
+
+    def get_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        with self.pool.connection() as conn:
+            rows = conn.execute(self._select_statement(), (memory_id,)).fetchall()
+        return [_history_row_to_dict(r) for r in rows]
+
+    def reset(self) -> None:
+        with self.pool.connection() as conn:
+            conn.execute(self._sql.SQL("DROP TABLE IF EXISTS {table}").format(table=self._table))
+            for statement in self._schema_statements():
+                conn.execute(statement)
+
+    def close(self) -> None:
+        self.pool.close()
+
+    def _open_async_pool(self):
+        from psycopg_pool import AsyncConnectionPool
+
+        pool = AsyncConnectionPool(self.conninfo, min_size=self.minconn, max_size=self.maxconn, open=False)
+        return pool, asyncio.ensure_future(pool.open())
+
+    async def _get_async_pool(self):
+        """The async pool of the running event loop, opened on first use."""
+        # Concurrent first callers of a loop all wait for the same open
+        entry = self._async_pools.get()
+        pool, opening = entry
+        try:
+            await opening
+        except Exception:
+            self._async_pools.discard(entry)
+            raise
+        return pool
+
+    async def aadd_history_batch(self, records: List[Dict[str, Any]]) -> None:
+        if not records:
+            return
+
+        rows = _history_rows(records)
+        pool = await self._get_async_pool()
+        try:
+            async with pool.connection() as conn:
+                async with conn.cursor() as cur:
+                    async with cur.copy(self._copy_statement()) as copy:
+                        for row in rows:
+                            await copy.write_row(row)
+        except Exception as e:
+            logger.error(f"Failed to add {len(rows)} history records: {e}")
+            raise
+
+    async def aget_history(self, memory_id: str) -> List[Dict[str, Any]]:
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            cur = await conn.execute(self._select_statement(), (memory_id,))
+            rows = await cur.fetchall()
+        return [_history_row_to_dict(r) for r in rows]
+
+    async def areset(self) -> None:
+        pool = await self._get_async_pool()
+        async with pool.connection() as conn:
+            await conn.execute(self._sql.SQL("DROP TABLE IF EXISTS {table}").format(table=self._table))
+            for statement in self._schema_statements():
+                await conn.execute(statement)
+
+    async def aclose(self) -> None:
+        entry = self._async_pools.discard()
+        if entry is not None:
+            await entry[0].close()
+        await asyncio.to_thread(self.pool.close)
@@ -10,7 +10,9 @@ from mem0.configs.llms.lmstudio import LMStudioConfig
 from mem0.configs.llms.ollama import OllamaConfig
 from mem0.configs.llms.openai import OpenAIConfig
 from mem0.configs.llms.vllm import VllmConfig
+from mem0.embeddings.cached import CachedEmbedder
 from mem0.embeddings.mock import MockEmbeddings
+from mem0.llms.cache import create_response_cache
 
 
 def load_class(class_type):
@@ -68,6 +70,11 @@ class LlmFactory:
         class_type, config_class = cls.provider_to_class[provider_name]
         llm_class = load_class(class_type)
 
+        response_cache = kwargs.pop("response_cache", None)
+        if isinstance(config, dict) and "response_cache" in config:
+            config = dict(config)
+            response_cache = config.pop("response_cache")
+
         # Handle configuration
         if config is None:
             # Create default config with kwargs
@@ -100,7 +107,9 @@ class LlmFactory:
             # Assume it's already the correct config type
             pass
 
-        return llm_class(config)
+        llm = llm_class(config)
+        llm.response_cache = create_response_cache(response_cache)
+        return llm
 
     @classmethod
     def register_provider(cls, name: str, class_path: str, config_class=None):
@@ -147,9 +156,15 @@ class EmbedderFactory:
             return MockEmbeddings()
         class_type = cls.provider_to_class.get(provider_name)
         if class_type:
+            config = dict(config or {})
+            cache_config = config.pop("cache", None)
             embedder_instance = load_class(class_type)
             base_config = BaseEmbedderConfig(**config)
-            return embedder_instance(base_config)
+            embedder = embedder_instance(base_config)
+            if cache_config:
+                cache_config = {} if cache_config is True else dict(cache_config)
+                embedder = CachedEmbedder(embedder, provider=provider_name, **cache_config)
+            return embedder
         else:
             raise ValueError(f"Unsupported Embedder provider: {provider_name}")
 
@@ -191,6 +206,23 @@ class VectorStoreFactory:
         return instance
 
 
+class HistoryStoreFactory:
+    provider_to_class = {
+        "sqlite": "mem0.memory.storage.SQLiteManager",
+        "postgres": "mem0.memory.storage.PostgresHistoryManager",
+        "memory": "mem0.memory.storage.MemoryHistoryManager",
+    }
+
+    @classmethod
+    def create(cls, provider_name, config: Optional[dict] = None):
+        class_type = cls.provider_to_class.get(provider_name)
+        if class_type:
+            history_store_instance = load_class(class_type)
+            return history_store_instance(**(config or {}))
+        else:
+            raise ValueError(f"Unsupported HistoryStore provider: {provider_name}")
+
+
 class GraphStoreFactory:
     """
     Factory for creating MemoryGraph instances for different graph store providers.
@@ -200,6 +232,7 @@ class GraphStoreFactory:
     provider_to_class = {
         "memgraph": "mem0.memory.memgraph_memory.MemoryGraph",
         "neptune": "mem0.graphs.neptune.main.MemoryGraph",
+        "local": "mem0.graphs.local.main.MemoryGraph",
         "default": "mem0.memory.graph_memory.MemoryGraph",
     }
 
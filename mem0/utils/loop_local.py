@@ -0,0 +1,52 @@
+import asyncio
+import threading
+import weakref
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """
+    One value per running event loop, created by `factory` on first use in each loop.
+
+    Async clients and pools are bound to the loop that first used them, so an object reused
+    across `asyncio.run()` calls needs a fresh one for each loop. Values of closed loops are
+    dropped on the next lookup.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._values = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def get(self) -> T:
+        """The value of the running loop, created if needed."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            for closed_loop in [other for other in self._values if other.is_closed()]:
+                del self._values[closed_loop]
+            value = self._values.get(loop)
+            if value is None:
+                value = self._values[loop] = self._factory()
+            return value
+
+    def discard(self, value: Optional[T] = None) -> Optional[T]:
+        """
+        Forget the value of the running loop, only if it is `value` when one is given.
+
+        Returns:
+            The value forgotten, or None.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            current = self._values.get(loop)
+            if current is None or (value is not None and current is not value):
+                return None
+            del self._values[loop]
+            return current
+
+    def clear(self):
+        """Forget the values of every loop."""
+        with self._lock:
+            self._values.clear()
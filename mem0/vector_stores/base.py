@@ -1,3 +1,4 @@
+import concurrent.futures
 from abc import ABC, abstractmethod
 
 
@@ -17,6 +18,31 @@ class VectorStoreBase(ABC):
         """Search for similar vectors."""
         pass
 
+    def search_batch(self, queries, vectors_list, limit=5, filters=None):
+        """
+        Search for similar vectors for several queries at once.
+
+        Stores with a native multi-query endpoint override this. The default runs the
+        individual searches concurrently on a thread pool.
+
+        Args:
+            queries (list): Queries.
+            vectors_list (list): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters applied to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query, in the same order as `queries`.
+        """
+        if not queries:
+            return []
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(self.search, query, vectors, limit, filters)
+                for query, vectors in zip(queries, vectors_list)
+            ]
+            return [future.result() for future in futures]
+
     @abstractmethod
     def delete(self, vector_id):
         """Delete a vector by ID."""
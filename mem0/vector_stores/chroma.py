@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Dict, List, Optional
 
@@ -9,6 +10,7 @@ try:
 except ImportError:
     raise ImportError("The 'chromadb' library is required. Please install it using 'pip install chromadb'.")
 
+from mem0.utils.loop_local import LoopLocal
 from mem0.vector_stores.base import VectorStoreBase
 
 logger = logging.getLogger(__name__)
@@ -39,6 +41,10 @@ class ChromaDB(VectorStoreBase):
             port (int, optional): Port for chromadb server. Defaults to None.
             path (str, optional): Path for local chromadb database. Defaults to None.
         """
+        # Server of the async client, only known when the client is built here for a chroma server
+        self._async_server = None
+        # Collection of the async client being opened, one per event loop
+        self._async_collections = LoopLocal(lambda: asyncio.ensure_future(self._open_async_collection()))
         if client:
             self.client = client
         else:
@@ -48,6 +54,7 @@ class ChromaDB(VectorStoreBase):
                 self.settings.chroma_server_host = host
                 self.settings.chroma_server_http_port = port
                 self.settings.chroma_api_impl = "chromadb.api.fastapi.FastAPI"
+                self._async_server = (host, port)
             else:
                 if path is None:
                     path = "db"
@@ -229,6 +236,87 @@ class ChromaDB(VectorStoreBase):
         logger.warning(f"Resetting index {self.collection_name}...")
         self.delete_col()
         self.collection = self.create_col(self.collection_name)
+        self._async_collections.clear()
+
+    async def _open_async_collection(self):
+        host, port = self._async_server
+        client = await chromadb.AsyncHttpClient(host=host, port=port, settings=Settings(anonymized_telemetry=False))
+        return await client.get_or_create_collection(name=self.collection_name)
+
+    async def _get_async_collection(self):
+        """
+        The collection on the async HTTP client of the running event loop, or None when the
+        store is not a chroma server.
+        """
+        if self._async_server is None:
+            return None
+        # Concurrent first callers of a loop all wait for the same open
+        opening = self._async_collections.get()
+        try:
+            return await opening
+        except Exception:
+            self._async_collections.discard(opening)
+            raise
+
+    async def ainsert(
+        self,
+        vectors: List[list],
+        payloads: Optional[List[Dict]] = None,
+        ids: Optional[List[str]] = None,
+    ):
+        """Async version of `insert`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.insert, vectors, payloads, ids)
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        await collection.add(ids=ids, embeddings=vectors, metadatas=payloads)
+
+    async def asearch(
+        self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[OutputData]:
+        """Async version of `search`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.search, query, vectors, limit, filters)
+        where_clause = self._generate_where_clause(filters) if filters else None
+        results = await collection.query(query_embeddings=vectors, where=where_clause, n_results=limit)
+        return self._parse_output(results)
+
+    async def adelete(self, vector_id: str):
+        """Async version of `delete`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.delete, vector_id)
+        await collection.delete(ids=vector_id)
+
+    async def aupdate(
+        self,
+        vector_id: str,
+        vector: Optional[List[float]] = None,
+        payload: Optional[Dict] = None,
+    ):
+        """Async version of `update`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.update, vector_id, vector, payload)
+        await collection.update(ids=vector_id, embeddings=vector, metadatas=payload)
+
+    async def aget(self, vector_id: str) -> OutputData:
+        """Async version of `get`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.get, vector_id)
+        result = await collection.get(ids=[vector_id])
+        return self._parse_output(result)[0]
+
+    async def alist(self, filters: Optional[Dict] = None, limit: int = 100) -> List[OutputData]:
+        """Async version of `list`."""
+        collection = await self._get_async_collection()
+        if collection is None:
+            return await asyncio.to_thread(self.list, filters, limit)
+        where_clause = self._generate_where_clause(filters) if filters else None
+        results = await collection.get(where=where_clause, limit=limit)
+        return [self._parse_output(results)]
 
     @staticmethod
     def _generate_where_clause(where: dict[str, any]) -> dict[str, any]:
@@ -1,14 +1,31 @@
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 
 from pydantic import BaseModel, Field, model_validator
 
 
+class QuantizationConfig(BaseModel):
+    """
+    Quantized storage of the vectors, mapped to each store's native support:
+
+    - qdrant: scalar (int8) or binary quantization of the collection
+    - pgvector: HNSW index over `halfvec` (int8) or `bit` (binary) expressions of the vector column
+    - faiss: `IndexScalarQuantizer`/`IndexHNSWSQ` (int8) or a sign-bit `IndexLSH` (binary)
+    """
+
+    type: Literal["int8", "binary"] = Field(description="Quantization of the stored vectors: 'int8' or 'binary'")
+    rescore: bool = Field(True, description="Rescore the top candidates with the full-precision vectors")
+    oversampling: float = Field(3.0, ge=1.0, description="Candidates fetched per requested result before rescoring")
+
+
 class VectorStoreConfig(BaseModel):
     provider: str = Field(
         description="Provider of the vector store (e.g., 'qdrant', 'chroma', 'upstash_vector')",
         default="qdrant",
     )
     config: Optional[Dict] = Field(description="Configuration for the specific vector store", default=None)
+    quantization: Optional[QuantizationConfig] = Field(
+        description="Quantized storage of the vectors, for the qdrant, pgvector and faiss providers", default=None
+    )
 
     _provider_configs: Dict[str, str] = {
         "qdrant": "QdrantConfig",
@@ -30,6 +47,8 @@ class VectorStoreConfig(BaseModel):
         "langchain": "LangchainConfig",
     }
 
+    _quantization_providers = ("qdrant", "pgvector", "faiss")
+
     @model_validator(mode="after")
     def validate_and_create_config(self) -> "VectorStoreConfig":
         provider = self.provider
@@ -37,6 +56,11 @@ class VectorStoreConfig(BaseModel):
 
         if provider not in self._provider_configs:
             raise ValueError(f"Unsupported vector store provider: {provider}")
+        if self.quantization is not None and provider not in self._quantization_providers:
+            raise ValueError(
+                f"Quantization is not supported for provider {provider}. "
+                f"Supported providers: {', '.join(self._quantization_providers)}"
+            )
 
         module = __import__(
             f"mem0.configs.vector_stores.{provider}",
@@ -47,9 +71,14 @@ class VectorStoreConfig(BaseModel):
         if config is None:
             config = {}
 
+        if self.quantization is not None and isinstance(config, dict):
+            config["quantization"] = self.quantization
+
         if not isinstance(config, dict):
             if not isinstance(config, config_class):
                 raise ValueError(f"Invalid config type for provider {provider}")
+            if self.quantization is not None:
+                config.quantization = self.quantization
             return self
 
         # also check if path in allowed kays for pydantic model, and whether config extra fields are allowed
@@ -1,9 +1,14 @@
 import logging
+import math
 import os
 import pickle
+import sqlite3
+import threading
+import time
 import uuid
+from collections.abc import Hashable
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import numpy as np
 from pydantic import BaseModel
@@ -21,6 +26,7 @@ except ImportError:
     )
 
 from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.configs import QuantizationConfig
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +37,170 @@ class OutputData(BaseModel):
     payload: Optional[Dict]  # metadata
 
 
+# Fraction of tombstoned HNSW rows that triggers a rebuild of the graph
+HNSW_COMPACTION_RATIO = 0.2
+
+# Payload keys kept in an inverted index so that filtered searches only visit matching vectors
+INDEXED_PAYLOAD_KEYS = ("user_id", "agent_id", "run_id", "actor_id")
+
+# Filtered searches on approximate (IVF/HNSW) indexes scan the candidates exactly up to this many
+EXACT_FILTER_THRESHOLD = 2048
+
+# int8-quantized flat and HNSW collections stay full precision until they hold this many vectors to train on
+QUANTIZATION_TRAINING_SIZE = 1000
+
+
+class _WriteAheadLog:
+    """
+    SQLite-backed docstore and vector log for the FAISS "wal" persistence mode.
+
+    Payload changes are written to the docstore table and vector additions/removals are
+    appended to vector_log, both in the same transaction as the store operation. The log
+    is replayed on top of the last index checkpoint at load time and truncated after each
+    checkpoint.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS docstore (vector_id TEXT PRIMARY KEY, index_id INTEGER NOT NULL, payload BLOB)"
+            )
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS vector_log ("
+                "seq INTEGER PRIMARY KEY AUTOINCREMENT, op TEXT NOT NULL, index_id INTEGER NOT NULL, vector BLOB)"
+            )
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.pending_entries = self.connection.execute("SELECT COUNT(*) FROM vector_log").fetchone()[0]
+        self.last_checkpoint = time.monotonic()
+
+    def is_empty(self) -> bool:
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'next_index_id'").fetchone()
+        return row is None
+
+    def append(self, ops: List[tuple], next_index_id: int):
+        """Apply docstore changes and log vector changes in a single transaction."""
+        vector_ops = 0
+        with self.connection:
+            for op in ops:
+                kind = op[0]
+                if kind == "put":
+                    _, vector_id, index_id, payload = op
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO docstore (vector_id, index_id, payload) VALUES (?, ?, ?)",
+                        (vector_id, index_id, pickle.dumps(payload)),
+                    )
+                elif kind == "delete":
+                    self.connection.execute("DELETE FROM docstore WHERE vector_id = ?", (op[1],))
+                elif kind == "add":
+                    self.connection.execute(
+                        "INSERT INTO vector_log (op, index_id, vector) VALUES ('add', ?, ?)", (op[1], op[2])
+                    )
+                    vector_ops += 1
+                elif kind == "remove":
+                    self.connection.execute("INSERT INTO vector_log (op, index_id) VALUES ('remove', ?)", (op[1],))
+                    vector_ops += 1
+            self.connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('next_index_id', ?)", (str(next_index_id),)
+            )
+        self.pending_entries += vector_ops
+
+    def load(self):
+        """
+        Returns:
+            tuple: (docstore, index_to_id, next_index_id)
+        """
+        docstore, index_to_id = {}, {}
+        for vector_id, index_id, payload in self.connection.execute(
+            "SELECT vector_id, index_id, payload FROM docstore"
+        ):
+            docstore[vector_id] = pickle.loads(payload)
+            index_to_id[index_id] = vector_id
+        row = self.connection.execute("SELECT value FROM meta WHERE key = 'next_index_id'").fetchone()
+        return docstore, index_to_id, int(row[0]) if row else 0
+
+    def entries(self):
+        return self.connection.execute("SELECT op, index_id, vector FROM vector_log ORDER BY seq").fetchall()
+
+    def should_checkpoint(self, batch_size: int, interval: float) -> bool:
+        if not self.pending_entries:
+            return False
+        return self.pending_entries >= batch_size or time.monotonic() - self.last_checkpoint >= interval
+
+    def truncate(self):
+        """Drop log entries that are covered by a checkpoint."""
+        with self.connection:
+            self.connection.execute("DELETE FROM vector_log")
+        self.pending_entries = 0
+        self.last_checkpoint = time.monotonic()
+
+    def reset(self):
+        with self.connection:
+            self.connection.execute("DELETE FROM docstore")
+            self.connection.execute("DELETE FROM vector_log")
+            self.connection.execute("DELETE FROM meta")
+        self.pending_entries = 0
+
+    def close(self):
+        self.connection.close()
+
+
+class _VectorFile:
+    """
+    Full-precision copies of quantized vectors, in a memory-mapped float32 file addressed by internal id.
+
+    Quantized indexes cannot give the original vectors back, so this file serves the rescoring pass,
+    exact filtered searches and index rebuilds. Rows of deleted vectors stay until the collection is reset.
+    """
+
+    def __init__(self, path: str, dims: int):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.path = path
+        self.dims = dims
+        self._array = None
+        if os.path.exists(path) and os.path.getsize(path):
+            self._map(os.path.getsize(path) // (dims * 4))
+
+    def _map(self, rows: int):
+        self._array = np.memmap(self.path, dtype=np.float32, mode="r+", shape=(rows, self.dims))
+
+    def write(self, index_ids, vectors: np.ndarray):
+        index_ids = np.asarray(index_ids, dtype=np.int64)
+        if not len(index_ids):
+            return
+        rows = int(index_ids.max()) + 1
+        capacity = 0 if self._array is None else len(self._array)
+        if rows > capacity:
+            # Grow geometrically so that appending one vector at a time does not remap the file each time
+            capacity = max(rows, 2 * capacity, 1024)
+            self.flush()
+            self._array = None
+            with open(self.path, "a+b") as f:
+                f.truncate(capacity * self.dims * 4)
+            self._map(capacity)
+        self._array[index_ids] = vectors
+
+    def read(self, index_ids) -> np.ndarray:
+        return np.array(self._array[np.asarray(index_ids, dtype=np.int64)])
+
+    def flush(self):
+        if self._array is not None:
+            self._array.flush()
+
+    def reset(self):
+        self._array = None
+        with open(self.path, "wb"):
+            pass
+
+    def remove(self):
+        self._array = None
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
 class FAISS(VectorStoreBase):
     def __init__(
         self,
@@ -39,10 +209,23 @@ class FAISS(VectorStoreBase):
         distance_strategy: str = "euclidean",
         normalize_L2: bool = False,
         embedding_model_dims: int = 1536,
+        index_type: str = "flat",
+        nlist: int = 100,
+        nprobe: int = 10,
+        hnsw_m: int = 32,
+        ef_construction: int = 40,
+        ef_search: int = 16,
+        persistence: str = "snapshot",
+        checkpoint_interval: float = 60.0,
+        checkpoint_batch_size: int = 1000,
+        quantization: Optional[QuantizationConfig] = None,
     ):
         """
         Initialize the FAISS vector store.
 
+        Vectors live in an IndexIDMap2 keyed by int64 ids, so deletes remove rows from the
+        index instead of leaving them behind in search results.
+
         Args:
             collection_name (str): Name of the collection.
             path (str, optional): Path for local FAISS database. Defaults to None.
@@ -50,17 +233,70 @@ class FAISS(VectorStoreBase):
                 Defaults to "euclidean".
             normalize_L2 (bool, optional): Whether to normalize L2 vectors. Only applicable for euclidean distance.
                 Defaults to False.
+            embedding_model_dims (int, optional): Dimension of the embedding vectors. Defaults to 1536.
+            index_type (str, optional): Index structure. Options: 'flat' (exact), 'ivf', 'hnsw'. An IVF collection
+                stays flat until it holds `nlist` vectors to train on. Defaults to "flat".
+            nlist (int, optional): Number of IVF clusters. Defaults to 100.
+            nprobe (int, optional): Number of IVF clusters visited per search. Defaults to 10.
+            hnsw_m (int, optional): Number of HNSW neighbors per node. Defaults to 32.
+            ef_construction (int, optional): HNSW candidate list size while building. Defaults to 40.
+            ef_search (int, optional): HNSW candidate list size while searching. Defaults to 16.
+            persistence (str, optional): How changes are saved to `path`. 'snapshot' rewrites the index and
+                pickled docstore on every write; 'wal' writes payloads and vector changes incrementally to a
+                SQLite log and checkpoints the index periodically. Defaults to "snapshot".
+            checkpoint_interval (float, optional): Seconds after which pending log entries are checkpointed
+                into the index file on the next write ('wal' only). Defaults to 60.
+            checkpoint_batch_size (int, optional): Number of logged vector changes that triggers a checkpoint
+                ('wal' only). Defaults to 1000.
+            quantization (QuantizationConfig, optional): Store the vectors as 8-bit scalars ('int8', any index
+                type, trained once there is enough data) or as sign bits searched by Hamming distance ('binary',
+                flat only). Full-precision copies are kept in a memory-mapped file to rescore the candidates.
+                Defaults to None.
         """
+        if index_type not in ("flat", "ivf", "hnsw"):
+            raise ValueError(f"Invalid index_type: {index_type}. Must be one of: 'flat', 'ivf', 'hnsw'")
+        if persistence not in ("snapshot", "wal"):
+            raise ValueError(f"Invalid persistence: {persistence}. Must be one of: 'snapshot', 'wal'")
+        quantization = QuantizationConfig.model_validate(quantization) if quantization else None
+        if quantization and quantization.type == "binary" and index_type != "flat":
+            raise ValueError("Binary quantization is only supported with the 'flat' index_type")
+
         self.collection_name = collection_name
         self.path = path or f"/tmp/faiss/{collection_name}"
         self.distance_strategy = distance_strategy
         self.normalize_L2 = normalize_L2
         self.embedding_model_dims = embedding_model_dims
+        self.index_type = index_type
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.persistence = persistence
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_batch_size = checkpoint_batch_size
+        self.quantization = quantization
 
         # Initialize storage structures
+        # The index and the docstore are shared mutable state, guard them so memory
+        # actions can be applied from several threads.
+        self._lock = threading.RLock()
         self.index = None
         self.docstore = {}
-        self.index_to_id = {}
+        self.index_to_id: Dict[int, str] = {}
+        self.id_to_index: Dict[str, int] = {}
+        self._next_index_id = 0
+        # HNSW graphs cannot remove vectors, so deleted rows are skipped until the next rebuild
+        self._tombstones: Set[int] = set()
+        # payload key -> value -> internal ids, for INDEXED_PAYLOAD_KEYS
+        self._payload_index: Dict[str, Dict[Any, Set[int]]] = {key: {} for key in INDEXED_PAYLOAD_KEYS}
+        # Changes made by the current operation, written to the log by _save in "wal" mode
+        self._wal = None
+        self._pending_ops: List[tuple] = []
+        # Full-precision vectors of a quantized collection
+        self._vectors: Optional[_VectorFile] = None
+        if self.quantization:
+            self._open_vectors()
 
         # Create directory if it doesn't exist
         if self.path:
@@ -69,7 +305,22 @@ class FAISS(VectorStoreBase):
             # Try to load existing index if available
             index_path = f"{self.path}/{collection_name}.faiss"
             docstore_path = f"{self.path}/{collection_name}.pkl"
-            if os.path.exists(index_path) and os.path.exists(docstore_path):
+            if self.persistence == "wal":
+                self._open_wal()
+                if not self._wal.is_empty():
+                    self._load_wal(index_path)
+                elif os.path.exists(index_path) and os.path.exists(docstore_path):
+                    # Switching an existing snapshot collection to the log
+                    self._load(index_path, docstore_path)
+                    self._record(
+                        ("put", vector_id, self.id_to_index[vector_id], payload)
+                        for vector_id, payload in self.docstore.items()
+                    )
+                    self._save()
+                    self.checkpoint()
+                else:
+                    self.create_col(collection_name)
+            elif os.path.exists(index_path) and os.path.exists(docstore_path):
                 self._load(index_path, docstore_path)
             else:
                 self.create_col(collection_name)
@@ -83,31 +334,273 @@ class FAISS(VectorStoreBase):
             docstore_path (str): Path to docstore pickle file.
         """
         try:
-            self.index = faiss.read_index(index_path)
+            index = faiss.read_index(index_path)
             with open(docstore_path, "rb") as f:
                 self.docstore, self.index_to_id = pickle.load(f)
+            self.id_to_index = {vector_id: index_id for index_id, vector_id in self.index_to_id.items()}
+
+            if isinstance(index, (faiss.IndexIDMap2, faiss.IndexIVF)):
+                self.index = index
+                self._configure_search_params()
+                stored_ids = self._stored_ids()
+            else:
+                # Indexes written before the IndexIDMap2 layout address vectors by position
+                self.index = self._build_index()
+                live_ids = np.array(sorted(self.index_to_id), dtype=np.int64)
+                if len(live_ids):
+                    self.index.add_with_ids(index.reconstruct_n(0, index.ntotal)[live_ids], live_ids)
+                stored_ids = live_ids
+                logger.info(f"Migrated FAISS index {index_path} to IndexIDMap2")
+
+            self._next_index_id = int(max(stored_ids.max(initial=-1), max(self.index_to_id, default=-1))) + 1
+            self._finish_load(stored_ids)
             logger.info(f"Loaded FAISS index from {index_path} with {self.index.ntotal} vectors")
         except Exception as e:
             logger.warning(f"Failed to load FAISS index: {e}")
 
             self.docstore = {}
             self.index_to_id = {}
+            self.id_to_index = {}
+            self._tombstones = set()
+            self.create_col(self.collection_name)
+
+    def _finish_load(self, stored_ids):
+        """Drop index rows without a docstore entry, index payloads and train the index if it is due."""
+        self._rebuild_payload_index()
+        orphaned = [int(i) for i in stored_ids if int(i) not in self.index_to_id]
+        if orphaned:
+            self._remove_from_index(orphaned)
+        self._maybe_train()
+
+    def _index_payload(self, index_id: int, payload: Dict):
+        for key in INDEXED_PAYLOAD_KEYS:
+            value = payload.get(key)
+            if value is not None and isinstance(value, Hashable):
+                self._payload_index[key].setdefault(value, set()).add(index_id)
+
+    def _unindex_payload(self, index_id: int, payload: Optional[Dict]):
+        if not payload:
+            return
+        for key in INDEXED_PAYLOAD_KEYS:
+            value = payload.get(key)
+            if value is None or not isinstance(value, Hashable):
+                continue
+            ids = self._payload_index[key].get(value)
+            if ids is not None:
+                ids.discard(index_id)
+                if not ids:
+                    del self._payload_index[key][value]
+
+    def _rebuild_payload_index(self):
+        self._payload_index = {key: {} for key in INDEXED_PAYLOAD_KEYS}
+        for vector_id, payload in self.docstore.items():
+            index_id = self.id_to_index.get(vector_id)
+            if index_id is not None:
+                self._index_payload(index_id, payload)
+
+    def _candidate_ids(self, filters: Optional[Dict]) -> Tuple[Optional[Set[int]], bool]:
+        """
+        Resolve the indexed keys of a filter to the set of internal ids that can match.
+
+        Returns:
+            Tuple[Optional[Set[int]], bool]: The candidate ids, or None when no filter key is indexed,
+                and whether every filter key was resolved by the inverted index.
+        """
+        if not filters:
+            return None, True
+
+        candidates = None
+        exact = True
+        for key, value in filters.items():
+            values = value if isinstance(value, list) else [value]
+            if key not in self._payload_index or not all(isinstance(v, Hashable) for v in values):
+                exact = False
+                continue
+            matches = set()
+            for v in values:
+                matches |= self._payload_index[key].get(v, set())
+            candidates = matches if candidates is None else candidates & matches
+        return candidates, exact
+
+    def _search_params(self, candidates: Set[int]):
+        """Search parameters restricting the index search to `candidates`."""
+        selector = faiss.IDSelectorBatch(np.fromiter(candidates, dtype=np.int64, count=len(candidates)))
+        base = self._base_index()
+        if isinstance(base, faiss.IndexIVF):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        elif isinstance(base, faiss.IndexHNSW):
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=self.ef_search)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        return params
+
+    def _index_search(self, query_vectors: np.ndarray, limit: int, filters: Optional[Dict]):
+        """
+        Run the index search, restricted to the vectors matching the indexed filter keys.
+
+        Returns:
+            tuple: (scores, indices), or None when no vector can match the filters.
+        """
+        limit = self._candidate_limit(limit)
+        candidates, exact = self._candidate_ids(filters)
+        if candidates is None:
+            return self._rescore(query_vectors, *self.index.search(query_vectors, self._fetch_k(limit, filters)))
+        if not candidates:
+            return None
+
+        # Tombstoned rows never enter the payload index, so no over-fetch is needed for them
+        fetch_k = min(limit if exact else limit * 2, len(candidates))
+        base = self._base_index()
+        if not isinstance(base, faiss.IndexFlat) and len(candidates) <= EXACT_FILTER_THRESHOLD:
+            # A selective filter starves IVF probes and HNSW walks, so scan the few candidates exactly
+            return self._exact_search(query_vectors, candidates, fetch_k)
+        if isinstance(base, faiss.IndexLSH):
+            # IndexLSH cannot restrict its search to an id selector
+            return self._exact_search(query_vectors, candidates, fetch_k)
+        return self._rescore(
+            query_vectors, *self.index.search(query_vectors, fetch_k, params=self._search_params(candidates))
+        )
+
+    def _candidate_limit(self, limit: int) -> int:
+        """Number of candidates to fetch from a quantized index so that `limit` survive rescoring."""
+        if self.quantization and self.quantization.rescore:
+            return math.ceil(limit * self.quantization.oversampling)
+        return limit
+
+    def _rescore(self, query_vectors: np.ndarray, scores: np.ndarray, indices: np.ndarray):
+        """Re-rank the candidates of a quantized index on their full-precision vectors."""
+        if not (self.quantization and self.quantization.rescore):
+            return scores, indices
+
+        inner_product = self._uses_inner_product()
+        rescored_scores = np.full(scores.shape, -np.inf if inner_product else np.inf, dtype=np.float32)
+        rescored_indices = np.full(indices.shape, -1, dtype=np.int64)
+        for row, (query_vector, row_indices) in enumerate(zip(query_vectors, indices)):
+            candidate_ids = row_indices[row_indices >= 0]
+            if not len(candidate_ids):
+                continue
+            vectors = self._vectors.read(candidate_ids)
+            if inner_product:
+                row_scores = vectors @ query_vector
+                order = np.argsort(-row_scores, kind="stable")
+            else:
+                row_scores = ((vectors - query_vector) ** 2).sum(axis=1)
+                order = np.argsort(row_scores, kind="stable")
+            rescored_scores[row, : len(order)] = row_scores[order]
+            rescored_indices[row, : len(order)] = candidate_ids[order]
+        return rescored_scores, rescored_indices
+
+    def _exact_search(self, query_vectors: np.ndarray, candidates: Set[int], k: int):
+        """Brute-force search over the candidate vectors, returning scores and internal ids."""
+        candidate_ids = np.array(sorted(candidates), dtype=np.int64)
+        flat = self._flat_index()
+        flat.add(self._vectors_of(candidate_ids))
+        scores, positions = flat.search(query_vectors, k)
+        return scores, np.where(positions >= 0, candidate_ids[positions], -1)
+
+    def _open_wal(self):
+        os.makedirs(self.path, exist_ok=True)
+        self._wal = _WriteAheadLog(f"{self.path}/{self.collection_name}.db")
+
+    def _open_vectors(self):
+        self._vectors = _VectorFile(f"{self.path}/{self.collection_name}.vectors", self.embedding_model_dims)
+
+    def _vectors_of(self, index_ids: np.ndarray) -> np.ndarray:
+        """Full-precision vectors of the given internal ids."""
+        if self._vectors is not None:
+            return self._vectors.read(index_ids)
+        return self.index.reconstruct_batch(index_ids)
+
+    def _load_wal(self, index_path: str):
+        """
+        Load the last index checkpoint and replay the vector log on top of it.
+
+        Replay is idempotent, so a crash between writing a checkpoint and truncating the log
+        is harmless.
+
+        Args:
+            index_path (str): Path to the checkpointed FAISS index file.
+        """
+        self.docstore, self.index_to_id, self._next_index_id = self._wal.load()
+        self.id_to_index = {vector_id: index_id for index_id, vector_id in self.index_to_id.items()}
+
+        if os.path.exists(index_path):
+            self.index = faiss.read_index(index_path)
+            self._configure_search_params()
+        else:
+            self.index = self._build_index()
+
+        stored = set(self._stored_ids().tolist())
+        for op, index_id, vector in self._wal.entries():
+            if op == "add" and index_id not in stored:
+                vector = np.frombuffer(vector, dtype=np.float32).reshape(1, -1)
+                self.index.add_with_ids(vector, np.array([index_id], dtype=np.int64))
+                if self._vectors is not None:
+                    self._vectors.write([index_id], vector)
+                stored.add(index_id)
+            elif op == "remove" and index_id in stored and self.index_type != "hnsw":
+                self.index.remove_ids(np.array([index_id], dtype=np.int64))
+                stored.discard(index_id)
+
+        self._finish_load(np.array(sorted(stored), dtype=np.int64))
+        logger.info(
+            f"Loaded FAISS index {self.collection_name} with {self.index.ntotal} vectors from checkpoint and log"
+        )
+
+    def _record(self, ops):
+        """Queue changes for the write-ahead log. A no-op in snapshot mode."""
+        if self._wal is not None:
+            self._pending_ops.extend(ops)
+
+    def checkpoint(self):
+        """
+        Write the index to disk and truncate the write-ahead log.
+
+        The index is written to a temporary file that is fsynced and atomically renamed over the
+        previous checkpoint. Only used in "wal" persistence mode.
+        """
+        with self._lock:
+            if self._wal is None or self.index is None:
+                return
+
+            if self._vectors is not None:
+                self._vectors.flush()
+            index_path = f"{self.path}/{self.collection_name}.faiss"
+            tmp_path = f"{index_path}.tmp"
+            faiss.write_index(self.index, tmp_path)
+            with open(tmp_path, "rb") as f:
+                os.fsync(f.fileno())
+            os.replace(tmp_path, index_path)
+            self._wal.truncate()
 
     def _save(self):
         """Save FAISS index and docstore to disk."""
-        if not self.path or not self.index:
-            return
+        with self._lock:
+            if self._wal is not None:
+                ops, self._pending_ops = self._pending_ops, []
+                try:
+                    self._wal.append(ops, self._next_index_id)
+                    if self._wal.should_checkpoint(self.checkpoint_batch_size, self.checkpoint_interval):
+                        self.checkpoint()
+                except Exception as e:
+                    logger.warning(f"Failed to write FAISS log: {e}")
+                return
+
+            if not self.path or not self.index:
+                return
 
-        try:
-            os.makedirs(self.path, exist_ok=True)
-            index_path = f"{self.path}/{self.collection_name}.faiss"
-            docstore_path = f"{self.path}/{self.collection_name}.pkl"
+            try:
+                os.makedirs(self.path, exist_ok=True)
+                index_path = f"{self.path}/{self.collection_name}.faiss"
+                docstore_path = f"{self.path}/{self.collection_name}.pkl"
 
-            faiss.write_index(self.index, index_path)
-            with open(docstore_path, "wb") as f:
-                pickle.dump((self.docstore, self.index_to_id), f)
-        except Exception as e:
-            logger.warning(f"Failed to save FAISS index: {e}")
+                if self._vectors is not None:
+                    self._vectors.flush()
+                faiss.write_index(self.index, index_path)
+                with open(docstore_path, "wb") as f:
+                    pickle.dump((self.docstore, self.index_to_id), f)
+            except Exception as e:
+                logger.warning(f"Failed to save FAISS index: {e}")
 
     def _parse_output(self, scores, ids, limit=None) -> List[OutputData]:
         """
@@ -125,7 +618,9 @@ class FAISS(VectorStoreBase):
             limit = len(ids)
 
         results = []
-        for i in range(min(len(ids), limit)):
+        for i in range(len(ids)):
+            if len(results) >= limit:
+                break
             if ids[i] == -1:  # FAISS returns -1 for empty results
                 continue
 
@@ -150,6 +645,139 @@ class FAISS(VectorStoreBase):
 
         return results
 
+    def _uses_inner_product(self) -> bool:
+        return self.distance_strategy.lower() in ("inner_product", "cosine")
+
+    def _flat_index(self):
+        if self._uses_inner_product():
+            return faiss.IndexFlatIP(self.embedding_model_dims)
+        return faiss.IndexFlatL2(self.embedding_model_dims)
+
+    def _build_index(self, training_vectors: Optional[np.ndarray] = None):
+        """
+        Create an empty IndexIDMap2 for the configured index type.
+
+        IVF collections start out flat; `_maybe_train` swaps in the IVF index once there is
+        enough data to train the clusters. int8-quantized collections likewise stay full precision
+        until `training_vectors` holds QUANTIZATION_TRAINING_SIZE vectors to train the quantizer on.
+
+        Args:
+            training_vectors (np.ndarray, optional): Vectors to train the scalar quantizer on. Defaults to None.
+        """
+        metric = faiss.METRIC_INNER_PRODUCT if self._uses_inner_product() else faiss.METRIC_L2
+        quantize = (
+            self.quantization is not None
+            and self.quantization.type == "int8"
+            and self.index_type != "ivf"
+            and training_vectors is not None
+            and len(training_vectors) >= QUANTIZATION_TRAINING_SIZE
+        )
+        if self.index_type == "hnsw":
+            if quantize:
+                base = faiss.IndexHNSWSQ(self.embedding_model_dims, faiss.ScalarQuantizer.QT_8bit, self.hnsw_m, metric)
+            else:
+                base = faiss.IndexHNSWFlat(self.embedding_model_dims, self.hnsw_m, metric)
+            base.hnsw.efConstruction = self.ef_construction
+            base.hnsw.efSearch = self.ef_search
+        elif self.quantization is not None and self.quantization.type == "binary":
+            # One sign bit per dimension, compared by Hamming distance
+            base = faiss.IndexLSH(self.embedding_model_dims, self.embedding_model_dims, False, False)
+        elif quantize:
+            base = faiss.IndexScalarQuantizer(self.embedding_model_dims, faiss.ScalarQuantizer.QT_8bit, metric)
+        else:
+            base = self._flat_index()
+        if quantize:
+            base.train(training_vectors)
+        return faiss.IndexIDMap2(base)
+
+    def _base_index(self):
+        """The index doing the search: the IVF index itself, or the index wrapped by IndexIDMap2."""
+        if isinstance(self.index, faiss.IndexIDMap2):
+            return faiss.downcast_index(self.index.index)
+        return self.index
+
+    def _stored_ids(self) -> np.ndarray:
+        """Internal ids of every vector held by the index, including HNSW tombstones."""
+        if isinstance(self.index, faiss.IndexIDMap2):
+            return faiss.vector_to_array(self.index.id_map).astype(np.int64)
+
+        invlists = self.index.invlists
+        ids = [
+            faiss.rev_swig_ptr(invlists.get_ids(list_no), invlists.list_size(list_no)).copy()
+            for list_no in range(invlists.nlist)
+            if invlists.list_size(list_no)
+        ]
+        return np.concatenate(ids).astype(np.int64) if ids else np.array([], dtype=np.int64)
+
+    def _configure_search_params(self):
+        """Apply nprobe/efSearch to an index read from disk."""
+        base = self._base_index()
+        if isinstance(base, faiss.IndexIVF):
+            base.nprobe = self.nprobe
+            base.set_direct_map_type(faiss.DirectMap.Hashtable)
+        elif isinstance(base, faiss.IndexHNSW):
+            base.hnsw.efSearch = self.ef_search
+
+    def _maybe_train(self):
+        """
+        Replace a full-precision index with a trained one once there is enough data.
+
+        An IVF-configured index becomes an IVF index once it holds `nlist` vectors. The IVF index
+        stores the int64 ids itself rather than sitting behind IndexIDMap2, whose remove_ids assumes
+        the wrapped index renumbers its rows after a removal like a flat index does. An int8-quantized
+        flat or HNSW index is rebuilt quantized once it holds QUANTIZATION_TRAINING_SIZE vectors.
+        """
+        if self.index_type != "ivf":
+            if (
+                self.quantization is not None
+                and self.quantization.type == "int8"
+                and len(self.index_to_id) >= QUANTIZATION_TRAINING_SIZE
+                and not isinstance(self._base_index(), (faiss.IndexScalarQuantizer, faiss.IndexHNSWSQ))
+            ):
+                self._rebuild_index()
+            return
+        if self.index.ntotal < self.nlist or isinstance(self.index, faiss.IndexIVF):
+            return
+
+        index_ids = self._stored_ids()
+        vectors = self._vectors_of(index_ids)
+        metric = faiss.METRIC_INNER_PRODUCT if self._uses_inner_product() else faiss.METRIC_L2
+        if self.quantization is not None:
+            ivf = faiss.IndexIVFScalarQuantizer(
+                self._flat_index(), self.embedding_model_dims, self.nlist, faiss.ScalarQuantizer.QT_8bit, metric
+            )
+        else:
+            ivf = faiss.IndexIVFFlat(self._flat_index(), self.embedding_model_dims, self.nlist, metric)
+        ivf.train(vectors)
+        ivf.nprobe = self.nprobe
+        # Keyed lookups for reconstruct and remove_ids
+        ivf.set_direct_map_type(faiss.DirectMap.Hashtable)
+        ivf.add_with_ids(vectors, index_ids)
+        self.index = ivf
+        logger.info(f"Trained IVF index with {self.nlist} lists on {len(index_ids)} vectors")
+
+    def _remove_from_index(self, index_ids: List[int]):
+        """Remove vectors from the index, tombstoning them when the index type cannot remove."""
+        self._record(("remove", index_id) for index_id in index_ids)
+        if self.index_type != "hnsw":
+            self.index.remove_ids(np.array(index_ids, dtype=np.int64))
+            return
+
+        self._tombstones.update(index_ids)
+        if len(self._tombstones) > HNSW_COMPACTION_RATIO * self.index.ntotal:
+            self._rebuild_index()
+
+    def _rebuild_index(self):
+        """Rebuild the index from the live vectors, dropping tombstoned rows."""
+        live_ids = np.array(sorted(self.index_to_id), dtype=np.int64)
+        vectors = self._vectors_of(live_ids)
+        index = self._build_index(vectors)
+        if len(live_ids):
+            index.add_with_ids(vectors, live_ids)
+        self.index = index
+        self._tombstones = set()
+        logger.info(f"Rebuilt FAISS index {self.collection_name} with {len(live_ids)} vectors")
+
     def create_col(self, name: str, distance: str = None):
         """
         Create a new collection.
@@ -162,19 +790,32 @@ class FAISS(VectorStoreBase):
         Returns:
             self: The FAISS instance.
         """
-        distance_strategy = distance or self.distance_strategy
-
-        # Create index based on distance strategy
-        if distance_strategy.lower() == "inner_product" or distance_strategy.lower() == "cosine":
-            self.index = faiss.IndexFlatIP(self.embedding_model_dims)
-        else:
-            self.index = faiss.IndexFlatL2(self.embedding_model_dims)
+        with self._lock:
+            if distance:
+                self.distance_strategy = distance
 
-        self.collection_name = name
-
-        self._save()
+            self.index = self._build_index()
+            self.index_to_id = {}
+            self.id_to_index = {}
+            self._next_index_id = 0
+            self._tombstones = set()
+            self._payload_index = {key: {} for key in INDEXED_PAYLOAD_KEYS}
+
+            self.collection_name = name
+            if self.quantization:
+                self._open_vectors()
+                self._vectors.reset()
+
+            if self.persistence == "wal" and self.path:
+                if self._wal is None:
+                    self._open_wal()
+                self._pending_ops = []
+                self._wal.reset()
+                self.checkpoint()
+            else:
+                self._save()
 
-        return self
+            return self
 
     def insert(
         self,
@@ -190,33 +831,52 @@ class FAISS(VectorStoreBase):
             payloads (Optional[List[Dict]], optional): List of payloads corresponding to vectors. Defaults to None.
             ids (Optional[List[str]], optional): List of IDs corresponding to vectors. Defaults to None.
         """
-        if self.index is None:
-            raise ValueError("Collection not initialized. Call create_col first.")
-
-        if ids is None:
-            ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
-
-        if payloads is None:
-            payloads = [{} for _ in range(len(vectors))]
-
-        if len(vectors) != len(ids) or len(vectors) != len(payloads):
-            raise ValueError("Vectors, payloads, and IDs must have the same length")
-
-        vectors_np = np.array(vectors, dtype=np.float32)
-
-        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
-            faiss.normalize_L2(vectors_np)
-
-        self.index.add(vectors_np)
-
-        starting_idx = len(self.index_to_id)
-        for i, (vector_id, payload) in enumerate(zip(ids, payloads)):
-            self.docstore[vector_id] = payload.copy()
-            self.index_to_id[starting_idx + i] = vector_id
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
+
+            if ids is None:
+                ids = [str(uuid.uuid4()) for _ in range(len(vectors))]
+
+            if payloads is None:
+                payloads = [{} for _ in range(len(vectors))]
+
+            if len(vectors) != len(ids) or len(vectors) != len(payloads):
+                raise ValueError("Vectors, payloads, and IDs must have the same length")
+
+            vectors_np = np.array(vectors, dtype=np.float32)
+
+            if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                faiss.normalize_L2(vectors_np)
+
+            # Re-inserting an existing id replaces its vector
+            replaced = [self.id_to_index.pop(vector_id) for vector_id in ids if vector_id in self.id_to_index]
+            for index_id in replaced:
+                self._unindex_payload(index_id, self.docstore.get(self.index_to_id.pop(index_id, None)))
+            if replaced:
+                self._remove_from_index(replaced)
+
+            index_ids = np.arange(self._next_index_id, self._next_index_id + len(ids), dtype=np.int64)
+            self._next_index_id += len(ids)
+            self.index.add_with_ids(vectors_np, index_ids)
+            if self._vectors is not None:
+                self._vectors.write(index_ids, vectors_np)
+
+            for index_id, vector_id, payload in zip(index_ids.tolist(), ids, payloads):
+                self.docstore[vector_id] = payload.copy()
+                self.index_to_id[index_id] = vector_id
+                self.id_to_index[vector_id] = index_id
+                self._index_payload(index_id, payload)
+            self._record(
+                op
+                for index_id, vector_id, vector in zip(index_ids.tolist(), ids, vectors_np)
+                for op in (("add", index_id, vector.tobytes()), ("put", vector_id, index_id, self.docstore[vector_id]))
+            )
 
-        self._save()
+            self._maybe_train()
+            self._save()
 
-        logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
+            logger.info(f"Inserted {len(vectors)} vectors into collection {self.collection_name}")
 
     def search(
         self, query: str, vectors: List[list], limit: int = 5, filters: Optional[Dict] = None
@@ -233,32 +893,94 @@ class FAISS(VectorStoreBase):
         Returns:
             List[OutputData]: Search results.
         """
-        if self.index is None:
-            raise ValueError("Collection not initialized. Call create_col first.")
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
+
+            query_vectors = np.array(vectors, dtype=np.float32)
+
+            if len(query_vectors.shape) == 1:
+                query_vectors = query_vectors.reshape(1, -1)
+
+            if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                faiss.normalize_L2(query_vectors)
+
+            search_result = self._index_search(query_vectors, limit, filters)
+            if search_result is None:
+                return []
+            scores, indices = search_result
+
+            # Filtering happens after parsing, so only truncate unfiltered results here
+            results = self._parse_output(scores[0], indices[0], None if filters else limit)
+
+            return self._filter_results(results, filters, limit)
+
+    def search_batch(
+        self, queries: List[str], vectors_list: List[list], limit: int = 5, filters: Optional[Dict] = None
+    ) -> List[List[OutputData]]:
+        """
+        Search for similar vectors for several queries with a single index search over the stacked query matrix.
+
+        Args:
+            queries (List[str]): Queries (not used, kept for API compatibility).
+            vectors_list (List[list]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Optional[Dict], optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            List[List[OutputData]]: One list of search results per query.
+        """
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
+
+            if not queries:
+                return []
 
-        query_vectors = np.array(vectors, dtype=np.float32)
+            query_vectors = np.array(vectors_list, dtype=np.float32)
 
-        if len(query_vectors.shape) == 1:
-            query_vectors = query_vectors.reshape(1, -1)
+            if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
+                faiss.normalize_L2(query_vectors)
 
-        if self.normalize_L2 and self.distance_strategy.lower() == "euclidean":
-            faiss.normalize_L2(query_vectors)
+            search_result = self._index_search(query_vectors, limit, filters)
+            if search_result is None:
+                return [[] for _ in queries]
+            scores, indices = search_result
 
+            return [
+                self._filter_results(
+                    self._parse_output(query_scores, query_indices, None if filters else limit), filters, limit
+                )
+                for query_scores, query_indices in zip(scores, indices)
+            ]
+
+    def _fetch_k(self, limit: int, filters: Optional[Dict]) -> int:
+        """Number of neighbors to request so that `limit` results survive filtering and tombstones."""
         fetch_k = limit * 2 if filters else limit
-        scores, indices = self.index.search(query_vectors, fetch_k)
+        return fetch_k + len(self._tombstones)
 
-        results = self._parse_output(scores[0], indices[0], limit)
+    def _filter_results(self, results: List[OutputData], filters: Optional[Dict], limit: int) -> List[OutputData]:
+        """
+        Keep the results whose payloads pass the filters.
 
-        if filters:
-            filtered_results = []
-            for result in results:
-                if self._apply_filters(result.payload, filters):
-                    filtered_results.append(result)
-                    if len(filtered_results) >= limit:
-                        break
-            results = filtered_results[:limit]
+        Args:
+            results (List[OutputData]): Parsed search results.
+            filters (Optional[Dict]): Filters to apply.
+            limit (int): Maximum number of results to keep.
 
-        return results
+        Returns:
+            List[OutputData]: Filtered results.
+        """
+        if not filters:
+            return results
+
+        filtered_results = []
+        for result in results:
+            if self._apply_filters(result.payload, filters):
+                filtered_results.append(result)
+                if len(filtered_results) >= limit:
+                    break
+        return filtered_results[:limit]
 
     def _apply_filters(self, payload: Dict, filters: Dict) -> bool:
         """
@@ -293,24 +1015,23 @@ class FAISS(VectorStoreBase):
         Args:
             vector_id (str): ID of the vector to delete.
         """
-        if self.index is None:
-            raise ValueError("Collection not initialized. Call create_col first.")
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
 
-        index_to_delete = None
-        for idx, vid in self.index_to_id.items():
-            if vid == vector_id:
-                index_to_delete = idx
-                break
+            index_to_delete = self.id_to_index.pop(vector_id, None)
 
-        if index_to_delete is not None:
-            self.docstore.pop(vector_id, None)
-            self.index_to_id.pop(index_to_delete, None)
+            if index_to_delete is not None:
+                self._unindex_payload(index_to_delete, self.docstore.pop(vector_id, None))
+                self.index_to_id.pop(index_to_delete, None)
+                self._record([("delete", vector_id)])
+                self._remove_from_index([index_to_delete])
 
-            self._save()
+                self._save()
 
-            logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
-        else:
-            logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
+                logger.info(f"Deleted vector {vector_id} from collection {self.collection_name}")
+            else:
+                logger.warning(f"Vector {vector_id} not found in collection {self.collection_name}")
 
     def update(
         self,
@@ -326,25 +1047,32 @@ class FAISS(VectorStoreBase):
             vector (Optional[List[float]], optional): Updated vector. Defaults to None.
             payload (Optional[Dict], optional): Updated payload. Defaults to None.
         """
-        if self.index is None:
-            raise ValueError("Collection not initialized. Call create_col first.")
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
-            raise ValueError(f"Vector {vector_id} not found")
+            if vector_id not in self.docstore:
+                raise ValueError(f"Vector {vector_id} not found")
 
-        current_payload = self.docstore[vector_id].copy()
-
-        if payload is not None:
-            self.docstore[vector_id] = payload.copy()
             current_payload = self.docstore[vector_id].copy()
 
-        if vector is not None:
-            self.delete(vector_id)
-            self.insert([vector], [current_payload], [vector_id])
-        else:
-            self._save()
+            if payload is not None:
+                index_id = self.id_to_index.get(vector_id)
+                if index_id is not None:
+                    self._unindex_payload(index_id, self.docstore[vector_id])
+                    self._index_payload(index_id, payload)
+                self.docstore[vector_id] = payload.copy()
+                current_payload = self.docstore[vector_id].copy()
+
+            if vector is not None:
+                self.delete(vector_id)
+                self.insert([vector], [current_payload], [vector_id])
+            else:
+                if self._wal is not None:
+                    self._record([("put", vector_id, self.id_to_index[vector_id], current_payload)])
+                self._save()
 
-        logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
+            logger.info(f"Updated vector {vector_id} in collection {self.collection_name}")
 
     def get(self, vector_id: str) -> OutputData:
         """
@@ -356,19 +1084,20 @@ class FAISS(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        if self.index is None:
-            raise ValueError("Collection not initialized. Call create_col first.")
+        with self._lock:
+            if self.index is None:
+                raise ValueError("Collection not initialized. Call create_col first.")
 
-        if vector_id not in self.docstore:
-            return None
+            if vector_id not in self.docstore:
+                return None
 
-        payload = self.docstore[vector_id].copy()
+            payload = self.docstore[vector_id].copy()
 
-        return OutputData(
-            id=vector_id,
-            score=None,
-            payload=payload,
-        )
+            return OutputData(
+                id=vector_id,
+                score=None,
+                payload=payload,
+            )
 
     def list_cols(self) -> List[str]:
         """
@@ -394,23 +1123,37 @@ class FAISS(VectorStoreBase):
         """
         Delete a collection.
         """
-        if self.path:
-            try:
-                index_path = f"{self.path}/{self.collection_name}.faiss"
-                docstore_path = f"{self.path}/{self.collection_name}.pkl"
-
-                if os.path.exists(index_path):
-                    os.remove(index_path)
-                if os.path.exists(docstore_path):
-                    os.remove(docstore_path)
-
-                logger.info(f"Deleted collection {self.collection_name}")
-            except Exception as e:
-                logger.warning(f"Failed to delete collection: {e}")
-
-        self.index = None
-        self.docstore = {}
-        self.index_to_id = {}
+        with self._lock:
+            if self.path:
+                try:
+                    index_path = f"{self.path}/{self.collection_name}.faiss"
+                    docstore_path = f"{self.path}/{self.collection_name}.pkl"
+
+                    if os.path.exists(index_path):
+                        os.remove(index_path)
+                    if os.path.exists(docstore_path):
+                        os.remove(docstore_path)
+                    if self._vectors is not None:
+                        self._vectors.remove()
+                    if self._wal is not None:
+                        self._wal.close()
+                        self._wal = None
+                        for suffix in ("", "-wal", "-shm"):
+                            log_path = f"{self.path}/{self.collection_name}.db{suffix}"
+                            if os.path.exists(log_path):
+                                os.remove(log_path)
+
+                    logger.info(f"Deleted collection {self.collection_name}")
+                except Exception as e:
+                    logger.warning(f"Failed to delete collection: {e}")
+
+            self.index = None
+            self.docstore = {}
+            self.index_to_id = {}
+            self.id_to_index = {}
+            self._tombstones = set()
+            self._payload_index = {key: {} for key in INDEXED_PAYLOAD_KEYS}
+            self._pending_ops = []
 
     def col_info(self) -> Dict:
         """
@@ -424,7 +1167,7 @@ class FAISS(VectorStoreBase):
 
         return {
             "name": self.collection_name,
-            "count": self.index.ntotal,
+            "count": self.index.ntotal - len(self._tombstones),
             "dimension": self.index.d,
             "distance": self.distance_strategy,
         }
@@ -440,31 +1183,32 @@ class FAISS(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        if self.index is None:
-            return []
+        with self._lock:
+            if self.index is None:
+                return []
 
-        results = []
-        count = 0
+            results = []
+            count = 0
 
-        for vector_id, payload in self.docstore.items():
-            if filters and not self._apply_filters(payload, filters):
-                continue
+            for vector_id, payload in self.docstore.items():
+                if filters and not self._apply_filters(payload, filters):
+                    continue
 
-            payload_copy = payload.copy()
+                payload_copy = payload.copy()
 
-            results.append(
-                OutputData(
-                    id=vector_id,
-                    score=None,
-                    payload=payload_copy,
+                results.append(
+                    OutputData(
+                        id=vector_id,
+                        score=None,
+                        payload=payload_copy,
+                    )
                 )
-            )
 
-            count += 1
-            if count >= limit:
-                break
+                count += 1
+                if count >= limit:
+                    break
 
-        return [results]
+            return [results]
 
     def reset(self):
         """Reset the index by deleting and recreating it."""
@@ -160,6 +160,31 @@ class MilvusDB(VectorStoreBase):
         result = self._parse_output(data=hits[0])
         return result
 
+    def search_batch(self, queries: list, vectors_list: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several queries in a single multi-vector request.
+
+        Args:
+            queries (list): Queries.
+            vectors_list (list): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        hits = self.client.search(
+            collection_name=self.collection_name,
+            data=list(vectors_list),
+            limit=limit,
+            filter=query_filter,
+            output_fields=["*"],
+        )
+        return [self._parse_output(data=query_hits) for query_hits in hits]
+
     def delete(self, vector_id):
         """
         Delete a vector by ID.
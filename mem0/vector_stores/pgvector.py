@@ -1,34 +1,62 @@
+import asyncio
+import itertools
 import json
 import logging
+import math
+import re
+import struct
+import uuid
+from contextlib import asynccontextmanager, contextmanager
 from typing import List, Optional
 
-from psycopg.types.json import Json
+import numpy as np
 from pydantic import BaseModel
 
 # Try to import psycopg (psycopg3) first, then fall back to psycopg2
 try:
-    import psycopg
-    from psycopg import execute_values
+    from psycopg.types.json import Json
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
     PSYCOPG_VERSION = 3
     logger = logging.getLogger(__name__)
     logger.info("Using psycopg (psycopg3) for PostgreSQL connections")
 except ImportError:
     try:
-        import psycopg2
-        from psycopg2.extras import execute_values
+        from psycopg2.extras import Json
+        from psycopg2.pool import ThreadedConnectionPool
+
         PSYCOPG_VERSION = 2
         logger = logging.getLogger(__name__)
         logger.info("Using psycopg2 for PostgreSQL connections")
     except ImportError:
         raise ImportError(
             "Neither 'psycopg' nor 'psycopg2' library is available. "
-            "Please install one of them using 'pip install psycopg' or 'pip install psycopg2'."
+            "Please install one of them using 'pip install \"psycopg[pool]\"' or 'pip install psycopg2'."
         )
 
+# A caller-provided psycopg2 pool also works when psycopg3 is installed
+try:
+    from psycopg2.extras import Json as Psycopg2Json
+    from psycopg2.extras import execute_values
+except ImportError:
+    Psycopg2Json = execute_values = None
+
+from mem0.utils.loop_local import LoopLocal
 from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.configs import QuantizationConfig
 
 logger = logging.getLogger(__name__)
 
+# Payload fields stored as indexed columns, so filters on them can use a btree index
+SCOPE_COLUMNS = ("user_id", "agent_id", "run_id")
+
+# Inserts of at least this many rows are streamed with COPY instead of INSERT statements
+BULK_INSERT_THRESHOLD = 1000
+BULK_INSERT_CHUNK_SIZE = 1000
+
+_COPY_BINARY_HEADER = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+_COPY_BINARY_TRAILER = struct.pack("!h", -1)
+
 
 class OutputData(BaseModel):
     id: Optional[str]
@@ -36,6 +64,30 @@ class OutputData(BaseModel):
     payload: Optional[dict]
 
 
+class _ChunkReader:
+    """File-like reader over byte chunks, for psycopg2's copy_expert."""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._chunk = memoryview(b"")
+        self._position = 0
+
+    def read(self, size=-1):
+        parts = []
+        while size != 0:
+            if self._position >= len(self._chunk):
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._chunk, self._position = memoryview(chunk), 0
+            end = len(self._chunk) if size < 0 else min(len(self._chunk), self._position + size)
+            parts.append(self._chunk[self._position : end])
+            if size > 0:
+                size -= end - self._position
+            self._position = end
+        return b"".join(parts)
+
+
 class PGVector(VectorStoreBase):
     def __init__(
         self,
@@ -51,10 +103,21 @@ class PGVector(VectorStoreBase):
         sslmode=None,
         connection_string=None,
         connection_pool=None,
+        minconn=1,
+        maxconn=5,
+        hnsw_m=None,
+        hnsw_ef_construction=None,
+        hnsw_ef_search=None,
+        hnsw_iterative_scan=None,
+        quantization=None,
     ):
         """
         Initialize the PGVector database.
 
+        Every call checks a connection out of a pool for its own duration, so the store can be
+        used from several threads at once. Async methods (`asearch`, `ainsert`, ...) run on a
+        separate psycopg3 async pool, opened on first use.
+
         Args:
             dbname (str): Database name
             collection_name (str): Collection name
@@ -67,84 +130,224 @@ class PGVector(VectorStoreBase):
             hnsw (bool, optional): Use HNSW for faster search
             sslmode (str, optional): SSL mode for PostgreSQL connection (e.g., 'require', 'prefer', 'disable')
             connection_string (str, optional): PostgreSQL connection string (overrides individual connection parameters)
-            connection_pool (Any, optional): psycopg2 connection pool object (overrides connection string and individual parameters)
+            connection_pool (Any, optional): psycopg_pool or psycopg2 connection pool object (overrides connection string and individual parameters)
+            minconn (int, optional): Minimum number of connections kept in the pool. Defaults to 1.
+            maxconn (int, optional): Maximum number of connections in the pool. Defaults to 5.
+            hnsw_m (int, optional): Max connections per node of the HNSW index. Defaults to pgvector's default.
+            hnsw_ef_construction (int, optional): Candidate list size when building the HNSW index.
+                Defaults to pgvector's default.
+            hnsw_ef_search (int, optional): Candidate list size when searching the HNSW index.
+                Defaults to the server setting.
+            hnsw_iterative_scan (str, optional): 'strict_order' or 'relaxed_order' to keep scanning the
+                HNSW index until enough rows pass the filters (pgvector 0.8+). Defaults to the server setting.
+            quantization (QuantizationConfig, optional): Index the vectors quantized, as `halfvec` for 'int8'
+                or as `bit` for 'binary' (pgvector 0.7+). The full-precision column is kept to rescore the
+                candidates. Takes precedence over `diskann`. Defaults to None.
         """
         self.collection_name = collection_name
         self.use_diskann = diskann
         self.use_hnsw = hnsw
         self.embedding_model_dims = embedding_model_dims
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.hnsw_m = hnsw_m
+        self.hnsw_ef_construction = hnsw_ef_construction
+        self.hnsw_ef_search = hnsw_ef_search
+        self.hnsw_iterative_scan = hnsw_iterative_scan
+        self.quantization = QuantizationConfig.model_validate(quantization) if quantization else None
+
+        # psycopg3 async pools and their opening, one per event loop
+        self._async_pools = LoopLocal(self._open_async_pool)
 
         # Connection setup with priority: connection_pool > connection_string > individual parameters
         if connection_pool is not None:
-            # Use provided connection pool
-            self.conn = connection_pool.getconn()
+            # Use provided connection pool, it stays owned by the caller
             self.connection_pool = connection_pool
-        elif connection_string is not None:
-            # Use connection string
-            if sslmode:
-                # Append sslmode to connection string if provided
-                if 'sslmode=' in connection_string:
-                    # Replace existing sslmode
-                    import re
-                    connection_string = re.sub(r'sslmode=[^ ]*', f'sslmode={sslmode}', connection_string)
-                else:
-                    # Add sslmode to connection string
-                    connection_string = f"{connection_string} sslmode={sslmode}"
-            
-            if PSYCOPG_VERSION == 3:
-                self.conn = psycopg.connect(connection_string)
-            else:
-                self.conn = psycopg2.connect(connection_string)
-            self.connection_pool = None
+            self._owns_pool = False
+            # psycopg3 pools hand out connections through connection(), psycopg2 pools through getconn()
+            self._psycopg_version = 3 if hasattr(connection_pool, "connection") else 2
+            self._conninfo = None
+            self._connect_kwargs = None
         else:
-            # Use individual connection parameters
-            conn_params = {
-                'dbname': dbname,
-                'user': user,
-                'password': password,
-                'host': host,
-                'port': port
-            }
-            if sslmode:
-                conn_params['sslmode'] = sslmode
-            
+            if connection_string is not None:
+                if sslmode:
+                    if "sslmode=" in connection_string:
+                        # Replace existing sslmode
+                        connection_string = re.sub(r"sslmode=[^ ]*", f"sslmode={sslmode}", connection_string)
+                    else:
+                        # Add sslmode to connection string
+                        connection_string = f"{connection_string} sslmode={sslmode}"
+                self._conninfo = connection_string
+                self._connect_kwargs = {}
+            else:
+                # Use individual connection parameters
+                self._conninfo = ""
+                self._connect_kwargs = {
+                    "dbname": dbname,
+                    "user": user,
+                    "password": password,
+                    "host": host,
+                    "port": port,
+                }
+                if sslmode:
+                    self._connect_kwargs["sslmode"] = sslmode
+
             if PSYCOPG_VERSION == 3:
-                self.conn = psycopg.connect(**conn_params)
+                self.connection_pool = ConnectionPool(
+                    self._conninfo, kwargs=self._connect_kwargs, min_size=minconn, max_size=maxconn, open=True
+                )
             else:
-                self.conn = psycopg2.connect(**conn_params)
-            self.connection_pool = None
-        
-        self.cur = self.conn.cursor()
+                self.connection_pool = ThreadedConnectionPool(
+                    minconn, maxconn, self._conninfo or None, **self._connect_kwargs
+                )
+            self._owns_pool = True
+            self._psycopg_version = PSYCOPG_VERSION
 
         collections = self.list_cols()
         if collection_name not in collections:
             self.create_col(embedding_model_dims)
+        else:
+            self._migrate_scope_columns()
+            if self.quantization:
+                # Collections created without quantization get the quantized index added
+                with self._get_cursor(commit=True) as cur:
+                    self._create_vector_index(cur, embedding_model_dims)
+
+    def _json(self, payload):
+        """Wrap a payload for the psycopg version of the pool."""
+        return Json(payload) if self._psycopg_version == 3 else Psycopg2Json(payload)
+
+    @contextmanager
+    def _get_cursor(self, commit=False):
+        """
+        Check a connection out of the pool for the duration of one call and yield a cursor on it.
+
+        The transaction is committed if `commit` is set and rolled back on error, then the
+        connection goes back to the pool.
+        """
+        if self._psycopg_version == 3:
+            with self.connection_pool.connection() as conn:
+                with conn.cursor() as cur:
+                    try:
+                        yield cur
+                        if commit:
+                            conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        raise
+        else:
+            conn = self.connection_pool.getconn()
+            try:
+                with conn.cursor() as cur:
+                    yield cur
+                if commit:
+                    conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                self.connection_pool.putconn(conn)
+
+    def _open_async_pool(self):
+        pool = AsyncConnectionPool(
+            self._conninfo, kwargs=self._connect_kwargs, min_size=self.minconn, max_size=self.maxconn, open=False
+        )
+        return pool, asyncio.ensure_future(pool.open())
+
+    async def _get_async_pool(self):
+        """The psycopg3 async pool of the running event loop, or None when only the sync pool can be used."""
+        if self._psycopg_version != 3 or self._conninfo is None:
+            return None
+        # Concurrent first callers of a loop all wait for the same open
+        entry = self._async_pools.get()
+        pool, opening = entry
+        try:
+            await opening
+        except Exception:
+            self._async_pools.discard(entry)
+            raise
+        return pool
+
+    @asynccontextmanager
+    async def _get_async_cursor(self, pool, commit=False):
+        """Async counterpart of `_get_cursor` on the psycopg3 async pool."""
+        async with pool.connection() as conn:
+            async with conn.cursor() as cur:
+                try:
+                    yield cur
+                    if commit:
+                        await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+
+    def _scope_columns_sql(self):
+        return ",\n".join(
+            f"{column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED" for column in SCOPE_COLUMNS
+        )
+
+    def _create_scope_indexes(self, cur):
+        for column in SCOPE_COLUMNS:
+            cur.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.collection_name}_{column}_idx ON {self.collection_name} ({column})"
+            )
 
     def create_col(self, embedding_model_dims):
         """
         Create a new collection (table in PostgreSQL).
         Will also initialize vector search index if specified.
 
+        user_id, agent_id and run_id are kept in indexed columns generated from the payload.
+
         Args:
             embedding_model_dims (int): Dimension of the embedding vector.
         """
-        self.cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
-        self.cur.execute(
-            f"""
-            CREATE TABLE IF NOT EXISTS {self.collection_name} (
-                id UUID PRIMARY KEY,
-                vector vector({embedding_model_dims}),
-                payload JSONB
-            );
-        """
-        )
-
-        if self.use_diskann and embedding_model_dims < 2000:
+        with self._get_cursor(commit=True) as cur:
+            cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+            cur.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self.collection_name} (
+                    id UUID PRIMARY KEY,
+                    vector vector({embedding_model_dims}),
+                    payload JSONB,
+                    {self._scope_columns_sql()}
+                );
+            """
+            )
+            self._create_scope_indexes(cur)
+
+            self._create_vector_index(cur, embedding_model_dims)
+
+    def _quantized_vector(self, vector):
+        """SQL expression of `vector` in the quantized type of the index."""
+        dims = int(self.embedding_model_dims)
+        if self.quantization.type == "binary":
+            return f"binary_quantize({vector})::bit({dims})"
+        return f"({vector})::halfvec({dims})"
+
+    def _index_options(self):
+        index_options = {"m": self.hnsw_m, "ef_construction": self.hnsw_ef_construction}
+        index_options = ", ".join(f"{name} = {int(value)}" for name, value in index_options.items() if value)
+        return f"WITH ({index_options})" if index_options else ""
+
+    def _create_vector_index(self, cur, embedding_model_dims):
+        if self.quantization:
+            # HNSW index over an expression: the table keeps the full-precision vectors
+            operator_class = "bit_hamming_ops" if self.quantization.type == "binary" else "halfvec_cosine_ops"
+            cur.execute(
+                f"""
+                CREATE INDEX IF NOT EXISTS {self.collection_name}_{self.quantization.type}_idx
+                ON {self.collection_name}
+                USING hnsw (({self._quantized_vector("vector")}) {operator_class})
+                {self._index_options()}
+            """
+            )
+        elif self.use_diskann and embedding_model_dims < 2000:
             # Check if vectorscale extension is installed
-            self.cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
-            if self.cur.fetchone():
+            cur.execute("SELECT * FROM pg_extension WHERE extname = 'vectorscale'")
+            if cur.fetchone():
                 # Create DiskANN index if extension is installed for faster search
-                self.cur.execute(
+                cur.execute(
                     f"""
                     CREATE INDEX IF NOT EXISTS {self.collection_name}_diskann_idx
                     ON {self.collection_name}
@@ -152,15 +355,43 @@ class PGVector(VectorStoreBase):
                 """
                 )
         elif self.use_hnsw:
-            self.cur.execute(
+            cur.execute(
                 f"""
                 CREATE INDEX IF NOT EXISTS {self.collection_name}_hnsw_idx
                 ON {self.collection_name}
                 USING hnsw (vector vector_cosine_ops)
+                {self._index_options()}
             """
             )
 
-        self.conn.commit()
+    def _migrate_scope_columns(self):
+        """Add the user_id, agent_id and run_id columns to a collection created before they existed."""
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_schema = 'public' AND table_name = %s",
+                (self.collection_name,),
+            )
+            existing_columns = {row[0] for row in cur.fetchall()}
+            missing_columns = [column for column in SCOPE_COLUMNS if column not in existing_columns]
+            if not missing_columns:
+                return
+
+            logger.warning(
+                f"Adding {', '.join(missing_columns)} columns to collection {self.collection_name}, "
+                "this rewrites the table once"
+            )
+            # Generated columns are backfilled from the payload by the rewrite
+            cur.execute(
+                f"ALTER TABLE {self.collection_name} "
+                + ", ".join(
+                    f"ADD COLUMN IF NOT EXISTS {column} TEXT GENERATED ALWAYS AS (payload->>'{column}') STORED"
+                    for column in missing_columns
+                )
+            )
+            self._create_scope_indexes(cur)
+
+    def _insert_rows(self, vectors, payloads, ids):
+        return [(id, vector, json.dumps(payload)) for id, vector, payload in zip(ids, vectors, payloads)]
 
     def insert(self, vectors, payloads=None, ids=None):
         """
@@ -170,22 +401,198 @@ class PGVector(VectorStoreBase):
             vectors (List[List[float]]): List of vectors to insert.
             payloads (List[Dict], optional): List of payloads corresponding to vectors.
             ids (List[str], optional): List of IDs corresponding to vectors.
+
+        Batches of BULK_INSERT_THRESHOLD rows or more go through `bulk_insert`.
         """
+        if len(vectors) >= BULK_INSERT_THRESHOLD:
+            self.bulk_insert(vectors, payloads, ids)
+            return
+
         logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
-        json_payloads = [json.dumps(payload) for payload in payloads]
+        data = self._insert_rows(vectors, payloads, ids)
+        with self._get_cursor(commit=True) as cur:
+            if self._psycopg_version == 3:
+                # psycopg3 pipelines executemany into a single round trip
+                cur.executemany(
+                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                    data,
+                )
+            else:
+                execute_values(
+                    cur,
+                    f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s",
+                    data,
+                )
 
-        data = [(id, vector, payload) for id, vector, payload in zip(ids, vectors, json_payloads)]
-        execute_values(
-            self.cur,
-            f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES %s",
-            data,
+    def _copy_binary_chunks(self, vectors, payloads, ids):
+        """
+        Encode rows as a binary COPY stream: the header, one chunk of bytes per BULK_INSERT_CHUNK_SIZE
+        rows, then the trailer. The input is validated before the first chunk is produced.
+
+        The fixed-size part of every row (field count, UUID and the pgvector binary vector: dimensions,
+        an unused int16, then big-endian float4 values) is laid out by a NumPy structured array in one
+        pass; only the JSONB payloads are encoded row by row.
+        """
+        vectors = np.asarray(vectors, dtype=">f4")
+        if vectors.ndim != 2 or vectors.shape[1] != self.embedding_model_dims:
+            raise ValueError(f"Expected vectors of shape (n, {self.embedding_model_dims}), got {vectors.shape}")
+        count, dims = vectors.shape
+        if len(ids) != count or len(payloads) != count:
+            raise ValueError("vectors, payloads and ids must have the same length")
+
+        fixed = np.empty(
+            count,
+            dtype=[
+                ("fields", ">i2"),
+                ("id_length", ">i4"),
+                ("id", "V16"),
+                ("vector_length", ">i4"),
+                ("dims", ">i2"),
+                ("unused", ">i2"),
+                ("vector", ">f4", (dims,)),
+            ],
         )
-        self.conn.commit()
+        fixed["fields"] = 3
+        fixed["id_length"] = 16
+        fixed["id"] = np.frombuffer(b"".join(uuid.UUID(str(id)).bytes for id in ids), dtype="V16")
+        fixed["vector_length"] = 4 + 4 * dims
+        fixed["dims"] = dims
+        fixed["unused"] = 0
+        fixed["vector"] = vectors
+
+        fixed_rows = memoryview(fixed.tobytes())
+        row_size = fixed.dtype.itemsize
+
+        def encode_rows():
+            for start in range(0, count, BULK_INSERT_CHUNK_SIZE):
+                parts = []
+                for index in range(start, min(start + BULK_INSERT_CHUNK_SIZE, count)):
+                    # JSONB binary format: a version byte followed by the JSON text
+                    payload = json.dumps(payloads[index]).encode()
+                    parts.append(fixed_rows[index * row_size : (index + 1) * row_size])
+                    parts.append(struct.pack("!ib", len(payload) + 1, 1))
+                    parts.append(payload)
+                yield b"".join(parts)
+
+        return itertools.chain([_COPY_BINARY_HEADER], encode_rows(), [_COPY_BINARY_TRAILER])
+
+    def bulk_insert(self, vectors, payloads, ids, defer_index=False):
+        """
+        Stream vectors into the collection with COPY ... FROM STDIN (FORMAT BINARY).
+
+        Much faster than `insert` for backfills: rows are sent in PostgreSQL's binary format,
+        with no per-row statement and no text parsing of the vectors on either side.
+
+        Args:
+            vectors (numpy.ndarray or List[List[float]]): Vectors to insert, of shape (n, embedding_model_dims).
+            payloads (List[Dict]): Payloads corresponding to vectors.
+            ids (List[str]): UUIDs corresponding to vectors.
+            defer_index (bool, optional): Drop the vector index before the load and build it once at the
+                end, in the same transaction. Searches wait for the load to finish. Defaults to False.
+        """
+        logger.info(f"Bulk loading {len(ids)} vectors into collection {self.collection_name}")
+        copy_sql = f"COPY {self.collection_name} (id, vector, payload) FROM STDIN (FORMAT BINARY)"
+        chunks = self._copy_binary_chunks(vectors, payloads, ids)
+        with self._get_cursor(commit=True) as cur:
+            if defer_index:
+                cur.execute(f"DROP INDEX IF EXISTS {self.collection_name}_hnsw_idx")
+                cur.execute(f"DROP INDEX IF EXISTS {self.collection_name}_diskann_idx")
+                if self.quantization:
+                    cur.execute(f"DROP INDEX IF EXISTS {self.collection_name}_{self.quantization.type}_idx")
+
+            if self._psycopg_version == 3:
+                with cur.copy(copy_sql) as copy:
+                    for chunk in chunks:
+                        copy.write(chunk)
+            else:
+                cur.copy_expert(copy_sql, _ChunkReader(chunks), size=1 << 20)
+
+            if defer_index:
+                self._create_vector_index(cur, self.embedding_model_dims)
+
+    def _filter_clause(self, filters):
+        """WHERE clause matching payload fields, and its parameters."""
+        filter_conditions = []
+        filter_params = []
+
+        if filters:
+            for k, v in filters.items():
+                if k in SCOPE_COLUMNS:
+                    filter_conditions.append(f"{k} = %s")
+                    filter_params.append(str(v))
+                else:
+                    filter_conditions.append("payload->>%s = %s")
+                    filter_params.extend([k, str(v)])
+
+        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+        return filter_clause, filter_params
+
+    def _search_settings(self):
+        """Statement applying the HNSW search settings to the current transaction, or None."""
+        settings = {"hnsw.ef_search": self.hnsw_ef_search, "hnsw.iterative_scan": self.hnsw_iterative_scan}
+        settings = {name: str(value) for name, value in settings.items() if value is not None}
+        if not (self.use_hnsw or self.quantization) or not settings:
+            return None
+        sql = "SELECT " + ", ".join("set_config(%s, %s, true)" for _ in settings)
+        return sql, tuple(item for setting in settings.items() for item in setting)
+
+    def _nearest_query(self, query_vector, vector_params, filter_clause, filter_params, limit):
+        """
+        Query of the `limit` rows nearest to `query_vector`, and its parameters.
+
+        With quantization, rows are ranked on the quantized index and, when rescoring,
+        `limit * oversampling` candidates are re-ranked on the full-precision vectors.
+
+        Args:
+            query_vector (str): SQL expression of the query vector.
+            vector_params (tuple): Parameters of `query_vector`, empty when it has none.
+            filter_clause (str): WHERE clause of the query.
+            filter_params (list): Parameters of `filter_clause`.
+            limit (int): Number of rows to return.
+        """
+        distance = f"vector <=> {query_vector}::vector"
+        if self.quantization is None:
+            query = f"""
+                SELECT id, {distance} AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY distance
+                LIMIT %s
+            """
+            return query, (*vector_params, *filter_params, limit)
+
+        operator = "<~>" if self.quantization.type == "binary" else "<=>"
+        order = f"{self._quantized_vector('vector')} {operator} {self._quantized_vector(f'{query_vector}::vector')}"
+        query = f"""
+                SELECT id, {distance} AS distance, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                ORDER BY {order}
+                LIMIT %s
+            """
+        if not self.quantization.rescore:
+            return query, (*vector_params, *filter_params, *vector_params, limit)
+
+        candidates = math.ceil(limit * self.quantization.oversampling)
+        query = f"""
+                SELECT id, distance, payload
+                FROM ({query}) candidates
+                ORDER BY distance
+                LIMIT %s
+            """
+        return query, (*vector_params, *filter_params, *vector_params, candidates, limit)
+
+    def _search_query(self, vectors, limit, filters):
+        filter_clause, filter_params = self._filter_clause(filters)
+        return self._nearest_query("%s", (vectors,), filter_clause, filter_params, limit)
 
     def search(self, query, vectors, limit=5, filters=None):
         """
         Search for similar vectors.
 
+        The statement is prepared server-side on each pooled connection (psycopg3), so repeated
+        searches with the same filter keys skip parsing and planning.
+
         Args:
             query (str): Query.
             vectors (List[float]): Query vector.
@@ -195,29 +602,63 @@ class PGVector(VectorStoreBase):
         Returns:
             list: Search results.
         """
-        filter_conditions = []
-        filter_params = []
+        sql, params = self._search_query(vectors, limit, filters)
+        settings = self._search_settings()
+        with self._get_cursor() as cur:
+            if settings:
+                cur.execute(*settings)
+            if self._psycopg_version == 3:
+                cur.execute(sql, params, prepare=True)
+            else:
+                cur.execute(sql, params)
+            results = cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+    def _search_batch_query(self, vectors_list, limit, filters):
+        filter_clause, filter_params = self._filter_clause(filters)
+        query_vectors = ["[" + ",".join(str(float(x)) for x in vectors) + "]" for vectors in vectors_list]
+        nearest_query, nearest_params = self._nearest_query("q.query_vector", (), filter_clause, filter_params, limit)
+        query = f"""
+                SELECT q.ord, r.id, r.distance, r.payload
+                FROM unnest(%s::text[]) WITH ORDINALITY AS q(query_vector, ord)
+                CROSS JOIN LATERAL ({nearest_query}) r
+                ORDER BY q.ord, r.distance
+            """
+        return query, (query_vectors, *nearest_params)
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+    def _group_batch_results(self, rows, vectors_list):
+        grouped_results = [[] for _ in vectors_list]
+        for r in rows:
+            grouped_results[r[0] - 1].append(OutputData(id=str(r[1]), score=float(r[2]), payload=r[3]))
+        return grouped_results
 
-        self.cur.execute(
-            f"""
-            SELECT id, vector <=> %s::vector AS distance, payload
-            FROM {self.collection_name}
-            {filter_clause}
-            ORDER BY distance
-            LIMIT %s
-        """,
-            (vectors, *filter_params, limit),
-        )
+    def search_batch(self, queries, vectors_list, limit=5, filters=None):
+        """
+        Search for similar vectors for several queries in a single round trip.
 
-        results = self.cur.fetchall()
-        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
+        Each query vector is joined laterally against the collection, so every query
+        keeps its own ORDER BY/LIMIT and can still use the vector index.
+
+        Args:
+            queries (List[str]): Queries.
+            vectors_list (List[List[float]]): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (Dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+
+        sql, params = self._search_batch_query(vectors_list, limit, filters)
+        settings = self._search_settings()
+        with self._get_cursor() as cur:
+            if settings:
+                cur.execute(*settings)
+            cur.execute(sql, params)
+            rows = cur.fetchall()
+        return self._group_batch_results(rows, vectors_list)
 
     def delete(self, vector_id):
         """
@@ -226,8 +667,18 @@ class PGVector(VectorStoreBase):
         Args:
             vector_id (str): ID of the vector to delete.
         """
-        self.cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
-        self.conn.commit()
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+
+    def _update_statements(self, vector_id, vector, payload):
+        statements = []
+        if vector:
+            statements.append((f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s", (vector, vector_id)))
+        if payload:
+            statements.append(
+                (f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s", (self._json(payload), vector_id))
+            )
+        return statements
 
     def update(self, vector_id, vector=None, payload=None):
         """
@@ -238,26 +689,9 @@ class PGVector(VectorStoreBase):
             vector (List[float], optional): Updated vector.
             payload (Dict, optional): Updated payload.
         """
-        if vector:
-            self.cur.execute(
-                f"UPDATE {self.collection_name} SET vector = %s WHERE id = %s",
-                (vector, vector_id),
-            )
-        if payload:
-            # Handle JSON serialization based on psycopg version
-            if PSYCOPG_VERSION == 3:
-                # psycopg3 uses psycopg.types.json.Json
-                self.cur.execute(
-                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
-                    (Json(payload), vector_id),
-                )
-            else:
-                # psycopg2 uses psycopg2.extras.Json
-                self.cur.execute(
-                    f"UPDATE {self.collection_name} SET payload = %s WHERE id = %s",
-                    (psycopg2.extras.Json(payload), vector_id),
-                )
-        self.conn.commit()
+        with self._get_cursor(commit=True) as cur:
+            for sql, params in self._update_statements(vector_id, vector, payload):
+                cur.execute(sql, params)
 
     def get(self, vector_id) -> OutputData:
         """
@@ -269,11 +703,12 @@ class PGVector(VectorStoreBase):
         Returns:
             OutputData: Retrieved vector.
         """
-        self.cur.execute(
-            f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
-            (vector_id,),
-        )
-        result = self.cur.fetchone()
+        with self._get_cursor() as cur:
+            cur.execute(
+                f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s",
+                (vector_id,),
+            )
+            result = cur.fetchone()
         if not result:
             return None
         return OutputData(id=str(result[0]), score=None, payload=result[2])
@@ -285,13 +720,14 @@ class PGVector(VectorStoreBase):
         Returns:
             List[str]: List of collection names.
         """
-        self.cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
-        return [row[0] for row in self.cur.fetchall()]
+        with self._get_cursor() as cur:
+            cur.execute("SELECT table_name FROM information_schema.tables WHERE table_schema = 'public'")
+            return [row[0] for row in cur.fetchall()]
 
     def delete_col(self):
         """Delete a collection."""
-        self.cur.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
-        self.conn.commit()
+        with self._get_cursor(commit=True) as cur:
+            cur.execute(f"DROP TABLE IF EXISTS {self.collection_name}")
 
     def col_info(self):
         """
@@ -300,20 +736,31 @@ class PGVector(VectorStoreBase):
         Returns:
             Dict[str, Any]: Collection information.
         """
-        self.cur.execute(
-            f"""
-            SELECT 
-                table_name, 
-                (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
-                (SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))) as total_size
-            FROM information_schema.tables 
-            WHERE table_schema = 'public' AND table_name = %s
-        """,
-            (self.collection_name,),
-        )
-        result = self.cur.fetchone()
+        with self._get_cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT
+                    table_name,
+                    (SELECT COUNT(*) FROM {self.collection_name}) as row_count,
+                    (SELECT pg_size_pretty(pg_total_relation_size('{self.collection_name}'))) as total_size
+                FROM information_schema.tables
+                WHERE table_schema = 'public' AND table_name = %s
+            """,
+                (self.collection_name,),
+            )
+            result = cur.fetchone()
         return {"name": result[0], "count": result[1], "size": result[2]}
 
+    def _list_query(self, filters, limit):
+        filter_clause, filter_params = self._filter_clause(filters)
+        query = f"""
+                SELECT id, vector, payload
+                FROM {self.collection_name}
+                {filter_clause}
+                LIMIT %s
+            """
+        return query, (*filter_params, limit)
+
     def list(self, filters=None, limit=100):
         """
         List all vectors in a collection.
@@ -325,41 +772,114 @@ class PGVector(VectorStoreBase):
         Returns:
             List[OutputData]: List of vectors.
         """
-        filter_conditions = []
-        filter_params = []
-
-        if filters:
-            for k, v in filters.items():
-                filter_conditions.append("payload->>%s = %s")
-                filter_params.extend([k, str(v)])
+        sql, params = self._list_query(filters, limit)
+        with self._get_cursor() as cur:
+            cur.execute(sql, params)
+            results = cur.fetchall()
+        return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
-        filter_clause = "WHERE " + " AND ".join(filter_conditions) if filter_conditions else ""
+    async def ainsert(self, vectors, payloads=None, ids=None):
+        """Async version of `insert`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.insert, vectors, payloads, ids)
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            await cur.executemany(
+                f"INSERT INTO {self.collection_name} (id, vector, payload) VALUES (%s, %s, %s)",
+                self._insert_rows(vectors, payloads, ids),
+            )
 
-        query = f"""
-            SELECT id, vector, payload
-            FROM {self.collection_name}
-            {filter_clause}
-            LIMIT %s
-        """
+    async def asearch(self, query, vectors, limit=5, filters=None):
+        """Async version of `search`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.search, query, vectors, limit, filters)
+        sql, params = self._search_query(vectors, limit, filters)
+        settings = self._search_settings()
+        async with self._get_async_cursor(pool) as cur:
+            if settings:
+                await cur.execute(*settings)
+            await cur.execute(sql, params, prepare=True)
+            results = await cur.fetchall()
+        return [OutputData(id=str(r[0]), score=float(r[1]), payload=r[2]) for r in results]
 
-        self.cur.execute(query, (*filter_params, limit))
+    async def asearch_batch(self, queries, vectors_list, limit=5, filters=None):
+        """Async version of `search_batch`."""
+        if not queries:
+            return []
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.search_batch, queries, vectors_list, limit, filters)
+        sql, params = self._search_batch_query(vectors_list, limit, filters)
+        settings = self._search_settings()
+        async with self._get_async_cursor(pool) as cur:
+            if settings:
+                await cur.execute(*settings)
+            await cur.execute(sql, params)
+            rows = await cur.fetchall()
+        return self._group_batch_results(rows, vectors_list)
+
+    async def adelete(self, vector_id):
+        """Async version of `delete`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.delete, vector_id)
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            await cur.execute(f"DELETE FROM {self.collection_name} WHERE id = %s", (vector_id,))
+
+    async def aupdate(self, vector_id, vector=None, payload=None):
+        """Async version of `update`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.update, vector_id, vector, payload)
+        async with self._get_async_cursor(pool, commit=True) as cur:
+            for sql, params in self._update_statements(vector_id, vector, payload):
+                await cur.execute(sql, params)
+
+    async def aget(self, vector_id) -> OutputData:
+        """Async version of `get`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.get, vector_id)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(f"SELECT id, vector, payload FROM {self.collection_name} WHERE id = %s", (vector_id,))
+            result = await cur.fetchone()
+        if not result:
+            return None
+        return OutputData(id=str(result[0]), score=None, payload=result[2])
 
-        results = self.cur.fetchall()
+    async def alist(self, filters=None, limit=100):
+        """Async version of `list`."""
+        pool = await self._get_async_pool()
+        if pool is None:
+            return await asyncio.to_thread(self.list, filters, limit)
+        sql, params = self._list_query(filters, limit)
+        async with self._get_async_cursor(pool) as cur:
+            await cur.execute(sql, params)
+            results = await cur.fetchall()
         return [[OutputData(id=str(r[0]), score=None, payload=r[2]) for r in results]]
 
+    async def aclose(self):
+        """Close the async pool of the running event loop, if it was opened."""
+        entry = self._async_pools.discard()
+        if entry is not None:
+            await entry[0].close()
+
+    def close(self):
+        """Close the connection pool, unless it was provided by the caller."""
+        if getattr(self, "_owns_pool", False) and self.connection_pool is not None:
+            if self._psycopg_version == 3:
+                self.connection_pool.close()
+            else:
+                self.connection_pool.closeall()
+            self.connection_pool = None
+
     def __del__(self):
         """
-        Close the database connection when the object is deleted.
+        Close the connection pool when the object is deleted.
         """
-        if hasattr(self, "cur"):
-            self.cur.close()
-        if hasattr(self, "conn"):
-            if hasattr(self, "connection_pool") and self.connection_pool is not None:
-                # Return connection to pool instead of closing it
-                self.connection_pool.putconn(self.conn)
-            else:
-                # Close the connection directly
-                self.conn.close()
+        self.close()
 
     def reset(self):
         """Reset the index by deleting and recreating it."""
@@ -1,24 +1,57 @@
+import asyncio
+import functools
 import logging
 import os
 import shutil
+import threading
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
     Distance,
     FieldCondition,
     Filter,
     MatchValue,
     PointIdsList,
     PointStruct,
+    QuantizationSearchParams,
+    QueryRequest,
     Range,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     VectorParams,
 )
 
+from mem0.utils.loop_local import LoopLocal
 from mem0.vector_stores.base import VectorStoreBase
+from mem0.vector_stores.configs import QuantizationConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _SerializedClient:
+    """Proxy serializing the calls to a local QdrantClient, whose in-process storage is not thread-safe."""
+
+    def __init__(self, client: QdrantClient):
+        self._client = client
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def serialized(*args, **kwargs):
+            with self._lock:
+                return attribute(*args, **kwargs)
+
+        return serialized
+
+
 class Qdrant(VectorStoreBase):
     def __init__(
         self,
@@ -31,6 +64,7 @@ class Qdrant(VectorStoreBase):
         url: str = None,
         api_key: str = None,
         on_disk: bool = False,
+        quantization: QuantizationConfig = None,
     ):
         """
         Initialize the Qdrant vector store.
@@ -45,7 +79,11 @@ class Qdrant(VectorStoreBase):
             url (str, optional): Full URL for Qdrant server. Defaults to None.
             api_key (str, optional): API key for Qdrant server. Defaults to None.
             on_disk (bool, optional): Enables persistent storage. Defaults to False.
+            quantization (QuantizationConfig, optional): Scalar (int8) or binary quantization of the collection.
+                The quantized vectors are kept in RAM, the originals follow `on_disk`. Defaults to None.
         """
+        # Async clients, one per event loop, only possible when the client is built here
+        self._async_clients = None
         if client:
             self.client = client
             self.is_local = False
@@ -67,12 +105,17 @@ class Qdrant(VectorStoreBase):
                         shutil.rmtree(path)
             else:
                 self.is_local = False
+                self._async_clients = LoopLocal(lambda: AsyncQdrantClient(**params))
 
             self.client = QdrantClient(**params)
+            if self.is_local:
+                # Memory and AsyncMemory call the store from worker threads
+                self.client = _SerializedClient(self.client)
 
         self.collection_name = collection_name
         self.embedding_model_dims = embedding_model_dims
         self.on_disk = on_disk
+        self.quantization = QuantizationConfig.model_validate(quantization) if quantization else None
         self.create_col(embedding_model_dims, on_disk)
 
     def create_col(self, vector_size: int, on_disk: bool, distance: Distance = Distance.COSINE):
@@ -89,15 +132,42 @@ class Qdrant(VectorStoreBase):
         for collection in response.collections:
             if collection.name == self.collection_name:
                 logger.debug(f"Collection {self.collection_name} already exists. Skipping creation.")
+                if self.quantization and not self.is_local:
+                    # Qdrant quantizes the existing points in the background
+                    self.client.update_collection(
+                        collection_name=self.collection_name, quantization_config=self._quantization_config()
+                    )
                 self._create_filter_indexes()
                 return
 
         self.client.create_collection(
             collection_name=self.collection_name,
             vectors_config=VectorParams(size=vector_size, distance=distance, on_disk=on_disk),
+            quantization_config=self._quantization_config(),
         )
         self._create_filter_indexes()
 
+    def _quantization_config(self):
+        """Qdrant quantization of the collection, or None."""
+        if self.quantization is None:
+            return None
+        if self.quantization.type == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(type=ScalarType.INT8, quantile=0.99, always_ram=True)
+        )
+
+    def _search_params(self):
+        """Search parameters rescoring quantized candidates, or None."""
+        # Local mode always searches exactly
+        if self.quantization is None or self.is_local:
+            return None
+        return SearchParams(
+            quantization=QuantizationSearchParams(
+                rescore=self.quantization.rescore, oversampling=self.quantization.oversampling
+            )
+        )
+
     def _create_filter_indexes(self):
         """Create indexes for commonly used filter fields to enable filtering."""
         # Only create payload indexes for remote Qdrant servers
@@ -177,10 +247,36 @@ class Qdrant(VectorStoreBase):
             collection_name=self.collection_name,
             query=vectors,
             query_filter=query_filter,
+            search_params=self._search_params(),
             limit=limit,
         )
         return hits.points
 
+    def search_batch(self, queries: list, vectors_list: list, limit: int = 5, filters: dict = None) -> list:
+        """
+        Search for similar vectors for several queries in a single request.
+
+        Args:
+            queries (list): Queries.
+            vectors_list (list): Query vectors, one per query.
+            limit (int, optional): Number of results to return per query. Defaults to 5.
+            filters (dict, optional): Filters to apply to every query. Defaults to None.
+
+        Returns:
+            list: One list of search results per query.
+        """
+        if not queries:
+            return []
+        query_filter = self._create_filter(filters) if filters else None
+        requests = [
+            QueryRequest(
+                query=vectors, filter=query_filter, params=self._search_params(), limit=limit, with_payload=True
+            )
+            for vectors in vectors_list
+        ]
+        responses = self.client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [response.points for response in responses]
+
     def delete(self, vector_id: int):
         """
         Delete a vector by ID.
@@ -254,14 +350,117 @@ class Qdrant(VectorStoreBase):
             list: List of vectors.
         """
         query_filter = self._create_filter(filters) if filters else None
-        result = self.client.scroll(
+        # scroll returns the points and the offset of the next page
+        points, _ = self.client.scroll(
+            collection_name=self.collection_name,
+            scroll_filter=query_filter,
+            limit=limit,
+            with_payload=True,
+            with_vectors=False,
+        )
+        return [points]
+
+    def _get_async_client(self):
+        """
+        The async client of the running event loop, or None when only the sync client can be
+        used: local storage is opened by a single client, and a client passed by the caller has
+        no async twin.
+        """
+        if self._async_clients is None:
+            return None
+        return self._async_clients.get()
+
+    async def ainsert(self, vectors: list, payloads: list = None, ids: list = None):
+        """Async version of `insert`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.insert, vectors, payloads, ids)
+        logger.info(f"Inserting {len(vectors)} vectors into collection {self.collection_name}")
+        points = [
+            PointStruct(
+                id=idx if ids is None else ids[idx],
+                vector=vector,
+                payload=payloads[idx] if payloads else {},
+            )
+            for idx, vector in enumerate(vectors)
+        ]
+        await client.upsert(collection_name=self.collection_name, points=points)
+
+    async def asearch(self, query: str, vectors: list, limit: int = 5, filters: dict = None) -> list:
+        """Async version of `search`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.search, query, vectors, limit, filters)
+        query_filter = self._create_filter(filters) if filters else None
+        hits = await client.query_points(
+            collection_name=self.collection_name,
+            query=vectors,
+            query_filter=query_filter,
+            search_params=self._search_params(),
+            limit=limit,
+        )
+        return hits.points
+
+    async def asearch_batch(self, queries: list, vectors_list: list, limit: int = 5, filters: dict = None) -> list:
+        """Async version of `search_batch`."""
+        if not queries:
+            return []
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.search_batch, queries, vectors_list, limit, filters)
+        query_filter = self._create_filter(filters) if filters else None
+        requests = [
+            QueryRequest(
+                query=vectors, filter=query_filter, params=self._search_params(), limit=limit, with_payload=True
+            )
+            for vectors in vectors_list
+        ]
+        responses = await client.query_batch_points(collection_name=self.collection_name, requests=requests)
+        return [response.points for response in responses]
+
+    async def adelete(self, vector_id: int):
+        """Async version of `delete`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.delete, vector_id)
+        await client.delete(collection_name=self.collection_name, points_selector=PointIdsList(points=[vector_id]))
+
+    async def aupdate(self, vector_id: int, vector: list = None, payload: dict = None):
+        """Async version of `update`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.update, vector_id, vector, payload)
+        point = PointStruct(id=vector_id, vector=vector, payload=payload)
+        await client.upsert(collection_name=self.collection_name, points=[point])
+
+    async def aget(self, vector_id: int) -> dict:
+        """Async version of `get`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.get, vector_id)
+        result = await client.retrieve(collection_name=self.collection_name, ids=[vector_id], with_payload=True)
+        return result[0] if result else None
+
+    async def alist(self, filters: dict = None, limit: int = 100) -> list:
+        """Async version of `list`."""
+        client = self._get_async_client()
+        if client is None:
+            return await asyncio.to_thread(self.list, filters, limit)
+        query_filter = self._create_filter(filters) if filters else None
+        points, _ = await client.scroll(
             collection_name=self.collection_name,
             scroll_filter=query_filter,
             limit=limit,
             with_payload=True,
             with_vectors=False,
         )
-        return result.points
+        return [points]
+
+    async def aclose(self):
+        """Close the async client of the running event loop, if it was opened."""
+        client = self._async_clients.discard() if self._async_clients is not None else None
+        if client is not None:
+            await client.close()
 
     def reset(self):
         """Reset the index by deleting and recreating it."""
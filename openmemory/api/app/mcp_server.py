@@ -23,15 +23,20 @@ import uuid
 
 from app.database import SessionLocal
 from app.models import Memory, MemoryAccessLog, MemoryState, MemoryStatusHistory
+from app.utils.access_state import (
+    access_payload,
+    accessible_memories_qdrant_filter,
+    ensure_access_indexes,
+    restore_updated_access_state,
+)
 from app.utils.db import get_user_and_app
 from app.utils.memory import get_memory_client
-from app.utils.permissions import check_memory_access_permissions
+from app.utils.permissions import accessible_memories_filter
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
 from fastapi.routing import APIRouter
 from mcp.server.fastmcp import FastMCP
 from mcp.server.sse import SseServerTransport
-from qdrant_client import models as qdrant_models
 
 # Load environment variables
 load_dotenv()
@@ -88,7 +93,9 @@ async def add_memories(text: str) -> str:
                                          metadata={
                                             "source_app": "openmemory",
                                             "mcp_client": client_name,
+                                            **access_payload(app.id),
                                         })
+            restore_updated_access_state(db, response)
 
             # Process the response and update database
             if isinstance(response, dict) and 'results' in response:
@@ -162,18 +169,12 @@ async def search_memory(query: str) -> str:
             # Get or create user and app
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
-            # Get accessible memory IDs based on ACL
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
-            
-            conditions = [qdrant_models.FieldCondition(key="user_id", match=qdrant_models.MatchValue(value=uid))]
-            
-            if accessible_memory_ids:
-                # Convert UUIDs to strings for Qdrant
-                accessible_memory_ids_str = [str(memory_id) for memory_id in accessible_memory_ids]
-                conditions.append(qdrant_models.HasIdCondition(has_id=accessible_memory_ids_str))
+            # ACL as a payload filter on the memory state mirrored into Qdrant
+            filters = accessible_memories_qdrant_filter(db, uid, app.id)
+            if filters is None:
+                return json.dumps([], indent=2)
 
-            filters = qdrant_models.Filter(must=conditions)
+            ensure_access_indexes(memory_client)
             embeddings = memory_client.embedding_model.embed(query, "search")
             
             hits = memory_client.vector_store.client.query_points(
@@ -265,8 +266,10 @@ async def list_memories() -> str:
             filtered_memories = []
 
             # Filter memories based on permissions
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memory_ids = {
+                memory_id for (memory_id,) in
+                db.query(Memory.id).filter(Memory.user_id == user.id, accessible_memories_filter(db, app.id))
+            }
             if isinstance(memories, dict) and 'results' in memories:
                 for memory_data in memories['results']:
                     if 'id' in memory_data:
@@ -287,8 +290,7 @@ async def list_memories() -> str:
             else:
                 for memory in memories:
                     memory_id = uuid.UUID(memory['id'])
-                    memory_obj = db.query(Memory).filter(Memory.id == memory_id).first()
-                    if memory_obj and check_memory_access_permissions(db, memory_obj, app.id):
+                    if memory_id in accessible_memory_ids:
                         # Create access log entry
                         access_log = MemoryAccessLog(
                             memory_id=memory_id,
@@ -329,11 +331,13 @@ async def delete_all_memories() -> str:
             # Get or create user and app
             user, app = get_user_and_app(db, user_id=uid, app_id=client_name)
 
-            user_memories = db.query(Memory).filter(Memory.user_id == user.id).all()
-            accessible_memory_ids = [memory.id for memory in user_memories if check_memory_access_permissions(db, memory, app.id)]
+            accessible_memories = db.query(Memory).filter(
+                Memory.user_id == user.id, accessible_memories_filter(db, app.id)
+            ).all()
 
             # delete the accessible memories only
-            for memory_id in accessible_memory_ids:
+            for memory in accessible_memories:
+                memory_id = memory.id
                 try:
                     memory_client.delete(memory_id)
                 except Exception as delete_error:
@@ -341,8 +345,8 @@ async def delete_all_memories() -> str:
 
             # Update each memory's state and create history entries
             now = datetime.datetime.now(datetime.UTC)
-            for memory_id in accessible_memory_ids:
-                memory = db.query(Memory).filter(Memory.id == memory_id).first()
+            for memory in accessible_memories:
+                memory_id = memory.id
                 # Update memory state
                 memory.state = MemoryState.deleted
                 memory.deleted_at = now
@@ -1,10 +1,12 @@
 import datetime
 import enum
+import logging
 import uuid
+from typing import Dict, List
 
 import sqlalchemy as sa
-from app.database import Base
-from app.utils.categorization import get_categories_for_memory
+from app.database import Base, SessionLocal
+from app.utils.categorization import CategorizationQueue
 from sqlalchemy import (
     JSON,
     UUID,
@@ -18,8 +20,9 @@ from sqlalchemy import (
     String,
     Table,
     event,
+    inspect,
 )
-from sqlalchemy.orm import Session, relationship
+from sqlalchemy.orm import Session, object_session, relationship
 
 
 def get_current_utc_time():
@@ -187,57 +190,85 @@ class MemoryAccessLog(Base):
         Index('idx_access_app_time', 'app_id', 'accessed_at'),
     )
 
-def categorize_memory(memory: Memory, db: Session) -> None:
-    """Categorize a memory using OpenAI and store the categories in the database."""
+def store_memory_categories(categories_by_memory: Dict[uuid.UUID, List[str]]) -> None:
+    """Link memories to their categories, creating missing categories, in a few bulk statements."""
+    db = SessionLocal()
     try:
-        # Get categories from OpenAI
-        categories = get_categories_for_memory(memory.content)
-
-        # Get or create categories in the database
-        for category_name in categories:
-            category = db.query(Category).filter(Category.name == category_name).first()
-            if not category:
-                category = Category(
-                    name=category_name,
-                    description=f"Automatically created category for {category_name}"
-                )
-                db.add(category)
-                db.flush()  # Flush to get the category ID
-
-            # Check if the memory-category association already exists
-            existing = db.execute(
-                memory_categories.select().where(
-                    (memory_categories.c.memory_id == memory.id) &
-                    (memory_categories.c.category_id == category.id)
-                )
-            ).first()
-
-            if not existing:
-                # Create the association
-                db.execute(
-                    memory_categories.insert().values(
-                        memory_id=memory.id,
-                        category_id=category.id
-                    )
-                )
-
+        names = {name for categories in categories_by_memory.values() for name in categories}
+        category_ids = dict(db.query(Category.name, Category.id).filter(Category.name.in_(list(names))).all())
+        new_categories = [
+            {
+                "id": uuid.uuid4(),
+                "name": name,
+                "description": f"Automatically created category for {name}",
+            }
+            for name in names - category_ids.keys()
+        ]
+        if new_categories:
+            db.execute(sa.insert(Category), new_categories)
+            category_ids.update((category["name"], category["id"]) for category in new_categories)
+
+        # Skip memories deleted from the table since they were queued
+        memory_ids = {
+            memory_id for (memory_id,) in
+            db.query(Memory.id).filter(Memory.id.in_(list(categories_by_memory))).all()
+        }
+        existing = set(
+            db.execute(
+                sa.select(memory_categories.c.memory_id, memory_categories.c.category_id)
+                .where(memory_categories.c.memory_id.in_(list(memory_ids)))
+            ).all()
+        )
+        links = {
+            (memory_id, category_ids[name])
+            for memory_id, categories in categories_by_memory.items() if memory_id in memory_ids
+            for name in categories
+        } - existing
+        if links:
+            db.execute(
+                memory_categories.insert(),
+                [{"memory_id": memory_id, "category_id": category_id} for memory_id, category_id in links]
+            )
         db.commit()
     except Exception as e:
         db.rollback()
-        print(f"Error categorizing memory: {e}")
+        logging.error(f"Error storing memory categories: {e}")
+    finally:
+        db.close()
+
+
+categorization_queue = CategorizationQueue(store_memory_categories)
+
+# Memories written in a session, categorized once the session commits
+PENDING_CATEGORIZATION = "pending_categorization"
+
+
+def _schedule_categorization(target: Memory) -> None:
+    db = object_session(target)
+    if db is not None:
+        db.info.setdefault(PENDING_CATEGORIZATION, {})[target.id] = target.content
 
 
 @event.listens_for(Memory, 'after_insert')
 def after_memory_insert(mapper, connection, target):
-    """Trigger categorization after a memory is inserted."""
-    db = Session(bind=connection)
-    categorize_memory(target, db)
-    db.close()
+    """Schedule categorization of a new memory."""
+    _schedule_categorization(target)
 
 
 @event.listens_for(Memory, 'after_update')
 def after_memory_update(mapper, connection, target):
-    """Trigger categorization after a memory is updated."""
-    db = Session(bind=connection)
-    categorize_memory(target, db)
-    db.close()
+    """Schedule categorization of a memory whose content changed."""
+    if inspect(target).attrs.content.history.has_changes():
+        _schedule_categorization(target)
+
+
+@event.listens_for(Session, 'after_commit')
+def after_session_commit(session):
+    """Hand the committed memories to the categorization worker."""
+    for memory_id, content in session.info.pop(PENDING_CATEGORIZATION, {}).items():
+        categorization_queue.enqueue(memory_id, content)
+
+
+@event.listens_for(Session, 'after_rollback')
+def after_session_rollback(session):
+    session.info.pop(PENDING_CATEGORIZATION, None)
@@ -0,0 +1,260 @@
+"""
+Access state of memories mirrored into the vector store payload.
+
+Each memory point carries the id of the app that created it and the state of the memory
+as indexed keyword fields, so that searches filter on the payload instead of sending the
+id of every accessible memory with each query.
+
+Points written before the state was mirrored get it from a one-time backfill at startup.
+Until the backfill has run, and while mirroring a change fails, searches also exclude the
+user's inaccessible memories by id.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from app.database import SessionLocal
+from app.models import Memory, MemoryState, User
+from app.utils.memory import get_memory_client
+from app.utils.permissions import get_app_access
+from qdrant_client import models as qdrant_models
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, object_session
+
+ACCESS_PAYLOAD_FIELDS = ("app_id", "state")
+# Points updated per set_payload request
+PAYLOAD_UPDATE_BATCH_SIZE = 1000
+INACCESSIBLE_STATES = [state.value for state in MemoryState if state != MemoryState.active]
+
+_indexed_collections = set()
+# Set once every memory in the database has its access state in the vector store payload
+access_state_backfilled = threading.Event()
+
+
+def access_payload(app_id: UUID, state: MemoryState = MemoryState.active) -> Dict[str, str]:
+    """Payload fields to store with a new memory, pass them in the metadata of Memory.add."""
+    return {"app_id": str(app_id), "state": state.value}
+
+
+def ensure_access_indexes(memory_client) -> None:
+    """Create the keyword indexes of the access fields, once per collection."""
+    vector_store = memory_client.vector_store
+    if vector_store.collection_name in _indexed_collections:
+        return
+    # Local Qdrant does not support payload indexes
+    if not getattr(vector_store, "is_local", False):
+        for field in ACCESS_PAYLOAD_FIELDS:
+            try:
+                vector_store.client.create_payload_index(
+                    collection_name=vector_store.collection_name,
+                    field_name=field,
+                    field_schema=qdrant_models.PayloadSchemaType.KEYWORD,
+                )
+            except Exception as e:
+                logging.debug(f"Index for {field} might already exist: {e}")
+    _indexed_collections.add(vector_store.collection_name)
+
+
+def accessible_memories_qdrant_filter(db: Session, user_id: str, app_id: UUID) -> Optional[qdrant_models.Filter]:
+    """
+    Build the Qdrant filter matching the memories of a user that an app may access.
+
+    Memory state is checked on the payload, where points without a mirrored state count as
+    active. Until the backfill has given every point its state, the inaccessible memories of
+    the user are also excluded by id. Only the explicit allow rules of the app, if any, are
+    sent as ids.
+
+    Args:
+        db: Database session
+        user_id: User ID as stored in the payload
+        app_id: ID of the app searching
+
+    Returns:
+        Optional[Filter]: The filter, or None if the app may not access any memory
+    """
+    access = get_app_access(db, app_id)
+    if access is None or not access.is_active:
+        return None
+
+    must = [qdrant_models.FieldCondition(key="user_id", match=qdrant_models.MatchValue(value=user_id))]
+    if access.memory_ids is not None:
+        if not access.memory_ids:
+            return None
+        must.append(qdrant_models.HasIdCondition(has_id=[str(memory_id) for memory_id in access.memory_ids]))
+    must_not = [qdrant_models.FieldCondition(key="state", match=qdrant_models.MatchAny(any=INACCESSIBLE_STATES))]
+    if not access_state_backfilled.is_set():
+        inaccessible_ids = db.query(Memory.id).join(User, Memory.user_id == User.id).filter(
+            User.user_id == user_id,
+            Memory.state != MemoryState.active
+        ).all()
+        if inaccessible_ids:
+            must_not.append(qdrant_models.HasIdCondition(has_id=[str(memory_id) for (memory_id,) in inaccessible_ids]))
+    return qdrant_models.Filter(must=must, must_not=must_not)
+
+
+def set_access_payloads(memory_client, payloads: Dict[UUID, Dict[str, str]]) -> None:
+    """Write access fields into the payload of points, with one request per payload and batch of points."""
+    vector_store = memory_client.vector_store
+    by_payload: Dict[Tuple[Tuple[str, str], ...], List[str]] = defaultdict(list)
+    for memory_id, payload in payloads.items():
+        by_payload[tuple(sorted(payload.items()))].append(str(memory_id))
+
+    for payload, memory_ids in by_payload.items():
+        for start in range(0, len(memory_ids), PAYLOAD_UPDATE_BATCH_SIZE):
+            vector_store.client.set_payload(
+                collection_name=vector_store.collection_name,
+                payload=dict(payload),
+                # A filter selector skips ids without a point, e.g. memories mem0 already deleted
+                points=qdrant_models.FilterSelector(
+                    filter=qdrant_models.Filter(
+                        must=[qdrant_models.HasIdCondition(has_id=memory_ids[start:start + PAYLOAD_UPDATE_BATCH_SIZE])]
+                    )
+                ),
+            )
+
+
+# Payloads that failed to reach the vector store, retried with the next sync
+_pending_payloads: Dict[UUID, Dict[str, str]] = {}
+_pending_lock = threading.Lock()
+_backfill_done = threading.Event()
+
+
+def sync_access_payloads(payloads: Dict[UUID, Dict[str, str]]) -> None:
+    """
+    Mirror access fields into the vector store of the configured memory client.
+
+    While a write fails, searches exclude inaccessible memories by id again, and the failed
+    payloads are retried with the next sync.
+    """
+    with _pending_lock:
+        merged = dict(_pending_payloads)
+        _pending_payloads.clear()
+    for memory_id, payload in payloads.items():
+        merged[memory_id] = {**merged.get(memory_id, {}), **payload}
+
+    try:
+        memory_client = get_memory_client()
+        if memory_client is None:
+            raise Exception("Memory client is not available")
+        set_access_payloads(memory_client, merged)
+    except Exception as e:
+        with _pending_lock:
+            for memory_id, payload in merged.items():
+                _pending_payloads[memory_id] = {**payload, **_pending_payloads.get(memory_id, {})}
+        access_state_backfilled.clear()
+        logging.warning(
+            f"Failed to mirror the access state of {len(merged)} memories into the vector store, "
+            f"excluding them by id until it succeeds: {e}"
+        )
+        return
+
+    with _pending_lock:
+        if _backfill_done.is_set() and not _pending_payloads:
+            access_state_backfilled.set()
+
+
+def sync_memory_states(states: Dict[UUID, MemoryState]) -> None:
+    """Mirror memory states into the vector store of the configured memory client."""
+    sync_access_payloads({memory_id: {"state": state.value} for memory_id, state in states.items()})
+
+
+def restore_updated_access_state(db: Session, response) -> None:
+    """
+    Mirror the app and state from the database into the memories that Memory.add updated.
+
+    mem0 stores the metadata of the add, with the access payload of the writing app, in the
+    points it updates. The database keeps the original app and state of those memories.
+    """
+    results = response.get("results", []) if isinstance(response, dict) else []
+    memory_ids = [UUID(result["id"]) for result in results if result.get("event") == "UPDATE"]
+    if not memory_ids:
+        return
+    rows = db.query(Memory.id, Memory.app_id, Memory.state).filter(Memory.id.in_(memory_ids)).all()
+    if rows:
+        sync_access_payloads({memory_id: access_payload(app_id, state) for memory_id, app_id, state in rows})
+
+
+def backfill_access_state(memory_client) -> None:
+    """
+    Mirror the app and state of every memory into the payload of its point.
+
+    Points that already have a state keep it, as it was mirrored on a later state change.
+    Points without a memory in the database are left as they are.
+    """
+    vector_store = memory_client.vector_store
+    missing_state = qdrant_models.IsEmptyCondition(is_empty=qdrant_models.PayloadField(key="state"))
+    unmigrated = vector_store.client.count(
+        collection_name=vector_store.collection_name,
+        count_filter=qdrant_models.Filter(must=[missing_state]),
+        exact=True,
+    ).count
+    if not unmigrated:
+        return
+
+    db = SessionLocal()
+    try:
+        by_access: Dict[Tuple[UUID, MemoryState], List[str]] = defaultdict(list)
+        for memory_id, app_id, state in db.query(Memory.id, Memory.app_id, Memory.state).yield_per(
+            PAYLOAD_UPDATE_BATCH_SIZE
+        ):
+            by_access[(app_id, state)].append(str(memory_id))
+    finally:
+        db.close()
+
+    for (app_id, state), memory_ids in by_access.items():
+        for start in range(0, len(memory_ids), PAYLOAD_UPDATE_BATCH_SIZE):
+            has_ids = qdrant_models.HasIdCondition(has_id=memory_ids[start:start + PAYLOAD_UPDATE_BATCH_SIZE])
+            vector_store.client.set_payload(
+                collection_name=vector_store.collection_name,
+                payload={"app_id": str(app_id)},
+                points=qdrant_models.FilterSelector(filter=qdrant_models.Filter(must=[has_ids])),
+            )
+            vector_store.client.set_payload(
+                collection_name=vector_store.collection_name,
+                payload={"state": state.value},
+                points=qdrant_models.FilterSelector(filter=qdrant_models.Filter(must=[has_ids, missing_state])),
+            )
+    logging.info(f"Backfilled the access state of {unmigrated} memories into the vector store")
+
+
+def run_access_state_backfill() -> None:
+    """Backfill the access state with the configured memory client, meant to run once at startup."""
+    try:
+        memory_client = get_memory_client()
+        if memory_client is None:
+            raise Exception("Memory client is not available")
+        ensure_access_indexes(memory_client)
+        backfill_access_state(memory_client)
+        _backfill_done.set()
+        with _pending_lock:
+            if not _pending_payloads:
+                access_state_backfilled.set()
+    except Exception as e:
+        logging.warning(f"Failed to backfill the access state of memories, excluding them by id: {e}")
+
+
+# States of memories changed in a session, mirrored once the session commits
+CHANGED_MEMORY_STATES = "changed_memory_states"
+
+
+@event.listens_for(Memory, 'after_update')
+def after_memory_update(mapper, connection, target):
+    if inspect(target).attrs.state.history.has_changes():
+        db = object_session(target)
+        if db is not None:
+            db.info.setdefault(CHANGED_MEMORY_STATES, {})[target.id] = target.state
+
+
+@event.listens_for(Session, 'after_commit')
+def after_session_commit(session):
+    changed = session.info.pop(CHANGED_MEMORY_STATES, {})
+    if changed:
+        sync_memory_states(changed)
+
+
+@event.listens_for(Session, 'after_rollback')
+def after_session_rollback(session):
+    session.info.pop(CHANGED_MEMORY_STATES, None)
@@ -1,7 +1,15 @@
+import hashlib
+import json
 import logging
-from typing import List
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+from uuid import UUID
 
-from app.utils.prompts import MEMORY_CATEGORIZATION_PROMPT
+from app.utils.prompts import MEMORY_BATCH_CATEGORIZATION_PROMPT, MEMORY_CATEGORIZATION_PROMPT
 from dotenv import load_dotenv
 from openai import OpenAI
 from pydantic import BaseModel
@@ -10,11 +18,25 @@ from tenacity import retry, stop_after_attempt, wait_exponential
 load_dotenv()
 openai_client = OpenAI()
 
+# Memories sent to the LLM in one call, and how long the worker waits for a batch to fill up
+CATEGORIZATION_BATCH_SIZE = int(os.getenv("CATEGORIZATION_BATCH_SIZE", "20"))
+CATEGORIZATION_BATCH_WAIT = float(os.getenv("CATEGORIZATION_BATCH_WAIT", "0.5"))
+CATEGORIZATION_CACHE_SIZE = int(os.getenv("CATEGORIZATION_CACHE_SIZE", "10000"))
+
 
 class MemoryCategories(BaseModel):
     categories: List[str]
 
 
+class IndexedMemoryCategories(BaseModel):
+    index: int
+    categories: List[str]
+
+
+class BatchMemoryCategories(BaseModel):
+    memories: List[IndexedMemoryCategories]
+
+
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
 def get_categories_for_memory(memory: str) -> List[str]:
     try:
@@ -41,3 +63,166 @@ def get_categories_for_memory(memory: str) -> List[str]:
         except Exception as debug_e:
             logging.debug(f"[DEBUG] Could not extract raw response: {debug_e}")
         raise
+
+
+@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
+def get_categories_for_memories(memories: List[str]) -> Dict[int, List[str]]:
+    """Categorize several memories in one structured output call.
+
+    Returns the categories by position of the memory in the list. Memories the model
+    skipped are missing from the result.
+    """
+    if len(memories) == 1:
+        return {0: get_categories_for_memory(memories[0])}
+
+    try:
+        messages = [
+            {"role": "system", "content": MEMORY_BATCH_CATEGORIZATION_PROMPT},
+            {"role": "user", "content": json.dumps(
+                [{"index": index, "memory": memory} for index, memory in enumerate(memories)]
+            )}
+        ]
+
+        completion = openai_client.beta.chat.completions.parse(
+            model="gpt-4o-mini",
+            messages=messages,
+            response_format=BatchMemoryCategories,
+            temperature=0
+        )
+
+        parsed: BatchMemoryCategories = completion.choices[0].message.parsed
+        return {
+            item.index: [cat.strip().lower() for cat in item.categories]
+            for item in parsed.memories
+            if 0 <= item.index < len(memories)
+        }
+
+    except Exception as e:
+        logging.error(f"[ERROR] Failed to get categories for {len(memories)} memories: {e}")
+        raise
+
+
+def content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CategorizationQueue:
+    """Categorizes memories on a background thread, off the request path.
+
+    Writers enqueue (memory id, content) pairs once their transaction has committed. The
+    worker collects them into batches, answers repeated contents from an LRU cache keyed by
+    content hash, asks the LLM for the rest in one call per batch and hands the categories
+    of the whole batch to `store`, which writes them in bulk.
+    """
+
+    def __init__(
+        self,
+        store: Callable[[Dict[UUID, List[str]]], None],
+        batch_size: int = CATEGORIZATION_BATCH_SIZE,
+        batch_wait: float = CATEGORIZATION_BATCH_WAIT,
+        cache_size: int = CATEGORIZATION_CACHE_SIZE,
+        categorize: Callable[[List[str]], Dict[int, List[str]]] = get_categories_for_memories,
+    ):
+        self.store = store
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.cache_size = cache_size
+        self.categorize = categorize
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._cache: "OrderedDict[str, List[str]]" = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def enqueue(self, memory_id: UUID, content: str) -> None:
+        """Schedule a memory for categorization. Returns immediately."""
+        if not content:
+            return
+        self.start()
+        self._queue.put((memory_id, content))
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="memory-categorization", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Categorize what is still queued, then stop the worker."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _next_batch(self) -> tuple:
+        """Block for the first item, then collect more until the batch is full or the wait is over."""
+        batch = {}
+        stopping = False
+        item = self._queue.get()
+        deadline = time.monotonic() + self.batch_wait
+        while True:
+            if item is None:
+                stopping = True
+            else:
+                # A memory updated twice before its batch runs only needs its latest content
+                batch[item[0]] = item[1]
+            remaining = deadline - time.monotonic()
+            if stopping or len(batch) >= self.batch_size:
+                break
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+        return batch, stopping
+
+    def _run(self) -> None:
+        while True:
+            batch, stopping = self._next_batch()
+            if batch:
+                try:
+                    self.process(batch)
+                except Exception as e:
+                    logging.error(f"Error categorizing {len(batch)} memories: {e}")
+            if stopping:
+                return
+
+    def process(self, batch: Dict[UUID, str]) -> None:
+        """Categorize a batch of memories and store the categories."""
+        hashes = {memory_id: content_hash(content) for memory_id, content in batch.items()}
+        found = {}
+        missing = {}
+        for memory_id, content in batch.items():
+            digest = hashes[memory_id]
+            categories = self._cache_get(digest)
+            if categories is not None:
+                found[digest] = categories
+            else:
+                missing.setdefault(digest, content)
+
+        if missing:
+            digests = list(missing)
+            for index, categories in self.categorize(list(missing.values())).items():
+                found[digests[index]] = categories
+                self._cache_put(digests[index], categories)
+
+        categories_by_memory = {}
+        for memory_id, digest in hashes.items():
+            categories = found.get(digest)
+            if categories is None:
+                logging.warning(f"No categories returned for memory {memory_id}")
+            elif categories:
+                categories_by_memory[memory_id] = categories
+        if categories_by_memory:
+            self.store(categories_by_memory)
+
+    def _cache_get(self, digest: str) -> Optional[List[str]]:
+        categories = self._cache.get(digest)
+        if categories is not None:
+            self._cache.move_to_end(digest)
+        return categories
+
+    def _cache_put(self, digest: str, categories: List[str]) -> None:
+        self._cache[digest] = categories
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
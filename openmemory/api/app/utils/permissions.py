@@ -1,8 +1,148 @@
-from typing import Optional
+import os
+import threading
+import time
+from typing import Dict, FrozenSet, NamedTuple, Optional, Set, Tuple
 from uuid import UUID
 
-from app.models import App, Memory, MemoryState
-from sqlalchemy.orm import Session
+from app.models import AccessControl, App, Memory, MemoryState
+from sqlalchemy import and_, event, false
+from sqlalchemy.orm import Session, object_session
+
+# Seconds an app's access rules are reused before they are read from the database again
+ACL_CACHE_TTL = float(os.getenv("ACL_CACHE_TTL", "5"))
+
+
+class AppAccess(NamedTuple):
+    """Access rules of an app, resolved from its App row and its AccessControl rules."""
+    is_active: bool
+    # None when the app may access every memory
+    memory_ids: Optional[FrozenSet[UUID]]
+
+
+_access_cache: Dict[UUID, Tuple[float, AppAccess]] = {}
+_access_cache_lock = threading.Lock()
+
+
+def _resolve_memory_ids(db: Session, app_id: UUID) -> Optional[Set[UUID]]:
+    # Get app-level access controls
+    app_access = db.query(AccessControl).filter(
+        AccessControl.subject_type == "app",
+        AccessControl.subject_id == app_id,
+        AccessControl.object_type == "memory"
+    ).all()
+
+    # If no app-level rules exist, return None to indicate all memories are accessible
+    if not app_access:
+        return None
+
+    # Initialize sets for allowed and denied memory IDs
+    allowed_memory_ids = set()
+    denied_memory_ids = set()
+
+    # Process app-level rules
+    for rule in app_access:
+        if rule.effect == "allow":
+            if rule.object_id:  # Specific memory access
+                allowed_memory_ids.add(rule.object_id)
+            else:  # All memories access
+                return None  # All memories allowed
+        elif rule.effect == "deny":
+            if rule.object_id:  # Specific memory denied
+                denied_memory_ids.add(rule.object_id)
+            else:  # All memories denied
+                return set()  # No memories accessible
+
+    # Remove denied memories from allowed set
+    if allowed_memory_ids:
+        allowed_memory_ids -= denied_memory_ids
+
+    return allowed_memory_ids
+
+
+def get_app_access(db: Session, app_id: UUID) -> Optional[AppAccess]:
+    """
+    Get the access rules of an app, from a short-lived per-app cache.
+
+    The cache entry of an app is dropped as soon as its App row or its access controls
+    change, the TTL only bounds how stale the rules can be after changes made outside
+    this process.
+
+    Args:
+        db: Database session
+        app_id: ID of the app
+
+    Returns:
+        Optional[AppAccess]: The access rules, or None if the app does not exist
+    """
+    now = time.monotonic()
+    with _access_cache_lock:
+        cached = _access_cache.get(app_id)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    app = db.query(App).filter(App.id == app_id).first()
+    if not app:
+        return None
+
+    memory_ids = _resolve_memory_ids(db, app_id)
+    access = AppAccess(
+        is_active=bool(app.is_active),
+        memory_ids=frozenset(memory_ids) if memory_ids is not None else None,
+    )
+    with _access_cache_lock:
+        _access_cache[app_id] = (now + ACL_CACHE_TTL, access)
+    return access
+
+
+def invalidate_app_access(app_id: Optional[UUID] = None) -> None:
+    """Drop the cached access rules of an app, or of every app when no app_id is given."""
+    with _access_cache_lock:
+        if app_id is None:
+            _access_cache.clear()
+        else:
+            _access_cache.pop(app_id, None)
+
+
+def get_accessible_memory_ids(db: Session, app_id: UUID) -> Optional[Set[UUID]]:
+    """
+    Get the set of memory IDs that the app has access to based on app-level ACL rules.
+    Returns None if no specific restrictions are found, meaning all memories are accessible.
+    """
+    access = get_app_access(db, app_id)
+    if access is None or access.memory_ids is None:
+        return None
+    return set(access.memory_ids)
+
+
+def accessible_memories_filter(db: Session, app_id: Optional[UUID] = None):
+    """
+    Build a SQL condition on Memory matching the memories the app may access, based on:
+    1. Memory state (must be active)
+    2. App state (must not be paused)
+    3. App-specific access controls
+
+    Filtering in the query resolves the access rules once per request, instead of once
+    per memory.
+
+    Args:
+        db: Database session
+        app_id: Optional app ID to check permissions for
+
+    Returns:
+        A condition to pass to Query.filter
+    """
+    conditions = [Memory.state == MemoryState.active]
+
+    # If no app_id provided, only check memory state
+    if not app_id:
+        return and_(*conditions)
+
+    access = get_app_access(db, app_id)
+    if access is None or not access.is_active:
+        return false()
+    if access.memory_ids is not None:
+        conditions.append(Memory.id.in_(access.memory_ids))
+    return and_(*conditions)
 
 
 def check_memory_access_permissions(
@@ -33,21 +173,48 @@ def check_memory_access_permissions(
         return True
 
     # Check if app exists and is active
-    app = db.query(App).filter(App.id == app_id).first()
-    if not app:
-        return False
-
-    # Check if app is paused/inactive
-    if not app.is_active:
+    access = get_app_access(db, app_id)
+    if access is None or not access.is_active:
         return False
 
-    # Check app-specific access controls
-    from app.routers.memories import get_accessible_memory_ids
-    accessible_memory_ids = get_accessible_memory_ids(db, app_id)
-
-    # If accessible_memory_ids is None, all memories are accessible
-    if accessible_memory_ids is None:
+    # If memory_ids is None, all memories are accessible
+    if access.memory_ids is None:
         return True
 
     # Check if memory is in the accessible set
-    return memory.id in accessible_memory_ids
+    return memory.id in access.memory_ids
+
+
+# Apps whose access rules changed in a session, invalidated once the session commits
+CHANGED_APP_ACCESS = "changed_app_access"
+
+
+def _record_app_change(app_id: Optional[UUID], target) -> None:
+    db = object_session(target)
+    if db is not None and app_id is not None:
+        db.info.setdefault(CHANGED_APP_ACCESS, set()).add(app_id)
+
+
+@event.listens_for(App, 'after_update')
+@event.listens_for(App, 'after_delete')
+def after_app_change(mapper, connection, target):
+    _record_app_change(target.id, target)
+
+
+@event.listens_for(AccessControl, 'after_insert')
+@event.listens_for(AccessControl, 'after_update')
+@event.listens_for(AccessControl, 'after_delete')
+def after_access_control_change(mapper, connection, target):
+    if target.subject_type == "app":
+        _record_app_change(target.subject_id, target)
+
+
+@event.listens_for(Session, 'after_commit')
+def after_session_commit(session):
+    for app_id in session.info.pop(CHANGED_APP_ACCESS, set()):
+        invalidate_app_access(app_id)
+
+
+@event.listens_for(Session, 'after_rollback')
+def after_session_rollback(session):
+    session.info.pop(CHANGED_APP_ACCESS, None)
@@ -26,3 +26,8 @@ Guidelines:
 - If you cannot categorize the memory, return an empty list with key 'categories'.
 - Don't limit yourself to the categories listed above only. Feel free to create new categories based on the memory. Make sure that it is a single phrase.
 """
+
+MEMORY_BATCH_CATEGORIZATION_PROMPT = MEMORY_CATEGORIZATION_PROMPT + """
+You will receive several memories at once, as a JSON list of objects with an 'index' and a 'memory'.
+Categorize each memory on its own and return one entry per memory under the 'memories' key, with the 'index' of the memory and its 'categories'.
+"""
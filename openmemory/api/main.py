@@ -1,11 +1,13 @@
 import datetime
+import threading
 from uuid import uuid4
 
 from app.config import DEFAULT_APP_ID, USER_ID
 from app.database import Base, SessionLocal, engine
 from app.mcp_server import setup_mcp_server
-from app.models import App, User
+from app.models import App, User, categorization_queue
 from app.routers import apps_router, config_router, memories_router, stats_router
+from app.utils.access_state import run_access_state_backfill
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi_pagination import add_pagination
@@ -86,3 +88,15 @@ app.include_router(config_router)
 
 # Add pagination support
 add_pagination(app)
+
+
+@app.on_event("startup")
+def start_access_state_backfill():
+    # Mirror the state of memories written by earlier versions without delaying startup
+    threading.Thread(target=run_access_state_backfill, name="access-state-backfill", daemon=True).start()
+
+
+@app.on_event("shutdown")
+def stop_categorization_queue():
+    # Categorize the memories still queued before the process exits
+    categorization_queue.stop(timeout=30)
@@ -0,0 +1,6 @@
+import os
+import tempfile
+
+# The app modules create their engine at import, point it to a throwaway database
+os.environ["DATABASE_URL"] = f"sqlite:///{tempfile.mkdtemp()}/openmemory_test.db"
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
@@ -0,0 +1,124 @@
+import uuid
+from types import SimpleNamespace
+
+import pytest
+import sqlalchemy as sa
+from app.database import Base, SessionLocal, engine
+from app.models import App, Memory, MemoryState, User
+from app.utils import access_state
+from app.utils.access_state import (
+    accessible_memories_qdrant_filter,
+    restore_updated_access_state,
+    sync_memory_states,
+)
+from qdrant_client import QdrantClient
+from qdrant_client import models as qdrant_models
+
+COLLECTION = "openmemory"
+
+
+@pytest.fixture
+def db():
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def memory_client(monkeypatch):
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        COLLECTION, vectors_config=qdrant_models.VectorParams(size=2, distance=qdrant_models.Distance.COSINE)
+    )
+    memory_client = SimpleNamespace(vector_store=SimpleNamespace(client=client, collection_name=COLLECTION))
+    monkeypatch.setattr(access_state, "get_memory_client", lambda: memory_client)
+    access_state._backfill_done.set()
+    access_state.access_state_backfilled.set()
+    yield memory_client
+    access_state._backfill_done.clear()
+    access_state.access_state_backfilled.clear()
+    access_state._pending_payloads.clear()
+
+
+def _add_memory(db, memory_client, user_id, app_id, state):
+    memory_id = uuid.uuid4()
+    # Core inserts skip the categorization of new memories
+    db.execute(
+        sa.insert(Memory),
+        [{"id": memory_id, "user_id": user_id, "app_id": app_id, "content": "likes tea", "state": state}],
+    )
+    db.commit()
+    memory_client.vector_store.client.upsert(
+        COLLECTION,
+        points=[
+            qdrant_models.PointStruct(
+                id=str(memory_id),
+                vector=[1.0, 0.0],
+                payload={"user_id": "alice", **access_state.access_payload(app_id, state)},
+            )
+        ],
+    )
+    return memory_id
+
+
+def _create_user_and_apps(db):
+    user = User(id=uuid.uuid4(), user_id="alice")
+    writer = App(id=uuid.uuid4(), owner_id=user.id, name="writer")
+    reader = App(id=uuid.uuid4(), owner_id=user.id, name="reader")
+    db.add_all([user, writer, reader])
+    db.commit()
+    return user, writer, reader
+
+
+def _search(db, memory_client, app_id):
+    query_filter = accessible_memories_qdrant_filter(db, "alice", app_id)
+    points = memory_client.vector_store.client.query_points(
+        COLLECTION, query=[1.0, 0.0], query_filter=query_filter, limit=10
+    ).points
+    return {uuid.UUID(point.id) for point in points}
+
+
+def test_archived_memory_updated_through_add_stays_hidden(db, memory_client):
+    user, writer, reader = _create_user_and_apps(db)
+    archived_id = _add_memory(db, memory_client, user.id, writer.id, MemoryState.archived)
+    active_id = _add_memory(db, memory_client, user.id, writer.id, MemoryState.active)
+
+    # Memory.add turns the new fact into an UPDATE, storing the metadata of the add in the point
+    memory_client.vector_store.client.set_payload(
+        COLLECTION, payload=access_state.access_payload(reader.id), points=[str(archived_id)]
+    )
+    response = {"results": [{"id": str(archived_id), "memory": "likes green tea", "event": "UPDATE"}]}
+    restore_updated_access_state(db, response)
+
+    assert _search(db, memory_client, reader.id) == {active_id}
+    payload = memory_client.vector_store.client.retrieve(COLLECTION, ids=[str(archived_id)])[0].payload
+    assert payload["state"] == MemoryState.archived.value
+    assert payload["app_id"] == str(writer.id)
+
+
+def test_failed_state_sync_excludes_memories_by_id_until_retried(db, memory_client, monkeypatch):
+    user, writer, _ = _create_user_and_apps(db)
+    memory_id = _add_memory(db, memory_client, user.id, writer.id, MemoryState.active)
+    db.execute(sa.update(Memory).where(Memory.id == memory_id).values(state=MemoryState.archived))
+    db.commit()
+
+    def unavailable(**kwargs):
+        raise RuntimeError("Qdrant is unavailable")
+
+    set_payload = memory_client.vector_store.client.set_payload
+    monkeypatch.setattr(memory_client.vector_store.client, "set_payload", unavailable)
+    sync_memory_states({memory_id: MemoryState.archived})
+
+    assert not access_state.access_state_backfilled.is_set()
+    assert _search(db, memory_client, writer.id) == set()
+
+    # The next sync retries the failed state and trusts the payload again
+    monkeypatch.setattr(memory_client.vector_store.client, "set_payload", set_payload)
+    sync_memory_states({})
+
+    assert access_state.access_state_backfilled.is_set()
+    payload = memory_client.vector_store.client.retrieve(COLLECTION, ids=[str(memory_id)])[0].payload
+    assert payload["state"] == MemoryState.archived.value
+    assert _search(db, memory_client, writer.id) == set()
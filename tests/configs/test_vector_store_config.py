@@ -0,0 +1,21 @@
+import pytest
+
+from mem0.vector_stores.configs import QuantizationConfig, VectorStoreConfig
+
+
+def test_quantization_is_passed_to_provider_config():
+    config = VectorStoreConfig(
+        provider="faiss", config={"embedding_model_dims": 4}, quantization={"type": "int8", "oversampling": 2}
+    )
+
+    assert config.config.quantization == QuantizationConfig(type="int8", rescore=True, oversampling=2.0)
+
+
+def test_quantization_rejected_for_unsupported_provider():
+    with pytest.raises(ValueError, match="Quantization is not supported for provider chroma"):
+        VectorStoreConfig(provider="chroma", quantization={"type": "binary"})
+
+
+def test_quantization_oversampling_below_one_rejected():
+    with pytest.raises(ValueError):
+        QuantizationConfig(type="int8", oversampling=0.5)
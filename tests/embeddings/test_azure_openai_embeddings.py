@@ -50,3 +50,19 @@ def test_embed_text_with_default_headers(default_headers, expected_header):
     assert embedder.client.api_key == "test"
     assert embedder.client._api_version == "test_version"
     assert embedder.client.default_headers.get("Test") == expected_header
+
+
+def test_embed_batch(mock_openai_client):
+    config = BaseEmbedderConfig(model="text-embedding-ada-002")
+    embedder = AzureOpenAIEmbedding(config)
+
+    mock_embedding_response = Mock()
+    mock_embedding_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+    mock_openai_client.embeddings.create.return_value = mock_embedding_response
+
+    embeddings = embedder.embed_batch(["first\ntext", "second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["first text", "second text"], model="text-embedding-ada-002"
+    )
+    assert embeddings == [[0.1, 0.2], [0.3, 0.4]]
@@ -0,0 +1,113 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from mem0.configs.embeddings.base import BaseEmbedderConfig
+from mem0.embeddings.cached import CachedEmbedder
+from mem0.utils.factory import EmbedderFactory
+
+
+@pytest.fixture
+def mock_embedder():
+    embedder = Mock()
+    embedder.config = BaseEmbedderConfig(model="test-model", embedding_dims=3)
+    embedder.embed.side_effect = lambda text, memory_action=None: [float(len(text)), 0.5, 0.25]
+    embedder.embed_batch.side_effect = lambda texts, memory_action=None: [[float(len(t)), 0.5, 0.25] for t in texts]
+    return embedder
+
+
+def test_embed_uses_cache(mock_embedder):
+    cached = CachedEmbedder(mock_embedder, provider="openai")
+
+    assert cached.embed("hello", "search") == [5.0, 0.5, 0.25]
+    assert cached.embed("hello", "search") == [5.0, 0.5, 0.25]
+
+    mock_embedder.embed.assert_called_once_with("hello", "search")
+    assert cached.stats == {"hits": 1, "disk_hits": 0, "misses": 1, "size": 1}
+
+
+def test_memory_action_is_part_of_key(mock_embedder):
+    cached = CachedEmbedder(mock_embedder)
+
+    cached.embed("hello", "add")
+    cached.embed("hello", "search")
+
+    assert mock_embedder.embed.call_count == 2
+
+
+def test_embed_batch_only_embeds_misses(mock_embedder):
+    cached = CachedEmbedder(mock_embedder)
+    cached.embed("cat", "add")
+
+    result = cached.embed_batch(["cat", "horse", "horse", "dog"], "add")
+
+    assert result == [[3.0, 0.5, 0.25], [5.0, 0.5, 0.25], [5.0, 0.5, 0.25], [3.0, 0.5, 0.25]]
+    mock_embedder.embed_batch.assert_called_once_with(["horse", "dog"], "add")
+    assert cached.stats["misses"] == 3
+
+
+def test_lru_eviction(mock_embedder):
+    cached = CachedEmbedder(mock_embedder, max_size=2)
+    cached.embed("a")
+    cached.embed("b")
+    cached.embed("a")  # "b" is now least recently used
+    cached.embed("c")
+
+    cached.embed("a")
+    assert mock_embedder.embed.call_count == 3
+    cached.embed("b")
+    assert mock_embedder.embed.call_count == 4
+
+
+def test_persistent_tier(mock_embedder, tmp_path):
+    path = str(tmp_path / "embeddings.db")
+    cached = CachedEmbedder(mock_embedder, path=path)
+    cached.embed_batch(["hello", "world!"], "add")
+    cached.close()
+
+    restarted = CachedEmbedder(mock_embedder, path=path)
+    assert restarted.embed_batch(["hello", "world!"], "add") == [[5.0, 0.5, 0.25], [6.0, 0.5, 0.25]]
+    mock_embedder.embed_batch.assert_called_once()
+    assert restarted.stats == {"hits": 0, "disk_hits": 2, "misses": 0, "size": 2}
+
+    restarted.clear()
+    restarted.embed("hello", "add")
+    assert restarted.stats["misses"] == 1
+    restarted.close()
+
+
+def test_attributes_delegate_to_embedder(mock_embedder):
+    mock_embedder.client = "client"
+    cached = CachedEmbedder(mock_embedder)
+
+    assert cached.client == "client"
+    assert cached.config.model == "test-model"
+
+
+def test_factory_applies_cache_from_config():
+    with patch("mem0.embeddings.openai.OpenAI"):
+        embedder = EmbedderFactory.create("openai", {"api_key": "key", "cache": {"max_size": 5}}, None)
+        assert isinstance(embedder, CachedEmbedder)
+        assert embedder.max_size == 5
+        assert embedder.provider == "openai"
+
+        assert not isinstance(EmbedderFactory.create("openai", {"api_key": "key"}, None), CachedEmbedder)
+
+
+@pytest.mark.asyncio
+async def test_async_embed_batch_awaits_wrapped_embedder_for_misses(mock_embedder):
+    mock_embedder.aembed = AsyncMock(side_effect=lambda text, memory_action=None: [float(len(text)), 0.5, 0.25])
+    mock_embedder.aembed_batch = AsyncMock(
+        side_effect=lambda texts, memory_action=None: [[float(len(t)), 0.5, 0.25] for t in texts]
+    )
+    cached = CachedEmbedder(mock_embedder)
+
+    assert await cached.aembed("cat", "add") == [3.0, 0.5, 0.25]
+    vectors = await cached.aembed_batch(["cat", "horse", "horse"], "add")
+
+    assert vectors == [[3.0, 0.5, 0.25], [5.0, 0.5, 0.25], [5.0, 0.5, 0.25]]
+    mock_embedder.aembed.assert_awaited_once_with("cat", "add")
+    mock_embedder.aembed_batch.assert_awaited_once_with(["horse"], "add")
+    mock_embedder.embed.assert_not_called()
+    mock_embedder.embed_batch.assert_not_called()
+    assert cached.stats == {"hits": 1, "disk_hits": 0, "misses": 2, "size": 2}
@@ -58,3 +58,23 @@ def test_config_initialization(config):
     assert embedder.config.api_key == "dummy_api_key"
     assert embedder.config.model == "test_model"
     assert embedder.config.embedding_dims == 786
+
+
+def test_embed_batch(mock_genai, config):
+    mock_genai.return_value = type(
+        "Response",
+        (),
+        {
+            "embeddings": [
+                type("Embedding", (), {"values": [0.1, 0.2]}),
+                type("Embedding", (), {"values": [0.3, 0.4]}),
+            ]
+        },
+    )()
+
+    embedder = GoogleGenAIEmbedding(config)
+
+    result = embedder.embed_batch(["Hello,\nworld!", "Second"])
+
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+    mock_genai.assert_called_once_with(model="test_model", contents=["Hello, world!", "Second"], config=ANY)
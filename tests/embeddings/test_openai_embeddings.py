@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -88,3 +89,60 @@ def test_embed_uses_environment_api_key(mock_openai_client, monkeypatch):
         input=["Environment key test"], model="text-embedding-3-small", dimensions=1536
     )
     assert result == [1.3, 1.4, 1.5]
+
+
+def test_embed_batch_single_request(mock_openai_client):
+    config = BaseEmbedderConfig()
+    embedder = OpenAIEmbedding(config)
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+    mock_openai_client.embeddings.create.return_value = mock_response
+
+    result = embedder.embed_batch(["Hello\nworld", "Second text"])
+
+    mock_openai_client.embeddings.create.assert_called_once_with(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+
+
+def test_embed_batch_empty_input(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig())
+
+    assert embedder.embed_batch([]) == []
+    mock_openai_client.embeddings.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_aembed_uses_async_client(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="key"))
+    mock_response = Mock()
+    mock_response.data = [Mock(embedding=[0.1, 0.2]), Mock(embedding=[0.3, 0.4])]
+
+    with patch("mem0.embeddings.openai.AsyncOpenAI") as mock_async_openai:
+        mock_async_openai.return_value.embeddings.create = AsyncMock(return_value=mock_response)
+
+        result = await embedder.aembed_batch(["Hello\nworld", "Second text"])
+        await embedder.aembed("Hello")
+
+    mock_async_openai.assert_called_once_with(api_key="key", base_url="https://api.openai.com/v1")
+    mock_async_openai.return_value.embeddings.create.assert_any_await(
+        input=["Hello world", "Second text"], model="text-embedding-3-small", dimensions=1536
+    )
+    assert result == [[0.1, 0.2], [0.3, 0.4]]
+    mock_openai_client.embeddings.create.assert_not_called()
+
+
+def test_async_client_per_event_loop(mock_openai_client):
+    embedder = OpenAIEmbedding(BaseEmbedderConfig(api_key="key"))
+
+    async def get_client():
+        return embedder.async_client, embedder.async_client
+
+    with patch("mem0.embeddings.openai.AsyncOpenAI", side_effect=lambda **kwargs: Mock()) as mock_async_openai:
+        first, same = asyncio.run(get_client())
+        second, _ = asyncio.run(get_client())
+
+    assert first is same
+    assert first is not second
+    assert mock_async_openai.call_count == 2
@@ -0,0 +1,111 @@
+import pytest
+from rank_bm25 import BM25Okapi
+
+from mem0.graphs.bm25 import BM25Reranker, tokenize
+
+CORPUS = [
+    ("alice", "works_at", "acme"),
+    ("alice", "lives_in", "paris"),
+    ("bob", "works_at", "globex"),
+    ("alice", "likes", "hiking"),
+    ("carol", "lives_in", "berlin"),
+]
+
+
+def test_tokenize_lowercases_and_splits_underscores():
+    assert tokenize("Where does Alice_Smith work_at?") == ["where", "does", "alice", "smith", "work", "at"]
+
+
+def test_rerank_matches_rank_bm25_scores():
+    reranker = BM25Reranker(top_n=3)
+    query = "what does alice work at"
+
+    reranked = reranker.rerank(query, CORPUS, {"user_id": "user1"}, load_corpus=lambda: CORPUS)
+
+    bm25 = BM25Okapi([tokenize(" ".join(triple)) for triple in CORPUS])
+    scores = bm25.get_scores(tokenize(query))
+    expected = [CORPUS[index] for index in sorted(range(len(CORPUS)), key=lambda index: -scores[index])[:3]]
+    assert reranked == expected
+    assert reranked[0] == ("alice", "works_at", "acme")
+
+
+def test_corpus_is_loaded_once_and_updated_incrementally():
+    reranker = BM25Reranker()
+    loads = []
+
+    def load_corpus():
+        loads.append(1)
+        return CORPUS[:2]
+
+    filters = {"user_id": "user1"}
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    assert len(loads) == 1
+
+    reranker.add({"user_id": "user1", "agent_id": "agent1"}, [CORPUS[3]])
+    reranker.add({"user_id": "user2"}, [CORPUS[4]])
+    stats = reranker._scopes[("user1", None, None)]
+    assert set(stats.documents) == {CORPUS[0], CORPUS[1], CORPUS[3]}
+    assert stats.document_frequency["alice"] == 3
+
+    reranker.remove(filters, [CORPUS[0]])
+    assert stats.document_frequency["alice"] == 2
+    assert "acme" not in stats.document_frequency
+    assert stats.total_length == sum(len(tokenize(" ".join(triple))) for triple in (CORPUS[1], CORPUS[3]))
+
+    reranker.invalidate(filters)
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    assert len(loads) == 2
+
+
+def test_rerank_uses_candidates_without_corpus():
+    reranker = BM25Reranker(top_n=1)
+    assert reranker.rerank("bob", CORPUS, {"user_id": "user1"}) == [("bob", "works_at", "globex")]
+    assert reranker.rerank("bob", [], {"user_id": "user1"}) == []
+    assert reranker.rerank("bob", CORPUS, {"user_id": "user1"}, top_n=2)[0] == ("bob", "works_at", "globex")
+
+
+def test_top_n_must_be_positive():
+    with pytest.raises(ValueError):
+        BM25Reranker(top_n=0)
+
+
+def test_least_recently_searched_scope_is_evicted():
+    reranker = BM25Reranker(max_scopes=2)
+    for user_id in ("user1", "user2"):
+        reranker.rerank("alice", CORPUS, {"user_id": user_id}, load_corpus=lambda: CORPUS)
+    # user1 is searched again, so user2 is the least recently used when user3 arrives
+    reranker.rerank("alice", CORPUS, {"user_id": "user1"}, load_corpus=lambda: CORPUS)
+    reranker.rerank("alice", CORPUS, {"user_id": "user3"}, load_corpus=lambda: CORPUS)
+
+    assert list(reranker._scopes) == [("user1", None, None), ("user3", None, None)]
+
+
+def test_expired_scope_is_reloaded(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("mem0.graphs.bm25.time.monotonic", lambda: now[0])
+    reranker = BM25Reranker(cache_ttl=60)
+    corpus = [CORPUS[:2]]
+    loads = []
+
+    def load_corpus():
+        loads.append(1)
+        return corpus[0]
+
+    filters = {"user_id": "user1"}
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    now[0] += 30
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    assert len(loads) == 1
+
+    # Another process wrote a relation, it is counted once the statistics expire
+    corpus[0] = CORPUS[:3]
+    now[0] += 31
+    reranker.rerank("alice", CORPUS[:2], filters, load_corpus=load_corpus)
+    assert len(loads) == 2
+    assert set(reranker._scopes[("user1", None, None)].documents) == set(CORPUS[:3])
+
+
+def test_max_scopes_must_be_positive():
+    with pytest.raises(ValueError):
+        BM25Reranker(max_scopes=0)
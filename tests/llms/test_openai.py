@@ -1,5 +1,5 @@
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -104,3 +104,28 @@ def test_generate_response_with_tools(mock_openai_client):
     assert len(response["tool_calls"]) == 1
     assert response["tool_calls"][0]["name"] == "add_memory"
     assert response["tool_calls"][0]["arguments"] == {"data": "Today is a sunny day."}
+
+
+@pytest.mark.asyncio
+async def test_agenerate_response_uses_async_client(mock_openai_client):
+    config = OpenAIConfig(model="gpt-4o", temperature=0.7, max_tokens=100, top_p=1.0, api_key="api_key")
+    llm = OpenAILLM(config)
+    messages = [{"role": "user", "content": "Hello"}]
+    mock_response = Mock()
+    mock_response.choices = [Mock(message=Mock(content="Hi"))]
+
+    with patch("mem0.llms.openai.AsyncOpenAI") as mock_async_openai:
+        mock_async_openai.return_value.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        response = await llm.agenerate_response(messages, response_format={"type": "json_object"})
+
+    mock_async_openai.return_value.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4o",
+        messages=messages,
+        temperature=0.7,
+        max_tokens=100,
+        top_p=1.0,
+        response_format={"type": "json_object"},
+    )
+    assert response == "Hi"
+    mock_openai_client.chat.completions.create.assert_not_called()
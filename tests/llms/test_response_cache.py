@@ -0,0 +1,173 @@
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mem0.configs.llms.base import BaseLlmConfig
+from mem0.llms.base import LLMBase
+from mem0.llms.cache import InMemoryResponseCache, SQLiteResponseCache, create_response_cache, make_cache_key
+from mem0.utils.factory import LlmFactory
+
+
+class FakeLLM(LLMBase):
+    def __init__(self, config=None):
+        super().__init__(config or BaseLlmConfig(model="fake-model"))
+        self.calls = Mock(side_effect=lambda messages, **kwargs: f"response {len(messages)}")
+
+    def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs):
+        return self.calls(messages, response_format=response_format, tools=tools, **kwargs)
+
+
+MESSAGES = [{"role": "system", "content": "Extract facts"}, {"role": "user", "content": "I like tea"}]
+
+
+def test_no_cache_by_default():
+    llm = FakeLLM()
+
+    llm.generate_response(MESSAGES)
+    llm.generate_response(MESSAGES)
+
+    assert llm.calls.call_count == 2
+
+
+def test_identical_requests_are_served_from_cache():
+    llm = FakeLLM()
+    llm.response_cache = InMemoryResponseCache()
+
+    assert llm.generate_response(MESSAGES, response_format={"type": "json_object"}) == "response 2"
+    assert llm.generate_response(MESSAGES, response_format={"type": "json_object"}) == "response 2"
+    assert llm.calls.call_count == 1
+
+    # Any part of the key changing is a miss
+    llm.generate_response(MESSAGES)
+    llm.generate_response(MESSAGES + [{"role": "user", "content": "and coffee"}])
+    llm.config.temperature = 0.7
+    llm.generate_response(MESSAGES)
+    assert llm.calls.call_count == 4
+    assert llm.response_cache.stats == {"hits": 1, "misses": 4, "evictions": 0, "expirations": 0}
+
+
+def test_subclass_delegating_to_parent_is_cached_once():
+    class WrappingLLM(FakeLLM):
+        def generate_response(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs):
+            return super().generate_response(messages, response_format=response_format) + "!"
+
+    llm = WrappingLLM()
+    llm.response_cache = InMemoryResponseCache()
+
+    assert llm.generate_response(MESSAGES) == "response 2!"
+    assert llm.generate_response(MESSAGES) == "response 2!"
+    assert llm.response_cache.stats["misses"] == 1
+    assert llm.response_cache.stats["hits"] == 1
+
+
+
+@pytest.mark.asyncio
+async def test_async_requests_share_the_cache():
+    class AsyncFakeLLM(FakeLLM):
+        async def agenerate_response(self, messages, response_format=None, tools=None, tool_choice="auto", **kwargs):
+            return self.calls(messages, response_format=response_format, tools=tools, **kwargs)
+
+    llm = AsyncFakeLLM()
+    llm.response_cache = InMemoryResponseCache()
+
+    assert await llm.agenerate_response(MESSAGES) == "response 2"
+    assert await llm.agenerate_response(MESSAGES) == "response 2"
+    assert llm.generate_response(MESSAGES) == "response 2"
+    assert llm.calls.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_default_async_response_runs_sync_provider():
+    llm = FakeLLM()
+    llm.response_cache = InMemoryResponseCache()
+
+    assert await llm.agenerate_response(MESSAGES, response_format={"type": "json_object"}) == "response 2"
+    assert llm.generate_response(MESSAGES, response_format={"type": "json_object"}) == "response 2"
+    assert llm.calls.call_count == 1
+
+def test_key_includes_tools():
+    base = make_cache_key("m", MESSAGES, None, 0.1)
+    assert base == make_cache_key("m", list(MESSAGES), None, 0.1)
+    assert base != make_cache_key("m", MESSAGES, None, 0.1, tools=[{"name": "add_memory"}])
+    assert base != make_cache_key("other", MESSAGES, None, 0.1)
+
+
+def test_in_memory_eviction_and_ttl():
+    cache = InMemoryResponseCache(max_size=2, ttl=60)
+    cache.set("a", "A")
+    cache.set("b", "B")
+    cache.get("a")
+    cache.set("c", "C")
+
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "A")
+
+    with patch("mem0.llms.cache.time.time", return_value=10**12):
+        assert cache.get("a") == (False, None)
+    assert cache.stats["evictions"] == 1
+    assert cache.stats["expirations"] == 1
+
+
+def test_sqlite_cache_persists(tmp_path):
+    path = str(tmp_path / "llm.db")
+    cache = SQLiteResponseCache(path, max_size=2)
+    cache.set("a", {"content": None, "tool_calls": [{"name": "noop", "arguments": {}}]})
+    cache.set("b", "B")
+    cache.close()
+
+    reopened = SQLiteResponseCache(path, max_size=2)
+    assert reopened.get("a") == (True, {"content": None, "tool_calls": [{"name": "noop", "arguments": {}}]})
+
+    reopened.set("c", "C")
+    assert reopened.get("a") == (False, None)
+    assert reopened.stats["evictions"] == 1
+
+    reopened.ttl = 60
+    with patch("mem0.llms.cache.time.time", return_value=10**12):
+        assert reopened.get("c") == (False, None)
+    assert reopened.stats["expirations"] == 1
+    reopened.close()
+
+
+def test_sqlite_cache_counts_rows_without_scanning_on_write(tmp_path):
+    cache = SQLiteResponseCache(str(tmp_path / "llm.db"), max_size=3)
+    statements = []
+    cache._connection.set_trace_callback(statements.append)
+
+    for key in ["a", "b", "a", "c", "d"]:
+        cache.set(key, key.upper())
+
+    assert not [statement for statement in statements if "COUNT(*)" in statement]
+    # Replacing "a" does not grow the cache, so only the oldest entry is evicted once "d" arrives
+    assert cache.stats["evictions"] == 1
+    assert [cache.get(key)[0] for key in ["a", "b", "c", "d"]] == [True, False, True, True]
+
+    cache.clear()
+    for key in ["e", "f", "g"]:
+        cache.set(key, key.upper())
+    assert cache.stats["evictions"] == 1
+    cache.close()
+
+
+def test_create_response_cache(tmp_path):
+    assert create_response_cache(None) is None
+    assert isinstance(create_response_cache(True), InMemoryResponseCache)
+    sqlite_cache = create_response_cache({"backend": "sqlite", "path": str(tmp_path / "llm.db"), "ttl": 5})
+    assert isinstance(sqlite_cache, SQLiteResponseCache)
+    assert sqlite_cache.ttl == 5
+    sqlite_cache.close()
+
+    with pytest.raises(ValueError, match="requires a 'path'"):
+        create_response_cache({"backend": "sqlite"})
+    with pytest.raises(ValueError, match="Unsupported LLM response cache backend"):
+        create_response_cache({"backend": "redis"})
+
+
+def test_factory_applies_response_cache():
+    config = {"api_key": "key", "response_cache": {"max_size": 10}}
+    with patch("mem0.llms.openai.OpenAI"):
+        llm = LlmFactory.create("openai", config)
+
+    assert isinstance(llm.response_cache, InMemoryResponseCache)
+    assert llm.response_cache.max_size == 10
+    assert "response_cache" in config
@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+import pytest
+
+from mem0.configs.base import ConcurrencyConfig, RateLimitConfig
+from mem0.memory import concurrency
+from mem0.memory.concurrency import CallLimiter, TokenBucket, create_call_limiters, get_rate_limiter
+
+
+@pytest.fixture(autouse=True)
+def clear_rate_limiters():
+    concurrency._rate_limiters.clear()
+    yield
+    concurrency._rate_limiters.clear()
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_burst_then_spaces_calls():
+    bucket = TokenBucket(rate=20, capacity=2)
+    started = time.monotonic()
+    for _ in range(4):
+        await bucket.acquire()
+    # Two calls use the burst, the next two wait 1/20s each
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_call_limiter_bounds_in_flight_calls_and_reports_queue_depth():
+    limiter = CallLimiter(max_concurrent=2)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        peak = max(peak, limiter.stats["in_flight"])
+        await asyncio.sleep(0.01)
+        return "ok"
+
+    results = await asyncio.gather(*(limiter.run(call) for _ in range(6)))
+
+    assert results == ["ok"] * 6
+    assert peak == 2
+    stats = limiter.stats
+    assert stats["calls"] == 6
+    assert stats["max_waiting"] == 4
+    assert stats["waiting"] == 0
+    assert stats["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_call_limiter_releases_slot_when_call_fails():
+    limiter = CallLimiter(max_concurrent=1)
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        await limiter.run(fail)
+    assert await asyncio.wait_for(limiter.run(lambda: asyncio.sleep(0, "ok")), timeout=1) == "ok"
+    assert limiter.stats["in_flight"] == 0
+
+
+def test_call_limiter_works_across_event_loops():
+    limiter = CallLimiter(max_concurrent=1)
+    for _ in range(2):
+        assert asyncio.run(limiter.run(lambda: asyncio.sleep(0, "ok"))) == "ok"
+
+
+def test_rate_limiters_are_shared_by_provider():
+    config = ConcurrencyConfig(
+        max_embedding_calls=4, rate_limits={"openai": RateLimitConfig(requests_per_second=10, burst=5)}
+    )
+    first = create_call_limiters(config, {"embedder": "openai", "llm": "openai", "vector_store": "qdrant"})
+    second = create_call_limiters(config, {"embedder": "openai", "llm": "openai", "vector_store": "qdrant"})
+
+    assert first["embedder"].rate_limiter is first["llm"].rate_limiter is second["embedder"].rate_limiter
+    assert first["embedder"].max_concurrent == 4
+    assert first["llm"].max_concurrent is None
+    assert first["vector_store"].rate_limiter is None
+    assert first["embedder"] is not second["embedder"]
+
+
+def test_instances_with_different_limits_keep_their_own(caplog):
+    fast = ConcurrencyConfig(rate_limits={"openai": RateLimitConfig(requests_per_second=50, burst=100)})
+    slow = ConcurrencyConfig(rate_limits={"openai": RateLimitConfig(requests_per_second=5)})
+    providers = {"embedder": "openai", "llm": "openai", "vector_store": "qdrant"}
+
+    first = create_call_limiters(fast, providers)
+    second = create_call_limiters(slow, providers)
+
+    # Creating the second instance leaves the limits of the first one as configured
+    assert (first["llm"].rate_limiter.rate, first["llm"].rate_limiter.capacity) == (50, 100)
+    assert (second["llm"].rate_limiter.rate, second["llm"].rate_limiter.capacity) == (5, 5)
+    assert create_call_limiters(fast, providers)["llm"].rate_limiter is first["llm"].rate_limiter
+    assert "Rate limits of openai differ" in caplog.text
+
+
+def test_get_rate_limiter_normalizes_default_burst():
+    assert get_rate_limiter("openai", 10) is get_rate_limiter("openai", 10, 10)
@@ -0,0 +1,324 @@
+import math
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.memory import graph_memory
+from mem0.memory.graph_memory import VECTOR_INDEX_NAME, MemoryGraph
+
+
+def _make_graph(base_label=True, embedding_dims=4):
+    config = MagicMock()
+    config.graph_store.config.base_label = base_label
+    config.graph_store.llm = None
+    config.graph_store.rerank_top_n = 5
+    config.graph_store.rerank_cache_max_scopes = 1000
+    config.graph_store.rerank_cache_ttl = None
+    config.llm.provider = "openai_structured"
+
+    embedding_model = MagicMock()
+    embedding_model.config.embedding_dims = embedding_dims
+    embedding_model.embed_batch.side_effect = lambda texts, memory_action=None: [
+        [float(len(text)), 0.0, 0.0, 1.0] for text in texts
+    ]
+
+    with (
+        patch("mem0.memory.graph_memory.Neo4jGraph") as mock_neo4j,
+        patch("mem0.memory.graph_memory.EmbedderFactory.create", return_value=embedding_model),
+        patch("mem0.memory.graph_memory.LlmFactory.create", return_value=MagicMock()),
+    ):
+        memory_graph = MemoryGraph(config)
+    mock_neo4j.return_value.query.reset_mock()
+    return memory_graph
+
+
+@pytest.fixture
+def memory_graph():
+    return _make_graph()
+
+
+def test_vector_index_created_with_base_label(memory_graph):
+    assert memory_graph.vector_index_name == VECTOR_INDEX_NAME
+
+
+@pytest.mark.parametrize("base_label, embedding_dims", [(False, 4), (True, None)])
+def test_no_vector_index_without_label_or_dims(base_label, embedding_dims):
+    assert _make_graph(base_label=base_label, embedding_dims=embedding_dims).vector_index_name is None
+
+
+def test_add_entities_batches_embeddings_resolution_and_writes(memory_graph):
+    to_be_added = [
+        {"source": "alice", "relationship": "works_at", "destination": "acme"},
+        {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        {"source": "bob", "relationship": "works_at", "destination": "acme"},
+    ]
+    entity_type_map = {"alice": "person", "bob": "person", "acme": "company", "paris": "city"}
+    memory_graph.graph.query.side_effect = [
+        [{"query_node": name, "covered": True} for name in ["alice", "acme", "paris", "bob"]],
+        [{"query_node": "alice", "node_id": "node-1"}],
+        [
+            {"idx": 0, "source": "alice", "relationship": "works_at", "target": "acme"},
+            {"idx": 2, "source": "bob", "relationship": "works_at", "target": "acme"},
+            {"idx": 1, "source": "alice", "relationship": "lives_in", "target": "paris"},
+        ],
+    ]
+
+    results = memory_graph._add_entities(to_be_added, {"user_id": "user1", "agent_id": "agent1"}, entity_type_map)
+
+    memory_graph.embedding_model.embed_batch.assert_called_once_with(["alice", "acme", "paris", "bob"])
+    assert memory_graph.graph.query.call_count == 3
+
+    resolve_cypher = memory_graph.graph.query.call_args_list[1].args[0]
+    resolve_params = memory_graph.graph.query.call_args_list[1].kwargs["params"]
+    assert "db.index.vector.queryNodes" in resolve_cypher
+    assert "candidate.agent_id = $agent_id" in resolve_cypher
+    assert [entity["name"] for entity in resolve_params["query_nodes"]] == ["alice", "acme", "paris", "bob"]
+
+    write_cypher = memory_graph.graph.query.call_args_list[2].args[0]
+    write_params = memory_graph.graph.query.call_args_list[2].kwargs["params"]
+    assert write_cypher.count("UNION ALL") == 1
+    assert "[r:works_at]" in write_cypher and "[r:lives_in]" in write_cypher
+    assert write_params["agent_id"] == "agent1"
+    works_at = write_params["batch_0"]
+    assert [row["idx"] for row in works_at] == [0, 2]
+    assert works_at[0]["source_id"] == "node-1"
+    assert works_at[1]["source_id"] is None
+    assert works_at[1]["destination_embedding"] == [4.0, 0.0, 0.0, 1.0]
+
+    assert results == [
+        [{"source": "alice", "relationship": "works_at", "target": "acme"}],
+        [{"source": "alice", "relationship": "lives_in", "target": "paris"}],
+        [{"source": "bob", "relationship": "works_at", "target": "acme"}],
+    ]
+
+
+def test_add_entities_falls_back_to_similarity_scan(memory_graph):
+    memory_graph.graph.query.side_effect = [Exception("index is populating"), [], []]
+
+    memory_graph._add_entities(
+        [{"source": "alice", "relationship": "knows", "destination": "bob"}], {"user_id": "user1"}, {}
+    )
+
+    assert memory_graph.graph.query.call_count == 3
+    scan_cypher = memory_graph.graph.query.call_args_list[1].args[0]
+    assert "vector.similarity.cosine(candidate.embedding, query_node.embedding)" in scan_cypher
+
+
+def test_add_entities_without_triples_makes_no_queries(memory_graph):
+    assert memory_graph._add_entities([], {"user_id": "user1"}, {}) == []
+    memory_graph.graph.query.assert_not_called()
+    memory_graph.embedding_model.embed_batch.assert_not_called()
+
+
+def _relation(relation_id, similarity, query_node="alice"):
+    return {
+        "query_node": query_node,
+        "source": "alice",
+        "source_id": "n1",
+        "relationship": f"rel_{relation_id}",
+        "relation_id": relation_id,
+        "destination": "acme",
+        "destination_id": "n2",
+        "similarity": similarity,
+    }
+
+
+def test_search_graph_db_runs_one_query_and_dedupes(memory_graph):
+    memory_graph.graph.query.side_effect = [
+        [{"query_node": "alice", "covered": True}, {"query_node": "acme", "covered": True}],
+        [
+            _relation("r1", 0.8, query_node="alice"),
+            _relation("r2", 0.75, query_node="alice"),
+            _relation("r1", 0.95, query_node="acme"),
+        ],
+    ]
+
+    results = memory_graph._search_graph_db(
+        ["alice", "acme", "alice"], {"user_id": "user1", "run_id": "run1"}, limit=10
+    )
+
+    memory_graph.embedding_model.embed_batch.assert_called_once_with(["alice", "acme"])
+    assert memory_graph.graph.query.call_count == 2
+    cypher = memory_graph.graph.query.call_args.args[0]
+    params = memory_graph.graph.query.call_args.kwargs["params"]
+    assert "UNWIND $query_nodes AS query_node" in cypher
+    assert "db.index.vector.queryNodes" in cypher
+    assert "run_id: $run_id" in cypher
+    assert params["limit"] == 10
+    assert params["threshold"] == memory_graph.threshold
+
+    assert [(relation["relation_id"], relation["query_node"]) for relation in results] == [
+        ("r1", "acme"),
+        ("r2", "alice"),
+    ]
+
+
+class _MultiUserGraph:
+    """
+    In-memory stand-in for Neo4j over the nodes of several users, answering the vector index,
+    index coverage and similarity scan statements of `_query_similar_nodes`.
+    """
+
+    def __init__(self, nodes):
+        # (node id, user id, embedding)
+        self.nodes = nodes
+        self.statements = []
+
+    @staticmethod
+    def _similarity(a, b):
+        return round(sum(x * y for x, y in zip(a, b)) / (math.hypot(*a) * math.hypot(*b)), 4)
+
+    def _nearest(self, embedding, count):
+        return sorted(self.nodes, key=lambda node: -self._similarity(node[2], embedding))[:count]
+
+    def query(self, cypher, params):
+        if "AS covered" in cypher:
+            self.statements.append("coverage")
+            rows = []
+            for query_node in params["query_nodes"]:
+                nearest = self._nearest(query_node["embedding"], params["candidates"])
+                lowest = min(self._similarity(node[2], query_node["embedding"]) for node in nearest)
+                covered = len(nearest) < params["candidates"] or lowest < params["threshold"]
+                rows.append({"query_node": query_node["name"], "covered": covered})
+            return rows
+
+        if "db.index.vector.queryNodes" in cypher:
+            self.statements.append("index")
+            candidates = {q["name"]: self._nearest(q["embedding"], q["candidates"]) for q in params["query_nodes"]}
+        else:
+            self.statements.append("scan")
+            candidates = {q["name"]: self.nodes for q in params["query_nodes"]}
+
+        rows = []
+        for query_node in params["query_nodes"]:
+            for node_id, user_id, embedding in candidates[query_node["name"]]:
+                similarity = self._similarity(embedding, query_node["embedding"])
+                if user_id == params["user_id"] and similarity >= params["threshold"]:
+                    row = {"query_node": query_node["name"], "similarity": similarity}
+                    if "AS node_id" in cypher:
+                        row["node_id"] = node_id
+                    else:
+                        row.update(_relation(node_id, similarity, query_node=query_node["name"]))
+                    rows.append(row)
+        return rows
+
+
+@pytest.fixture
+def multi_user_graph(memory_graph, monkeypatch):
+    monkeypatch.setattr(graph_memory, "VECTOR_INDEX_CANDIDATES", 2)
+    monkeypatch.setattr(graph_memory, "VECTOR_INDEX_MAX_CANDIDATES", 20)
+    memory_graph.embedding_model.embed_batch.side_effect = lambda texts, memory_action=None: [
+        [1.0, 0.0] for _ in texts
+    ]
+
+    def use_nodes(other_user_nodes):
+        # Nodes of another user nearer to the query than the user's own node
+        nodes = [(f"other-{i}", "user2", [1.0, 0.001 * i]) for i in range(other_user_nodes)]
+        nodes.append(("own", "user1", [1.0, 0.1]))
+        memory_graph.graph = _MultiUserGraph(nodes)
+        return memory_graph
+
+    return use_nodes
+
+
+def test_resolve_nodes_grows_candidates_past_other_users_nodes(multi_user_graph):
+    memory_graph = multi_user_graph(other_user_nodes=5)
+
+    assert memory_graph._resolve_nodes({"alice": [1.0, 0.0]}, {"user_id": "user1"}) == {"alice": "own"}
+    assert memory_graph.graph.statements == ["coverage", "coverage", "index"]
+
+
+def test_resolve_nodes_scans_when_other_users_nodes_fill_the_index(multi_user_graph):
+    memory_graph = multi_user_graph(other_user_nodes=30)
+
+    assert memory_graph._resolve_nodes({"alice": [1.0, 0.0]}, {"user_id": "user1"}) == {"alice": "own"}
+    assert memory_graph.graph.statements == ["coverage", "coverage", "scan"]
+
+
+@pytest.mark.parametrize("other_user_nodes", [5, 30])
+def test_search_graph_db_finds_own_nodes_in_shared_graph(multi_user_graph, other_user_nodes):
+    memory_graph = multi_user_graph(other_user_nodes=other_user_nodes)
+
+    results = memory_graph._search_graph_db(["alice"], {"user_id": "user1"})
+
+    assert [relation["relation_id"] for relation in results] == ["own"]
+
+
+def test_search_graph_db_without_nodes_makes_no_queries(memory_graph):
+    assert memory_graph._search_graph_db([], {"user_id": "user1"}) == []
+    memory_graph.graph.query.assert_not_called()
+
+
+def _stub_pipeline_stages(memory_graph, barrier):
+    memory_graph._retrieve_nodes_from_data = MagicMock(return_value={"alice": "person"})
+
+    def establish(data, filters, entity_type_map):
+        barrier.wait()
+        return [{"source": "alice", "relationship": "works_at", "destination": "acme"}]
+
+    def search(node_list, filters):
+        barrier.wait()
+        return []
+
+    memory_graph._establish_nodes_relations_from_data = MagicMock(side_effect=establish)
+    memory_graph._search_graph_db = MagicMock(side_effect=search)
+    memory_graph._get_delete_entities_from_search_output = MagicMock(return_value=[])
+    memory_graph._delete_entities = MagicMock(return_value=[])
+    memory_graph._add_entities = MagicMock(return_value=[["added"]])
+
+
+def test_add_overlaps_relation_extraction_and_graph_search(memory_graph):
+    # Both stages wait for each other, so this only completes if they run concurrently
+    _stub_pipeline_stages(memory_graph, threading.Barrier(2, timeout=5))
+
+    result = memory_graph.add("Alice works at Acme", {"user_id": "user1"})
+
+    assert result == {"deleted_entities": [], "added_entities": [["added"]]}
+    memory_graph._search_graph_db.assert_called_once_with(node_list=["alice"], filters={"user_id": "user1"})
+    memory_graph._add_entities.assert_called_once_with(
+        [{"source": "alice", "relationship": "works_at", "destination": "acme"}],
+        {"user_id": "user1"},
+        {"alice": "person"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_aadd_overlaps_relation_extraction_and_graph_search(memory_graph):
+    _stub_pipeline_stages(memory_graph, threading.Barrier(2, timeout=5))
+
+    result = await memory_graph.aadd("Alice works at Acme", {"user_id": "user1"})
+
+    assert result == {"deleted_entities": [], "added_entities": [["added"]]}
+    memory_graph._get_delete_entities_from_search_output.assert_called_once_with(
+        [], "Alice works at Acme", {"user_id": "user1"}
+    )
+
+
+def test_search_reranks_with_cached_corpus(memory_graph):
+    memory_graph._retrieve_nodes_from_data = MagicMock(return_value={"alice": "person"})
+    memory_graph._search_graph_db = MagicMock(
+        return_value=[
+            {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+            {"source": "alice", "relationship": "works_at", "destination": "acme"},
+        ]
+    )
+    corpus = [
+        ("alice", "lives_in", "paris"),
+        ("alice", "works_at", "acme"),
+        ("bob", "likes", "tea"),
+        ("carol", "lives_in", "berlin"),
+        ("dave", "knows", "erin"),
+    ]
+    memory_graph.get_all = MagicMock(
+        return_value=[
+            {"source": source, "relationship": relationship, "target": target}
+            for source, relationship, target in corpus
+        ]
+    )
+
+    for _ in range(2):
+        results = memory_graph.search("Where does Alice work at?", {"user_id": "user1"})
+
+    assert results[0] == {"source": "alice", "relationship": "works_at", "destination": "acme"}
+    memory_graph.get_all.assert_called_once_with({"user_id": "user1"}, limit=memory_graph.reranker.max_corpus_size)
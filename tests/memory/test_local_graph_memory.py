@@ -0,0 +1,193 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mem0.graphs.local.main import MemoryGraph
+from mem0.graphs.local.store import LocalGraphStore
+
+VECTORS = {
+    "alice": [1.0, 0.0, 0.0],
+    "acme": [0.0, 1.0, 0.0],
+    "acme_corp": [0.0, 0.99, 0.05],
+    "paris": [0.0, 0.0, 1.0],
+    "bob": [0.6, 0.0, 0.8],
+}
+
+
+def _embed_batch(texts, memory_action=None):
+    return [VECTORS[text] for text in texts]
+
+
+@pytest.fixture
+def store():
+    store = LocalGraphStore(":memory:")
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def memory_graph(tmp_path):
+    config = MagicMock()
+    config.graph_store.config.path = str(tmp_path / "graph.db")
+    config.graph_store.llm = None
+    config.graph_store.rerank_top_n = 5
+    config.graph_store.rerank_cache_max_scopes = 1000
+    config.graph_store.rerank_cache_ttl = None
+    config.graph_store.custom_prompt = None
+    config.llm.provider = "openai_structured"
+
+    embedding_model = MagicMock()
+    embedding_model.embed_batch.side_effect = _embed_batch
+
+    with patch("mem0.graphs.local.main.EmbedderFactory.create", return_value=embedding_model), patch(
+        "mem0.graphs.local.main.LlmFactory.create", return_value=MagicMock()
+    ):
+        memory_graph = MemoryGraph(config)
+    yield memory_graph
+    memory_graph.graph.close()
+
+
+def _relation(source, relationship, destination, **extra):
+    return {
+        "source": source,
+        "relationship": relationship,
+        "destination": destination,
+        "source_embedding": VECTORS[source],
+        "destination_embedding": VECTORS[destination],
+        **extra,
+    }
+
+
+def test_add_relations_merges_nodes_and_counts_mentions(store):
+    filters = {"user_id": "user1"}
+    store.add_relations([_relation("alice", "works_at", "acme"), _relation("alice", "lives_in", "paris")], filters)
+    store.add_relations([_relation("alice", "works_at", "acme")], filters)
+
+    assert store.get_relations(filters) == [
+        {"source": "alice", "relationship": "works_at", "target": "acme"},
+        {"source": "alice", "relationship": "lives_in", "target": "paris"},
+    ]
+    mentions = dict(store._connection.execute("SELECT name, mentions FROM nodes").fetchall())
+    assert mentions == {"alice": 3, "acme": 2, "paris": 1}
+    assert store._connection.execute(
+        "SELECT mentions FROM relationships WHERE relationship = 'works_at'"
+    ).fetchone() == (2,)
+
+
+def test_nearest_and_neighborhood_respect_scope(store):
+    store.add_relations([_relation("alice", "works_at", "acme")], {"user_id": "user1"})
+    store.add_relations([_relation("alice", "knows", "bob")], {"user_id": "user2"})
+    store.add_relations([_relation("alice", "lives_in", "paris")], {"user_id": "user1", "agent_id": "agent1"})
+
+    [matches] = store.nearest([VECTORS["acme_corp"]], {"user_id": "user1"}, threshold=0.9)
+    assert len(matches) == 1 and matches[0][1] > 0.9
+    acme_id = matches[0][0]
+    assert [relation["source"] for relation in store.neighborhood(acme_id, {"user_id": "user1"})] == ["alice"]
+
+    # Nodes created under an agent are also part of the user's scope, not the other way round
+    assert len(store.nearest([VECTORS["alice"]], {"user_id": "user1"}, threshold=0.9)[0]) == 2
+    agent_filters = {"user_id": "user1", "agent_id": "agent1"}
+    [(alice_id, _)] = store.nearest([VECTORS["alice"]], agent_filters, threshold=0.9)[0]
+    assert [relation["relationship"] for relation in store.neighborhood(alice_id, agent_filters)] == ["lives_in"]
+    assert store.nearest([VECTORS["bob"]], {"user_id": "user1"}, threshold=0.9) == [[]]
+
+
+def test_delete_relation_and_delete_nodes(store):
+    store.add_relations([_relation("alice", "works_at", "acme")], {"user_id": "user1"})
+    store.add_relations([_relation("alice", "works_at", "acme")], {"user_id": "user2"})
+
+    deleted = store.delete_relation("alice", "works_at", "acme", {"user_id": "user1"})
+
+    assert deleted == [{"source": "alice", "target": "acme", "relationship": "works_at"}]
+    assert store.get_relations({"user_id": "user1"}) == []
+    [alice] = store.nearest([VECTORS["alice"]], {"user_id": "user1"}, threshold=0.9)[0]
+    assert store.neighborhood(alice[0], {"user_id": "user1"}) == []
+
+    store.delete_nodes({"user_id": "user2"})
+    assert store.get_relations({"user_id": "user2"}) == []
+    assert store._connection.execute("SELECT COUNT(*) FROM relationships").fetchone() == (0,)
+
+
+def test_graph_persists_across_instances(tmp_path):
+    path = str(tmp_path / "graph.db")
+    store = LocalGraphStore(path)
+    store.add_relations([_relation("alice", "works_at", "acme")], {"user_id": "user1"})
+    store.close()
+
+    reopened = LocalGraphStore(path)
+    [[(node_id, _)]] = reopened.nearest([VECTORS["alice"]], {"user_id": "user1"}, threshold=0.9)
+    assert [relation["destination"] for relation in reopened.neighborhood(node_id, {"user_id": "user1"})] == ["acme"]
+    reopened.close()
+
+
+def test_add_entities_resolves_similar_nodes(memory_graph):
+    filters = {"user_id": "user1"}
+    memory_graph._add_entities([{"source": "alice", "relationship": "works_at", "destination": "acme"}], filters, {})
+
+    added = memory_graph._add_entities(
+        [{"source": "alice", "relationship": "likes", "destination": "acme_corp"}], filters, {}
+    )
+
+    assert added == [[{"source": "alice", "relationship": "likes", "target": "acme"}]]
+    memory_graph.embedding_model.embed_batch.assert_called_with(["alice", "acme_corp"])
+
+
+def test_search_graph_db_returns_tagged_relations(memory_graph):
+    filters = {"user_id": "user1"}
+    memory_graph._add_entities(
+        [
+            {"source": "alice", "relationship": "works_at", "destination": "acme"},
+            {"source": "alice", "relationship": "lives_in", "destination": "paris"},
+        ],
+        filters,
+        {},
+    )
+
+    results = memory_graph._search_graph_db(["acme", "alice"], filters)
+
+    assert [(relation["relationship"], relation["query_node"]) for relation in results] == [
+        ("works_at", "acme"),
+        ("lives_in", "alice"),
+    ]
+
+
+def _llm_response(messages, tools):
+    # The relation extraction and deletion planning calls run concurrently, so answer by tool
+    tool_name = tools[0]["function"]["name"]
+    if tool_name == "extract_entities":
+        entities = [{"entity": "alice", "entity_type": "person"}]
+        return {"tool_calls": [{"name": "extract_entities", "arguments": {"entities": entities}}]}
+    if tool_name.startswith("establish_relation"):
+        entities = [{"source": "alice", "relationship": "works at", "destination": "acme"}]
+        return {"tool_calls": [{"name": tool_name, "arguments": {"entities": entities}}]}
+    return {"tool_calls": []}
+
+
+def test_add_and_search_with_llm(memory_graph):
+    memory_graph.llm.generate_response.side_effect = _llm_response
+
+    result = memory_graph.add("Alice works at Acme", {"user_id": "user1"})
+
+    assert result == {
+        "deleted_entities": [],
+        "added_entities": [[{"source": "alice", "relationship": "works_at", "target": "acme"}]],
+    }
+    assert memory_graph.get_all({"user_id": "user1"}) == [
+        {"source": "alice", "relationship": "works_at", "target": "acme"}
+    ]
+    assert memory_graph.search("where does alice work", {"user_id": "user1"}) == [
+        {"source": "alice", "relationship": "works_at", "destination": "acme"}
+    ]
+
+    memory_graph.delete_all({"user_id": "user1"})
+    assert memory_graph.get_all({"user_id": "user1"}) == []
+
+
+@pytest.mark.asyncio
+async def test_aadd_matches_add(memory_graph):
+    memory_graph.llm.generate_response.side_effect = _llm_response
+
+    result = await memory_graph.aadd("Alice works at Acme", {"user_id": "user1"})
+
+    assert result["added_entities"] == [[{"source": "alice", "relationship": "works_at", "target": "acme"}]]
+    assert memory_graph.llm.generate_response.call_count == 3
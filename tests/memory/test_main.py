@@ -1,8 +1,10 @@
+import asyncio
 import logging
 from unittest.mock import MagicMock
 
 import pytest
 
+from mem0.configs.base import MemoryConfig
 from mem0.memory.main import AsyncMemory, Memory
 
 
@@ -125,3 +127,424 @@ class TestAsyncAddToVectorStoreErrors:
         assert result == []
         assert "Invalid JSON response" in caplog.text
         assert mock_capture_event.call_count == 1
+
+
+class TestAddToVectorStoreBatching:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        """Fixture that returns a Memory instance with mocker-based mocks"""
+        _setup_mocks(mocker)
+
+        memory = Memory()
+        memory.config = mocker.MagicMock()
+        memory.config.custom_fact_extraction_prompt = None
+        memory.config.custom_update_memory_prompt = None
+        memory.api_version = "v1.1"
+
+        return memory
+
+    def test_facts_embedded_in_single_batch(self, mocker, mock_memory):
+        """All extracted facts are embedded with one embed_batch call"""
+        mocker.patch("mem0.memory.main.capture_event")
+        mock_memory.llm.generate_response.side_effect = ['{"facts": ["fact1", "fact2", "fact3"]}', "{}"]
+        mock_memory.embedding_model.embed_batch.return_value = [[0.1], [0.2], [0.3]]
+
+        mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        mock_memory.embedding_model.embed_batch.assert_called_once_with(["fact1", "fact2", "fact3"], "add")
+        mock_memory.embedding_model.embed.assert_not_called()
+
+    def test_facts_searched_in_single_batch(self, mocker, mock_memory):
+        """Related memories for all facts are fetched with one search_batch call and deduplicated"""
+        mocker.patch("mem0.memory.main.capture_event")
+        mock_get_update_memory_messages = mocker.patch(
+            "mem0.memory.main.get_update_memory_messages", return_value="update prompt"
+        )
+        mock_memory.llm.generate_response.side_effect = ['{"facts": ["fact1", "fact2"]}', "{}"]
+        mock_memory.embedding_model.embed_batch.return_value = [[0.1], [0.2]]
+        shared = MagicMock(id="shared-id", payload={"data": "shared memory"})
+        other = MagicMock(id="other-id", payload={"data": "other memory"})
+        mock_memory.vector_store.search_batch.return_value = [[shared], [shared, other]]
+
+        mock_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "test"}], metadata={}, filters={"user_id": "u"}, infer=True
+        )
+
+        mock_memory.vector_store.search_batch.assert_called_once_with(
+            queries=["fact1", "fact2"], vectors_list=[[0.1], [0.2]], limit=5, filters={"user_id": "u"}
+        )
+        mock_memory.vector_store.search.assert_not_called()
+        retrieved_old_memory = mock_get_update_memory_messages.call_args[0][0]
+        assert retrieved_old_memory == [{"id": "0", "text": "shared memory"}, {"id": "1", "text": "other memory"}]
+
+
+class TestApplyMemoryActions:
+    @pytest.fixture
+    def mock_memory(self, mocker):
+        """Fixture that returns a Memory instance with mocker-based mocks"""
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+
+        memory = Memory()
+        memory.db = mocker.MagicMock()
+        memory.api_version = "v1.1"
+
+        existing = {
+            "mem-1": MagicMock(id="mem-1", payload={"data": "likes tea", "user_id": "u", "created_at": "t0"}),
+            "mem-2": MagicMock(id="mem-2", payload={"data": "lives in Paris", "user_id": "u", "role": "user"}),
+        }
+        memory.vector_store.get.side_effect = lambda vector_id: existing.get(vector_id)
+        memory.embedding_model.embed_batch.side_effect = lambda texts, memory_action: [[0.5] for _ in texts]
+        return memory
+
+    def test_actions_applied_with_bulk_writes(self, mock_memory):
+        actions = [
+            {"event": "ADD", "text": "likes hiking"},
+            {"event": "UPDATE", "id": "0", "text": "likes green tea", "old_memory": "likes tea"},
+            {"event": "DELETE", "id": "1", "text": "lives in Paris"},
+            {"event": "ADD", "text": "has a dog"},
+            {"event": "NONE", "text": "unchanged"},
+        ]
+        existing_embeddings = {"likes hiking": [0.1], "has a dog": [0.2]}
+
+        result = mock_memory._apply_memory_actions(
+            actions, {"0": "mem-1", "1": "mem-2"}, existing_embeddings, {"user_id": "u"}
+        )
+
+        assert [(r["event"], r["memory"]) for r in result] == [
+            ("ADD", "likes hiking"),
+            ("UPDATE", "likes green tea"),
+            ("DELETE", "lives in Paris"),
+            ("ADD", "has a dog"),
+        ]
+        assert result[1] == {
+            "id": "mem-1",
+            "memory": "likes green tea",
+            "event": "UPDATE",
+            "previous_memory": "likes tea",
+        }
+
+        # Both ADDs are written with one bulk insert
+        mock_memory.vector_store.insert.assert_called_once()
+        insert_kwargs = mock_memory.vector_store.insert.call_args.kwargs
+        assert insert_kwargs["vectors"] == [[0.1], [0.2]]
+        assert insert_kwargs["ids"] == [result[0]["id"], result[3]["id"]]
+        assert [p["data"] for p in insert_kwargs["payloads"]] == ["likes hiking", "has a dog"]
+
+        # Only the missing UPDATE text is embedded
+        mock_memory.embedding_model.embed_batch.assert_called_once_with(["likes green tea"], "update")
+        update_kwargs = mock_memory.vector_store.update.call_args.kwargs
+        assert update_kwargs["vector_id"] == "mem-1"
+        assert update_kwargs["payload"]["created_at"] == "t0"
+        assert update_kwargs["payload"]["user_id"] == "u"
+        mock_memory.vector_store.delete.assert_called_once_with(vector_id="mem-2")
+
+        # History is written in one batch, in action order
+        mock_memory.db.add_history_batch.assert_called_once()
+        mock_memory.db.add_history.assert_not_called()
+        history = mock_memory.db.add_history_batch.call_args[0][0]
+        assert [(h["memory_id"], h["event"]) for h in history] == [
+            (result[0]["id"], "ADD"),
+            ("mem-1", "UPDATE"),
+            ("mem-2", "DELETE"),
+            (result[3]["id"], "ADD"),
+        ]
+        assert history[1]["old_memory"] == "likes tea"
+        assert history[2]["is_deleted"] == 1
+
+    def test_failed_write_is_not_reported(self, mock_memory, caplog):
+        mock_memory.vector_store.delete.side_effect = RuntimeError("boom")
+        actions = [
+            {"event": "DELETE", "id": "1", "text": "lives in Paris"},
+            {"event": "UPDATE", "id": "7", "text": "hallucinated id"},
+            {"event": "ADD", "text": "has a dog"},
+        ]
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._apply_memory_actions(actions, {"1": "mem-2"}, {"has a dog": [0.2]}, {})
+
+        assert [r["event"] for r in result] == ["ADD"]
+        history = mock_memory.db.add_history_batch.call_args[0][0]
+        assert [h["event"] for h in history] == ["ADD"]
+        assert "boom" in caplog.text
+
+    def test_failed_history_write_still_reports_applied_actions(self, mock_memory, caplog):
+        mock_memory.db.add_history_batch.side_effect = RuntimeError("history down")
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._apply_memory_actions(
+                [{"event": "ADD", "text": "has a dog"}], {}, {"has a dog": [0.2]}, {}
+            )
+
+        assert [r["event"] for r in result] == ["ADD"]
+        mock_memory.vector_store.insert.assert_called_once()
+        assert "history down" in caplog.text
+
+    def test_failed_embedding_only_fails_its_actions(self, mock_memory, caplog):
+        def embed_batch(texts, memory_action):
+            if memory_action == "add":
+                raise RuntimeError("embedder down")
+            return [[0.5] for _ in texts]
+
+        mock_memory.embedding_model.embed_batch.side_effect = embed_batch
+        actions = [
+            {"event": "ADD", "text": "has a dog"},
+            {"event": "UPDATE", "id": "0", "text": "likes green tea"},
+            {"event": "DELETE", "id": "1", "text": "lives in Paris"},
+        ]
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._apply_memory_actions(actions, {"0": "mem-1", "1": "mem-2"}, {}, {})
+
+        assert [r["event"] for r in result] == ["UPDATE", "DELETE"]
+        mock_memory.vector_store.insert.assert_not_called()
+        assert "embedder down" in caplog.text
+
+    def test_failed_bulk_insert_retries_memories_one_by_one(self, mock_memory, caplog):
+        def insert(vectors, ids, payloads):
+            if len(ids) > 1 or payloads[0]["data"] == "bad memory":
+                raise RuntimeError("insert failed")
+
+        mock_memory.vector_store.insert.side_effect = insert
+        actions = [{"event": "ADD", "text": "has a dog"}, {"event": "ADD", "text": "bad memory"}]
+
+        with caplog.at_level(logging.ERROR):
+            result = mock_memory._apply_memory_actions(actions, {}, {"has a dog": [0.2], "bad memory": [0.3]}, {})
+
+        assert [r["memory"] for r in result] == ["has a dog"]
+        assert mock_memory.vector_store.insert.call_count == 3
+        history = mock_memory.db.add_history_batch.call_args[0][0]
+        assert [h["new_memory"] for h in history] == ["has a dog"]
+
+    def test_bulk_insert_failing_partway_is_not_inserted_twice(self, mock_memory):
+        stored = {}
+
+        def insert(vectors, ids, payloads):
+            # Like a store without transactions, rows before the failing one stay written
+            for vector_id, payload in zip(ids, payloads):
+                if payload["data"] == "bad memory":
+                    raise RuntimeError("insert failed")
+                if vector_id in stored:
+                    raise AssertionError(f"{vector_id} inserted twice")
+                stored[vector_id] = MagicMock(id=vector_id, payload=payload)
+
+        mock_memory.vector_store.insert.side_effect = insert
+        mock_memory.vector_store.get.side_effect = lambda vector_id: stored.get(vector_id)
+        actions = [
+            {"event": "ADD", "text": "has a dog"},
+            {"event": "ADD", "text": "bad memory"},
+            {"event": "ADD", "text": "likes tea"},
+        ]
+        embeddings = {"has a dog": [0.2], "bad memory": [0.3], "likes tea": [0.4]}
+
+        result = mock_memory._apply_memory_actions(actions, {}, embeddings, {})
+
+        assert [r["memory"] for r in result] == ["has a dog", "likes tea"]
+        assert [payload.payload["data"] for payload in stored.values()] == ["has a dog", "likes tea"]
+        history = mock_memory.db.add_history_batch.call_args[0][0]
+        assert [h["new_memory"] for h in history] == ["has a dog", "likes tea"]
+
+    def test_repeated_action_on_same_memory_is_skipped(self, mock_memory):
+        actions = [
+            {"event": "UPDATE", "id": "0", "text": "likes green tea"},
+            {"event": "DELETE", "id": "0", "text": "likes green tea"},
+        ]
+
+        result = mock_memory._apply_memory_actions(actions, {"0": "mem-1"}, {"likes green tea": [0.3]}, {})
+
+        assert [r["event"] for r in result] == ["UPDATE"]
+        mock_memory.vector_store.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+class TestAsyncApplyMemoryActions:
+    @pytest.fixture
+    def mock_async_memory(self, mocker):
+        """Fixture for AsyncMemory with mocker-based mocks"""
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+
+        memory = AsyncMemory()
+        memory.db = mocker.AsyncMock()
+        memory.api_version = "v1.1"
+        existing = {"mem-1": MagicMock(id="mem-1", payload={"data": "likes tea", "user_id": "u"})}
+        memory.vector_store.get.side_effect = lambda vector_id: existing.get(vector_id)
+        return memory
+
+    async def test_async_actions_applied_with_bulk_writes(self, mock_async_memory):
+        actions = [
+            {"event": "ADD", "text": "likes hiking"},
+            {"event": "UPDATE", "id": "0", "text": "likes green tea", "old_memory": "likes tea"},
+            {"event": "ADD", "text": "has a dog"},
+        ]
+        existing_embeddings = {"likes hiking": [0.1], "has a dog": [0.2], "likes green tea": [0.3]}
+
+        result = await mock_async_memory._apply_memory_actions(
+            actions, {"0": "mem-1"}, existing_embeddings, {"user_id": "u"}
+        )
+
+        assert [(r["event"], r["memory"]) for r in result] == [
+            ("ADD", "likes hiking"),
+            ("UPDATE", "likes green tea"),
+            ("ADD", "has a dog"),
+        ]
+        mock_async_memory.vector_store.insert.assert_called_once()
+        assert mock_async_memory.vector_store.insert.call_args.kwargs["vectors"] == [[0.1], [0.2]]
+        mock_async_memory.vector_store.update.assert_called_once()
+        mock_async_memory.db.aadd_history_batch.assert_awaited_once()
+        assert len(mock_async_memory.db.aadd_history_batch.call_args[0][0]) == 3
+
+    async def test_async_partial_failures_keep_applied_actions(self, mock_async_memory, caplog):
+        def insert(vectors, ids, payloads):
+            if len(ids) > 1 or payloads[0]["data"] == "bad memory":
+                raise RuntimeError("insert failed")
+
+        mock_async_memory.vector_store.insert.side_effect = insert
+        mock_async_memory.db.aadd_history_batch.side_effect = RuntimeError("history down")
+        actions = [
+            {"event": "ADD", "text": "has a dog"},
+            {"event": "ADD", "text": "bad memory"},
+            {"event": "UPDATE", "id": "0", "text": "likes green tea"},
+        ]
+        existing_embeddings = {"has a dog": [0.2], "bad memory": [0.3], "likes green tea": [0.4]}
+
+        with caplog.at_level(logging.ERROR):
+            result = await mock_async_memory._apply_memory_actions(actions, {"0": "mem-1"}, existing_embeddings, {})
+
+        assert [(r["event"], r["memory"]) for r in result] == [("ADD", "has a dog"), ("UPDATE", "likes green tea")]
+        assert mock_async_memory.vector_store.insert.call_count == 3
+        assert "history down" in caplog.text
+
+    async def test_async_bulk_insert_failing_partway_is_not_inserted_twice(self, mock_async_memory):
+        stored = {}
+
+        def insert(vectors, ids, payloads):
+            for vector_id, payload in zip(ids, payloads):
+                if payload["data"] == "bad memory":
+                    raise RuntimeError("insert failed")
+                if vector_id in stored:
+                    raise AssertionError(f"{vector_id} inserted twice")
+                stored[vector_id] = MagicMock(id=vector_id, payload=payload)
+
+        mock_async_memory.vector_store.insert.side_effect = insert
+        mock_async_memory.vector_store.get.side_effect = lambda vector_id: stored.get(vector_id)
+        actions = [{"event": "ADD", "text": "has a dog"}, {"event": "ADD", "text": "bad memory"}]
+
+        result = await mock_async_memory._apply_memory_actions(
+            actions, {}, {"has a dog": [0.2], "bad memory": [0.3]}, {}
+        )
+
+        assert [r["memory"] for r in result] == ["has a dog"]
+        assert len(stored) == 1
+        history = mock_async_memory.db.aadd_history_batch.call_args[0][0]
+        assert [h["new_memory"] for h in history] == ["has a dog"]
+
+    async def test_native_async_vector_store_methods_are_awaited(self, mock_async_memory, mocker):
+        mock_async_memory.vector_store.aget = mocker.AsyncMock(
+            return_value=MagicMock(id="mem-1", payload={"data": "likes tea", "user_id": "u"})
+        )
+        mock_async_memory.vector_store.aupdate = mocker.AsyncMock()
+
+        result = await mock_async_memory._apply_memory_actions(
+            [{"event": "UPDATE", "id": "0", "text": "likes green tea", "old_memory": "likes tea"}],
+            {"0": "mem-1"},
+            {"likes green tea": [0.3]},
+            {"user_id": "u"},
+        )
+
+        assert [r["event"] for r in result] == ["UPDATE"]
+        mock_async_memory.vector_store.aget.assert_awaited_once_with(vector_id="mem-1")
+        mock_async_memory.vector_store.aupdate.assert_awaited_once()
+        mock_async_memory.vector_store.get.assert_not_called()
+        mock_async_memory.vector_store.update.assert_not_called()
+
+
+    async def test_native_async_embedder_and_llm_are_awaited(self, mock_async_memory, mocker):
+        mock_async_memory.config = mocker.MagicMock()
+        mock_async_memory.config.custom_fact_extraction_prompt = None
+        mock_async_memory.config.custom_update_memory_prompt = None
+        mock_async_memory.llm.agenerate_response = mocker.AsyncMock(
+            side_effect=['{"facts": ["likes tea"]}', '{"memory": [{"id": "0", "text": "likes tea", "event": "ADD"}]}']
+        )
+        mock_async_memory.embedding_model.aembed_batch = mocker.AsyncMock(return_value=[[0.1]])
+        mock_async_memory.vector_store.search_batch.return_value = [[]]
+
+        result = await mock_async_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "I like tea"}],
+            metadata={"user_id": "u"},
+            effective_filters={"user_id": "u"},
+            infer=True,
+        )
+
+        assert [r["event"] for r in result] == ["ADD"]
+        assert mock_async_memory.llm.agenerate_response.await_count == 2
+        mock_async_memory.embedding_model.aembed_batch.assert_awaited_once_with(["likes tea"], "add")
+        mock_async_memory.llm.generate_response.assert_not_called()
+        mock_async_memory.embedding_model.embed_batch.assert_not_called()
+
+    async def test_raw_messages_embedded_in_one_batch(self, mock_async_memory, mocker):
+        mock_async_memory.embedding_model.aembed_batch = mocker.AsyncMock(return_value=[[0.1], [0.2]])
+
+        result = await mock_async_memory._add_to_vector_store(
+            messages=[{"role": "user", "content": "I like tea"}, {"role": "assistant", "content": "Noted"}],
+            metadata={"user_id": "u"},
+            effective_filters={"user_id": "u"},
+            infer=False,
+        )
+
+        assert [(r["memory"], r["role"]) for r in result] == [("I like tea", "user"), ("Noted", "assistant")]
+        mock_async_memory.embedding_model.aembed_batch.assert_awaited_once_with(["I like tea", "Noted"], "add")
+        mock_async_memory.embedding_model.embed.assert_not_called()
+        assert mock_async_memory.vector_store.insert.call_count == 2
+
+    async def test_get_all_awaits_vector_store(self, mock_async_memory):
+        mock_async_memory.vector_store.list.return_value = [
+            [MagicMock(id="mem-1", payload={"data": "likes tea", "user_id": "u"})]
+        ]
+
+        result = await mock_async_memory.get_all(user_id="u")
+
+        assert [m["memory"] for m in result["results"]] == ["likes tea"]
+        mock_async_memory.vector_store.list.assert_called_once_with(filters={"user_id": "u"}, limit=100)
+
+    async def test_concurrent_embedding_calls_are_bounded(self, mocker):
+        _setup_mocks(mocker)
+        mocker.patch("mem0.memory.main.capture_event")
+        memory = AsyncMemory(MemoryConfig(concurrency={"max_embedding_calls": 2}))
+        in_flight = peak = 0
+
+        async def aembed(text, memory_action=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [0.1, 0.2, 0.3]
+
+        memory.embedding_model.aembed = aembed
+        memory.vector_store.search.return_value = []
+
+        await asyncio.gather(*(memory.search(f"query {i}", user_id="u") for i in range(5)))
+
+        assert peak == 2
+        stats = memory.concurrency_stats
+        assert stats["embedder"]["calls"] == 5
+        assert stats["embedder"]["max_waiting"] == 3
+        assert stats["vector_store"]["calls"] == 5
+
+def test_history_store_from_config(tmp_path):
+    from mem0.memory.main import _create_history_store
+    from mem0.memory.storage import MemoryHistoryManager, SQLiteManager
+
+    config = MemoryConfig(history_db_path=str(tmp_path / "history.db"))
+    store = _create_history_store(config)
+    assert isinstance(store, SQLiteManager)
+    assert store.db_path == str(tmp_path / "history.db")
+    store.close()
+
+    config = MemoryConfig(history_store={"provider": "memory", "config": {"max_records": 100}})
+    store = _create_history_store(config)
+    assert isinstance(store, MemoryHistoryManager)
+    assert store.max_records == 100
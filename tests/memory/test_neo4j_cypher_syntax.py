@@ -263,10 +263,8 @@ class TestNeo4jCypherSyntaxFix:
             content = f.read()
         
         # Check that search methods handle both agent_id and run_id
-        assert 'where_conditions.append("source_candidate.agent_id = $agent_id")' in content
-        assert 'where_conditions.append("source_candidate.run_id = $run_id")' in content
-        assert 'where_conditions.append("destination_candidate.agent_id = $agent_id")' in content
-        assert 'where_conditions.append("destination_candidate.run_id = $run_id")' in content
+        assert 'where_conditions.append("candidate.agent_id = $agent_id")' in content
+        assert 'where_conditions.append("candidate.run_id = $run_id")' in content
 
     def test_add_entities_integration(self):
         """Test that both agent_id and run_id are properly integrated into add_entities"""
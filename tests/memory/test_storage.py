@@ -0,0 +1,243 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mem0.memory.storage import MemoryHistoryManager, PostgresHistoryManager, SQLiteManager
+from mem0.utils.factory import HistoryStoreFactory
+
+
+@pytest.fixture
+def db():
+    manager = SQLiteManager(":memory:")
+    yield manager
+    manager.close()
+
+
+def test_add_history_batch(db):
+    db.add_history_batch(
+        [
+            {"memory_id": "m1", "old_memory": None, "new_memory": "likes tea", "event": "ADD", "created_at": "t0"},
+            {
+                "memory_id": "m1",
+                "old_memory": "likes tea",
+                "new_memory": "likes green tea",
+                "event": "UPDATE",
+                "created_at": "t0",
+                "updated_at": "t1",
+                "role": "user",
+            },
+            {"memory_id": "m2", "old_memory": "lives in Paris", "new_memory": None, "event": "DELETE", "is_deleted": 1},
+        ]
+    )
+
+    history = db.get_history("m1")
+    assert [h["event"] for h in history] == ["ADD", "UPDATE"]
+    assert history[1]["old_memory"] == "likes tea"
+    assert history[1]["role"] == "user"
+    assert db.get_history("m2")[0]["is_deleted"] is True
+
+
+def test_add_history_batch_is_atomic(db):
+    with pytest.raises(KeyError):
+        db.add_history_batch([{"memory_id": "m1", "event": "ADD"}, {"memory_id": "m2"}])
+
+    assert db.get_history("m1") == []
+
+
+def test_add_history_single_record(db):
+    db.add_history("m1", None, "likes tea", "ADD", created_at="t0", actor_id="alice")
+
+    history = db.get_history("m1")
+    assert len(history) == 1
+    assert history[0]["new_memory"] == "likes tea"
+    assert history[0]["actor_id"] == "alice"
+    assert history[0]["is_deleted"] is False
+
+
+def test_memory_id_is_indexed(db):
+    plan = db.connection.execute("EXPLAIN QUERY PLAN SELECT * FROM history WHERE memory_id = ?", ("m1",)).fetchall()
+    assert any("idx_history_memory_id" in row[-1] for row in plan)
+
+
+def test_reset_recreates_table_and_index(db):
+    db.add_history("m1", None, "likes tea", "ADD")
+
+    db.reset()
+
+    assert db.get_history("m1") == []
+    indexes = db.connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'").fetchall()
+    assert ("idx_history_memory_id",) in indexes
+
+
+def test_file_database_uses_wal_and_read_pool(tmp_path):
+    manager = SQLiteManager(str(tmp_path / "history.db"), read_pool_size=2)
+    try:
+        assert manager.connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert manager.connection.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+        manager.add_history("m1", None, "likes tea", "ADD")
+        assert manager.get_history("m1")[0]["new_memory"] == "likes tea"
+        assert len(manager._read_connections) == 1
+
+        # Pooled readers see later commits from the writer
+        manager.add_history("m1", "likes tea", "likes green tea", "UPDATE", created_at="t1")
+        assert [h["event"] for h in manager.get_history("m1")] == ["ADD", "UPDATE"]
+        assert len(manager._read_connections) == 1
+    finally:
+        manager.close()
+
+    assert manager._read_connections == []
+
+
+def test_concurrent_reads_bounded_by_pool_size(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager = SQLiteManager(str(tmp_path / "history.db"), read_pool_size=2)
+    try:
+        manager.add_history_batch([{"memory_id": f"m{i}", "event": "ADD"} for i in range(20)])
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(manager.get_history, [f"m{i}" for i in range(20)] * 5))
+
+        assert all(len(history) == 1 for history in results)
+        assert len(manager._read_connections) <= 2
+    finally:
+        manager.close()
+
+
+def test_invalid_synchronous_mode(tmp_path):
+    with pytest.raises(ValueError, match="Invalid synchronous mode"):
+        SQLiteManager(str(tmp_path / "history.db"), synchronous="sometimes")
+
+
+def test_memory_history_manager_ring_buffer():
+    manager = MemoryHistoryManager(max_records=3)
+    manager.add_history("m1", None, "v1", "ADD", created_at="t0")
+    manager.add_history_batch(
+        [
+            {"memory_id": "m1", "old_memory": "v1", "new_memory": "v2", "event": "UPDATE", "created_at": "t0", "updated_at": "t2"},
+            {"memory_id": "m1", "old_memory": "v2", "new_memory": "v3", "event": "UPDATE", "created_at": "t0", "updated_at": "t1"},
+            {"memory_id": "m2", "new_memory": "other", "event": "ADD"},
+        ]
+    )
+
+    # The oldest record was evicted and the rest are ordered by timestamps
+    assert [h["new_memory"] for h in manager.get_history("m1")] == ["v3", "v2"]
+    assert manager.get_history("m2")[0]["is_deleted"] is False
+
+    manager.reset()
+    assert manager.get_history("m1") == []
+
+
+@pytest.mark.asyncio
+async def test_async_history_api(db):
+    await db.aadd_history("m1", None, "likes tea", "ADD", created_at="t0")
+    await db.aadd_history_batch([{"memory_id": "m1", "old_memory": "likes tea", "new_memory": None, "event": "DELETE", "created_at": "t1"}])
+
+    assert [h["event"] for h in await db.aget_history("m1")] == ["ADD", "DELETE"]
+
+    await db.areset()
+    assert await db.aget_history("m1") == []
+
+
+@pytest.mark.parametrize(
+    "provider, config, expected_class",
+    [
+        ("sqlite", {"db_path": ":memory:"}, SQLiteManager),
+        ("memory", {"max_records": 10}, MemoryHistoryManager),
+    ],
+)
+def test_history_store_factory(provider, config, expected_class):
+    store = HistoryStoreFactory.create(provider, config)
+    assert isinstance(store, expected_class)
+    store.close()
+
+
+def test_history_store_factory_unsupported_provider():
+    with pytest.raises(ValueError, match="Unsupported HistoryStore provider"):
+        HistoryStoreFactory.create("mystery", {})
+
+
+class TestPostgresHistoryManager:
+    @pytest.fixture
+    def mock_pool(self):
+        with patch("psycopg_pool.ConnectionPool") as mock_pool_class:
+            pool = mock_pool_class.return_value
+            conn = pool.connection.return_value.__enter__.return_value
+            yield mock_pool_class, conn
+
+    def test_init_creates_pool_and_schema(self, mock_pool):
+        mock_pool_class, conn = mock_pool
+
+        manager = PostgresHistoryManager(user="mem0", password="secret", host="db", port=5432, maxconn=4)
+
+        args, kwargs = mock_pool_class.call_args
+        assert "host=db" in args[0] and "user=mem0" in args[0]
+        assert kwargs["max_size"] == 4
+        assert conn.execute.call_count == 2  # table + memory_id index
+        assert manager.table_name == "mem0_history"
+
+    def test_add_history_batch_uses_copy(self, mock_pool):
+        _, conn = mock_pool
+        cursor = conn.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        manager = PostgresHistoryManager(connection_string="postgresql://localhost/mem0")
+
+        manager.add_history_batch(
+            [
+                {"memory_id": "m1", "new_memory": "likes tea", "event": "ADD"},
+                {"memory_id": "m2", "old_memory": "lives in Paris", "event": "DELETE", "is_deleted": 1},
+            ]
+        )
+
+        cursor.copy.assert_called_once()
+        rows = [c.args[0] for c in copy.write_row.call_args_list]
+        assert [(r[1], r[4], r[7]) for r in rows] == [("m1", "ADD", 0), ("m2", "DELETE", 1)]
+
+    def test_get_history(self, mock_pool):
+        _, conn = mock_pool
+        manager = PostgresHistoryManager(connection_string="postgresql://localhost/mem0")
+        conn.execute.return_value.fetchall.return_value = [
+            ("h1", "m1", None, "likes tea", "ADD", "t0", None, 0, None, "user")
+        ]
+
+        history = manager.get_history("m1")
+
+        assert history == [
+            {
+                "id": "h1",
+                "memory_id": "m1",
+                "old_memory": None,
+                "new_memory": "likes tea",
+                "event": "ADD",
+                "created_at": "t0",
+                "updated_at": None,
+                "is_deleted": False,
+                "actor_id": None,
+                "role": "user",
+            }
+        ]
+        assert conn.execute.call_args.args[1] == ("m1",)
+
+    def test_async_pool_is_opened_per_event_loop(self, mock_pool):
+        manager = PostgresHistoryManager(connection_string="postgresql://localhost/mem0")
+        pools = []
+
+        def create_pool(*args, **kwargs):
+            pool = MagicMock()
+            pool.open = AsyncMock()
+            pool.close = AsyncMock()
+            conn = pool.connection.return_value.__aenter__.return_value
+            conn.execute = AsyncMock(return_value=MagicMock(fetchall=AsyncMock(return_value=[])))
+            pools.append(pool)
+            return pool
+
+        with patch("psycopg_pool.AsyncConnectionPool", side_effect=create_pool):
+            assert asyncio.run(manager.aget_history("m1")) == []
+            # A pool bound to the first loop cannot serve the second one
+            assert asyncio.run(manager.aget_history("m1")) == []
+
+        assert len(pools) == 2
+        assert all(pool.open.await_count == 1 for pool in pools)
+        assert all(pool.connection.return_value.__aenter__.return_value.execute.await_count == 1 for pool in pools)
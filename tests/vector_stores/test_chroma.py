@@ -1,4 +1,5 @@
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
@@ -245,3 +246,54 @@ def test_generate_where_clause_non_string_values():
     # Only string values should be included in $and array
     expected = {"$and": [{"user_id": "alice"}]}
     assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_async_search_uses_async_http_client():
+    async_collection = Mock()
+    async_collection.query = AsyncMock(
+        return_value={"ids": [["id1"]], "distances": [[0.1]], "metadatas": [[{"name": "vector1"}]]}
+    )
+    async_client = Mock()
+    async_client.get_or_create_collection = AsyncMock(return_value=async_collection)
+
+    with patch("chromadb.Client"), patch("chromadb.AsyncHttpClient", AsyncMock(return_value=async_client)) as factory:
+        instance = ChromaDB(collection_name="test_collection", host="chroma", port=8000)
+        results = await instance.asearch(query="q", vectors=[[0.1, 0.2, 0.3]], limit=1, filters={"user_id": "u"})
+        await instance.asearch(query="q", vectors=[[0.1, 0.2, 0.3]], limit=1)
+
+    # The async client and collection are opened once
+    factory.assert_awaited_once()
+    assert factory.await_args.kwargs["host"] == "chroma"
+    async_client.get_or_create_collection.assert_awaited_once_with(name="test_collection")
+    async_collection.query.assert_any_await(query_embeddings=[[0.1, 0.2, 0.3]], where={"user_id": "u"}, n_results=1)
+    assert results[0].id == "id1"
+    instance.collection.query.assert_not_called()
+
+
+def test_async_collection_per_event_loop():
+    async_client = Mock()
+    async_client.get_or_create_collection = AsyncMock(side_effect=lambda name: Mock())
+
+    with patch("chromadb.Client"), patch("chromadb.AsyncHttpClient", AsyncMock(return_value=async_client)) as factory:
+        instance = ChromaDB(collection_name="test_collection", host="chroma", port=8000)
+        first = asyncio.run(instance._get_async_collection())
+        second = asyncio.run(instance._get_async_collection())
+
+    # Each asyncio.run() loop opens its own client, the first one is bound to a closed loop
+    assert first is not second
+    assert factory.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_async_search_without_server_uses_sync_client(chromadb_instance):
+    chromadb_instance.collection.query.return_value = {
+        "ids": [["id1"]],
+        "distances": [[0.1]],
+        "metadatas": [[{"name": "vector1"}]],
+    }
+
+    results = await chromadb_instance.asearch(query="q", vectors=[[0.1, 0.2, 0.3]], limit=1)
+
+    chromadb_instance.collection.query.assert_called_once()
+    assert results[0].id == "id1"
@@ -11,7 +11,7 @@ from mem0.vector_stores.faiss import FAISS, OutputData
 
 @pytest.fixture
 def mock_faiss_index():
-    index = Mock(spec=faiss.IndexFlatL2)
+    index = Mock(spec=faiss.IndexIDMap2)
     index.d = 128  # Dimension of the vectors
     index.ntotal = 0  # Number of vectors in the index
     return index
@@ -21,7 +21,7 @@ def mock_faiss_index():
 def faiss_instance(mock_faiss_index):
     with tempfile.TemporaryDirectory() as temp_dir:
         # Mock the faiss index creation
-        with patch("faiss.IndexFlatL2", return_value=mock_faiss_index):
+        with patch("faiss.IndexFlatL2"), patch("faiss.IndexIDMap2", return_value=mock_faiss_index):
             # Mock the faiss.write_index function
             with patch("faiss.write_index"):
                 # Create a FAISS instance with a temporary directory
@@ -37,13 +37,16 @@ def faiss_instance(mock_faiss_index):
 
 def test_create_col(faiss_instance, mock_faiss_index):
     # Test creating a collection with euclidean distance
-    with patch("faiss.IndexFlatL2", return_value=mock_faiss_index) as mock_index_flat_l2:
+    with patch("faiss.IndexFlatL2") as mock_index_flat_l2, patch(
+        "faiss.IndexIDMap2", return_value=mock_faiss_index
+    ) as mock_id_map:
         with patch("faiss.write_index"):
             faiss_instance.create_col(name="new_collection")
             mock_index_flat_l2.assert_called_once_with(faiss_instance.embedding_model_dims)
+            mock_id_map.assert_called_once_with(mock_index_flat_l2.return_value)
 
     # Test creating a collection with inner product distance
-    with patch("faiss.IndexFlatIP", return_value=mock_faiss_index) as mock_index_flat_ip:
+    with patch("faiss.IndexFlatIP") as mock_index_flat_ip, patch("faiss.IndexIDMap2", return_value=mock_faiss_index):
         with patch("faiss.write_index"):
             faiss_instance.create_col(name="new_collection", distance="inner_product")
             mock_index_flat_ip.assert_called_once_with(faiss_instance.embedding_model_dims)
@@ -57,23 +60,24 @@ def test_insert(faiss_instance, mock_faiss_index):
 
     # Mock the numpy array conversion
     with patch("numpy.array", return_value=np.array(vectors, dtype=np.float32)) as mock_np_array:
-        # Mock index.add
-        mock_faiss_index.add.return_value = None
-
         # Call insert
         faiss_instance.insert(vectors=vectors, payloads=payloads, ids=ids)
 
         # Verify numpy.array was called
         mock_np_array.assert_called_once_with(vectors, dtype=np.float32)
 
-        # Verify index.add was called
-        mock_faiss_index.add.assert_called_once()
+        # Verify vectors were added under int64 ids
+        mock_faiss_index.add_with_ids.assert_called_once()
+        added_ids = mock_faiss_index.add_with_ids.call_args[0][1]
+        assert added_ids.dtype == np.int64
+        assert added_ids.tolist() == [0, 1]
 
-        # Verify docstore and index_to_id were updated
+        # Verify docstore and both id mappings were updated
         assert faiss_instance.docstore["id1"] == {"name": "vector1"}
         assert faiss_instance.docstore["id2"] == {"name": "vector2"}
         assert faiss_instance.index_to_id[0] == "id1"
         assert faiss_instance.index_to_id[1] == "id2"
+        assert faiss_instance.id_to_index == {"id1": 0, "id2": 1}
 
 
 def test_search(faiss_instance, mock_faiss_index):
@@ -165,17 +169,45 @@ def test_search_with_filters(faiss_instance, mock_faiss_index):
                 assert results[0].payload == {"name": "vector1", "category": "A"}
 
 
-def test_delete(faiss_instance):
-    # Setup the docstore and index_to_id mapping
+def test_search_batch(faiss_instance, mock_faiss_index):
+    faiss_instance.docstore = {
+        "id1": {"name": "vector1", "category": "A"},
+        "id2": {"name": "vector2", "category": "B"},
+    }
+    faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+
+    mock_faiss_index.search.return_value = (np.array([[0.9, 0.8], [0.7, 0.6]]), np.array([[0, 1], [1, 0]]))
+
+    results = faiss_instance.search_batch(
+        queries=["q1", "q2"], vectors_list=[[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], limit=2, filters={"category": "A"}
+    )
+
+    # Both queries are answered by a single index search over the stacked matrix
+    mock_faiss_index.search.assert_called_once()
+    query_matrix, fetch_k = mock_faiss_index.search.call_args[0]
+    assert query_matrix.shape == (2, 3)
+    assert fetch_k == 4
+
+    assert [[r.id for r in query_results] for query_results in results] == [["id1"], ["id1"]]
+    assert results[0][0].score == pytest.approx(0.9)
+    assert results[1][0].score == pytest.approx(0.6)
+
+
+def test_delete(faiss_instance, mock_faiss_index):
+    # Setup the docstore and id mappings
     faiss_instance.docstore = {"id1": {"name": "vector1"}, "id2": {"name": "vector2"}}
     faiss_instance.index_to_id = {0: "id1", 1: "id2"}
+    faiss_instance.id_to_index = {"id1": 0, "id2": 1}
 
     # Call delete
     faiss_instance.delete(vector_id="id1")
 
-    # Verify the vector was removed from docstore and index_to_id
+    # Verify the vector was removed from the index, docstore and both mappings
+    removed_ids = mock_faiss_index.remove_ids.call_args[0][0]
+    assert removed_ids.tolist() == [0]
     assert "id1" not in faiss_instance.docstore
     assert 0 not in faiss_instance.index_to_id
+    assert "id1" not in faiss_instance.id_to_index
     assert "id2" in faiss_instance.docstore
     assert 1 in faiss_instance.index_to_id
 
@@ -289,3 +321,294 @@ def test_normalize_L2(faiss_instance, mock_faiss_index):
 
             # Verify faiss.normalize_L2 was called
             mock_normalize.assert_called_once()
+
+
+@pytest.fixture
+def real_faiss(tmp_path):
+    def make(**kwargs):
+        return FAISS(collection_name="real", path=str(tmp_path / "faiss"), embedding_model_dims=4, **kwargs)
+
+    return make
+
+
+def _vectors(n, seed=0):
+    return np.random.default_rng(seed).random((n, 4), dtype=np.float32).tolist()
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_deleted_vectors_never_returned(real_faiss, index_type):
+    store = real_faiss(index_type=index_type)
+    vectors = _vectors(10)
+    store.insert(vectors, payloads=[{"n": i} for i in range(10)], ids=[f"id{i}" for i in range(10)])
+
+    store.delete("id3")
+    results = store.search(query="", vectors=vectors[3], limit=10)
+
+    assert "id3" not in [r.id for r in results]
+    assert len(results) == 9
+    assert store.col_info()["count"] == 9
+
+
+def test_delete_removes_rows_from_flat_index(real_faiss):
+    store = real_faiss()
+    store.insert(_vectors(5), ids=[f"id{i}" for i in range(5)])
+
+    store.delete("id1")
+    store.delete("id4")
+
+    assert store.index.ntotal == 3
+    assert store.get("id1") is None
+
+
+def test_update_vector_replaces_row(real_faiss):
+    store = real_faiss()
+    vectors = _vectors(3)
+    store.insert(vectors, payloads=[{"n": i} for i in range(3)], ids=["a", "b", "c"])
+
+    store.update("a", vector=vectors[2], payload={"n": 42})
+
+    assert store.index.ntotal == 3
+    top = store.search(query="", vectors=vectors[2], limit=2)
+    assert {r.id for r in top} == {"a", "c"}
+    assert store.get("a").payload == {"n": 42}
+
+
+def test_hnsw_compacts_tombstones(real_faiss):
+    store = real_faiss(index_type="hnsw", hnsw_m=8, ef_search=32)
+    store.insert(_vectors(10), ids=[f"id{i}" for i in range(10)])
+
+    store.delete("id0")
+    store.delete("id1")
+    assert store.index.ntotal == 10
+    assert len(store._tombstones) == 2
+
+    # A third tombstone crosses the compaction ratio and rebuilds the graph
+    store.delete("id2")
+    assert store.index.ntotal == 7
+    assert store._tombstones == set()
+    assert faiss.downcast_index(store.index.index).hnsw.efSearch == 32
+
+
+def test_ivf_trains_once_enough_vectors(real_faiss):
+    store = real_faiss(index_type="ivf", nlist=4, nprobe=4)
+    vectors = _vectors(3)
+    store.insert(vectors, ids=["a", "b", "c"])
+    assert isinstance(faiss.downcast_index(store.index.index), faiss.IndexFlat)
+
+    more = _vectors(20, seed=1)
+    store.insert(more, ids=[f"id{i}" for i in range(20)])
+
+    assert isinstance(store.index, faiss.IndexIVFFlat)
+    assert store.index.nprobe == 4
+    assert store.index.ntotal == 23
+    assert store.search(query="", vectors=vectors[0], limit=1)[0].id == "a"
+
+    # Removing from the trained index keeps the remaining ids addressable
+    store.delete("a")
+    assert store.index.ntotal == 22
+    assert store.search(query="", vectors=more[19], limit=1)[0].id == "id19"
+
+
+def test_ivf_wal_reload(real_faiss):
+    store = real_faiss(index_type="ivf", nlist=2, persistence="wal", checkpoint_batch_size=5)
+    vectors = _vectors(8)
+    store.insert(vectors, ids=[f"id{i}" for i in range(8)])
+    store.delete("id7")
+
+    reloaded = real_faiss(index_type="ivf", nlist=2, persistence="wal")
+
+    assert isinstance(reloaded.index, faiss.IndexIVFFlat)
+    assert reloaded.index.ntotal == 7
+    assert reloaded.search(query="", vectors=vectors[6], limit=1)[0].id == "id6"
+
+
+def test_reload_from_disk(real_faiss):
+    store = real_faiss(index_type="hnsw")
+    vectors = _vectors(6)
+    store.insert(vectors, payloads=[{"n": i} for i in range(6)], ids=[f"id{i}" for i in range(6)])
+    store.delete("id2")
+
+    reloaded = real_faiss(index_type="hnsw")
+
+    assert reloaded.id_to_index == store.id_to_index
+    assert reloaded._tombstones == {2}
+    assert [r.id for r in reloaded.search(query="", vectors=vectors[2], limit=5)].count("id2") == 0
+    reloaded.insert(_vectors(1, seed=3), ids=["new"])
+    assert reloaded.id_to_index["new"] == 6
+
+
+def test_legacy_positional_index_is_migrated(tmp_path):
+    import pickle
+
+    path = tmp_path / "faiss"
+    path.mkdir()
+    vectors = np.array(_vectors(3), dtype=np.float32)
+    legacy = faiss.IndexFlatL2(4)
+    legacy.add(vectors)
+    faiss.write_index(legacy, str(path / "legacy.faiss"))
+    # Position 1 was deleted by the old implementation but its vector stayed in the index
+    with open(path / "legacy.pkl", "wb") as f:
+        pickle.dump(({"a": {}, "c": {}}, {0: "a", 2: "c"}), f)
+
+    store = FAISS(collection_name="legacy", path=str(path), embedding_model_dims=4)
+
+    assert isinstance(store.index, faiss.IndexIDMap2)
+    assert store.index.ntotal == 2
+    assert [r.id for r in store.search(query="", vectors=vectors[2].tolist(), limit=3)] == ["c", "a"]
+    assert store._next_index_id == 3
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_wal_replays_log_on_reload(real_faiss, index_type):
+    store = real_faiss(index_type=index_type, persistence="wal")
+    vectors = _vectors(4)
+    with patch("faiss.write_index") as mock_write:
+        store.insert(vectors, payloads=[{"n": i} for i in range(4)], ids=["a", "b", "c", "d"])
+        store.delete("b")
+        store.update("c", payload={"n": 30})
+        store.update("d", vector=vectors[0])
+        # Writes below the batch size only touch the log
+        mock_write.assert_not_called()
+
+    reloaded = real_faiss(index_type=index_type, persistence="wal")
+
+    assert sorted(reloaded.docstore) == ["a", "c", "d"]
+    assert reloaded.get("c").payload == {"n": 30}
+    assert reloaded.col_info()["count"] == 3
+    assert {r.id for r in reloaded.search(query="", vectors=vectors[0], limit=2)} == {"a", "d"}
+    assert reloaded._next_index_id == store._next_index_id
+
+
+def test_wal_checkpoints_after_batch(real_faiss, tmp_path):
+    store = real_faiss(persistence="wal", checkpoint_batch_size=3)
+    store.insert(_vectors(2), ids=["a", "b"])
+    assert store._wal.pending_entries == 2
+
+    store.insert(_vectors(1, seed=1), ids=["c"])
+
+    assert store._wal.pending_entries == 0
+    assert store._wal.entries() == []
+    assert faiss.read_index(str(tmp_path / "faiss" / "real.faiss")).ntotal == 3
+    assert not os.path.exists(tmp_path / "faiss" / "real.faiss.tmp")
+
+
+def test_wal_replay_is_idempotent_after_interrupted_checkpoint(real_faiss):
+    store = real_faiss(persistence="wal")
+    store.insert(_vectors(3), ids=["a", "b", "c"])
+    store.delete("a")
+
+    # Simulate a crash after the checkpoint rename but before the log is truncated
+    with patch.object(store._wal, "truncate"):
+        store.checkpoint()
+    assert len(store._wal.entries()) == 4
+
+    reloaded = real_faiss(persistence="wal")
+    assert reloaded.index.ntotal == 2
+    assert sorted(reloaded.docstore) == ["b", "c"]
+
+
+def test_wal_migrates_snapshot_collection(real_faiss):
+    snapshot = real_faiss()
+    snapshot.insert(_vectors(2), payloads=[{"n": 1}, {"n": 2}], ids=["a", "b"])
+
+    store = real_faiss(persistence="wal")
+    assert store.get("b").payload == {"n": 2}
+
+    reloaded = real_faiss(persistence="wal")
+    assert sorted(reloaded.docstore) == ["a", "b"]
+    assert reloaded.index.ntotal == 2
+
+
+def test_wal_delete_col_removes_log(real_faiss, tmp_path):
+    store = real_faiss(persistence="wal")
+    store.insert(_vectors(1), ids=["a"])
+
+    store.delete_col()
+
+    assert not os.path.exists(tmp_path / "faiss" / "real.db")
+    store.create_col("real")
+    assert store._wal is not None
+    assert store.list()[0] == []
+
+
+@pytest.mark.parametrize("index_type", ["flat", "ivf", "hnsw"])
+def test_filtered_search_is_prefiltered(real_faiss, index_type):
+    store = real_faiss(index_type=index_type, nlist=4, nprobe=1)
+    vectors = _vectors(200)
+    # One vector belongs to "rare", the rest to other users
+    payloads = [{"user_id": "rare" if i == 150 else f"user{i % 7}", "agent_id": "bot"} for i in range(200)]
+    store.insert(vectors, payloads=payloads, ids=[f"id{i}" for i in range(200)])
+
+    results = store.search(query="", vectors=vectors[0], limit=5, filters={"user_id": "rare"})
+    assert [r.id for r in results] == ["id150"]
+
+    results = store.search(query="", vectors=vectors[0], limit=5, filters={"user_id": ["rare", "user3"], "agent_id": "bot"})
+    assert len(results) == 5
+    assert all(r.payload["user_id"] in ("rare", "user3") for r in results)
+
+    batch = store.search_batch(["a", "b"], [vectors[0], vectors[1]], limit=3, filters={"user_id": "rare"})
+    assert [[r.id for r in query_results] for query_results in batch] == [["id150"], ["id150"]]
+
+
+def test_filtered_search_without_candidates_skips_index(real_faiss):
+    store = real_faiss()
+    store.insert(_vectors(3), payloads=[{"user_id": "alice"}] * 3, ids=["a", "b", "c"])
+
+    with patch.object(store.index, "search") as mock_search:
+        assert store.search(query="", vectors=_vectors(1)[0], filters={"user_id": "bob"}) == []
+        assert store.search_batch(["q"], _vectors(1), filters={"user_id": "bob"}) == [[]]
+        mock_search.assert_not_called()
+
+
+def test_payload_index_follows_changes(real_faiss):
+    store = real_faiss(persistence="wal")
+    vectors = _vectors(3)
+    store.insert(vectors, payloads=[{"user_id": "alice"}, {"user_id": "alice"}, {"user_id": "bob"}], ids=["a", "b", "c"])
+
+    store.delete("a")
+    store.update("b", payload={"user_id": "bob"})
+    store.update("c", vector=vectors[0])
+
+    assert store.search(query="", vectors=vectors[0], filters={"user_id": "alice"}) == []
+    assert {r.id for r in store.search(query="", vectors=vectors[0], filters={"user_id": "bob"})} == {"b", "c"}
+
+    reloaded = real_faiss(persistence="wal")
+    assert reloaded._payload_index == store._payload_index
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_int8_quantization_trains_and_rescores(real_faiss, index_type):
+    store = real_faiss(index_type=index_type, quantization={"type": "int8", "oversampling": 4})
+    vectors = _vectors(12)
+    with patch("mem0.vector_stores.faiss.QUANTIZATION_TRAINING_SIZE", 8):
+        store.insert(vectors[:4], ids=[f"id{i}" for i in range(4)])
+        assert isinstance(store._base_index(), (faiss.IndexFlat, faiss.IndexHNSWFlat))
+
+        store.insert(vectors[4:], ids=[f"id{i}" for i in range(4, 12)])
+
+    assert isinstance(store._base_index(), (faiss.IndexScalarQuantizer, faiss.IndexHNSWSQ))
+    # Scores come from the full-precision vectors, not the 8-bit codes
+    exact = ((np.array(vectors) - np.array(vectors[5])) ** 2).sum(axis=1)
+    results = store.search(query="", vectors=vectors[5], limit=3)
+    assert [r.id for r in results] == [f"id{i}" for i in np.argsort(exact)[:3]]
+    np.testing.assert_allclose([r.score for r in results], np.sort(exact)[:3], atol=1e-6)
+
+
+def test_binary_quantization_persists_full_vectors(real_faiss):
+    # Four sign bits cannot tell six vectors apart, so every candidate goes through rescoring
+    quantization = {"type": "binary", "oversampling": 6}
+    store = real_faiss(quantization=quantization, persistence="wal")
+    vectors = (np.array(_vectors(6)) - 0.5).tolist()
+    store.insert(vectors, payloads=[{"user_id": "alice"}] * 6, ids=[f"id{i}" for i in range(6)])
+    store.delete("id1")
+
+    assert isinstance(store._base_index(), faiss.IndexLSH)
+    reloaded = real_faiss(quantization=quantization, persistence="wal")
+    for i in (0, 2, 5):
+        assert reloaded.search(query="", vectors=vectors[i], limit=1)[0].id == f"id{i}"
+        assert reloaded.search(query="", vectors=vectors[i], limit=1, filters={"user_id": "alice"})[0].id == f"id{i}"
+
+
+def test_binary_quantization_requires_flat_index(real_faiss):
+    with pytest.raises(ValueError, match="Binary quantization"):
+        real_faiss(index_type="hnsw", quantization={"type": "binary"})
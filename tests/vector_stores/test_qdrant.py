@@ -1,13 +1,17 @@
+import asyncio
 import unittest
 import uuid
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from qdrant_client import QdrantClient
 from qdrant_client.models import (
+    BinaryQuantization,
     Distance,
     Filter,
     PointIdsList,
     PointStruct,
+    ScalarQuantization,
+    ScalarType,
     VectorParams,
 )
 
@@ -33,7 +37,7 @@ class TestQdrant(unittest.TestCase):
         expected_config = VectorParams(size=128, distance=Distance.COSINE, on_disk=True)
 
         self.client_mock.create_collection.assert_called_with(
-            collection_name="test_collection", vectors_config=expected_config
+            collection_name="test_collection", vectors_config=expected_config, quantization_config=None
         )
 
     def test_insert(self):
@@ -63,6 +67,7 @@ class TestQdrant(unittest.TestCase):
             collection_name="test_collection",
             query=vectors,
             query_filter=None,
+            search_params=None,
             limit=1,
         )
 
@@ -135,6 +140,28 @@ class TestQdrant(unittest.TestCase):
 
         self.assertEqual(len(results), 1)
 
+    def test_search_batch(self):
+        vectors_list = [[0.1, 0.2], [0.3, 0.4]]
+        point_a = MagicMock(id=str(uuid.uuid4()), score=0.9, payload={"key": "a"})
+        point_b = MagicMock(id=str(uuid.uuid4()), score=0.8, payload={"key": "b"})
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=[point_a]), MagicMock(points=[point_b])]
+
+        results = self.qdrant.search_batch(
+            queries=["q1", "q2"], vectors_list=vectors_list, limit=3, filters={"user_id": "alice"}
+        )
+
+        self.client_mock.query_batch_points.assert_called_once()
+        self.client_mock.query_points.assert_not_called()
+        requests = self.client_mock.query_batch_points.call_args[1]["requests"]
+        self.assertEqual([request.query for request in requests], vectors_list)
+        for request in requests:
+            self.assertEqual(request.limit, 3)
+            self.assertTrue(request.with_payload)
+            self.assertEqual(request.filter.must[0].key, "user_id")
+            self.assertEqual(request.filter.must[0].match.value, "alice")
+
+        self.assertEqual(results, [[point_a], [point_b]])
+
     def test_create_filter_multiple_filters(self):
         """Test _create_filter with multiple filters."""
         filters = {"user_id": "alice", "agent_id": "agent1", "run_id": "run1"}
@@ -231,10 +258,10 @@ class TestQdrant(unittest.TestCase):
             score=0.95, 
             payload={"user_id": "alice", "agent_id": "agent1", "run_id": "run1"}
         )
-        self.client_mock.scroll.return_value = MagicMock(points=[mock_point])
+        self.client_mock.scroll.return_value = ([mock_point], None)
 
         filters = {"user_id": "alice", "agent_id": "agent1", "run_id": "run1"}
-        results = self.qdrant.list(filters=filters, limit=10)
+        [results] = self.qdrant.list(filters=filters, limit=10)
 
         # Verify that _create_filter was called and scroll_filter was passed
         self.client_mock.scroll.assert_called_once()
@@ -259,10 +286,10 @@ class TestQdrant(unittest.TestCase):
             score=0.95, 
             payload={"user_id": "alice"}
         )
-        self.client_mock.scroll.return_value = MagicMock(points=[mock_point])
+        self.client_mock.scroll.return_value = ([mock_point], None)
 
         filters = {"user_id": "alice"}
-        results = self.qdrant.list(filters=filters, limit=10)
+        [results] = self.qdrant.list(filters=filters, limit=10)
 
         # Verify that a Filter object was created with single condition
         call_args = self.client_mock.scroll.call_args[1]
@@ -276,9 +303,9 @@ class TestQdrant(unittest.TestCase):
     def test_list_with_no_filters(self):
         """Test list with no filters."""
         mock_point = MagicMock(id=str(uuid.uuid4()), score=0.95, payload={"key": "value"})
-        self.client_mock.scroll.return_value = MagicMock(points=[mock_point])
+        self.client_mock.scroll.return_value = ([mock_point], None)
 
-        results = self.qdrant.list(filters=None, limit=10)
+        [results] = self.qdrant.list(filters=None, limit=10)
 
         call_args = self.client_mock.scroll.call_args[1]
         self.assertIsNone(call_args["scroll_filter"])
@@ -293,5 +320,97 @@ class TestQdrant(unittest.TestCase):
         self.qdrant.col_info()
         self.client_mock.get_collection.assert_called_once_with(collection_name="test_collection")
 
+    def test_quantization(self):
+        self.client_mock.get_collections.return_value = MagicMock(collections=[])
+        qdrant = Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            quantization={"type": "int8", "oversampling": 2.0},
+        )
+
+        quantization_config = self.client_mock.create_collection.call_args[1]["quantization_config"]
+        self.assertIsInstance(quantization_config, ScalarQuantization)
+        self.assertEqual(quantization_config.scalar.type, ScalarType.INT8)
+        self.assertTrue(quantization_config.scalar.always_ram)
+
+        self.client_mock.query_points.return_value = MagicMock(points=[])
+        qdrant.search(query="", vectors=[0.1, 0.2], limit=1)
+        search_params = self.client_mock.query_points.call_args[1]["search_params"]
+        self.assertTrue(search_params.quantization.rescore)
+        self.assertEqual(search_params.quantization.oversampling, 2.0)
+
+        self.client_mock.query_batch_points.return_value = [MagicMock(points=[])]
+        qdrant.search_batch(queries=["q"], vectors_list=[[0.1, 0.2]], limit=1)
+        [request] = self.client_mock.query_batch_points.call_args[1]["requests"]
+        self.assertEqual(request.params, search_params)
+
+    def test_quantization_of_existing_collection(self):
+        collection = MagicMock()
+        collection.name = "test_collection"
+        self.client_mock.get_collections.return_value = MagicMock(collections=[collection])
+
+        Qdrant(
+            collection_name="test_collection",
+            embedding_model_dims=128,
+            client=self.client_mock,
+            quantization={"type": "binary"},
+        )
+
+        self.client_mock.update_collection.assert_called_once()
+        quantization_config = self.client_mock.update_collection.call_args[1]["quantization_config"]
+        self.assertIsInstance(quantization_config, BinaryQuantization)
+
+    def test_async_methods_use_async_client(self):
+        with patch("mem0.vector_stores.qdrant.QdrantClient"), patch(
+            "mem0.vector_stores.qdrant.AsyncQdrantClient"
+        ) as async_client_class:
+            async_client = async_client_class.return_value
+            async_client.query_points = AsyncMock(return_value=MagicMock(points=["hit"]))
+            async_client.retrieve = AsyncMock(return_value=[])
+            qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=128, url="http://qdrant:6333")
+
+            async def search_and_get():
+                results = await qdrant.asearch(query="q", vectors=[0.1, 0.2], limit=3, filters={"user_id": "u"})
+                return results, await qdrant.aget(vector_id="missing")
+
+            results, missing = asyncio.run(search_and_get())
+
+        async_client_class.assert_called_once_with(url="http://qdrant:6333")
+        self.assertIsNone(missing)
+        self.assertEqual(results, ["hit"])
+        kwargs = async_client.query_points.await_args.kwargs
+        self.assertEqual(kwargs["collection_name"], "test_collection")
+        self.assertEqual(kwargs["limit"], 3)
+        self.assertEqual(kwargs["query_filter"].must[0].key, "user_id")
+        qdrant.client.query_points.assert_not_called()
+
+    def test_async_client_per_event_loop(self):
+        with patch("mem0.vector_stores.qdrant.QdrantClient"), patch(
+            "mem0.vector_stores.qdrant.AsyncQdrantClient", side_effect=lambda **kwargs: MagicMock(close=AsyncMock())
+        ) as async_client_class:
+            qdrant = Qdrant(collection_name="test_collection", embedding_model_dims=128, url="http://qdrant:6333")
+
+            async def get_client():
+                return qdrant._get_async_client(), qdrant._get_async_client()
+
+            # An AsyncMemory reused across asyncio.run() calls gets a client bound to each loop
+            first, same = asyncio.run(get_client())
+            second, _ = asyncio.run(get_client())
+
+        self.assertIs(first, same)
+        self.assertIsNot(first, second)
+        self.assertEqual(async_client_class.call_count, 2)
+
+    def test_async_methods_fall_back_to_sync_client(self):
+        self.client_mock.query_points.return_value = MagicMock(points=["hit"])
+
+        with patch("mem0.vector_stores.qdrant.AsyncQdrantClient") as async_client_class:
+            results = asyncio.run(self.qdrant.asearch(query="q", vectors=[0.1, 0.2], limit=3))
+
+        async_client_class.assert_not_called()
+        self.assertEqual(results, ["hit"])
+        self.client_mock.query_points.assert_called_once()
+
     def tearDown(self):
         del self.qdrant